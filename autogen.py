@@ -37,6 +37,76 @@ BOOLEAN_STATUS_ROUTES: list[tuple[str, str]] = [
     ("GET", "/virtual_tag_configs/async/{request_id}"),
 ]
 
+# Paginated endpoints whose pages are large enough to warrant a streaming variant
+# that decodes items incrementally from the response body.
+# Each entry is (METHOD, openapi_path_template).
+STREAMING_ROUTES: list[tuple[str, str]] = [
+    ("GET", "/costs"),
+    ("GET", "/resources"),
+]
+
+# Paginated cost endpoints that also get a *_columnar variant returning a
+# ColumnarResult. Maps (METHOD, openapi_path_template) to the item fields stored
+# as float64 and the fields that are dictionary-encoded.
+COLUMNAR_ROUTES: dict[tuple[str, str], tuple[tuple[str, ...], tuple[str, ...]]] = {
+    ("GET", "/costs"): (
+        ("amount",),
+        ("currency", "provider", "service", "region", "account_id", "billing_account_id",
+         "cost_category", "cost_subcategory"),
+    ),
+    ("GET", "/unit_costs"): (
+        ("unit_cost_amount", "business_metric_amount", "scale"),
+        ("business_metric_token", "business_metric_title"),
+    ),
+    ("GET", "/cost_reports/{cost_report_token}/forecasted_costs"): (
+        ("amount",),
+        ("provider", "service"),
+    ),
+}
+
+# Paginated cost endpoints that also get a *_sharded variant, which splits the
+# start_date..end_date range along date_bin into concurrently fetched queries.
+# Each entry is (METHOD, openapi_path_template).
+SHARDED_ROUTES: list[tuple[str, str]] = [
+    ("GET", "/costs"),
+]
+
+# Query parameters a *_sharded method requires, and the one it manages itself.
+SHARD_REQUIRED_PARAMS = ("start_date", "end_date", "date_bin")
+
+# Endpoints that create a DataExport and return its Location. Their resource
+# also gets an export_and_download method that waits for the export and
+# downloads its files. Each entry is (METHOD, openapi_path_template).
+EXPORT_ROUTES: list[tuple[str, str]] = [
+    ("POST", "/costs/data_exports"),
+    ("POST", "/kubernetes_efficiency_reports/data_exports"),
+    ("POST", "/unit_costs/data_exports"),
+]
+
+# Multipart endpoints that create a UserCostsUpload. Their resource also gets an
+# ingest_costs method that uploads a large file in concurrent chunks.
+# Each entry is (METHOD, openapi_path_template).
+INGEST_ROUTES: list[tuple[str, str]] = [
+    ("POST", "/integrations/{integration_token}/costs.csv"),
+]
+
+# Endpoints that start an asynchronous update, mapped to the boolean-status endpoint
+# that reports whether it has finished and the name of the generated method that
+# waits on many of them. Their resource also gets <method>_and_wait.
+# Keys are (METHOD, openapi_path_template); values are (METHOD, openapi_path_template, waiter name).
+ASYNC_UPDATE_ROUTES: dict[tuple[str, str], tuple[str, str, str]] = {
+    ("PUT", "/virtual_tag_configs/{token}/async"): ("GET", "/virtual_tag_configs/async/{request_id}", "wait_async_updates"),
+}
+
+# GET endpoints of long-running operations. Their resource gets a method that returns
+# a future resolved once the operation has finished, polled by the client's Waiter.
+# Keys are (METHOD, openapi_path_template); values are (method name, finished test),
+# where the test is a function of the decoded response imported by the clients.
+WAIT_ROUTES: dict[tuple[str, str], tuple[str, str]] = {
+    ("GET", "/data_exports/{data_export_token}"): ("wait", "export_finished"),
+    ("GET", "/virtual_tag_configs/{token}/status"): ("wait_until_processed", "virtual_tag_processed"),
+}
+
 
 @dataclass
 class Parameter:
@@ -68,6 +138,14 @@ class Endpoint:
     response_handler: str | None = None  # internal client method to call, if not the default
     response_handler_return_type: str | None = None
     boolean_status: bool = False  # 404->False, 2xx->True, else raise VantageAPIError
+    pagination_field: str | None = None  # list field on a paginated response, e.g. "costs"
+    pagination_item_type: str | None = None  # item model of that field, e.g. "Cost"
+    streaming: bool = False  # also emit a stream_* method that decodes items incrementally
+    # (numeric, categorical) item fields for a *_columnar method, if any
+    columnar: tuple[tuple[str, ...], tuple[str, ...]] | None = None
+    sharded: bool = False  # also emit a *_sharded method that splits the date range
+    export_download: bool = False  # also emit export_and_download on top of this endpoint
+    ingest: bool = False  # also emit ingest_costs on top of this endpoint
 
 
 @dataclass
@@ -334,6 +412,44 @@ def build_class_name_map(schemas: dict[str, Any], request_body_schemas: set[str]
     return result
 
 
+def find_pagination_field(
+    response_type: str | None,
+    schemas: dict[str, Any],
+    name_map: dict[str, str] | None = None,
+) -> tuple[str, str] | None:
+    """Find the item list of a paginated response model.
+
+    A response is paginated when its schema has a ``links`` property and an
+    array-of-models property. If several arrays qualify (e.g. ``Costs`` has
+    ``costs`` and ``total_usage``), the required one wins.
+
+    Returns (field_name, item_class_name), or None if not paginated.
+    """
+    if not response_type:
+        return None
+    class_names = name_map or {name: to_pascal_case(name) for name in schemas}
+    raw_name = next((raw for raw, cls in class_names.items() if cls == response_type), None)
+    if raw_name is None:
+        return None
+    spec = schemas[raw_name]
+    properties = spec.get("properties", {})
+    if "links" not in properties:
+        return None
+
+    candidates = []
+    for prop_name, prop_spec in properties.items():
+        if prop_spec.get("type") != "array" or "$ref" not in prop_spec.get("items", {}):
+            continue
+        item_type = openapi_type_to_python(prop_spec["items"], schemas, name_map)
+        candidates.append((prop_name, item_type))
+    if len(candidates) > 1:
+        required = set(spec.get("required", []))
+        candidates = [c for c in candidates if c[0] in required]
+    if len(candidates) != 1:
+        return None
+    return candidates[0]
+
+
 def parse_endpoints(schema: dict[str, Any]) -> list[Endpoint]:
     """Parse all endpoints from OpenAPI schema."""
     endpoints = []
@@ -386,6 +502,22 @@ def parse_endpoints(schema: dict[str, Any]) -> list[Endpoint]:
                 (m.upper(), p) for m, p in BOOLEAN_STATUS_ROUTES
             }
 
+            pagination = None
+            if method.upper() == "GET":
+                pagination = find_pagination_field(response_type, schemas, name_map)
+
+            streaming = pagination is not None and (method.upper(), path) in {
+                (m.upper(), p) for m, p in STREAMING_ROUTES
+            }
+            columnar = COLUMNAR_ROUTES.get((method.upper(), path)) if pagination else None
+            sharded = pagination is not None and (method.upper(), path) in {
+                (m.upper(), p) for m, p in SHARDED_ROUTES
+            }
+            export_download = response_handler == "_request_for_location" and (method.upper(), path) in {
+                (m.upper(), p) for m, p in EXPORT_ROUTES
+            }
+            ingest = is_multipart and (method.upper(), path) in {(m.upper(), p) for m, p in INGEST_ROUTES}
+
             endpoints.append(
                 Endpoint(
                     path=path,
@@ -404,6 +536,13 @@ def parse_endpoints(schema: dict[str, Any]) -> list[Endpoint]:
                     response_handler=response_handler,
                     response_handler_return_type=response_handler_return_type,
                     boolean_status=boolean_status,
+                    pagination_field=pagination[0] if pagination else None,
+                    pagination_item_type=pagination[1] if pagination else None,
+                    streaming=streaming,
+                    columnar=columnar,
+                    sharded=sharded,
+                    export_download=export_download,
+                    ingest=ingest,
                 )
             )
 
@@ -497,6 +636,20 @@ def _is_model_type(type_hint: str) -> bool:
     return bool(re.match(r"^[A-Z][A-Za-z0-9_]*$", type_hint))
 
 
+def _returns_model(return_type: str) -> bool:
+    """Return True if a response of this type is mapped into generated models."""
+    type_hint = _extract_inner_type(return_type.strip(), "Optional[") or return_type.strip()
+    list_inner = _extract_inner_type(type_hint, "List[")
+    dict_inner = _extract_dict_value_type(type_hint)
+    return _is_model_type(list_inner or dict_inner or type_hint)
+
+
+def _single_model_type(return_type: str) -> str | None:
+    """Return the model name if a response of this type is one generated model."""
+    type_hint = _extract_inner_type(return_type.strip(), "Optional[") or return_type.strip()
+    return type_hint if _is_model_type(type_hint) else None
+
+
 def _append_response_mapping(lines: list[str], return_type: str, data_var: str) -> None:
     """Append generated code that coerces dict payloads into typed models."""
     type_hint = return_type.strip()
@@ -510,7 +663,7 @@ def _append_response_mapping(lines: list[str], return_type: str, data_var: str)
         lines.extend(
             [
                 f"        if isinstance({data_var}, list):",
-                f"            return [{list_inner}.model_validate(item) if isinstance(item, dict) else item for item in {data_var}]",
+                f"            return [self._client._parse({list_inner}, item, validate) if isinstance(item, dict) else item for item in {data_var}]",
             ]
         )
         return
@@ -520,7 +673,7 @@ def _append_response_mapping(lines: list[str], return_type: str, data_var: str)
         lines.extend(
             [
                 f"        if isinstance({data_var}, dict):",
-                f"            return {{k: {dict_inner}.model_validate(v) if isinstance(v, dict) else v for k, v in {data_var}.items()}}",
+                f"            return {{k: self._client._parse({dict_inner}, v, validate) if isinstance(v, dict) else v for k, v in {data_var}.items()}}",
             ]
         )
         return
@@ -529,7 +682,7 @@ def _append_response_mapping(lines: list[str], return_type: str, data_var: str)
         lines.extend(
             [
                 f"        if isinstance({data_var}, dict):",
-                f"            return {type_hint}.model_validate({data_var})",
+                f"            return self._client._parse({type_hint}, {data_var}, validate)",
             ]
         )
 
@@ -545,7 +698,13 @@ def generate_pydantic_models(schema: dict[str, Any]) -> str:
         "",
         "from typing import Any, Optional, List, Dict",
         "",
-        "from pydantic import BaseModel, Field",
+        "from pydantic import BaseModel as _PydanticBaseModel, ConfigDict, Field",
+        "",
+        "",
+        "class BaseModel(_PydanticBaseModel):",
+        '    """Base for the generated models. Validators are built on first use, not at import."""',
+        "",
+        "    model_config = ConfigDict(defer_build=True)",
         "",
         "",
     ]
@@ -648,6 +807,227 @@ def _collect_boolean_status_prefixes(resources: dict[str, Resource]) -> list[tup
     return result
 
 
+def _generate_request_method(resources: dict[str, Resource], is_async: bool) -> list[str]:
+    """Generate request() and the route lookup used when no precompiled Route is passed."""
+    await_ = "await " if is_async else ""
+    lines = [
+        f"    {'async ' if is_async else ''}def request(",
+        "        self,",
+        "        method: str,",
+        "        path: str,",
+        "        *,",
+        "        params: Optional[Dict[str, Any]] = None,",
+        "        body: Optional[Dict[str, Any]] = None,",
+        "        model: Any = None,",
+        "        validate: Optional[ValidateMode] = None,",
+        "        route: Optional[Route] = None,",
+        "    ) -> Any:",
+        '        """',
+        "        Make a raw API request.",
+        "",
+        "        The JSON response is decoded with the client's codec, or parsed into",
+        "        `model` according to `validate` when a model is given. Generated methods",
+        "        pass their precompiled `route`; without one it is looked up from the path.",
+        '        """',
+        "        if route is None:",
+        "            route = self._resolve_route(method, path)",
+        "        url = self._base_url + path",
+        "",
+        "        if method.upper() == 'GET' and params:",
+        "            url += build_query_string(params)",
+        "            params = None",
+        "",
+        "        if self._tracing is None:",
+        f"            return {await_}self._request(method, path, url, params, body, model, validate, route)",
+        "        event = RequestEvent(method.upper(), route.path, url)",
+        "        with self._tracing.span(route, url, event):",
+        f"            return {await_}self._request(method, path, url, params, body, model, validate, route, event)",
+        "",
+        f"    {'async ' if is_async else ''}def _request(",
+        "        self,",
+        "        method: str,",
+        "        path: str,",
+        "        url: str,",
+        "        params: Optional[Dict[str, Any]],",
+        "        body: Optional[Dict[str, Any]],",
+        "        model: Any,",
+        "        validate: Optional[ValidateMode],",
+        "        route: Route,",
+        "        event: Optional[RequestEvent] = None,",
+        "    ) -> Any:",
+        '        """Serve a `request()` from the caches or the API, reporting it to the hooks through `event`."""',
+        "        cached = None",
+        "        if method.upper() == 'GET' and not (route.handler or route.boolean_status):",
+        "            if self._disk_cache is not None:",
+        "                stored = self._disk_cache.get(self._cache_scope, path, url)",
+        "                if stored is not None:",
+        "                    return self._decode(stored, model, validate)",
+        "            if self._cache is not None:",
+        "                cached = self._cache.get(self._cache_scope, path, url)",
+        "                if cached is not None and cached.fresh:",
+        "                    return self._decode(cached.content, model, validate)",
+        "",
+        '        headers = {"Content-Type": "application/json"} if body is not None else None',
+        "        if cached is not None:",
+        "            # Expired but revalidatable: ask the API whether it changed.",
+        "            headers = cached.revalidation_headers()",
+        "",
+        "        if event is None and self._hooks is not None:",
+        "            event = RequestEvent(method.upper(), route.path, url)",
+        "",
+        "        if route.multipart:",
+        "            # Files are streamed from disk or encoded as they are sent.",
+        "            multipart = MultipartBody(body)",
+        "            try:",
+        f"                response = {await_}self._send(",
+        "                    method,",
+        "                    path,",
+        "                    url,",
+        "                    data=multipart.data,",
+        "                    files=multipart.files or None,",
+        "                    retry=multipart.replayable,",
+        "                    event=event,",
+        "                )",
+        "            finally:",
+        "                multipart.close()",
+        "        elif self._single_flight is not None and method.upper() == 'GET' and body is None:",
+        "            # Identical GETs already in flight share one HTTP call and its response.",
+        f"            response = {await_}self._single_flight.do(",
+        "                (url, tuple(sorted(headers.items())) if headers else None),",
+        "                lambda: self._send(method, path, url, headers=headers, event=event),",
+        "            )",
+        "            if event is not None and event.status is None:",
+        "                # Another caller's request was shared; that caller reports it.",
+        "                event = None",
+        "        else:",
+        f"            response = {await_}self._send(",
+        "                method,",
+        "                path,",
+        "                url,",
+        "                params=params,",
+        "                content=self._json.dumps(body) if body is not None else None,",
+        "                headers=headers,",
+        "                event=event,",
+        "            )",
+        "",
+        "        if self._cache is not None:",
+        "            if cached is not None and response.status_code == 304:",
+        "                self._cache.refresh(cached, response.headers)",
+        "                return self._decode(cached.content, model, validate, event, route.items)",
+        "            if method.upper() != 'GET':",
+        "                # A create, update or delete makes cached reads of the resource stale.",
+        "                self._cache.invalidate(path)",
+        "",
+        "        if route.boolean_status:",
+        "            # 404 -> False, 2xx -> True",
+        "            if response.status_code != 404 and not response.is_success:",
+        "                raise self._api_error(response, event)",
+        "            if event is not None:",
+        "                self._hooks.completed(event)",
+        "            return response.is_success",
+        "",
+        "        if not response.is_success:",
+        "            raise self._api_error(response, event)",
+        "",
+        "        if route.handler is not None:",
+        "            if event is not None:",
+        "                self._hooks.completed(event)",
+        "            return getattr(self, route.handler)(response)",
+        "",
+        "        if method.upper() == 'GET':",
+        "            if self._cache is not None:",
+        "                self._cache.put(self._cache_scope, path, url, response.content, response.headers)",
+        "            if self._disk_cache is not None:",
+        "                self._disk_cache.put(self._cache_scope, path, url, response.content)",
+        "        return self._decode(response.content, model, validate, event, route.items)",
+        "",
+        "    def _decode(",
+        "        self,",
+        "        content: bytes,",
+        "        model: Any,",
+        "        validate: Optional[ValidateMode],",
+        "        event: Optional[RequestEvent] = None,",
+        "        items: Optional[str] = None,",
+        "    ) -> Any:",
+        '        """',
+        "        Decode a response body, parsing it into `model` when one is given.",
+        "",
+        "        With an `event`, the decode is timed, the `items` of a page are counted",
+        "        and the event is completed.",
+        '        """',
+        "        mode = self._validate if validate is None else validate",
+        "        if event is not None:",
+        "            result = decode_timed(content, model, mode, self._json.loads, event, items)",
+        "            self._hooks.completed(event)",
+        "            return result",
+        "        if model is not None:",
+        "            return parse_response(model, content, mode, self._json.loads)",
+        "        return decode_json(content, self._json.loads)",
+        "",
+        "    def _api_error(self, response: httpx.Response, event: Optional[RequestEvent]) -> VantageAPIError:",
+        '        """Build the error for an unsuccessful response, reporting it to the `on_error` hooks."""',
+        "        error = VantageAPIError(",
+        "            status=response.status_code,",
+        "            status_text=response.reason_phrase,",
+        "            body=response.text,",
+        "        )",
+        "        if event is not None:",
+        "            self._hooks.failed(event, error)",
+        "        return error",
+        "",
+        "    def _resolve_route(self, method: str, path: str) -> Route:",
+        '        """Look up the routing of a request made without a precompiled Route."""',
+        "        method = method.upper()",
+        "        handler = None",
+    ]
+
+    # One check per handler, matching the concrete (method, path)
+    handler_routes = _collect_handler_routes(resources)
+    for handler, routes in sorted(handler_routes.items()):
+        route_set = "{" + ", ".join(f'("{m}", "{p}")' for m, p in sorted(routes)) + "}"
+        lines.append(f"        if (method, path) in {route_set}:")
+        lines.append(f'            handler = "{handler}"')
+
+    # Boolean-status endpoints are matched by the path prefix before their first parameter
+    boolean_checks = [
+        f'(method == "{method}" and path.startswith("{prefix}"))'
+        for method, prefix in _collect_boolean_status_prefixes(resources)
+    ]
+    lines.extend(
+        [
+            f"        boolean_status = {' or '.join(boolean_checks) or 'False'}",
+            "        return Route(method, path, multipart=is_multipart_route(path, method), handler=handler, boolean_status=boolean_status)",
+        ]
+    )
+    return lines
+
+
+def _route_literal(endpoint: Endpoint, name: str) -> str:
+    """Render the precompiled Route of an endpoint served by the client method `name`."""
+    args = [f'"{endpoint.method}"', f'"/v2{endpoint.path}"']
+    if endpoint.is_multipart:
+        args.append("multipart=True")
+    if endpoint.response_handler:
+        args.append(f'handler="{endpoint.response_handler}"')
+    if endpoint.boolean_status:
+        args.append("boolean_status=True")
+    args.append(f'name="{name}"')
+    if endpoint.pagination_field:
+        args.append(f'items="{endpoint.pagination_field}"')
+    return f"Route({', '.join(args)})"
+
+
+def _generate_route_attributes(resource: Resource, resource_name: str) -> list[str]:
+    """Generate the class attributes holding each method's precompiled Route."""
+    lines = ["    # Routing of each method, resolved once when the class is defined."]
+    for endpoint in resource.endpoints:
+        method_name = generate_method_name(endpoint, resource_name)
+        name = f"{to_snake_case(resource_name)}.{method_name}"
+        lines.append(f"    _{method_name}_route = {_route_literal(endpoint, name)}")
+    lines.append("")
+    return lines
+
+
 def generate_sync_client(resources: dict[str, Resource]) -> str:
     """Generate synchronous client code."""
     lines = [
@@ -655,7 +1035,12 @@ def generate_sync_client(resources: dict[str, Resource]) -> str:
         "",
         "from __future__ import annotations",
         "",
-        "from typing import Any, Optional, Dict, List",
+        "import time",
+        "from concurrent.futures import Future, ThreadPoolExecutor",
+        "from contextlib import nullcontext",
+        "from functools import cached_property",
+        "from pathlib import Path",
+        "from typing import Any, Optional, Dict, Iterable, Iterator, List, Mapping, Tuple, Union",
         "from urllib.parse import quote",
         "",
         "import httpx",
@@ -663,9 +1048,34 @@ def generate_sync_client(resources: dict[str, Resource]) -> str:
         "from .._base import (",
         "    VantageAPIError,",
         "    DEFAULT_BASE_URL,",
+        "    DEFAULT_TIMEOUT,",
+        "    Route,",
+        "    ValidateMode,",
         "    build_query_string,",
+        "    check_validate_mode,",
+        "    decode_json,",
         "    is_multipart_route,",
+        "    next_page_path,",
+        "    parse_model,",
+        "    parse_response,",
         ")",
+        "from .._batch import BatchResult, run_batch, update_pairs",
+        "from .._cache import ResponseCache, cache_scope",
+        "from .._columnar import ColumnarResult",
+        "from .._disk_cache import DiskCache",
+        "from .._export import ExportDownload, download_export, export_finished",
+        "from .._hooks import Hooks, RequestEvent, decode_timed",
+        "from .._ingest import DEFAULT_CHUNK_ROWS, IngestResult, ingest_costs",
+        "from .._json import JSONCodec, get_json_codec",
+        "from .._polling import PollPolicy, Waiter, virtual_tag_processed",
+        "from .._profile import Profiler, get_profiler",
+        "from .._ratelimit import RateLimiter",
+        "from .._retry import DEFAULT_RETRY, RetryPolicy",
+        "from .._sharding import merge_shards, shard_date_range",
+        "from .._singleflight import SingleFlight",
+        "from .._stream import JSONArrayStream",
+        "from .._tracing import get_tracing",
+        "from .._upload import MultipartBody, UploadBody",
         "from .._types import *  # noqa: F401, F403",
         "",
         "",
@@ -677,29 +1087,78 @@ def generate_sync_client(resources: dict[str, Resource]) -> str:
         "        bearer_token: str,",
         "        *,",
         "        base_url: str = DEFAULT_BASE_URL,",
+        "        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,",
+        "        limits: Optional[httpx.Limits] = None,",
+        "        http2: bool = False,",
+        "        transport: Optional[httpx.BaseTransport] = None,",
+        "        retry: Optional[RetryPolicy] = DEFAULT_RETRY,",
+        "        rate_limiter: Optional[RateLimiter] = None,",
+        '        validate: ValidateMode = "full",',
+        "        json_codec: Union[str, JSONCodec, None] = None,",
+        "        cache: Optional[ResponseCache] = None,",
+        "        disk_cache: Optional[DiskCache] = None,",
+        "        coalesce: bool = False,",
+        "        hooks: Optional[Hooks] = None,",
+        "        tracing: Any = None,",
+        "        profile: Union[bool, Profiler] = False,",
         "    ) -> None:",
         "        self._bearer_token = bearer_token",
         "        self._base_url = base_url.rstrip('/')",
+        "        self._retry = retry",
+        "        self._rate_limiter = rate_limiter",
+        "        self._validate = check_validate_mode(validate)",
+        "        self._json = get_json_codec(json_codec)",
+        "        self._cache = cache",
+        "        self._disk_cache = disk_cache",
+        "        self._cache_scope = cache_scope(bearer_token)",
+        "        self._single_flight = SingleFlight() if coalesce else None",
+        "        self._tracing = get_tracing(tracing)",
+        "        self.profiler = get_profiler(profile)",
+        "        if self.profiler is not None:",
+        "            hooks = self.profiler.attach(hooks)",
+        "        # Traced calls are measured through a RequestEvent, which the hooks fill in.",
+        "        self._hooks = Hooks() if hooks is None and self._tracing is not None else hooks",
+        "        # An injected transport may be shared with other clients, so it is left open on close().",
+        "        self._owns_transport = transport is None",
         "        self._http = httpx.Client(",
         '            headers={"Authorization": f"Bearer {bearer_token}"},',
-        "            timeout=30.0,",
+        "            timeout=timeout,",
+        "            limits=limits if limits is not None else httpx.Limits(max_connections=100, max_keepalive_connections=20),",
+        "            http2=http2,",
+        "            transport=transport,",
         "        )",
         "",
-        "        # Initialize resource APIs",
+        "    # Resource APIs are created on first access, keeping client construction cheap.",
     ]
 
-    # Add resource initializers
-    for resource_name in sorted(resources.keys()):
+    # Add lazily created resource attributes
+    for index, resource_name in enumerate(sorted(resources.keys())):
         class_name = to_pascal_case(resource_name) + "Api"
         attr_name = to_snake_case(resource_name)
-        lines.append(f"        self.{attr_name} = {class_name}(self)")
+        if index:
+            lines.append("")
+        lines.extend(
+            [
+                "    @cached_property",
+                f"    def {attr_name}(self) -> {class_name}:",
+                f"        return {class_name}(self)",
+            ]
+        )
 
     lines.extend(
         [
+            "",
+            "    @cached_property",
+            "    def _waiter(self) -> Waiter:",
+            '        """Polls every long-running operation this client waits on."""',
+            "        return Waiter()",
             "",
             "    def close(self) -> None:",
             '        """Close the HTTP client."""',
-            "        self._http.close()",
+            '        if "_waiter" in self.__dict__:',
+            "            self._waiter.close()",
+            "        if self._owns_transport:",
+            "            self._http.close()",
             "",
             "    def __enter__(self) -> SyncClient:",
             "        return self",
@@ -707,85 +1166,138 @@ def generate_sync_client(resources: dict[str, Resource]) -> str:
             "    def __exit__(self, *args: Any) -> None:",
             "        self.close()",
             "",
-            "    def request(",
+        ]
+    )
+    lines.extend(_generate_request_method(resources, is_async=False))
+    lines.extend(
+        [
+            "",
+            "    def _parse(self, model: Any, data: Any, validate: Optional[ValidateMode] = None) -> Any:",
+            '        """Turn a decoded payload into `model` using the per-call or client-level validate mode."""',
+            "        return parse_model(model, data, self._validate if validate is None else validate)",
+            "",
+            "    def _send(",
             "        self,",
             "        method: str,",
             "        path: str,",
+            "        url: str,",
             "        *,",
-            "        params: Optional[Dict[str, Any]] = None,",
-            "        body: Optional[Dict[str, Any]] = None,",
-            "    ) -> Any:",
-            '        """Make a raw API request."""',
-            "        url = self._base_url + path",
-            "",
-            "        if method.upper() == 'GET' and params:",
-            "            url += build_query_string(params)",
-            "            params = None",
-            "",
-            "        if is_multipart_route(path, method):",
-            "            response = self._http.request(",
-            "                method,",
-            "                url,",
-            "                data=body,",
-            "            )",
-            "        else:",
-            "            response = self._http.request(",
-            "                method,",
-            "                url,",
-            "                params=params,",
-            "                json=body,",
-            "            )",
+            "        stream: bool = False,",
+            "        retry: bool = True,",
+            "        event: Optional[RequestEvent] = None,",
+            "        **kwargs: Any,",
+            "    ) -> httpx.Response:",
+            '        """',
+            "        Send a request, pacing it with the rate limiter and retrying transient failures.",
             "",
-        ]
-    )
-
-    # Inject boolean-status path checks (before the generic error check)
-    boolean_prefixes = _collect_boolean_status_prefixes(resources)
-    for method, prefix in boolean_prefixes:
-        lines.extend([
-            f'        if method.upper() == "{method}" and path.startswith("{prefix}"):',
-            "            if response.status_code == 404:",
-            "                return False",
-            "            elif response.is_success:",
-            "                return True",
+            "        Pass `retry=False` when the body cannot be sent twice, such as a stream.",
+            "        Each attempt, retry and transport error is reported to the hooks through `event`.",
+            '        """',
+            "        attempt = 0",
+            "        started = time.monotonic()",
+            "        while True:",
+            "            if self._rate_limiter is not None:",
+            "                wait = self._rate_limiter.reserve(path)",
+            "                if wait > 0:",
+            "                    time.sleep(wait)",
+            "            try:",
+            "                request = self._http.build_request(method, url, **kwargs)",
+            "                if event is not None:",
+            "                    self._hooks.start_attempt(event, request, attempt, asynchronous=False)",
+            "                    if event.span is not None:",
+            "                        self._tracing.inject(event.span, request.headers)",
+            "                response = self._http.send(request, stream=stream)",
+            "            except httpx.TransportError as e:",
+            "                delay = None",
+            "                if self._retry is not None and retry:",
+            "                    delay = self._retry.next_delay(method, attempt, time.monotonic() - started)",
+            "                if delay is None:",
+            "                    if event is not None:",
+            "                        self._hooks.failed(event, e)",
+            "                    raise",
+            "                if event is not None:",
+            "                    self._hooks.retrying(event, delay, e)",
             "            else:",
-            "                raise VantageAPIError(",
-            "                    status=response.status_code,",
-            "                    status_text=response.reason_phrase,",
-            "                    body=response.text,",
+            "                if self._rate_limiter is not None:",
+            "                    self._rate_limiter.observe(path, response.headers)",
+            "                if event is not None:",
+            "                    self._hooks.record_response(event, response)",
+            "                if self._retry is None or not retry:",
+            "                    return response",
+            "                delay = self._retry.next_delay(",
+            "                    method, attempt, time.monotonic() - started, response.status_code, response.headers",
             "                )",
+            "                if delay is None:",
+            "                    return response",
+            "                if event is not None:",
+            "                    self._hooks.retrying(event, delay)",
+            "                response.close()",
+            "            time.sleep(delay)",
+            "            attempt += 1",
             "",
-        ])
-
-    lines.extend(
-        [
-            "        if not response.is_success:",
-            "            raise VantageAPIError(",
-            "                status=response.status_code,",
-            "                status_text=response.reason_phrase,",
-            "                body=response.text,",
-            "            )",
-            "",
-        ]
-    )
-
-    # Inject generated routing: one if-block per handler, checking (method, path)
-    handler_routes = _collect_handler_routes(resources)
-    for handler, routes in sorted(handler_routes.items()):
-        route_set = "{" + ", ".join(f'("{m}", "{p}")' for m, p in sorted(routes)) + "}"
-        lines.append(f"        if (method, path) in {route_set}:")
-        lines.append(f"            return self.{handler}(response)")
-        lines.append("")
-
-    lines.extend(
-        [
-            "        try:",
-            "            data = response.json()",
-            "        except Exception:",
-            "            data = None",
+            "    def _stream_items(",
+            "        self, path: str, params: Optional[Dict[str, Any]], field: str, route: Route",
+            "    ) -> Iterator[Any]:",
+            '        """Yield the decoded items of a paginated GET one at a time, following `links.next`."""',
+            "        next_path: Optional[str] = path + build_query_string(params or {})",
+            "        while next_path is not None:",
+            "            url = self._base_url + next_path",
+            "            event = None",
+            "            if self._hooks is not None:",
+            '                event = RequestEvent("GET", route.path, url)',
+            "            # A page's span stays open while its items are yielded, so it is not made current.",
+            "            with self._tracing.span(route, url, event, current=False) if self._tracing is not None else nullcontext():",
+            '                response = self._send("GET", next_path, url, stream=True, event=event)',
+            "                try:",
+            "                    if not response.is_success:",
+            "                        response.read()",
+            "                        raise self._api_error(response, event)",
+            '                    stream = JSONArrayStream(field, capture={"links"})',
+            "                    for chunk in response.iter_bytes():",
+            "                        yield from stream.feed(chunk)",
+            "                    yield from stream.close()",
+            "                finally:",
+            "                    response.close()",
+            "                if event is not None:",
+            "                    # Items are decoded as the body arrives, so the page reports no separate decode time.",
+            "                    event.items = stream.count",
+            "                    self._hooks.record_response(event, response)",
+            "                    self._hooks.completed(event)",
+            '            next_path = next_page_path(stream.captured.get("links"))',
             "",
+            "    def _collect_pages(",
+            "        self, path: str, params: Optional[Dict[str, Any]], field: str, route: Optional[Route] = None",
+            "    ) -> Dict[str, Any]:",
+            '        """Fetch every page of a paginated GET into one decoded body, following `links.next`."""',
+            '        data = self.request("GET", path, params=params, route=route)',
+            "        items = list(data.get(field) or ())",
+            '        next_path = next_page_path(data.get("links"))',
+            "        while next_path is not None:",
+            '            page = self.request("GET", next_path, route=route)',
+            "            items.extend(page.get(field) or ())",
+            '            next_path = next_page_path(page.get("links"))',
+            "        data[field] = items",
             "        return data",
             "",
+            "    def _collect_shards(",
+            "        self,",
+            "        path: str,",
+            "        params: Dict[str, Any],",
+            "        field: str,",
+            "        shards: List[Tuple[str, str]],",
+            "        concurrency: int,",
+            "        route: Optional[Route] = None,",
+            "    ) -> List[Dict[str, Any]]:",
+            '        """Collect every page of each (start_date, end_date) shard, `concurrency` shards at a time, in shard order."""',
+            "        if concurrency < 1:",
+            '            raise ValueError("concurrency must be at least 1")',
+            "",
+            "        def collect(shard: Tuple[str, str]) -> Dict[str, Any]:",
+            '            return self._collect_pages(path, {**params, "start_date": shard[0], "end_date": shard[1]}, field, route)',
+            "",
+            "        with ThreadPoolExecutor(max_workers=concurrency) as pool:",
+            "            return list(pool.map(collect, shards))",
+            "",
             "    def _request_for_location(self, response: Any) -> str:",
             '        """Extract the Location header from a response."""',
             '        return response.headers["Location"]',
@@ -800,6 +1312,7 @@ def generate_sync_client(resources: dict[str, Resource]) -> str:
         lines.append(f"class {class_name}:")
         lines.append(f'    """API methods for {resource_name} resource."""')
         lines.append("")
+        lines.extend(_generate_route_attributes(resource, resource_name))
         lines.append("    def __init__(self, client: SyncClient) -> None:")
         lines.append("        self._client = client")
         lines.append("")
@@ -808,12 +1321,42 @@ def generate_sync_client(resources: dict[str, Resource]) -> str:
             method_name = generate_method_name(endpoint, resource_name)
             lines.extend(generate_sync_method(endpoint, method_name))
             lines.append("")
+            if endpoint.pagination_field:
+                lines.extend(generate_sync_iterator(endpoint, method_name))
+                lines.append("")
+            if endpoint.streaming:
+                lines.extend(generate_sync_stream(endpoint, method_name))
+                lines.append("")
+            if endpoint.columnar:
+                lines.extend(generate_sync_columnar(endpoint, method_name))
+                lines.append("")
+            if endpoint.sharded:
+                lines.extend(generate_sync_sharded(endpoint, method_name))
+                lines.append("")
+            if endpoint.export_download:
+                lines.extend(generate_sync_export_download(endpoint, method_name))
+                lines.append("")
+            if endpoint.ingest:
+                lines.extend(generate_sync_ingest(endpoint, method_name))
+                lines.append("")
+        for batch_lines in generate_batch_methods(resource, resource_name, is_async=False) + generate_wait_methods(
+            resource, resource_name, is_async=False
+        ):
+            lines.extend(batch_lines)
+            lines.append("")
 
         lines.append("")
 
     return "\n".join(lines)
 
 
+def _body_type(endpoint: Endpoint) -> str:
+    """Annotation of `body`: multipart endpoints also take a CSV file, path or rows."""
+    if endpoint.is_multipart:
+        return "UploadBody"
+    return endpoint.request_body_type or "Any"
+
+
 def generate_sync_method(endpoint: Endpoint, method_name: str) -> list[str]:
     """Generate a synchronous method for an endpoint."""
     lines = []
@@ -833,10 +1376,11 @@ def generate_sync_method(endpoint: Endpoint, method_name: str) -> list[str]:
 
     # Add request body if needed
     if endpoint.request_body_type:
+        body_type = _body_type(endpoint)
         if endpoint.request_body_required:
-            params.append(f"body: {endpoint.request_body_type}")
+            params.append(f"body: {body_type}")
         else:
-            params.append(f"body: Optional[{endpoint.request_body_type}] = None")
+            params.append(f"body: Optional[{body_type}] = None")
 
     # Add query params as kwargs
     if query_params:
@@ -863,13 +1407,17 @@ def generate_sync_method(endpoint: Endpoint, method_name: str) -> list[str]:
         doc_lines.append(".. deprecated::")
 
     # Method signature
-    param_str = ", ".join(["self"] + params) if params else "self"
     if endpoint.boolean_status:
         return_type = "bool"
     elif endpoint.response_handler:
         return_type = endpoint.response_handler_return_type or "Any"
     else:
         return_type = endpoint.response_type or "None"
+    if not (endpoint.boolean_status or endpoint.response_handler) and endpoint.response_type and _returns_model(return_type):
+        if "*" not in params:
+            params.append("*")
+        params.append("validate: Optional[ValidateMode] = None")
+    param_str = ", ".join(["self"] + params) if params else "self"
     lines.append(f"    def {method_name}({param_str}) -> {return_type}:")
 
     # Docstring
@@ -912,15 +1460,21 @@ def generate_sync_method(endpoint: Endpoint, method_name: str) -> list[str]:
     # Make request and coerce response payload into typed models where possible
     if endpoint.boolean_status or endpoint.response_handler:
         lines.append(
-            f'        return self._client.request("{endpoint.method}", path, params=params, body=body_data)'
+            f'        return self._client.request("{endpoint.method}", path, params=params, body=body_data, route=self._{method_name}_route)'
         )
     elif endpoint.response_type is None:
         lines.append(
-            f'        self._client.request("{endpoint.method}", path, params=params, body=body_data)'
+            f'        self._client.request("{endpoint.method}", path, params=params, body=body_data, route=self._{method_name}_route)'
+        )
+    elif _single_model_type(return_type):
+        # Let request() parse the body, straight from bytes when validating.
+        lines.append(
+            f'        return self._client.request("{endpoint.method}", path, params=params, body=body_data, '
+            f'model={_single_model_type(return_type)}, validate=validate, route=self._{method_name}_route)'
         )
     else:
         lines.append(
-            f'        data = self._client.request("{endpoint.method}", path, params=params, body=body_data)'
+            f'        data = self._client.request("{endpoint.method}", path, params=params, body=body_data, route=self._{method_name}_route)'
         )
         _append_response_mapping(lines, return_type, "data")
         lines.append("        return data")
@@ -928,6 +1482,665 @@ def generate_sync_method(endpoint: Endpoint, method_name: str) -> list[str]:
     return lines
 
 
+def generate_iterator_name(method_name: str) -> str:
+    """Name the auto-paginating companion of a paginated method."""
+    if method_name == "list":
+        return "list_all"
+    if method_name.startswith("get_"):
+        return "iter_" + method_name[len("get_"):]
+    return "iter_" + method_name
+
+
+def _iterator_signature(endpoint: Endpoint) -> tuple[list[str], list[str]]:
+    """Build the parameter list of a paginated method and the matching call arguments."""
+    params = []
+    call_args = []
+    query_params = []
+    for param in endpoint.parameters:
+        if param.location == "path":
+            params.append(f"{param.python_name}: {param.param_type}")
+            call_args.append(param.python_name)
+        elif param.location == "query":
+            query_params.append(param)
+    if query_params:
+        params.append("*")
+        for qp in query_params:
+            if qp.required:
+                params.append(f"{qp.python_name}: {qp.param_type}")
+            else:
+                params.append(f"{qp.python_name}: Optional[{qp.param_type}] = None")
+            call_args.append(f"{qp.python_name}={qp.python_name}")
+    return params, call_args
+
+
+def _with_validate(params: list[str]) -> list[str]:
+    """Append the keyword-only `validate` option to a parameter list."""
+    params = list(params)
+    if "*" not in params:
+        params.append("*")
+    params.append("validate: Optional[ValidateMode] = None")
+    return params
+
+
+def generate_sync_iterator(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate a lazy, auto-paginating iterator for a paginated endpoint.
+
+    Pages are fetched as raw dicts and only the yielded items go through the
+    validate mode, so no page-level model is built.
+    """
+    params, call_args = _iterator_signature(endpoint)
+    param_str = ", ".join(["self"] + _with_validate(params))
+    first_page_args = ", ".join(call_args + ['validate="raw"'])
+    item = endpoint.pagination_item_type
+    return [
+        f"    def {generate_iterator_name(method_name)}({param_str}) -> Iterator[{item}]:",
+        f'        """Iterate over every item of `{method_name}`, following `links.next` one page at a time."""',
+        f"        data = self.{method_name}({first_page_args})",
+        "        while True:",
+        '            next_path = next_page_path(data.get("links"))',
+        f'            for item in data.get("{endpoint.pagination_field}") or ():',
+        f"                yield self._client._parse({item}, item, validate)",
+        "            if next_path is None:",
+        "                return",
+        "            del data",
+        f'            data = self._client.request("GET", next_path, route=self._{method_name}_route)',
+    ]
+
+
+def generate_async_iterator(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate a lazy, auto-paginating async iterator for a paginated endpoint.
+
+    With ``concurrency`` > 1 and a ``links.last`` to size the walk, the remaining
+    pages are fetched through a bounded window while items keep their page order.
+    """
+    params, call_args = _iterator_signature(endpoint)
+    if "*" not in params:
+        params.append("*")
+    params.append("concurrency: int = 1")
+    param_str = ", ".join(["self"] + _with_validate(params))
+    first_page_args = ", ".join(call_args + ['validate="raw"'])
+    item = endpoint.pagination_item_type
+    field_name = endpoint.pagination_field
+    return [
+        f"    async def {generate_iterator_name(method_name)}({param_str}) -> AsyncIterator[{item}]:",
+        '        """',
+        f"        Iterate over every item of `{method_name}`, following `links.next` one page at a time.",
+        "",
+        "        With `concurrency` > 1, once `links.last` reveals the page count, up to",
+        "        `concurrency` pages are fetched at once; items are still yielded in page order.",
+        '        """',
+        f"        data = await self.{method_name}({first_page_args})",
+        '        remaining = remaining_page_paths(data.get("links")) if concurrency > 1 else None',
+        "        if remaining:",
+        f'            for item in data.get("{field_name}") or ():',
+        f"                yield self._client._parse({item}, item, validate)",
+        "            del data",
+        "",
+        "            async def fetch(next_path: str) -> Dict[str, Any]:",
+        f'                return await self._client.request("GET", next_path, route=self._{method_name}_route)',
+        "",
+        "            async for data in fetch_pages_in_order(fetch, remaining, concurrency):",
+        f'                for item in data.get("{field_name}") or ():',
+        f"                    yield self._client._parse({item}, item, validate)",
+        "            return",
+        "",
+        "        while True:",
+        '            next_path = next_page_path(data.get("links"))',
+        f'            for item in data.get("{field_name}") or ():',
+        f"                yield self._client._parse({item}, item, validate)",
+        "            if next_path is None:",
+        "                return",
+        "            del data",
+        f'            data = await self._client.request("GET", next_path, route=self._{method_name}_route)',
+    ]
+
+
+def generate_stream_name(method_name: str) -> str:
+    """Name the streaming companion of a paginated method."""
+    if method_name == "list":
+        return "stream"
+    if method_name.startswith("get_"):
+        return "stream_" + method_name[len("get_"):]
+    return "stream_" + method_name
+
+
+def _stream_body(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Build the docstring, path and params of a streaming method."""
+    lines = [
+        '        """',
+        f"        Stream every item of `{method_name}`, decoding each one as it arrives.",
+        "",
+        "        Pages are followed through `links.next`, and each response body is parsed",
+        "        incrementally, so memory is bounded by one item rather than one page.",
+        '        """',
+        f'        path = "/v2{endpoint.path}"',
+    ]
+    query_params = [p for p in endpoint.parameters if p.location == "query"]
+    if query_params:
+        lines.append("        params = {")
+        for qp in query_params:
+            lines.append(f'            "{qp.name}": {qp.python_name},')
+        lines.append("        }")
+    else:
+        lines.append("        params = None")
+    return lines
+
+
+def generate_sync_stream(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate a streaming iterator that decodes items incrementally for a paginated endpoint."""
+    params, _ = _iterator_signature(endpoint)
+    param_str = ", ".join(["self"] + _with_validate(params))
+    return [
+        f"    def {generate_stream_name(method_name)}({param_str}) -> Iterator[{endpoint.pagination_item_type}]:",
+        *_stream_body(endpoint, method_name),
+        f'        for item in self._client._stream_items(path, params, "{endpoint.pagination_field}", self._{method_name}_route):',
+        f"            yield self._client._parse({endpoint.pagination_item_type}, item, validate)",
+    ]
+
+
+def generate_async_stream(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate a streaming async iterator that decodes items incrementally for a paginated endpoint."""
+    params, _ = _iterator_signature(endpoint)
+    param_str = ", ".join(["self"] + _with_validate(params))
+    return [
+        f"    async def {generate_stream_name(method_name)}({param_str}) -> AsyncIterator[{endpoint.pagination_item_type}]:",
+        *_stream_body(endpoint, method_name),
+        f'        async for item in self._client._stream_items(path, params, "{endpoint.pagination_field}", self._{method_name}_route):',
+        f"            yield self._client._parse({endpoint.pagination_item_type}, item, validate)",
+    ]
+
+
+def _columnar_body(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Build the docstring, path, params and result of a columnar method."""
+    numeric, categorical = endpoint.columnar or ((), ())
+    lines = [
+        '        """',
+        f"        Fetch every page of `{method_name}` into column arrays instead of `{endpoint.pagination_item_type}` models.",
+        "",
+        "        Rows are decoded straight into a ColumnarResult, following `links.next`.",
+        f"        Stored as float64: {', '.join(numeric)}.",
+        f"        Dictionary-encoded: {', '.join(categorical)}.",
+        '        """',
+        f'        path = "/v2{endpoint.path}"',
+    ]
+    for pp in endpoint.parameters:
+        if pp.location == "path":
+            lines[-1] = "        path = f" + lines[-1].strip()[len("path = "):].replace(
+                f"{{{pp.name}}}", f"{{quote(str({pp.python_name}), safe='')}}"
+            )
+    query_params = [p for p in endpoint.parameters if p.location == "query"]
+    if query_params:
+        lines.append("        params = {")
+        for qp in query_params:
+            lines.append(f'            "{qp.name}": {qp.python_name},')
+        lines.append("        }")
+    else:
+        lines.append("        params = None")
+    lines.append(f"        result = ColumnarResult(numeric={numeric!r}, categorical={categorical!r})")
+    return lines
+
+
+def generate_sync_columnar(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate a method that decodes every page of a cost endpoint into columns."""
+    params, _ = _iterator_signature(endpoint)
+    param_str = ", ".join(["self"] + params)
+    return [
+        f"    def {method_name}_columnar({param_str}) -> ColumnarResult:",
+        *_columnar_body(endpoint, method_name),
+        f'        for row in self._client._stream_items(path, params, "{endpoint.pagination_field}", self._{method_name}_route):',
+        "            result.append(row)",
+        "        return result",
+    ]
+
+
+def generate_async_columnar(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate an async method that decodes every page of a cost endpoint into columns."""
+    params, _ = _iterator_signature(endpoint)
+    param_str = ", ".join(["self"] + params)
+    return [
+        f"    async def {method_name}_columnar({param_str}) -> ColumnarResult:",
+        *_columnar_body(endpoint, method_name),
+        f'        async for row in self._client._stream_items(path, params, "{endpoint.pagination_field}", self._{method_name}_route):',
+        "            result.append(row)",
+        "        return result",
+    ]
+
+
+def _sharded_signature(endpoint: Endpoint) -> list[str]:
+    """Build the parameter list of a *_sharded method: no `page`, required dates and bin."""
+    params = []
+    for param in endpoint.parameters:
+        if param.location == "path":
+            params.append(f"{param.python_name}: {param.param_type}")
+    params.append("*")
+    for qp in endpoint.parameters:
+        if qp.location != "query" or qp.name == "page":
+            continue
+        if qp.required or qp.name in SHARD_REQUIRED_PARAMS:
+            params.append(f"{qp.python_name}: {qp.param_type}")
+        else:
+            params.append(f"{qp.python_name}: Optional[{qp.param_type}] = None")
+    params.append("shard_bins: Optional[int] = None")
+    params.append("concurrency: int = 4")
+    return _with_validate(params)
+
+
+def _sharded_body(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Build the docstring, path, params and shards of a *_sharded method."""
+    lines = [
+        '        """',
+        f"        Fetch `{method_name}` for a long date range as several smaller queries.",
+        "",
+        "        `start_date`..`end_date` is split on `date_bin` boundaries into shards of",
+        "        `shard_bins` periods (by default 7 days, 4 weeks, 1 month or 1 quarter).",
+        "        Every page of each shard is fetched, up to `concurrency` shards at a time.",
+        "        Items are merged in `accrued_at` order and `total_cost`/`total_usage` are",
+        "        summed across shards.",
+        '        """',
+        f'        path = "/v2{endpoint.path}"',
+    ]
+    for pp in endpoint.parameters:
+        if pp.location == "path":
+            lines[-1] = "        path = f" + lines[-1].strip()[len("path = "):].replace(
+                f"{{{pp.name}}}", f"{{quote(str({pp.python_name}), safe='')}}"
+            )
+    lines.append("        params = {")
+    for qp in endpoint.parameters:
+        if qp.location == "query" and qp.name != "page":
+            lines.append(f'            "{qp.name}": {qp.python_name},')
+    lines.append("        }")
+    lines.append("        shards = shard_date_range(start_date, end_date, date_bin, shard_bins)")
+    return lines
+
+
+def _sharded_merge(endpoint: Endpoint) -> str:
+    descending = ', descending=order == "desc"' if any(
+        p.location == "query" and p.name == "order" for p in endpoint.parameters
+    ) else ""
+    return (
+        f"        return self._client._parse({endpoint.response_type}, "
+        f'merge_shards(pages, "{endpoint.pagination_field}"{descending}), validate)'
+    )
+
+
+def generate_sync_sharded(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate a method that fetches a date range as concurrent date_bin-aligned shards."""
+    param_str = ", ".join(["self"] + _sharded_signature(endpoint))
+    return [
+        f"    def {method_name}_sharded({param_str}) -> {endpoint.response_type}:",
+        *_sharded_body(endpoint, method_name),
+        f"        pages = self._client._collect_shards(",
+        f'            path, params, "{endpoint.pagination_field}", shards, concurrency, self._{method_name}_route',
+        "        )",
+        _sharded_merge(endpoint),
+    ]
+
+
+def generate_async_sharded(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate an async method that fetches a date range as concurrent date_bin-aligned shards."""
+    param_str = ", ".join(["self"] + _sharded_signature(endpoint))
+    return [
+        f"    async def {method_name}_sharded({param_str}) -> {endpoint.response_type}:",
+        *_sharded_body(endpoint, method_name),
+        f"        pages = await self._client._collect_shards(",
+        f'            path, params, "{endpoint.pagination_field}", shards, concurrency, self._{method_name}_route',
+        "        )",
+        _sharded_merge(endpoint),
+    ]
+
+
+def _export_download_signature(endpoint: Endpoint) -> tuple[list[str], list[str]]:
+    """Build the parameter list of export_and_download and the arguments passed on to the export method."""
+    params = []
+    call_args = []
+    for param in endpoint.parameters:
+        if param.location == "path":
+            params.append(f"{param.python_name}: {param.param_type}")
+            call_args.append(param.python_name)
+    params.append(f"body: {endpoint.request_body_type}")
+    call_args.append("body")
+    params.append("dest: Union[str, Path]")
+    params.append("*")
+    for qp in endpoint.parameters:
+        if qp.location == "query":
+            if qp.required:
+                params.append(f"{qp.python_name}: {qp.param_type}")
+            else:
+                params.append(f"{qp.python_name}: Optional[{qp.param_type}] = None")
+            call_args.append(f"{qp.python_name}={qp.python_name}")
+    params.extend(
+        [
+            "concurrency: int = 4",
+            "timeout: Optional[float] = 3600.0",
+            "resume: bool = True",
+            "validate: Optional[ValidateMode] = None",
+        ]
+    )
+    return params, call_args
+
+
+def _export_download_doc(method_name: str) -> list[str]:
+    return [
+        '        """',
+        f"        Generate a data export with `{method_name}`, wait for it and download its files into `dest`.",
+        "",
+        "        The export is polled with a growing interval (up to 30s) until it completes,",
+        "        failing after `timeout` seconds. Its files are streamed to disk `concurrency`",
+        "        at a time and checked against their size and checksum. With `resume`, files",
+        "        already downloaded are kept and partial ones are continued. Use",
+        "        `ExportDownload.rows()` to iterate the CSV rows of all files.",
+        '        """',
+    ]
+
+
+def generate_sync_export_download(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate export_and_download for an endpoint that creates a DataExport."""
+    params, call_args = _export_download_signature(endpoint)
+    param_str = ", ".join(["self"] + params)
+    return [
+        f"    def export_and_download({param_str}) -> ExportDownload:",
+        *_export_download_doc(method_name),
+        f"        location = self.{method_name}({', '.join(call_args)})",
+        "        return download_export(",
+        "            self._client, location, dest, concurrency=concurrency, timeout=timeout, resume=resume, validate=validate",
+        "        )",
+    ]
+
+
+def generate_async_export_download(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate an async export_and_download for an endpoint that creates a DataExport."""
+    params, call_args = _export_download_signature(endpoint)
+    param_str = ", ".join(["self"] + params)
+    return [
+        f"    async def export_and_download({param_str}) -> ExportDownload:",
+        *_export_download_doc(method_name),
+        f"        location = await self.{method_name}({', '.join(call_args)})",
+        "        return await download_export_async(",
+        "            self._client, location, dest, concurrency=concurrency, timeout=timeout, resume=resume, validate=validate",
+        "        )",
+    ]
+
+
+_INGEST_PARAMS = [
+    "source: UploadBody",
+    "*",
+    "fieldnames: Optional[List[str]] = None",
+    "chunk_rows: int = DEFAULT_CHUNK_ROWS",
+    "concurrency: int = 4",
+    "wait: bool = True",
+    "timeout: Optional[float] = 3600.0",
+    "rollback: bool = True",
+    "validate: Optional[ValidateMode] = None",
+]
+
+_INGEST_OPTIONS = (
+    "fieldnames=fieldnames, chunk_rows=chunk_rows, concurrency=concurrency,\n"
+    "            wait=wait, timeout=timeout, rollback=rollback, validate=validate,"
+)
+
+
+def _ingest_doc(method_name: str) -> list[str]:
+    return [
+        '        """',
+        f"        Upload a large cost file through `{method_name}` in concurrent chunks.",
+        "",
+        "        `source` (a path, file or iterable of rows) is read as CSV and split into",
+        "        files of at most `chunk_rows` rows, each with the header; up to `concurrency`",
+        "        are uploaded at once. With `wait`, the uploads are tracked through",
+        "        `get_user_costs_uploads` until they have imported. If any chunk fails, the",
+        "        uploads already made are deleted again (unless `rollback` is False) and",
+        "        IngestionError is raised.",
+        '        """',
+    ]
+
+
+def _ingest_head(endpoint: Endpoint) -> tuple[list[str], str]:
+    path_params = [p.python_name for p in endpoint.parameters if p.location == "path"]
+    params = [f"{name}: str" for name in path_params] + _INGEST_PARAMS
+    return params, ", ".join(path_params)
+
+
+def generate_sync_ingest(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate ingest_costs for an endpoint that creates a UserCostsUpload."""
+    params, path_args = _ingest_head(endpoint)
+    param_str = ", ".join(["self"] + params)
+    return [
+        f"    def ingest_costs({param_str}) -> IngestResult:",
+        *_ingest_doc(method_name),
+        "        return ingest_costs(",
+        f"            self._client, {path_args}, source,",
+        f"            {_INGEST_OPTIONS}",
+        "        )",
+    ]
+
+
+def generate_async_ingest(endpoint: Endpoint, method_name: str) -> list[str]:
+    """Generate an async ingest_costs for an endpoint that creates a UserCostsUpload."""
+    params, path_args = _ingest_head(endpoint)
+    param_str = ", ".join(["self"] + params)
+    return [
+        f"    async def ingest_costs({param_str}) -> IngestResult:",
+        *_ingest_doc(method_name),
+        "        return await ingest_costs_async(",
+        f"            self._client, {path_args}, source,",
+        f"            {_INGEST_OPTIONS}",
+        "        )",
+    ]
+
+
+def _resource_methods(resource: Resource, resource_name: str) -> dict[str, Endpoint]:
+    return {generate_method_name(endpoint, resource_name): endpoint for endpoint in resource.endpoints}
+
+
+def _single_token_param(endpoint: Endpoint) -> Parameter | None:
+    """The path parameter of an endpoint addressed by exactly one token."""
+    path_params = [p for p in endpoint.parameters if p.location == "path"]
+    return path_params[0] if len(path_params) == 1 else None
+
+
+def _return_type(endpoint: Endpoint) -> str:
+    if endpoint.boolean_status:
+        return "bool"
+    if endpoint.response_handler:
+        return endpoint.response_handler_return_type or "Any"
+    return endpoint.response_type or "None"
+
+
+def _generate_many(
+    endpoint: Endpoint,
+    method_name: str,
+    input_param: str,
+    call_args: list[str],
+    doc: list[str],
+    is_async: bool,
+    inputs: str,
+) -> list[str]:
+    """
+    Generate a *_many method that runs `method_name` once per input, `concurrency` at a time.
+
+    `call_args` are the arguments for one input, named `item` in the generated lambda;
+    the endpoint's query parameters and `validate` are passed through to every call.
+    """
+    params = [input_param, "*"]
+    call_args = list(call_args)
+    for qp in endpoint.parameters:
+        if qp.location != "query":
+            continue
+        if qp.required:
+            params.append(f"{qp.python_name}: {qp.param_type}")
+        else:
+            params.append(f"{qp.python_name}: Optional[{qp.param_type}] = None")
+        call_args.append(f"{qp.python_name}={qp.python_name}")
+    params.append("concurrency: int = 4")
+    return_type = _return_type(endpoint)
+    if endpoint.response_type and _single_model_type(return_type) and not endpoint.response_handler:
+        params.append("validate: Optional[ValidateMode] = None")
+        call_args.append("validate=validate")
+    param_str = ", ".join(["self"] + params)
+    prefix = "async " if is_async else ""
+    runner = "await run_batch_async" if is_async else "run_batch"
+    return [
+        f"    {prefix}def {method_name}_many({param_str}) -> BatchResult[{return_type}]:",
+        '        """',
+        *[f"        {line}" if line else "" for line in doc],
+        "",
+        "        Returns one BatchItem per input, in input order. An item that fails records",
+        "        its exception (e.g. VantageAPIError) instead of aborting the batch.",
+        '        """',
+        f"        return {runner}(lambda item: self.{method_name}({', '.join(call_args)}), {inputs}, concurrency)",
+    ]
+
+
+def generate_batch_methods(resource: Resource, resource_name: str, is_async: bool) -> list[list[str]]:
+    """Generate the *_many methods of a resource, one list of lines per method."""
+    methods = _resource_methods(resource, resource_name)
+    noun = resource_name.replace("_", " ")
+    batch = []
+
+    get = methods.get("get")
+    if get is not None and _single_token_param(get) and get.response_type and _single_model_type(get.response_type):
+        token = _single_token_param(get)
+        batch.append(_generate_many(
+            get, "get", f"tokens: Iterable[{token.param_type}]", ["item"],
+            [f"Fetch many {noun} by token, `concurrency` at a time."], is_async, "tokens",
+        ))
+
+    create = methods.get("create")
+    if (
+        create is not None
+        and not any(p.location == "path" for p in create.parameters)
+        and create.request_body_required
+        and not create.is_multipart
+    ):
+        batch.append(_generate_many(
+            create, "create", f"bodies: Iterable[{create.request_body_type}]", ["item"],
+            [f"Create many {noun}, `concurrency` at a time."], is_async, "bodies",
+        ))
+
+    update = methods.get("update")
+    if update is not None and _single_token_param(update) and update.request_body_required and not update.is_multipart:
+        token = _single_token_param(update)
+        body_type = update.request_body_type
+        batch.append(_generate_many(
+            update, "update",
+            f"updates: Union[Mapping[{token.param_type}, {body_type}], Iterable[Tuple[{token.param_type}, {body_type}]]]",
+            ["item[0]", "item[1]"],
+            [
+                f"Update many {noun}, `concurrency` at a time.",
+                "",
+                "`updates` maps tokens to update bodies, as a dict or as (token, body) pairs;",
+                "each BatchItem's input is the (token, body) pair.",
+            ],
+            is_async, "update_pairs(updates)",
+        ))
+
+    delete = methods.get("delete")
+    if delete is not None and _single_token_param(delete) and not delete.request_body_type:
+        token = _single_token_param(delete)
+        batch.append(_generate_many(
+            delete, "delete", f"tokens: Iterable[{token.param_type}]", ["item"],
+            [f"Delete many {noun} by token, `concurrency` at a time."], is_async, "tokens",
+        ))
+    return batch
+
+
+def generate_wait_methods(resource: Resource, resource_name: str, is_async: bool) -> list[list[str]]:
+    """Generate <method>_and_wait and the matching waiter for each route in ASYNC_UPDATE_ROUTES."""
+    names = {(ep.method, ep.path): generate_method_name(ep, resource_name) for ep in resource.endpoints}
+    methods = _resource_methods(resource, resource_name)
+    awaiting = "await " if is_async else ""
+    prefix = "async " if is_async else ""
+    generated = []
+    for endpoint in resource.endpoints:
+        status = ASYNC_UPDATE_ROUTES.get((endpoint.method, endpoint.path))
+        if status is None or (status[0], status[1]) not in names:
+            continue
+        status_method = names[(status[0], status[1])]
+        waiter = status[2]
+        method_name = names[(endpoint.method, endpoint.path)]
+        token = _single_token_param(endpoint)
+        get = methods.get("get")
+        wait_params = "timeout: Optional[float] = 600.0, poll: Optional[PollPolicy] = None"
+        generated.append([
+            f"    {prefix}def {method_name}_and_wait(self, {token.python_name}: {token.param_type}, "
+            f"body: {endpoint.request_body_type}, *, {wait_params}, validate: Optional[ValidateMode] = None) "
+            f"-> {get.response_type}:",
+            '        """',
+            f"        Start `{method_name}` and wait until `{status_method}` reports it done.",
+            "",
+            "        The status is checked right away and then with a growing interval (see",
+            "        PollPolicy), by the client's Waiter. Returns the updated resource. Raises",
+            "        WaitTimeoutError if the update has not finished within `timeout` seconds.",
+            '        """',
+            f'        update = {awaiting}self.{method_name}({token.python_name}, body, validate="raw")',
+            f'        {"(await " if is_async else ""}self.{waiter}([update["request_id"]], timeout=timeout, poll=poll)'
+            f'{")" if is_async else ""}.raise_for_errors()',
+            f"        return {awaiting}self.get({token.python_name}, validate=validate)",
+        ])
+        runner = "await self._client._waiter.wait_all" if is_async else "self._client._waiter.wait_all"
+        status_path = "/v2" + status[1]
+        for param in re.findall(r"\{(\w+)\}", status[1]):
+            status_path = status_path.replace(f"{{{param}}}", "{quote(str(request_id), safe='')}")
+        generated.append([
+            f"    {prefix}def {waiter}(self, request_ids: Iterable[str], *, {wait_params}) -> BatchResult[bool]:",
+            '        """',
+            f"        Wait until `{status_method}` reports every request done.",
+            "",
+            "        All requests are polled by the client's Waiter, with a growing interval",
+            "        each; waits on the same request share its checks. Returns one BatchItem",
+            "        per request ID, in input order; one that has not finished within `timeout`",
+            "        seconds records a WaitTimeoutError.",
+            '        """',
+            f"        return {runner}(",
+            f"            lambda request_id: lambda: self.{status_method}(request_id),",
+            "            request_ids,",
+            f'            key=lambda request_id: f"{status_path}",',
+            "            timeout=timeout,",
+            "            policy=poll,",
+            "        )",
+        ])
+    for endpoint in resource.endpoints:
+        wait = WAIT_ROUTES.get((endpoint.method, endpoint.path))
+        if wait is not None and endpoint.response_type:
+            generated.append(_generate_wait(endpoint, names[(endpoint.method, endpoint.path)], wait, is_async))
+    return generated
+
+
+def _generate_wait(endpoint: Endpoint, method_name: str, wait: tuple[str, str], is_async: bool) -> list[str]:
+    """Generate a method returning a future that resolves once a long-running operation finishes."""
+    wait_name, finished = wait
+    path_params = [p for p in endpoint.parameters if p.location == "path"]
+    params = [f"{p.python_name}: {p.param_type}" for p in path_params]
+    params += ["*", "timeout: Optional[float] = 3600.0", "poll: Optional[PollPolicy] = None", "validate: Optional[ValidateMode] = None"]
+    path = "/v2" + endpoint.path
+    for pp in path_params:
+        path = path.replace(f"{{{pp.name}}}", f"{{quote(str({pp.python_name}), safe='')}}")
+    future_type = "asyncio.Future" if is_async else "Future"
+    model = endpoint.response_type
+    usage = "await it" if is_async else "call `.result()` on it"
+    return [
+        f"    def {wait_name}({', '.join(['self'] + params)}) -> {future_type}[{model}]:",
+        '        """',
+        f"        Return a future that resolves to the {model} once it has finished.",
+        "",
+        f"        `{method_name}` is polled in the background by the client's Waiter, right away",
+        "        and then with a growing interval (see PollPolicy). Waits on the same",
+        "        resource share one status check. The future fails with WaitTimeoutError",
+        "        after `timeout` seconds; cancelling it stops the polling once nothing",
+        f"        else waits on it. To block until done, {usage}.",
+        '        """',
+        f'        path = f"{path}"',
+        "        return self._client._waiter.submit(",
+        f'            lambda: self._client.request("GET", path, route=self._{method_name}_route),',
+        "            key=path,",
+        f"            is_done={finished},",
+        "            timeout=timeout,",
+        "            policy=poll,",
+        f"            transform=lambda data: self._client._parse({model}, data, validate),",
+        "        )",
+    ]
+
+
 def generate_async_client(resources: dict[str, Resource]) -> str:
     """Generate asynchronous client code."""
     lines = [
@@ -935,7 +2148,12 @@ def generate_async_client(resources: dict[str, Resource]) -> str:
         "",
         "from __future__ import annotations",
         "",
-        "from typing import Any, Optional, Dict, List",
+        "import asyncio",
+        "import time",
+        "from contextlib import nullcontext",
+        "from functools import cached_property",
+        "from pathlib import Path",
+        "from typing import Any, Optional, Dict, AsyncIterator, Iterable, List, Mapping, Tuple, Union",
         "from urllib.parse import quote",
         "",
         "import httpx",
@@ -943,9 +2161,36 @@ def generate_async_client(resources: dict[str, Resource]) -> str:
         "from .._base import (",
         "    VantageAPIError,",
         "    DEFAULT_BASE_URL,",
+        "    DEFAULT_TIMEOUT,",
+        "    Route,",
+        "    ValidateMode,",
         "    build_query_string,",
+        "    check_validate_mode,",
+        "    decode_json,",
+        "    fetch_pages_in_order,",
         "    is_multipart_route,",
+        "    next_page_path,",
+        "    parse_model,",
+        "    parse_response,",
+        "    remaining_page_paths,",
         ")",
+        "from .._batch import BatchResult, run_batch_async, update_pairs",
+        "from .._cache import ResponseCache, cache_scope",
+        "from .._columnar import ColumnarResult",
+        "from .._disk_cache import DiskCache",
+        "from .._export import ExportDownload, download_export_async, export_finished",
+        "from .._hooks import Hooks, RequestEvent, decode_timed",
+        "from .._ingest import DEFAULT_CHUNK_ROWS, IngestResult, ingest_costs_async",
+        "from .._json import JSONCodec, get_json_codec",
+        "from .._polling import AsyncWaiter, PollPolicy, virtual_tag_processed",
+        "from .._profile import Profiler, get_profiler",
+        "from .._ratelimit import RateLimiter",
+        "from .._retry import DEFAULT_RETRY, RetryPolicy",
+        "from .._sharding import merge_shards, shard_date_range",
+        "from .._singleflight import AsyncSingleFlight",
+        "from .._stream import JSONArrayStream",
+        "from .._tracing import get_tracing",
+        "from .._upload import MultipartBody, UploadBody",
         "from .._types import *  # noqa: F401, F403",
         "",
         "",
@@ -957,29 +2202,78 @@ def generate_async_client(resources: dict[str, Resource]) -> str:
         "        bearer_token: str,",
         "        *,",
         "        base_url: str = DEFAULT_BASE_URL,",
+        "        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,",
+        "        limits: Optional[httpx.Limits] = None,",
+        "        http2: bool = False,",
+        "        transport: Optional[httpx.AsyncBaseTransport] = None,",
+        "        retry: Optional[RetryPolicy] = DEFAULT_RETRY,",
+        "        rate_limiter: Optional[RateLimiter] = None,",
+        '        validate: ValidateMode = "full",',
+        "        json_codec: Union[str, JSONCodec, None] = None,",
+        "        cache: Optional[ResponseCache] = None,",
+        "        disk_cache: Optional[DiskCache] = None,",
+        "        coalesce: bool = False,",
+        "        hooks: Optional[Hooks] = None,",
+        "        tracing: Any = None,",
+        "        profile: Union[bool, Profiler] = False,",
         "    ) -> None:",
         "        self._bearer_token = bearer_token",
         "        self._base_url = base_url.rstrip('/')",
+        "        self._retry = retry",
+        "        self._rate_limiter = rate_limiter",
+        "        self._validate = check_validate_mode(validate)",
+        "        self._json = get_json_codec(json_codec)",
+        "        self._cache = cache",
+        "        self._disk_cache = disk_cache",
+        "        self._cache_scope = cache_scope(bearer_token)",
+        "        self._single_flight = AsyncSingleFlight() if coalesce else None",
+        "        self._tracing = get_tracing(tracing)",
+        "        self.profiler = get_profiler(profile)",
+        "        if self.profiler is not None:",
+        "            hooks = self.profiler.attach(hooks)",
+        "        # Traced calls are measured through a RequestEvent, which the hooks fill in.",
+        "        self._hooks = Hooks() if hooks is None and self._tracing is not None else hooks",
+        "        # An injected transport may be shared with other clients, so it is left open on close().",
+        "        self._owns_transport = transport is None",
         "        self._http = httpx.AsyncClient(",
         '            headers={"Authorization": f"Bearer {bearer_token}"},',
-        "            timeout=30.0,",
+        "            timeout=timeout,",
+        "            limits=limits if limits is not None else httpx.Limits(max_connections=100, max_keepalive_connections=20),",
+        "            http2=http2,",
+        "            transport=transport,",
         "        )",
         "",
-        "        # Initialize resource APIs",
+        "    # Resource APIs are created on first access, keeping client construction cheap.",
     ]
 
-    # Add resource initializers
-    for resource_name in sorted(resources.keys()):
+    # Add lazily created resource attributes
+    for index, resource_name in enumerate(sorted(resources.keys())):
         class_name = to_pascal_case(resource_name) + "AsyncApi"
         attr_name = to_snake_case(resource_name)
-        lines.append(f"        self.{attr_name} = {class_name}(self)")
+        if index:
+            lines.append("")
+        lines.extend(
+            [
+                "    @cached_property",
+                f"    def {attr_name}(self) -> {class_name}:",
+                f"        return {class_name}(self)",
+            ]
+        )
 
     lines.extend(
         [
+            "",
+            "    @cached_property",
+            "    def _waiter(self) -> AsyncWaiter:",
+            '        """Polls every long-running operation this client waits on."""',
+            "        return AsyncWaiter()",
             "",
             "    async def close(self) -> None:",
             '        """Close the HTTP client."""',
-            "        await self._http.aclose()",
+            '        if "_waiter" in self.__dict__:',
+            "            self._waiter.close()",
+            "        if self._owns_transport:",
+            "            await self._http.aclose()",
             "",
             "    async def __aenter__(self) -> AsyncClient:",
             "        return self",
@@ -987,85 +2281,139 @@ def generate_async_client(resources: dict[str, Resource]) -> str:
             "    async def __aexit__(self, *args: Any) -> None:",
             "        await self.close()",
             "",
-            "    async def request(",
+        ]
+    )
+    lines.extend(_generate_request_method(resources, is_async=True))
+    lines.extend(
+        [
+            "",
+            "    def _parse(self, model: Any, data: Any, validate: Optional[ValidateMode] = None) -> Any:",
+            '        """Turn a decoded payload into `model` using the per-call or client-level validate mode."""',
+            "        return parse_model(model, data, self._validate if validate is None else validate)",
+            "",
+            "    async def _send(",
             "        self,",
             "        method: str,",
             "        path: str,",
+            "        url: str,",
             "        *,",
-            "        params: Optional[Dict[str, Any]] = None,",
-            "        body: Optional[Dict[str, Any]] = None,",
-            "    ) -> Any:",
-            '        """Make a raw API request."""',
-            "        url = self._base_url + path",
-            "",
-            "        if method.upper() == 'GET' and params:",
-            "            url += build_query_string(params)",
-            "            params = None",
-            "",
-            "        if is_multipart_route(path, method):",
-            "            response = await self._http.request(",
-            "                method,",
-            "                url,",
-            "                data=body,",
-            "            )",
-            "        else:",
-            "            response = await self._http.request(",
-            "                method,",
-            "                url,",
-            "                params=params,",
-            "                json=body,",
-            "            )",
+            "        stream: bool = False,",
+            "        retry: bool = True,",
+            "        event: Optional[RequestEvent] = None,",
+            "        **kwargs: Any,",
+            "    ) -> httpx.Response:",
+            '        """',
+            "        Send a request, pacing it with the rate limiter and retrying transient failures.",
             "",
-        ]
-    )
-
-    # Inject boolean-status path checks (before the generic error check)
-    boolean_prefixes = _collect_boolean_status_prefixes(resources)
-    for method, prefix in boolean_prefixes:
-        lines.extend([
-            f'        if method.upper() == "{method}" and path.startswith("{prefix}"):',
-            "            if response.status_code == 404:",
-            "                return False",
-            "            elif response.is_success:",
-            "                return True",
+            "        Pass `retry=False` when the body cannot be sent twice, such as a stream.",
+            "        Each attempt, retry and transport error is reported to the hooks through `event`.",
+            '        """',
+            "        attempt = 0",
+            "        started = time.monotonic()",
+            "        while True:",
+            "            if self._rate_limiter is not None:",
+            "                wait = self._rate_limiter.reserve(path)",
+            "                if wait > 0:",
+            "                    await asyncio.sleep(wait)",
+            "            try:",
+            "                request = self._http.build_request(method, url, **kwargs)",
+            "                if event is not None:",
+            "                    self._hooks.start_attempt(event, request, attempt, asynchronous=True)",
+            "                    if event.span is not None:",
+            "                        self._tracing.inject(event.span, request.headers)",
+            "                response = await self._http.send(request, stream=stream)",
+            "            except httpx.TransportError as e:",
+            "                delay = None",
+            "                if self._retry is not None and retry:",
+            "                    delay = self._retry.next_delay(method, attempt, time.monotonic() - started)",
+            "                if delay is None:",
+            "                    if event is not None:",
+            "                        self._hooks.failed(event, e)",
+            "                    raise",
+            "                if event is not None:",
+            "                    self._hooks.retrying(event, delay, e)",
             "            else:",
-            "                raise VantageAPIError(",
-            "                    status=response.status_code,",
-            "                    status_text=response.reason_phrase,",
-            "                    body=response.text,",
+            "                if self._rate_limiter is not None:",
+            "                    self._rate_limiter.observe(path, response.headers)",
+            "                if event is not None:",
+            "                    self._hooks.record_response(event, response)",
+            "                if self._retry is None or not retry:",
+            "                    return response",
+            "                delay = self._retry.next_delay(",
+            "                    method, attempt, time.monotonic() - started, response.status_code, response.headers",
             "                )",
+            "                if delay is None:",
+            "                    return response",
+            "                if event is not None:",
+            "                    self._hooks.retrying(event, delay)",
+            "                await response.aclose()",
+            "            await asyncio.sleep(delay)",
+            "            attempt += 1",
             "",
-        ])
-
-    lines.extend(
-        [
-            "        if not response.is_success:",
-            "            raise VantageAPIError(",
-            "                status=response.status_code,",
-            "                status_text=response.reason_phrase,",
-            "                body=response.text,",
-            "            )",
-            "",
-        ]
-    )
-
-    # Inject generated routing: one if-block per handler, checking (method, path)
-    handler_routes = _collect_handler_routes(resources)
-    for handler, routes in sorted(handler_routes.items()):
-        route_set = "{" + ", ".join(f'("{m}", "{p}")' for m, p in sorted(routes)) + "}"
-        lines.append(f"        if (method, path) in {route_set}:")
-        lines.append(f"            return self.{handler}(response)")
-        lines.append("")
-
-    lines.extend(
-        [
-            "        try:",
-            "            data = response.json()",
-            "        except Exception:",
-            "            data = None",
+            "    async def _stream_items(",
+            "        self, path: str, params: Optional[Dict[str, Any]], field: str, route: Route",
+            "    ) -> AsyncIterator[Any]:",
+            '        """Yield the decoded items of a paginated GET one at a time, following `links.next`."""',
+            "        next_path: Optional[str] = path + build_query_string(params or {})",
+            "        while next_path is not None:",
+            "            url = self._base_url + next_path",
+            "            event = None",
+            "            if self._hooks is not None:",
+            '                event = RequestEvent("GET", route.path, url)',
+            "            # A page's span stays open while its items are yielded, so it is not made current.",
+            "            with self._tracing.span(route, url, event, current=False) if self._tracing is not None else nullcontext():",
+            '                response = await self._send("GET", next_path, url, stream=True, event=event)',
+            "                try:",
+            "                    if not response.is_success:",
+            "                        await response.aread()",
+            "                        raise self._api_error(response, event)",
+            '                    stream = JSONArrayStream(field, capture={"links"})',
+            "                    async for chunk in response.aiter_bytes():",
+            "                        for item in stream.feed(chunk):",
+            "                            yield item",
+            "                    for item in stream.close():",
+            "                        yield item",
+            "                finally:",
+            "                    await response.aclose()",
+            "                if event is not None:",
+            "                    # Items are decoded as the body arrives, so the page reports no separate decode time.",
+            "                    event.items = stream.count",
+            "                    self._hooks.record_response(event, response)",
+            "                    self._hooks.completed(event)",
+            '            next_path = next_page_path(stream.captured.get("links"))',
             "",
+            "    async def _collect_pages(",
+            "        self, path: str, params: Optional[Dict[str, Any]], field: str, route: Optional[Route] = None",
+            "    ) -> Dict[str, Any]:",
+            '        """Fetch every page of a paginated GET into one decoded body, following `links.next`."""',
+            '        data = await self.request("GET", path, params=params, route=route)',
+            "        items = list(data.get(field) or ())",
+            '        next_path = next_page_path(data.get("links"))',
+            "        while next_path is not None:",
+            '            page = await self.request("GET", next_path, route=route)',
+            "            items.extend(page.get(field) or ())",
+            '            next_path = next_page_path(page.get("links"))',
+            "        data[field] = items",
             "        return data",
             "",
+            "    async def _collect_shards(",
+            "        self,",
+            "        path: str,",
+            "        params: Dict[str, Any],",
+            "        field: str,",
+            "        shards: List[Tuple[str, str]],",
+            "        concurrency: int,",
+            "        route: Optional[Route] = None,",
+            "    ) -> List[Dict[str, Any]]:",
+            '        """Collect every page of each (start_date, end_date) shard, `concurrency` shards at a time, in shard order."""',
+            "        if concurrency < 1:",
+            '            raise ValueError("concurrency must be at least 1")',
+            "",
+            "        def collect(shard: Tuple[str, str]) -> Any:",
+            '            return self._collect_pages(path, {**params, "start_date": shard[0], "end_date": shard[1]}, field, route)',
+            "",
+            "        return [data async for data in fetch_pages_in_order(collect, shards, concurrency)]",
+            "",
             "    def _request_for_location(self, response: Any) -> str:",
             '        """Extract the Location header from a response."""',
             '        return response.headers["Location"]',
@@ -1080,6 +2428,7 @@ def generate_async_client(resources: dict[str, Resource]) -> str:
         lines.append(f"class {class_name}:")
         lines.append(f'    """Async API methods for {resource_name} resource."""')
         lines.append("")
+        lines.extend(_generate_route_attributes(resource, resource_name))
         lines.append("    def __init__(self, client: AsyncClient) -> None:")
         lines.append("        self._client = client")
         lines.append("")
@@ -1088,6 +2437,29 @@ def generate_async_client(resources: dict[str, Resource]) -> str:
             method_name = generate_method_name(endpoint, resource_name)
             lines.extend(generate_async_method(endpoint, method_name))
             lines.append("")
+            if endpoint.pagination_field:
+                lines.extend(generate_async_iterator(endpoint, method_name))
+                lines.append("")
+            if endpoint.streaming:
+                lines.extend(generate_async_stream(endpoint, method_name))
+                lines.append("")
+            if endpoint.columnar:
+                lines.extend(generate_async_columnar(endpoint, method_name))
+                lines.append("")
+            if endpoint.sharded:
+                lines.extend(generate_async_sharded(endpoint, method_name))
+                lines.append("")
+            if endpoint.export_download:
+                lines.extend(generate_async_export_download(endpoint, method_name))
+                lines.append("")
+            if endpoint.ingest:
+                lines.extend(generate_async_ingest(endpoint, method_name))
+                lines.append("")
+        for batch_lines in generate_batch_methods(resource, resource_name, is_async=True) + generate_wait_methods(
+            resource, resource_name, is_async=True
+        ):
+            lines.extend(batch_lines)
+            lines.append("")
 
         lines.append("")
 
@@ -1113,10 +2485,11 @@ def generate_async_method(endpoint: Endpoint, method_name: str) -> list[str]:
 
     # Add request body if needed
     if endpoint.request_body_type:
+        body_type = _body_type(endpoint)
         if endpoint.request_body_required:
-            params.append(f"body: {endpoint.request_body_type}")
+            params.append(f"body: {body_type}")
         else:
-            params.append(f"body: Optional[{endpoint.request_body_type}] = None")
+            params.append(f"body: Optional[{body_type}] = None")
 
     # Add query params as kwargs
     if query_params:
@@ -1143,13 +2516,17 @@ def generate_async_method(endpoint: Endpoint, method_name: str) -> list[str]:
         doc_lines.append(".. deprecated::")
 
     # Method signature
-    param_str = ", ".join(["self"] + params) if params else "self"
     if endpoint.boolean_status:
         return_type = "bool"
     elif endpoint.response_handler:
         return_type = endpoint.response_handler_return_type or "Any"
     else:
         return_type = endpoint.response_type or "None"
+    if not (endpoint.boolean_status or endpoint.response_handler) and endpoint.response_type and _returns_model(return_type):
+        if "*" not in params:
+            params.append("*")
+        params.append("validate: Optional[ValidateMode] = None")
+    param_str = ", ".join(["self"] + params) if params else "self"
     lines.append(f"    async def {method_name}({param_str}) -> {return_type}:")
 
     # Docstring
@@ -1192,15 +2569,21 @@ def generate_async_method(endpoint: Endpoint, method_name: str) -> list[str]:
     # Make request and coerce response payload into typed models where possible
     if endpoint.boolean_status or endpoint.response_handler:
         lines.append(
-            f'        return await self._client.request("{endpoint.method}", path, params=params, body=body_data)'
+            f'        return await self._client.request("{endpoint.method}", path, params=params, body=body_data, route=self._{method_name}_route)'
         )
     elif endpoint.response_type is None:
         lines.append(
-            f'        await self._client.request("{endpoint.method}", path, params=params, body=body_data)'
+            f'        await self._client.request("{endpoint.method}", path, params=params, body=body_data, route=self._{method_name}_route)'
+        )
+    elif _single_model_type(return_type):
+        # Let request() parse the body, straight from bytes when validating.
+        lines.append(
+            f'        return await self._client.request("{endpoint.method}", path, params=params, body=body_data, '
+            f'model={_single_model_type(return_type)}, validate=validate, route=self._{method_name}_route)'
         )
     else:
         lines.append(
-            f'        data = await self._client.request("{endpoint.method}", path, params=params, body=body_data)'
+            f'        data = await self._client.request("{endpoint.method}", path, params=params, body=body_data, route=self._{method_name}_route)'
         )
         _append_response_mapping(lines, return_type, "data")
         lines.append("        return data")
@@ -0,0 +1,83 @@
+"""Track SDK import time with ``python -X importtime``.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --statement "import vantage; vantage.Client('x')"
+    python benchmarks/import_time.py --max-ms 100
+
+Each run happens in a fresh interpreter. The median time spent in top-level
+``vantage`` imports, including any the statement triggers lazily, is reported
+together with the modules that spent the most time importing themselves.
+With ``--max-ms`` the script exits non-zero when the median goes over
+budget, so it can guard cold starts in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(statement: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Run ``statement`` once, returning per-module self times and top-level cumulative times in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_us: Dict[str, int] = {}
+    cumulative_us: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            module = match.group(4)
+            self_us[module] = int(match.group(1))
+            # One space of indentation marks an import made directly by the statement.
+            if len(match.group(3)) == 1:
+                cumulative_us[module] = int(match.group(2))
+    return self_us, cumulative_us
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--statement", default="import vantage", help="Code to time (default: %(default)s).")
+    parser.add_argument("--package", default="vantage", help="Package whose top-level imports are summed.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to run.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules to list.")
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if the median is above this.")
+    args = parser.parse_args(argv)
+
+    # Warm up once so that bytecode compilation is not measured.
+    measure(args.statement)
+    runs = [measure(args.statement) for _ in range(args.runs)]
+
+    totals = [
+        sum(value for module, value in cumulative.items() if module.split(".")[0] == args.package) / 1000
+        for _, cumulative in runs
+    ]
+    median = statistics.median(totals)
+    print(f"{args.statement!r}: {args.package} median {median:.1f} ms over {args.runs} runs")
+
+    self_times: Dict[str, List[int]] = {}
+    for self_us, _ in runs:
+        for module, value in self_us.items():
+            self_times.setdefault(module, []).append(value)
+    slowest = sorted(self_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for module, values in slowest[: args.top]:
+        print(f"  {statistics.median(values) / 1000:8.1f} ms  {module}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"import time {median:.1f} ms is over the {args.max_ms:.1f} ms budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
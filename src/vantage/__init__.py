@@ -20,12 +20,30 @@ Usage:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
-from ._base import VantageAPIError, DEFAULT_BASE_URL
-from ._types import *
+from ._base import VantageAPIError, DEFAULT_BASE_URL, DEFAULT_TIMEOUT, ValidateMode
+from ._polling import AsyncWaiter, PollPolicy, WaitTimeoutError, Waiter
+from ._batch import BatchItem, BatchResult
+from ._cache import DEFAULT_CACHE_TTLS, ResponseCache
+from ._columnar import ColumnarResult
+from ._hooks import Hooks, RequestEvent
+from ._json import JSONCodec
+from ._profile import CallProfile, EndpointStats, Profiler
+from ._ratelimit import RateLimiter
+from ._retry import DEFAULT_RETRY, RetryPolicy
 
 if TYPE_CHECKING:
+    import httpx
+
+    from ._types import *
+
+    from ._disk_cache import DiskCache
+    from ._export import DataExportError, ExportDownload
+    from ._ingest import IngestionError, IngestResult
+    from ._upload import CSVRows
+
     from ._sync.client import SyncClient as _SyncClient
     from ._async.client import AsyncClient as _AsyncClient
 
@@ -34,6 +52,20 @@ def Client(
     bearer_token: str,
     *,
     base_url: str = DEFAULT_BASE_URL,
+    timeout: Union[float, "httpx.Timeout"] = DEFAULT_TIMEOUT,
+    limits: Optional["httpx.Limits"] = None,
+    http2: bool = False,
+    transport: Optional["httpx.BaseTransport"] = None,
+    retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+    rate_limiter: Optional[RateLimiter] = None,
+    validate: ValidateMode = "full",
+    json_codec: Union[str, JSONCodec, None] = None,
+    cache: Optional[ResponseCache] = None,
+    disk_cache: Optional[DiskCache] = None,
+    coalesce: bool = False,
+    hooks: Optional[Hooks] = None,
+    tracing: Any = None,
+    profile: Union[bool, Profiler] = False,
 ) -> "_SyncClient":
     """
     Create a synchronous Vantage API client.
@@ -41,6 +73,39 @@ def Client(
     Args:
         bearer_token: Your Vantage API bearer token.
         base_url: Base URL for the API (default: https://api.vantage.sh).
+        timeout: Request timeout in seconds, or an ``httpx.Timeout`` for
+            per-phase (connect/read/write/pool) timeouts.
+        limits: Connection pool limits (max connections, keep-alive expiry).
+        http2: Enable HTTP/2 multiplexing. Requires ``vantage-python[http2]``.
+        transport: A pre-built ``httpx.BaseTransport``. Pass the same transport
+            to several clients to share one connection pool. It is not closed
+            when the client is closed.
+        retry: Policy for retrying 429/5xx responses and transport errors.
+            Pass ``None`` to disable retries.
+        rate_limiter: A ``RateLimiter`` that paces requests before they are
+            sent. Share one instance between all clients using the same token.
+        validate: How responses become models. ``"full"`` validates them,
+            ``"construct"`` builds models without validation and ``"raw"``
+            returns the decoded JSON dicts. Methods take the same option per call.
+        json_codec: JSON codec for request and response bodies: ``"orjson"``,
+            ``"msgspec"``, ``"json"`` or a ``JSONCodec``. Defaults to the
+            fastest one installed.
+        cache: A ``ResponseCache`` for GETs of read-mostly endpoints. Writes
+            made through the client invalidate the resource's entries.
+        disk_cache: A ``DiskCache`` that keeps cost pages for closed date
+            windows on disk, so only the open period hits the network.
+        coalesce: Share one HTTP call between identical GETs that are in
+            flight at the same time. Each caller parses its own result, but
+            all of them see the same ``httpx.Response`` and, if the call
+            fails, the same exception instance.
+        hooks: ``Hooks`` called before each request, after each response and
+            on retries and errors, with the request's timings and sizes.
+        tracing: OpenTelemetry spans for each API call, off by default. Pass
+            ``True`` to trace with the global ``TracerProvider`` or a
+            ``TracerProvider`` to use. Requires ``vantage-python[otel]``.
+        profile: Record where the time of each call goes (waiting, transfer,
+            JSON decode, validation) in ``client.profiler``. Pass ``True`` or a
+            ``Profiler`` to share one between clients.
 
     Returns:
         A synchronous client instance.
@@ -51,13 +116,44 @@ def Client(
     """
     from ._sync.client import SyncClient
 
-    return SyncClient(bearer_token, base_url=base_url)
+    return SyncClient(
+        bearer_token,
+        base_url=base_url,
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
+        transport=transport,
+        retry=retry,
+        rate_limiter=rate_limiter,
+        validate=validate,
+        json_codec=json_codec,
+        cache=cache,
+        disk_cache=disk_cache,
+        coalesce=coalesce,
+        hooks=hooks,
+        tracing=tracing,
+        profile=profile,
+    )
 
 
 def AsyncClient(
     bearer_token: str,
     *,
     base_url: str = DEFAULT_BASE_URL,
+    timeout: Union[float, "httpx.Timeout"] = DEFAULT_TIMEOUT,
+    limits: Optional["httpx.Limits"] = None,
+    http2: bool = False,
+    transport: Optional["httpx.AsyncBaseTransport"] = None,
+    retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+    rate_limiter: Optional[RateLimiter] = None,
+    validate: ValidateMode = "full",
+    json_codec: Union[str, JSONCodec, None] = None,
+    cache: Optional[ResponseCache] = None,
+    disk_cache: Optional[DiskCache] = None,
+    coalesce: bool = False,
+    hooks: Optional[Hooks] = None,
+    tracing: Any = None,
+    profile: Union[bool, Profiler] = False,
 ) -> "_AsyncClient":
     """
     Create an asynchronous Vantage API client.
@@ -65,6 +161,39 @@ def AsyncClient(
     Args:
         bearer_token: Your Vantage API bearer token.
         base_url: Base URL for the API (default: https://api.vantage.sh).
+        timeout: Request timeout in seconds, or an ``httpx.Timeout`` for
+            per-phase (connect/read/write/pool) timeouts.
+        limits: Connection pool limits (max connections, keep-alive expiry).
+        http2: Enable HTTP/2 multiplexing. Requires ``vantage-python[http2]``.
+        transport: A pre-built ``httpx.AsyncBaseTransport``. Pass the same
+            transport to several clients to share one connection pool. It is
+            not closed when the client is closed.
+        retry: Policy for retrying 429/5xx responses and transport errors.
+            Pass ``None`` to disable retries.
+        rate_limiter: A ``RateLimiter`` that paces requests before they are
+            sent. Share one instance between all clients using the same token.
+        validate: How responses become models. ``"full"`` validates them,
+            ``"construct"`` builds models without validation and ``"raw"``
+            returns the decoded JSON dicts. Methods take the same option per call.
+        json_codec: JSON codec for request and response bodies: ``"orjson"``,
+            ``"msgspec"``, ``"json"`` or a ``JSONCodec``. Defaults to the
+            fastest one installed.
+        cache: A ``ResponseCache`` for GETs of read-mostly endpoints. Writes
+            made through the client invalidate the resource's entries.
+        disk_cache: A ``DiskCache`` that keeps cost pages for closed date
+            windows on disk, so only the open period hits the network.
+        coalesce: Share one HTTP call between identical GETs that are in
+            flight at the same time. Each caller parses its own result, but
+            all of them see the same ``httpx.Response`` and, if the call
+            fails, the same exception instance.
+        hooks: ``Hooks`` called before each request, after each response and
+            on retries and errors, with the request's timings and sizes.
+        tracing: OpenTelemetry spans for each API call, off by default. Pass
+            ``True`` to trace with the global ``TracerProvider`` or a
+            ``TracerProvider`` to use. Requires ``vantage-python[otel]``.
+        profile: Record where the time of each call goes (waiting, transfer,
+            JSON decode, validation) in ``client.profiler``. Pass ``True`` or a
+            ``Profiler`` to share one between clients.
 
     Returns:
         An asynchronous client instance.
@@ -75,4 +204,91 @@ def AsyncClient(
     """
     from ._async.client import AsyncClient as _AsyncClientImpl
 
-    return _AsyncClientImpl(bearer_token, base_url=base_url)
+    return _AsyncClientImpl(
+        bearer_token,
+        base_url=base_url,
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
+        transport=transport,
+        retry=retry,
+        rate_limiter=rate_limiter,
+        validate=validate,
+        json_codec=json_codec,
+        cache=cache,
+        disk_cache=disk_cache,
+        coalesce=coalesce,
+        hooks=hooks,
+        tracing=tracing,
+        profile=profile,
+    )
+
+
+# Exported by ``from vantage import *`` together with ``_LAZY`` and the generated models.
+_PUBLIC = [
+    "AsyncClient",
+    "AsyncWaiter",
+    "BatchItem",
+    "BatchResult",
+    "CallProfile",
+    "Client",
+    "ColumnarResult",
+    "DEFAULT_BASE_URL",
+    "DEFAULT_CACHE_TTLS",
+    "DEFAULT_RETRY",
+    "DEFAULT_TIMEOUT",
+    "EndpointStats",
+    "Hooks",
+    "JSONCodec",
+    "PollPolicy",
+    "Profiler",
+    "RateLimiter",
+    "RequestEvent",
+    "ResponseCache",
+    "RetryPolicy",
+    "ValidateMode",
+    "VantageAPIError",
+    "WaitTimeoutError",
+    "Waiter",
+]
+
+# Names whose modules pull in sqlite3, csv or hashlib, imported on first access.
+_LAZY = {
+    "CSVRows": "._upload",
+    "DataExportError": "._export",
+    "DiskCache": "._disk_cache",
+    "ExportDownload": "._export",
+    "IngestionError": "._ingest",
+    "IngestResult": "._ingest",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load the generated models and the heavier helpers on first access instead of at import."""
+    if name.startswith("__") and name != "__all__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name == "__all__":
+        names = _PUBLIC + list(_LAZY) + _model_names()
+        globals()["__all__"] = names
+        return names
+    if name not in _model_names():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}._types"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY) | set(_model_names()))
+
+
+def _model_names() -> List[str]:
+    """The models defined in ``_types``, leaving out what it imports from typing and pydantic."""
+    _types = importlib.import_module(f"{__name__}._types")
+    return [
+        n for n, v in vars(_types).items() if not n.startswith("_") and getattr(v, "__module__", None) == _types.__name__
+    ]
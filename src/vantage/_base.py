@@ -2,9 +2,41 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, List, Dict, Set
+import re
+from collections import deque
+import typing
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Optional,
+    List,
+    Dict,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from dataclasses import dataclass
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
+
+from ._json import default_codec
+
+# asyncio and pydantic are imported where they are used, so importing the
+# package does not pay for them up front.
+if TYPE_CHECKING:
+    import asyncio
+
+    from pydantic import BaseModel
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+ValidateMode = typing.Literal["full", "construct", "raw"]
+VALIDATE_MODES = typing.get_args(ValidateMode)
 
 
 @dataclass
@@ -21,12 +53,10 @@ class VantageAPIError(Exception):
         # Try to parse errors from JSON body
         if self.body:
             try:
-                import json
-
-                parsed = json.loads(self.body)
+                parsed = default_codec().loads(self.body)
                 if isinstance(parsed, dict) and "errors" in parsed:
                     self.errors = parsed["errors"]
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 pass
 
 
@@ -38,20 +68,41 @@ MULTIPART_ROUTES: Dict[str, Set[str]] = {
 }
 
 
+# The same table compiled once: (path regex, methods).
+_MULTIPART_PATTERNS = [
+    (re.compile(re.sub(r"\{[^}]+\}", r"[^/]+", pattern)), methods)
+    for pattern, methods in MULTIPART_ROUTES.items()
+]
+
+
 def is_multipart_route(path: str, method: str) -> bool:
     """Check if a route uses multipart/form-data."""
-    import re
-
-    for pattern, methods in MULTIPART_ROUTES.items():
-        if method.upper() not in methods:
-            continue
-        # Convert path pattern to regex
-        regex_pattern = re.sub(r"\{[^}]+\}", r"[^/]+", pattern)
-        if re.fullmatch(regex_pattern, path):
+    method = method.upper()
+    for regex, methods in _MULTIPART_PATTERNS:
+        if method in methods and regex.fullmatch(path):
             return True
     return False
 
 
+@dataclass(frozen=True)
+class Route:
+    """
+    How ``request()`` handles one endpoint.
+
+    Generated methods pass a Route built when their class is defined, so
+    ``request()`` does not match the path against the multipart,
+    response-handler and boolean-status tables on every call.
+    """
+
+    method: str
+    path: str  # the path template, or the concrete path for routes looked up per request
+    multipart: bool = False
+    handler: Optional[str] = None  # name of the client method that turns the response into the result
+    boolean_status: bool = False  # 404 -> False, 2xx -> True
+    name: Optional[str] = None  # the client method, e.g. "cost_reports.get"
+    items: Optional[str] = None  # the field listing the items of a paginated response
+
+
 def build_query_string(params: Dict[str, Any]) -> str:
     """Build a URL-safe query string from parameters."""
     if not params:
@@ -71,4 +122,232 @@ def build_query_string(params: Dict[str, Any]) -> str:
     return "?" + "&".join(parts) if parts else ""
 
 
+def _link(links: Any, name: str) -> Optional[str]:
+    """Read a URL from a ``Links`` model or its raw dict form."""
+    if isinstance(links, dict):
+        return links.get(name)
+    return getattr(links, name, None)
+
+
+def next_page_path(links: Any) -> Optional[str]:
+    """Return the path and query of the next page from a ``Links`` object, if any.
+
+    ``links.next`` is an absolute URL; only its path and query are kept so the
+    request goes through the client's own ``base_url``.
+    """
+    next_url = _link(links, "next")
+    if not next_url:
+        return None
+    parts = urlsplit(next_url)
+    return parts.path + ("?" + parts.query if parts.query else "")
+
+
+_PAGE_PARAM = re.compile(r"(?:^|&)page=(\d+)")
+
+
+def remaining_page_paths(links: Any) -> Optional[List[str]]:
+    """Return the paths of every page after the current one.
+
+    The page range is read from ``links.next`` and ``links.last``; each path is
+    ``links.next`` with its ``page`` parameter rewritten, so all other query
+    parameters are preserved verbatim. Returns None when the page count is unknown.
+    """
+    next_path = next_page_path(links)
+    last_url = _link(links, "last")
+    if next_path is None or not last_url:
+        return None
+    path, _, query = next_path.partition("?")
+    first_match = _PAGE_PARAM.search(query)
+    last_match = _PAGE_PARAM.search(urlsplit(last_url).query)
+    if first_match is None or last_match is None:
+        return None
+    first, last = int(first_match.group(1)), int(last_match.group(1))
+    paths = []
+    for page in range(first, last + 1):
+        start, end = first_match.span(1)
+        paths.append(f"{path}?{query[:start]}{page}{query[end:]}")
+    return paths
+
+
+async def fetch_pages_in_order(
+    fetch: Callable[[K], Awaitable[T]],
+    paths: List[K],
+    concurrency: int,
+) -> AsyncIterator[T]:
+    """Fetch ``paths`` (or any other keys) with at most ``concurrency`` requests in flight, yielding results in order."""
+    import asyncio
+
+    remaining = iter(paths)
+    pending: Deque[asyncio.Future[T]] = deque()
+    try:
+        for path in remaining:
+            pending.append(asyncio.ensure_future(fetch(path)))
+            if len(pending) >= concurrency:
+                break
+        while pending:
+            page = await pending.popleft()
+            path = next(remaining, None)
+            if path is not None:
+                pending.append(asyncio.ensure_future(fetch(path)))
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def check_validate_mode(mode: str) -> str:
+    """Return ``mode`` if it is a known validate mode, else raise ValueError."""
+    if mode not in VALIDATE_MODES:
+        raise ValueError(f"validate must be one of {', '.join(map(repr, VALIDATE_MODES))}, got {mode!r}")
+    return mode
+
+
+def parse_model(model: Type[BaseModel], data: Any, mode: str) -> Any:
+    """Turn a decoded JSON payload into ``model`` according to a validate mode.
+
+    ``"full"`` runs Pydantic validation, ``"construct"`` builds the model tree
+    with ``model_construct`` and no validation, and ``"raw"`` returns ``data``
+    as decoded.
+    """
+    if mode == "full":
+        return model.model_validate(data)
+    if mode == "construct":
+        return construct_model(model, data)
+    if mode == "raw":
+        return data
+    raise ValueError(f"validate must be one of {', '.join(map(repr, VALIDATE_MODES))}, got {mode!r}")
+
+
+def decode_json(content: bytes, loads: Callable[[bytes], Any]) -> Any:
+    """Decode a response body, returning None if it is empty or not JSON."""
+    if not content:
+        return None
+    try:
+        return loads(content)
+    except ValueError:
+        return None
+
+
+def parse_response(model: Type[BaseModel], content: bytes, mode: str, loads: Callable[[bytes], Any]) -> Any:
+    """Turn a response body into ``model`` according to a validate mode.
+
+    In ``"full"`` mode the raw bytes go straight to ``model_validate_json``, so
+    no intermediate dict is built. Bodies that are empty, not JSON or not a JSON
+    object are returned decoded as-is, like ``request()`` does.
+    """
+    if mode == "full" and content:
+        from pydantic import ValidationError
+
+        try:
+            return model.model_validate_json(content)
+        except ValidationError:
+            data = decode_json(content, loads)
+            if isinstance(data, dict):
+                raise
+            return data
+    data = decode_json(content, loads)
+    if isinstance(data, dict):
+        return parse_model(model, data, mode)
+    return data
+
+
+@dataclass
+class _ConstructPlan:
+    """How to build one model class from its JSON keys without validation."""
+
+    names: Dict[str, str]  # JSON key (alias) or field name -> field name
+    nested: Dict[str, Tuple[Type[BaseModel], bool]]  # JSON key or field name -> (model class, is a list)
+    defaults: Dict[str, Any]  # immutable defaults, shared by every instance
+    fresh: Dict[str, Any]  # field name -> FieldInfo whose default is a factory or mutable
+    keys: Set[str]  # JSON keys
+    identity: bool  # every JSON key equals its field name
+
+
+_CONSTRUCT_PLANS: Dict[type, _ConstructPlan] = {}
+
+
+def _construct_plan(model: Type[BaseModel]) -> _ConstructPlan:
+    plan = _CONSTRUCT_PLANS.get(model)
+    if plan is None:
+        from pydantic import BaseModel
+
+        plan = _ConstructPlan(names={}, nested={}, defaults={}, fresh={}, keys=set(), identity=True)
+        # The generated models use postponed annotations, so resolve them here.
+        hints = typing.get_type_hints(model)
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            plan.names[key] = name
+            plan.names.setdefault(name, name)
+            plan.keys.add(key)
+            plan.identity = plan.identity and key == name
+            if not field.is_required():
+                if field.default_factory is not None or not _immutable(field.default):
+                    plan.fresh[name] = field
+                else:
+                    plan.defaults[name] = field.default
+            annotation = hints.get(name, field.annotation)
+            # Unwrap Optional[X] to X.
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if typing.get_origin(annotation) is typing.Union and len(args) == 1:
+                annotation = args[0]
+            many = typing.get_origin(annotation) in (list, List)
+            if many:
+                annotation = typing.get_args(annotation)[0]
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                plan.nested[key] = plan.nested[name] = (annotation, many)
+        _CONSTRUCT_PLANS[model] = plan
+    return plan
+
+
+def _immutable(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool, tuple, frozenset))
+
+
+def construct_model(model: Type[BaseModel], data: Any) -> Any:
+    """Build ``model`` and its nested models from trusted data without validating it.
+
+    This is what ``model_construct`` does, minus its per-call field
+    introspection, and nested objects become model instances too, so
+    attribute access works the same as on a validated result. Fields are
+    accepted by alias or by name, factory and mutable defaults are made
+    afresh for each instance, and unknown keys are dropped, as they are by
+    validation.
+    """
+    if not isinstance(data, dict):
+        return data
+    plan = _construct_plan(model)
+    if not plan.nested and plan.identity and plan.keys.issuperset(data):
+        # Flat model whose JSON keys are its field names: no per-key work needed.
+        values = {**plan.defaults, **data}
+        fields_set = set(data)
+    else:
+        values = dict(plan.defaults)
+        fields_set = set()
+        for key, value in data.items():
+            name = plan.names.get(key)
+            if name is None or (name in fields_set and key not in plan.keys):
+                # Unknown, or a field name whose alias was given as well: the alias wins.
+                continue
+            nested = plan.nested.get(key)
+            if nested is not None and value is not None:
+                nested_model, many = nested
+                if many:
+                    value = [construct_model(nested_model, item) for item in value]
+                else:
+                    value = construct_model(nested_model, value)
+            values[name] = value
+            fields_set.add(name)
+    for name, field in plan.fresh.items():
+        if name not in fields_set:
+            values[name] = field.get_default(call_default_factory=True)
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
 DEFAULT_BASE_URL = "https://api.vantage.sh"
+
+DEFAULT_TIMEOUT = 30.0
@@ -0,0 +1,115 @@
+"""Running one API call per item with bounded concurrency, collecting per-item errors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Generic, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from ._base import fetch_pages_in_order
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchItem(Generic[T]):
+    """
+    The outcome of one item of a batch call.
+
+    Attributes:
+        input: The item as passed in, e.g. a token.
+        result: What the call returned, or None if it raised.
+        error: The exception the call raised, or None if it succeeded.
+    """
+
+    input: Any
+    result: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """
+    The outcomes of a batch call, one ``BatchItem`` per input, in input order.
+
+    Iterating yields the items. A failed item does not stop the others; call
+    ``raise_for_errors()`` to turn the first failure into an exception.
+    """
+
+    items: List[BatchItem[T]] = field(default_factory=list)
+
+    def __iter__(self) -> Iterator[BatchItem[T]]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> BatchItem[T]:
+        return self.items[index]
+
+    @property
+    def succeeded(self) -> List[BatchItem[T]]:
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> List[BatchItem[T]]:
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def results(self) -> List[Optional[T]]:
+        """The result of every item in input order, None where it failed."""
+        return [item.result for item in self.items]
+
+    def raise_for_errors(self) -> None:
+        """Re-raise the error of the first failed item, if any."""
+        for item in self.items:
+            if item.error is not None:
+                raise item.error
+
+
+def update_pairs(updates: Union[Mapping[Any, Any], Iterable[Tuple[Any, Any]]]) -> List[Tuple[Any, Any]]:
+    """Turn ``{token: body}`` or ``[(token, body), ...]`` into a list of pairs."""
+    if isinstance(updates, Mapping):
+        return list(updates.items())
+    return [(token, body) for token, body in updates]
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def run_batch(call: Callable[[Any], T], inputs: Iterable[Any], concurrency: int) -> BatchResult[T]:
+    """Call ``call`` on every input, ``concurrency`` at a time, capturing each input's exception."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    _check_concurrency(concurrency)
+
+    def run(value: Any) -> BatchItem[T]:
+        try:
+            return BatchItem(value, call(value))
+        except Exception as e:
+            return BatchItem(value, error=e)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return BatchResult(list(pool.map(run, inputs)))
+
+
+async def run_batch_async(
+    call: Callable[[Any], Awaitable[T]],
+    inputs: Iterable[Any],
+    concurrency: int,
+) -> BatchResult[T]:
+    """Async version of ``run_batch``."""
+    _check_concurrency(concurrency)
+
+    async def run(value: Any) -> BatchItem[T]:
+        try:
+            return BatchItem(value, await call(value))
+        except Exception as e:
+            return BatchItem(value, error=e)
+
+    return BatchResult([item async for item in fetch_pages_in_order(run, list(inputs), concurrency)])
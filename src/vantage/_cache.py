@@ -0,0 +1,173 @@
+"""In-memory response caching shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+# Read-mostly endpoints and how long their responses stay fresh, in seconds.
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+    "/v2/cost_providers": 3600.0,
+    "/v2/cost_services": 3600.0,
+    "/v2/resource_reports/columns": 3600.0,
+    "/v2/workspaces": 300.0,
+    "/v2/me": 300.0,
+    "/v2/tags": 300.0,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and the validators needed to revalidate it."""
+
+    path: str
+    content: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without asking the API."""
+        return time.monotonic() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def revalidation_headers(self) -> Dict[str, str]:
+        """Conditional request headers built from the stored validators."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def canonical_key(scope: str, url: str) -> str:
+    """Key a GET by the caller's scope and its URL with the query parameters sorted."""
+    base, sep, query = url.partition("?")
+    if sep:
+        base += "?" + "&".join(sorted(query.split("&")))
+    return f"{scope} {base}"
+
+
+def cache_scope(bearer_token: str) -> str:
+    """Fingerprint an API token so that clients for different tokens never share entries."""
+    import hashlib
+
+    return hashlib.sha256(bearer_token.encode("utf-8")).hexdigest()[:16]
+
+
+def _under(path: str, prefix: str) -> bool:
+    return path == prefix or path.startswith(prefix.rstrip("/") + "/")
+
+
+def resource_prefix(path: str) -> str:
+    """Return the ``/v2/<resource>`` part of a path, the unit of invalidation."""
+    return "/".join(path.split("/", 3)[:3])
+
+
+class ResponseCache:
+    """
+    A thread-safe LRU cache of successful GET responses.
+
+    Only GETs whose path starts with one of the ``ttls`` prefixes are cached,
+    keyed on the URL with its query parameters in canonical order. A fresh
+    entry is served without a request. Once it expires, an entry that came
+    with an ``ETag`` or ``Last-Modified`` header is revalidated with
+    ``If-None-Match``/``If-Modified-Since``, and a ``304 Not Modified`` renews
+    it. Any other request a client makes to a resource (a create, update or
+    delete) drops that resource's entries.
+
+    Share one instance between clients to share the cached responses; entries
+    are scoped to the client's API token. Subclass
+    it and override ``get``/``put``/``invalidate`` to plug in another store.
+
+    Args:
+        ttls: Seconds each path prefix stays fresh, longest prefix first.
+            Defaults to ``DEFAULT_CACHE_TTLS``. A TTL of 0 revalidates on every
+            use when the API sends validators.
+        max_entries: Maximum number of cached responses; the least recently
+            used are evicted first.
+
+    Example:
+        cache = ResponseCache({"/v2/workspaces": 600, "/v2/me": 60})
+        client = Client("your-token", cache=cache)
+    """
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None, *, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._ttls = dict(
+            sorted((DEFAULT_CACHE_TTLS if ttls is None else ttls).items(), key=lambda item: len(item[0]), reverse=True)
+        )
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Return the TTL for ``path``, or None if it is not cached."""
+        for prefix, ttl in self._ttls.items():
+            if _under(path, prefix):
+                return ttl
+        return None
+
+    def get(self, scope: str, path: str, url: str) -> Optional[CacheEntry]:
+        """Return the entry for a GET, if any. Expired entries without validators are dropped."""
+        key = canonical_key(scope, url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.fresh and not entry.revalidatable:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, scope: str, path: str, url: str, content: bytes, headers: Mapping[str, str]) -> None:
+        """Store a successful GET response, unless its path is not cached or it says ``no-store``."""
+        ttl = self.ttl_for(path)
+        if ttl is None or "no-store" in headers.get("cache-control", ""):
+            return
+        entry = CacheEntry(
+            path=path,
+            content=content,
+            expires_at=time.monotonic() + ttl,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+        key = canonical_key(scope, url)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def refresh(self, entry: CacheEntry, headers: Mapping[str, str]) -> None:
+        """Renew an entry after a ``304 Not Modified``, picking up any new validators."""
+        ttl = self.ttl_for(entry.path) or 0.0
+        with self._lock:
+            entry.expires_at = time.monotonic() + ttl
+            entry.etag = headers.get("etag", entry.etag)
+            entry.last_modified = headers.get("last-modified", entry.last_modified)
+
+    def invalidate(self, path: str) -> None:
+        """Drop every entry of the resource that ``path`` belongs to."""
+        prefix = resource_prefix(path)
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if _under(entry.path, prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,163 @@
+"""Column-oriented results for cost endpoints."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Union
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+    import pyarrow
+
+Column = Union["array[float]", "array[int]", List[Any]]
+
+# Per-row pagination links carry no data worth a column.
+_SKIPPED_KEYS = frozenset({"links"})
+
+
+class ColumnarResult:
+    """
+    Rows decoded straight into column arrays instead of one model per row.
+
+    Numeric columns (such as ``amount``) are stored as ``float64``, with
+    missing values as NaN. Categorical columns (such as ``provider``,
+    ``service`` and ``region``) are dictionary-encoded as integer codes into a
+    table of distinct values, with ``-1`` for missing values. Every other
+    column is a plain list. Columns appear in the order their keys are first
+    seen.
+
+    Use ``to_arrow()``, ``to_numpy()`` or ``to_pandas()`` to hand the data to
+    an analytics stack. These need the optional ``pyarrow``/``numpy``
+    packages (``pip install vantage-python[columnar]``).
+    """
+
+    def __init__(self, numeric: Iterable[str] = (), categorical: Iterable[str] = ()) -> None:
+        self.numeric = frozenset(numeric)
+        self.categorical = frozenset(categorical)
+        self._columns: Dict[str, Column] = {}
+        self._categories: Dict[str, List[Any]] = {}
+        self._category_codes: Dict[str, Dict[Any, int]] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult(rows={self._length}, columns={self.column_names})"
+
+    @property
+    def column_names(self) -> List[str]:
+        """Names of all columns, in the order they were first seen."""
+        return list(self._columns)
+
+    def __getitem__(self, name: str) -> List[Any]:
+        """Return a column as a list, with categorical codes and NaN placeholders decoded."""
+        column = self._columns[name]
+        if name in self.categorical:
+            categories = self._categories[name]
+            return [categories[code] if code >= 0 else None for code in column]
+        if name in self.numeric:
+            return [value if value == value else None for value in column]
+        return list(column)
+
+    def categories(self, name: str) -> List[Any]:
+        """Return the distinct values of a dictionary-encoded column, indexed by code."""
+        return list(self._categories[name])
+
+    def codes(self, name: str) -> "array[int]":
+        """Return the integer codes of a dictionary-encoded column."""
+        return self._columns[name]  # type: ignore[return-value]
+
+    def _missing_value(self, name: str) -> Any:
+        if name in self.numeric:
+            return float("nan")
+        if name in self.categorical:
+            return -1
+        return None
+
+    def _new_column(self, name: str) -> Column:
+        if name in self.numeric:
+            column: Column = array("d", [float("nan")]) * self._length
+        elif name in self.categorical:
+            column = array("l", [-1]) * self._length
+            self._categories[name] = []
+            self._category_codes[name] = {}
+        else:
+            column = [None] * self._length
+        self._columns[name] = column
+        return column
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """Append one decoded JSON row."""
+        for name, value in row.items():
+            if name in _SKIPPED_KEYS:
+                continue
+            column = self._columns.get(name)
+            if column is None:
+                column = self._new_column(name)
+            if name in self.numeric:
+                column.append(float(value) if value is not None else float("nan"))
+            elif name in self.categorical:
+                if value is None:
+                    column.append(-1)
+                    continue
+                codes = self._category_codes[name]
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(codes)
+                    self._categories[name].append(value)
+                column.append(code)
+            else:
+                column.append(value)
+        self._length += 1
+        # Back-fill columns this row did not mention.
+        for name, column in self._columns.items():
+            if len(column) < self._length:
+                column.append(self._missing_value(name))
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Build a ``pyarrow.Table``; categorical columns become dictionary arrays."""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow() requires pyarrow: pip install vantage-python[columnar]") from e
+
+        arrays = {}
+        for name, column in self._columns.items():
+            if name in self.numeric:
+                arrays[name] = pa.array(column, type=pa.float64(), from_pandas=True)
+            elif name in self.categorical:
+                indices = pa.array([code if code >= 0 else None for code in column], type=pa.int32())
+                arrays[name] = pa.DictionaryArray.from_arrays(indices, pa.array(self._categories[name]))
+            else:
+                arrays[name] = pa.array(column)
+        return pa.table(arrays)
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """Return a dict of NumPy arrays; categorical columns are decoded to object arrays."""
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("to_numpy() requires numpy: pip install vantage-python[columnar]") from e
+
+        result = {}
+        for name, column in self._columns.items():
+            if name in self.numeric:
+                result[name] = np.frombuffer(column, dtype=np.float64).copy()
+            elif name in self.categorical:
+                # The trailing None makes code -1 (missing) decode to None.
+                categories = np.array(self._categories[name] + [None], dtype=object)
+                result[name] = categories[np.frombuffer(column, dtype=f"i{column.itemsize}")]
+            else:
+                # Filled element by element so list values (e.g. tags) stay opaque objects.
+                values = np.empty(len(column), dtype=object)
+                for i, value in enumerate(column):
+                    values[i] = value
+                result[name] = values
+        return result
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Build a ``pandas.DataFrame`` through Arrow; categorical columns become ``category`` dtype."""
+        return self.to_arrow().to_pandas()
+
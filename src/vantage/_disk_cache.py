@@ -0,0 +1,126 @@
+"""Persistent SQLite cache for historical cost queries."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from ._cache import canonical_key
+
+# Endpoints whose results for a closed date window do not change.
+DEFAULT_DISK_CACHE_ROUTES = (
+    "/v2/costs",
+    "/v2/unit_costs",
+    "/v2/cost_reports/{cost_report_token}/forecasted_costs",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    content BLOB NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+def _template_regex(template: str) -> "re.Pattern[str]":
+    return re.compile(re.sub(r"\\\{[^}]+\\\}", r"[^/]+", re.escape(template)))
+
+
+class DiskCache:
+    """
+    An opt-in SQLite cache of cost pages for date windows that have closed.
+
+    A GET to one of ``routes`` is cached only when its ``end_date`` is at
+    least ``immutable_after_days`` days in the past, because only then is the
+    data final. Those pages are stored compressed, keyed on the API token and
+    the normalized query (``page`` included), and are served from disk from
+    then on. Queries that reach into the open period, or have no
+    ``end_date``, always go to the network.
+
+    The database uses WAL mode, so several processes can share one file.
+
+    Args:
+        path: SQLite database file, created if missing.
+        immutable_after_days: How many days after ``end_date`` a window
+            counts as closed.
+        routes: Path templates that may be cached. Defaults to
+            ``costs.list``, ``unit_costs.list`` and
+            ``cost_reports.get_forecasted_costs``.
+
+    Example:
+        client = Client("your-token", disk_cache=DiskCache("~/.cache/vantage.db", immutable_after_days=5))
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        immutable_after_days: int = 3,
+        routes: Iterable[str] = DEFAULT_DISK_CACHE_ROUTES,
+    ) -> None:
+        if immutable_after_days < 0:
+            raise ValueError("immutable_after_days must not be negative")
+        self.path = Path(path).expanduser()
+        self.immutable_after_days = immutable_after_days
+        self._routes = [_template_regex(template) for template in routes]
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    def cacheable(self, path: str, url: str) -> bool:
+        """Whether a GET for ``url`` asks for a closed window of a cached route."""
+        # Follow-up pages are requested with their query already in the path.
+        path = path.partition("?")[0]
+        if not any(regex.fullmatch(path) for regex in self._routes):
+            return False
+        end_date = dict(parse_qsl(urlsplit(url).query)).get("end_date")
+        if not end_date:
+            return False
+        try:
+            end = date.fromisoformat(end_date[:10])
+        except ValueError:
+            return False
+        today = datetime.now(timezone.utc).date()
+        return end + timedelta(days=self.immutable_after_days) <= today
+
+    def get(self, scope: str, path: str, url: str) -> Optional[bytes]:
+        """Return the stored body for a cacheable GET, if any."""
+        if not self.cacheable(path, url):
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT content FROM pages WHERE key = ?", (canonical_key(scope, url),)).fetchone()
+        return zlib.decompress(row[0]) if row is not None else None
+
+    def put(self, scope: str, path: str, url: str, content: bytes) -> None:
+        """Store the body of a successful GET if it is for a closed window."""
+        if not self.cacheable(path, url):
+            return
+        blob = zlib.compress(content, 1)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (key, content, stored_at) VALUES (?, ?, ?)",
+                (canonical_key(scope, url), blob, time.time()),
+            )
+
+    def clear(self) -> None:
+        """Delete every stored page."""
+        with self._lock:
+            self._db.execute("DELETE FROM pages")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
@@ -0,0 +1,326 @@
+"""Waiting for data exports and downloading their files."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote, unquote, urlsplit
+
+from ._base import ValidateMode, fetch_pages_in_order
+from ._polling import PollPolicy, WaitTimeoutError
+from ._retry import RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ._async.client import AsyncClient
+    from ._sync.client import SyncClient
+
+# Polling starts fast, since small exports finish within seconds, and slows
+# down geometrically for the multi-minute ones.
+EXPORT_POLL = PollPolicy(initial=1.0, factor=1.5, max_interval=30.0)
+
+# Downloads are resumed from where they stopped, so they can afford more
+# attempts than API calls and have no overall time budget.
+DOWNLOAD_RETRY = RetryPolicy(max_retries=5, backoff_factor=1.0, budget=None)
+
+_FAILED_STATUSES = frozenset({"failed", "errored", "error", "canceled", "cancelled"})
+_CONTENT_RANGE_TOTAL = re.compile(r"bytes \d+-\d+/(\d+)")
+_MD5_HEX = re.compile(r"[0-9a-fA-F]{32}")
+_CHUNK_SIZE = 1 << 20
+
+
+class DataExportError(Exception):
+    """A data export failed, timed out, or one of its files could not be downloaded intact."""
+
+
+@dataclass
+class ExportDownload:
+    """
+    The files of a completed data export.
+
+    Attributes:
+        export: The final ``DataExport``, parsed according to ``validate``.
+        paths: The downloaded files, in manifest order.
+    """
+
+    export: Any
+    paths: List[Path]
+
+    def rows(self) -> Iterator[Dict[str, str]]:
+        """Yield the CSV rows of every file in order, decompressing gzipped files on the fly."""
+        return iter_export_rows(self.paths)
+
+
+def iter_export_rows(paths: List[Path]) -> Iterator[Dict[str, str]]:
+    """Yield the rows of CSV export files as dicts keyed by their header row."""
+    import csv
+    import gzip
+
+    for path in paths:
+        with open(path, "rb") as raw:
+            gzipped = raw.read(2) == b"\x1f\x8b"
+        opener: Any = gzip.open if gzipped else open
+        with opener(path, "rt", encoding="utf-8", newline="") as handle:
+            yield from csv.DictReader(handle)
+
+
+def export_path(location: str) -> str:
+    """Turn the ``Location`` returned by ``create_export`` into the API path of the export."""
+    token = urlsplit(location).path.rstrip("/").rsplit("/", 1)[-1]
+    return "/v2/data_exports/" + quote(token, safe="")
+
+
+def export_finished(export: Mapping[str, Any]) -> bool:
+    """Whether a decoded ``DataExport`` has completed. Raises DataExportError if it failed."""
+    status = str(export.get("status") or "").lower()
+    if status in _FAILED_STATUSES:
+        raise DataExportError(f"data export {export.get('token')} {status}")
+    return status == "completed" or bool((export.get("manifest") or {}).get("completed_at"))
+
+
+def file_targets(urls: List[str], dest: Path) -> List[Path]:
+    """Name each manifest file after its URL, prefixing the index when names repeat."""
+    names = [unquote(urlsplit(url).path.rsplit("/", 1)[-1]) or "export" for url in urls]
+    if len(set(names)) < len(names):
+        names = [f"{index:04d}-{name}" for index, name in enumerate(names)]
+    return [dest / name for name in names]
+
+
+def _partial_path(target: Path) -> Path:
+    return target.with_name(target.name + ".part")
+
+
+def _file_request(http: Union[httpx.Client, httpx.AsyncClient], url: str, offset: int) -> httpx.Request:
+    request = http.build_request("GET", url, headers={"Range": f"bytes={offset}-"} if offset else None)
+    # Manifest URLs are presigned; sending the API token along would be rejected.
+    request.headers.pop("Authorization", None)
+    return request
+
+
+def _expected_size(response: httpx.Response) -> Optional[int]:
+    if response.status_code == 206:
+        match = _CONTENT_RANGE_TOTAL.match(response.headers.get("content-range", ""))
+        return int(match.group(1)) if match else None
+    length = response.headers.get("content-length", "")
+    return int(length) if length.isdigit() else None
+
+
+def _expected_md5(response: httpx.Response) -> Optional[str]:
+    headers = response.headers
+    if response.status_code == 200 and headers.get("content-md5"):
+        return base64.b64decode(headers["content-md5"]).hex()
+    for part in headers.get("x-goog-hash", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name == "md5":
+            return base64.b64decode(value).hex()
+    # A plain (single-part) S3 ETag is the MD5 of the object.
+    etag = headers.get("etag", "").strip('"')
+    return etag.lower() if _MD5_HEX.fullmatch(etag) else None
+
+
+def _open_partial(response: httpx.Response, partial: Path) -> Any:
+    """Open the partial file for a response: append to it for a 206, start over for a 200."""
+    return partial.open("ab" if response.status_code == 206 else "wb")
+
+
+def _verify(partial: Path, size: Optional[int], md5: Optional[str]) -> None:
+    actual = partial.stat().st_size
+    if size is not None and actual != size:
+        partial.unlink()
+        raise DataExportError(f"{partial.name}: expected {size} bytes, got {actual}")
+    if md5 is not None:
+        digest = hashlib.md5(usedforsecurity=False)
+        with partial.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != md5:
+            partial.unlink()
+            raise DataExportError(f"{partial.name}: MD5 {digest.hexdigest()} does not match {md5}")
+
+
+def _failed_download(response: httpx.Response, target: Path) -> DataExportError:
+    return DataExportError(f"downloading {target.name} failed with HTTP {response.status_code}")
+
+
+def _wait(client: SyncClient, location: str, timeout: Optional[float]) -> Dict[str, Any]:
+    path = export_path(location)
+    future = client._waiter.submit(
+        lambda: client.request("GET", path), key=path, is_done=export_finished, timeout=timeout, policy=EXPORT_POLL
+    )
+    try:
+        return future.result()
+    except WaitTimeoutError as e:
+        raise DataExportError(f"data export at {path} did not complete within {timeout} seconds") from e
+    finally:
+        future.cancel()
+
+
+def _download(client: SyncClient, url: str, target: Path, resume: bool) -> Path:
+    import httpx
+
+    if resume and target.exists():
+        return target
+    partial = _partial_path(target)
+    if not resume:
+        partial.unlink(missing_ok=True)
+    attempt = 0
+    while True:
+        offset = partial.stat().st_size if partial.exists() else 0
+        try:
+            response = client._http.send(_file_request(client._http, url, offset), stream=True)
+            try:
+                if response.status_code == 416 and offset:
+                    # The partial file is not a prefix of this object; start over.
+                    partial.unlink()
+                    delay: Optional[float] = 0.0
+                elif response.is_success:
+                    with _open_partial(response, partial) as handle:
+                        # Unbuffered, so that a broken connection loses nothing already received.
+                        for chunk in response.iter_raw():
+                            handle.write(chunk)
+                    _verify(partial, _expected_size(response), _expected_md5(response))
+                    partial.replace(target)
+                    return target
+                else:
+                    delay = DOWNLOAD_RETRY.next_delay("GET", attempt, 0.0, response.status_code, response.headers)
+                    if delay is None:
+                        raise _failed_download(response, target)
+            finally:
+                response.close()
+        except httpx.TransportError:
+            if partial.exists() and partial.stat().st_size > offset:
+                attempt = 0  # progress was made, so this is a fresh failure
+            delay = DOWNLOAD_RETRY.next_delay("GET", attempt, 0.0)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+def download_export(
+    client: SyncClient,
+    location: str,
+    dest: Union[str, Path],
+    *,
+    concurrency: int = 4,
+    timeout: Optional[float] = 3600.0,
+    resume: bool = True,
+    validate: Optional[ValidateMode] = None,
+) -> ExportDownload:
+    """
+    Wait for the data export at ``location`` and download its files into ``dest``.
+
+    The export is polled by the client's Waiter with a growing interval until it
+    completes, fails or ``timeout`` seconds pass. Its manifest files are then streamed to disk,
+    ``concurrency`` at a time. Each file is written to ``<name>.part`` and
+    renamed once its size and, when the server sends one, its MD5 checksum
+    match. With ``resume``, finished files are kept and ``.part`` files are
+    continued with a ``Range`` request, so a failed run can simply be repeated.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ._types import DataExport
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    export = _wait(client, location, timeout)
+    urls = list(export["manifest"]["files"])
+    targets = file_targets(urls, Path(dest).expanduser())
+    if targets:
+        targets[0].parent.mkdir(parents=True, exist_ok=True)
+
+    def download(pair: Tuple[str, Path]) -> Path:
+        return _download(client, pair[0], pair[1], resume)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        paths = list(pool.map(download, zip(urls, targets)))
+    return ExportDownload(client._parse(DataExport, export, validate), paths)
+
+
+async def _wait_async(client: AsyncClient, location: str, timeout: Optional[float]) -> Dict[str, Any]:
+    path = export_path(location)
+    future = client._waiter.submit(
+        lambda: client.request("GET", path), key=path, is_done=export_finished, timeout=timeout, policy=EXPORT_POLL
+    )
+    try:
+        return await future
+    except WaitTimeoutError as e:
+        raise DataExportError(f"data export at {path} did not complete within {timeout} seconds") from e
+
+
+async def _download_async(client: AsyncClient, url: str, target: Path, resume: bool) -> Path:
+    import asyncio
+
+    import httpx
+
+    if resume and target.exists():
+        return target
+    partial = _partial_path(target)
+    if not resume:
+        partial.unlink(missing_ok=True)
+    attempt = 0
+    while True:
+        offset = partial.stat().st_size if partial.exists() else 0
+        try:
+            response = await client._http.send(_file_request(client._http, url, offset), stream=True)
+            try:
+                if response.status_code == 416 and offset:
+                    # The partial file is not a prefix of this object; start over.
+                    partial.unlink()
+                    delay: Optional[float] = 0.0
+                elif response.is_success:
+                    with _open_partial(response, partial) as handle:
+                        # Unbuffered, so that a broken connection loses nothing already received.
+                        async for chunk in response.aiter_raw():
+                            handle.write(chunk)
+                    _verify(partial, _expected_size(response), _expected_md5(response))
+                    partial.replace(target)
+                    return target
+                else:
+                    delay = DOWNLOAD_RETRY.next_delay("GET", attempt, 0.0, response.status_code, response.headers)
+                    if delay is None:
+                        raise _failed_download(response, target)
+            finally:
+                await response.aclose()
+        except httpx.TransportError:
+            if partial.exists() and partial.stat().st_size > offset:
+                attempt = 0  # progress was made, so this is a fresh failure
+            delay = DOWNLOAD_RETRY.next_delay("GET", attempt, 0.0)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def download_export_async(
+    client: AsyncClient,
+    location: str,
+    dest: Union[str, Path],
+    *,
+    concurrency: int = 4,
+    timeout: Optional[float] = 3600.0,
+    resume: bool = True,
+    validate: Optional[ValidateMode] = None,
+) -> ExportDownload:
+    """Async version of ``download_export``."""
+    from ._types import DataExport
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    export = await _wait_async(client, location, timeout)
+    urls = list(export["manifest"]["files"])
+    targets = file_targets(urls, Path(dest).expanduser())
+    if targets:
+        targets[0].parent.mkdir(parents=True, exist_ok=True)
+
+    def download(pair: Tuple[str, Path]) -> Any:
+        return _download_async(client, pair[0], pair[1], resume)
+
+    paths = [path async for path in fetch_pages_in_order(download, list(zip(urls, targets)), concurrency)]
+    return ExportDownload(client._parse(DataExport, export, validate), paths)
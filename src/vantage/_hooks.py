@@ -0,0 +1,236 @@
+"""Instrumentation hooks for observing the requests a client makes."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from ._base import decode_json, parse_model, parse_response
+
+HookFn = Callable[["RequestEvent"], Any]
+
+
+class NetworkTimer:
+    """
+    Collects connection and transfer phases from httpx's ``trace`` request extension.
+
+    ``trace`` is installed on the requests of sync clients and ``atrace`` on
+    those of async clients, which httpcore awaits.
+    """
+
+    def __init__(self) -> None:
+        self.marks: Dict[str, float] = {}
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        # e.g. "connection.connect_tcp.started" or "http11.receive_response_headers.complete"
+        self.marks[name.split(".", 1)[1]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self.trace(name, info)
+
+    def _span(self, start: str, end: str) -> Optional[float]:
+        if start in self.marks and end in self.marks:
+            return self.marks[end] - self.marks[start]
+        return None
+
+    def apply(self, event: RequestEvent) -> None:
+        event.connect = self._span("connect_tcp.started", "connect_tcp.complete")
+        event.tls = self._span("start_tls.started", "start_tls.complete")
+        event.ttfb = self._span("send_request_headers.started", "receive_response_headers.complete")
+        event.transfer = self._span("receive_response_headers.complete", "receive_response_body.complete")
+
+
+@dataclass
+class RequestEvent:
+    """
+    What one API request did, filled in as it progresses.
+
+    The same event is passed to every hook of a request. Durations are in
+    seconds and are None when they were not measured: the connection phases
+    are only reported when a new connection is opened, and transports that do
+    not support the ``trace`` extension (such as ``httpx.MockTransport``)
+    report no network phases at all.
+
+    Attributes:
+        method: HTTP method.
+        route: The templated path, e.g. ``/v2/cost_reports/{cost_report_token}``.
+        url: The full URL requested.
+        attempt: Number of retries made before the current attempt.
+        status: HTTP status of the latest response.
+        request_bytes: Size of the request body.
+        response_bytes: Size of the response body as received.
+        items: Number of items in the page, for paginated endpoints.
+        connect: Time to open the TCP connection, including DNS resolution.
+        tls: Time for the TLS handshake.
+        ttfb: Time from sending the request to receiving the response headers.
+        transfer: Time from the response headers to the end of the body.
+        decode: Time spent decoding the JSON body.
+        validate: Time spent building models from it. In ``"full"`` mode
+            Pydantic parses and validates the raw bytes in one step, which is
+            all counted here. None in ``"raw"`` mode.
+        total: Time for the whole call, including rate-limit waits, retries
+            and parsing.
+        error: The exception, for ``on_error`` and for ``on_retry`` after a
+            transport error.
+        retry_delay: For ``on_retry``, how long the client waits before retrying.
+        span: The OpenTelemetry span of the call when the client traces, for
+            hooks that add their own attributes.
+    """
+
+    method: str
+    route: str
+    url: str
+    attempt: int = 0
+    status: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: Optional[int] = None
+    items: Optional[int] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None
+    transfer: Optional[float] = None
+    decode: Optional[float] = None
+    validate: Optional[float] = None
+    total: Optional[float] = None
+    error: Optional[BaseException] = None
+    retry_delay: Optional[float] = None
+    span: Any = None
+    started: float = field(default_factory=time.perf_counter, init=False, repr=False)
+    _timer: NetworkTimer = field(default_factory=NetworkTimer, init=False, repr=False, compare=False)
+
+
+def _as_list(hooks: Union[HookFn, Sequence[HookFn], None]) -> List[HookFn]:
+    if hooks is None:
+        return []
+    if callable(hooks):
+        return [hooks]
+    return list(hooks)
+
+
+class Hooks:
+    """
+    Callbacks run at each stage of every request a client makes.
+
+    Each argument takes a callable or a list of callables, which receive the
+    ``RequestEvent`` of the request. Hooks are plain functions for async
+    clients too. They run on the thread (or in the task) making the request,
+    so they should be quick. An exception raised by a hook is logged to the
+    ``vantage`` logger and does not affect the request or the other hooks.
+
+    Responses served from the response caches make no request and run no
+    hooks, and neither do GETs coalesced onto an identical one in flight.
+
+    Args:
+        before_request: Called before each attempt is sent.
+        after_response: Called once the final response has been received and
+            decoded, with every timing filled in.
+        on_error: Called when the request fails with a transport error or an
+            error status, before the exception is raised.
+        on_retry: Called when an attempt failed and will be retried.
+
+    Example:
+        def observe(event):
+            LATENCY.labels(event.method, event.route).observe(event.total)
+
+        client = Client("your-api-token", hooks=Hooks(after_response=observe))
+    """
+
+    def __init__(
+        self,
+        *,
+        before_request: Union[HookFn, Sequence[HookFn], None] = None,
+        after_response: Union[HookFn, Sequence[HookFn], None] = None,
+        on_error: Union[HookFn, Sequence[HookFn], None] = None,
+        on_retry: Union[HookFn, Sequence[HookFn], None] = None,
+    ) -> None:
+        self.before_request = _as_list(before_request)
+        self.after_response = _as_list(after_response)
+        self.on_error = _as_list(on_error)
+        self.on_retry = _as_list(on_retry)
+
+    # The clients call these as a request progresses.
+
+    def start_attempt(self, event: RequestEvent, request: Any, attempt: int, asynchronous: bool) -> None:
+        """Prepare ``event`` and ``request`` for one attempt and run ``before_request``."""
+        event.attempt = attempt
+        event.error = None
+        event.retry_delay = None
+        event.request_bytes = _content_length(request.headers)  # 0 for streamed bodies
+        event._timer = NetworkTimer()
+        request.extensions["trace"] = event._timer.atrace if asynchronous else event._timer.trace
+        _run(self.before_request, event)
+
+    def record_response(self, event: RequestEvent, response: Any) -> None:
+        """Copy the status, size and network phases of the latest response onto ``event``."""
+        event.status = response.status_code
+        # Transports that hand over a body already in memory, such as
+        # httpx.MockTransport, download nothing; fall back to Content-Length.
+        event.response_bytes = response.num_bytes_downloaded or _content_length(response.headers)
+        event._timer.apply(event)
+
+    def retrying(self, event: RequestEvent, delay: float, error: Optional[BaseException] = None) -> None:
+        event.retry_delay = delay
+        event.error = error
+        _run(self.on_retry, event)
+
+    def failed(self, event: RequestEvent, error: BaseException) -> None:
+        event.error = error
+        event.total = time.perf_counter() - event.started
+        _run(self.on_error, event)
+
+    def completed(self, event: RequestEvent) -> None:
+        event.total = time.perf_counter() - event.started
+        _run(self.after_response, event)
+
+
+def _run(hooks: List[HookFn], event: RequestEvent) -> None:
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            # A broken metrics or logging hook must not fail the API call.
+            import logging
+
+            logging.getLogger("vantage").exception("hook %r failed for %s %s", hook, event.method, event.route)
+
+
+def _content_length(headers: Any) -> int:
+    length = headers.get("content-length", "")
+    return int(length) if length.isdigit() else 0
+
+
+def decode_timed(
+    content: bytes,
+    model: Any,
+    mode: str,
+    loads: Callable[[bytes], Any],
+    event: RequestEvent,
+    items: Optional[str] = None,
+) -> Any:
+    """
+    Decode a response body like ``request()`` does, recording decode and validate time on ``event``.
+
+    ``items`` names the field listing the items of a paginated response, which
+    are counted into ``event.items``.
+    """
+    started = time.perf_counter()
+    if model is None or mode == "raw":
+        # Nothing is validated here. Raw pages that ``list_all`` validates item
+        # by item are validated after the call, so no validate time is recorded.
+        result = decode_json(content, loads)
+        event.decode = time.perf_counter() - started
+    elif mode == "full":
+        result = parse_response(model, content, mode, loads)
+        event.validate = time.perf_counter() - started
+    else:
+        data = decode_json(content, loads)
+        decoded = time.perf_counter()
+        event.decode = decoded - started
+        result = parse_model(model, data, mode) if isinstance(data, dict) else data
+        event.validate = time.perf_counter() - decoded
+    if items is not None:
+        page = result.get(items) if isinstance(result, dict) else getattr(result, items, None)
+        if isinstance(page, list):
+            event.items = len(page)
+    return result
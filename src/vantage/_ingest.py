@@ -0,0 +1,442 @@
+"""Chunked, concurrent custom-provider cost uploads with rollback."""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+from ._base import ValidateMode, VantageAPIError
+from ._polling import DEFAULT_POLL
+from ._retry import RetryPolicy
+from ._upload import CSVRows
+
+if TYPE_CHECKING:
+    from ._async.client import AsyncClient
+    from ._sync.client import SyncClient
+
+T = TypeVar("T")
+
+# Rows per uploaded file when the caller does not say otherwise.
+DEFAULT_CHUNK_ROWS = 50_000
+
+# Chunk uploads are POSTs, which the client never retries itself. A chunk is
+# rebuilt from its rows in memory and sent again after transport errors and
+# retryable statuses, up to this many times, before the ingestion gives up.
+CHUNK_RETRY = RetryPolicy(max_retries=3, backoff_factor=1.0, budget=120.0, methods=frozenset({"POST"}))
+
+_PENDING_STATUSES = frozenset({"pending", "queued", "processing", "importing", "in_progress"})
+_FAILED_STATUSES = frozenset({"failed", "errored", "error"})
+
+
+class IngestionError(Exception):
+    """
+    A chunked cost upload failed.
+
+    Attributes:
+        uploads: Decoded ``UserCostsUpload``s that are still on the integration,
+            i.e. those that were not rolled back.
+        rolled_back: Tokens of the uploads that were deleted again.
+    """
+
+    def __init__(self, message: str, uploads: List[Dict[str, Any]], rolled_back: List[str]) -> None:
+        super().__init__(message)
+        self.uploads = uploads
+        self.rolled_back = rolled_back
+
+
+@dataclass
+class IngestResult:
+    """
+    The uploads created for one ingested cost file.
+
+    Attributes:
+        uploads: One ``UserCostsUpload`` per chunk, in file order, parsed
+            according to ``validate``. With ``wait``, these carry the final
+            import status.
+        rows: Number of data rows uploaded.
+    """
+
+    uploads: List[Any] = field(default_factory=list)
+    rows: int = 0
+
+
+def _csv_reader(source: Any, cleanup: List[Callable[[], Any]]) -> Iterator[List[str]]:
+    if isinstance(source, (str, os.PathLike)):
+        handle: Any = open(source, newline="", encoding="utf-8")
+        cleanup.append(handle.close)
+    elif isinstance(source, io.TextIOBase):
+        handle = source
+    else:
+        handle = io.TextIOWrapper(source, encoding="utf-8", newline="")
+        # Detach rather than close, which would close the caller's file too.
+        cleanup.append(handle.detach)
+    return csv.reader(handle)
+
+
+def read_rows(
+    source: Any,
+    fieldnames: Optional[Sequence[str]],
+    cleanup: List[Callable[[], Any]],
+) -> Tuple[List[str], Iterator[Sequence[Any]]]:
+    """
+    Return the header and the data rows of a CSV source.
+
+    A path or file is read as CSV with its first line as the header. An
+    iterable of mappings takes its header from ``fieldnames`` or the first
+    row's keys; an iterable of sequences from ``fieldnames`` or its first row.
+    Callbacks that release files opened here are appended to ``cleanup``.
+    """
+    if isinstance(source, (str, os.PathLike)) or hasattr(source, "read"):
+        rows: Iterator[Any] = _csv_reader(source, cleanup)
+        header = next(rows, None)
+        return list(fieldnames or header or ()), rows
+    rows = iter(source)
+    first = next(rows, None)
+    if first is None:
+        return list(fieldnames or ()), iter(())
+    if isinstance(first, Mapping):
+        names = list(fieldnames or first)
+
+        def values() -> Iterator[List[Any]]:
+            for row in _chain(first, rows):
+                yield [row.get(name) for name in names]
+
+        return names, values()
+    if fieldnames is None:
+        return list(first), rows
+    return list(fieldnames), _chain(first, rows)
+
+
+def _chain(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
+
+
+def iter_chunks(rows: Iterable[Sequence[Any]], chunk_rows: int) -> Iterator[List[Sequence[Any]]]:
+    """Group rows into lists of at most ``chunk_rows``, reading one chunk at a time."""
+    chunk: List[Sequence[Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_guarded(chunks: Iterator[T], errors: List[BaseException]) -> Iterator[T]:
+    """Yield from ``chunks`` until reading fails, recording the exception in ``errors``."""
+    try:
+        yield from chunks
+    except Exception as e:
+        errors.append(e)
+
+
+def chunk_stem(source: Any) -> str:
+    """Base name of the chunk files: the source file's name without extension, or ``costs``."""
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", None)
+    return Path(str(name)).stem if isinstance(name, (str, os.PathLike)) else "costs"
+
+
+def import_finished(upload: Mapping[str, Any]) -> bool:
+    """Whether a decoded ``UserCostsUpload`` is done importing, successfully or not."""
+    return str(upload.get("import_status") or "").lower() not in _PENDING_STATUSES
+
+
+def import_failed(upload: Mapping[str, Any]) -> bool:
+    return str(upload.get("import_status") or "").lower() in _FAILED_STATUSES
+
+
+def chunk_retry_delay(error: BaseException, attempt: int, elapsed: float) -> Optional[float]:
+    """Seconds to wait before sending a chunk again after ``error``, or None to give up."""
+    import httpx
+
+    if isinstance(error, VantageAPIError):
+        return CHUNK_RETRY.next_delay("POST", attempt, elapsed, error.status)
+    if isinstance(error, httpx.TransportError):
+        return CHUNK_RETRY.next_delay("POST", attempt, elapsed)
+    return None
+
+
+def _check_options(chunk_rows: int, concurrency: int) -> None:
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def _rollback(
+    client: SyncClient, integration_token: str, uploads: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    kept, deleted = [], []
+    for upload in uploads:
+        try:
+            client.integrations.delete_user_costs_upload(integration_token, upload["token"])
+        except Exception:
+            kept.append(upload)
+        else:
+            deleted.append(upload["token"])
+    return kept, deleted
+
+
+def _wait_for_imports(
+    client: SyncClient,
+    integration_token: str,
+    uploads: List[Dict[str, Any]],
+    timeout: Optional[float],
+) -> List[Dict[str, Any]]:
+    by_token = {upload["token"]: upload for upload in uploads}
+    remaining = {token for token, upload in by_token.items() if not import_finished(upload)}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delays = DEFAULT_POLL.delays()
+    while remaining:
+        delay = next(delays)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise IngestionError(f"{len(remaining)} uploads still importing after {timeout} seconds", uploads, [])
+        time.sleep(delay)
+        for upload in client.integrations.iter_user_costs_uploads(integration_token, validate="raw"):
+            if upload["token"] in remaining and import_finished(upload):
+                by_token[upload["token"]] = upload
+                remaining.discard(upload["token"])
+    return [by_token[upload["token"]] for upload in uploads]
+
+
+def ingest_costs(
+    client: SyncClient,
+    integration_token: str,
+    source: Any,
+    *,
+    fieldnames: Optional[Sequence[str]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    concurrency: int = 4,
+    wait: bool = True,
+    timeout: Optional[float] = 3600.0,
+    rollback: bool = True,
+    validate: Optional[ValidateMode] = None,
+) -> IngestResult:
+    """
+    Upload a large custom-provider cost file as several smaller uploads.
+
+    ``source`` is read as CSV and split into files of at most ``chunk_rows``
+    data rows, each with the header. Up to ``concurrency`` chunks are uploaded
+    at once, and only those are held in memory. With ``wait``, the uploads are
+    then tracked through ``get_user_costs_uploads`` until they have imported.
+
+    A chunk whose upload hits a transport error or a retryable status is
+    sent again, rebuilt from its rows, as ``CHUNK_RETRY`` allows. If a chunk
+    still fails to upload, or reading ``source`` fails partway through, no
+    further chunks are sent. When that happens, or a chunk fails to import
+    or is still importing after ``timeout`` seconds, the uploads already
+    created are deleted with ``delete_user_costs_upload`` if ``rollback`` is
+    set. An ``IngestionError`` is raised either way.
+    """
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_for
+
+    from ._types import UserCostsUpload
+
+    _check_options(chunk_rows, concurrency)
+    cleanup: List[Callable[[], Any]] = []
+    uploaded: Dict[int, Dict[str, Any]] = {}
+    errors: List[BaseException] = []
+    rows = 0
+    try:
+        header, data = read_rows(source, fieldnames, cleanup)
+        stem = chunk_stem(source)
+
+        def upload(index: int, chunk: List[Sequence[Any]]) -> Dict[str, Any]:
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    return client.integrations.create_user_costs_upload_via_csv(
+                        integration_token,
+                        CSVRows(chunk, header, filename=f"{stem}-{index + 1:04d}.csv"),
+                        validate="raw",
+                    )
+                except Exception as e:
+                    delay = chunk_retry_delay(e, attempt, time.monotonic() - started)
+                    if delay is None:
+                        raise
+                time.sleep(delay)
+                attempt += 1
+
+        def collect(done: Iterable[Future[Any]], pending: Dict[Future[Any], int]) -> None:
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    uploaded[index] = future.result()
+                except Exception as e:
+                    errors.append(e)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pending: Dict[Future[Any], int] = {}
+            for index, chunk in enumerate(read_guarded(iter_chunks(data, chunk_rows), errors)):
+                pending[pool.submit(upload, index, chunk)] = index
+                rows += len(chunk)
+                if len(pending) >= concurrency:
+                    collect(wait_for(pending, return_when=FIRST_COMPLETED)[0], pending)
+                if errors:
+                    break
+            collect(wait_for(pending)[0], pending)
+    finally:
+        for release in cleanup:
+            release()
+
+    uploads = [uploaded[index] for index in sorted(uploaded)]
+    if not errors and wait:
+        try:
+            uploads = _wait_for_imports(client, integration_token, uploads, timeout)
+        except Exception as e:
+            errors.append(e)
+        else:
+            if any(import_failed(upload) for upload in uploads):
+                errors.append(IngestionError("an upload failed to import", uploads, []))
+    if errors:
+        kept, deleted = _rollback(client, integration_token, uploads) if rollback else (uploads, [])
+        raise IngestionError(f"ingesting costs failed: {errors[0]}", kept, deleted) from errors[0]
+    return IngestResult([client._parse(UserCostsUpload, upload, validate) for upload in uploads], rows)
+
+
+async def _rollback_async(
+    client: AsyncClient, integration_token: str, uploads: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    kept, deleted = [], []
+    for upload in uploads:
+        try:
+            await client.integrations.delete_user_costs_upload(integration_token, upload["token"])
+        except Exception:
+            kept.append(upload)
+        else:
+            deleted.append(upload["token"])
+    return kept, deleted
+
+
+async def _wait_for_imports_async(
+    client: AsyncClient,
+    integration_token: str,
+    uploads: List[Dict[str, Any]],
+    timeout: Optional[float],
+) -> List[Dict[str, Any]]:
+    import asyncio
+
+    by_token = {upload["token"]: upload for upload in uploads}
+    remaining = {token for token, upload in by_token.items() if not import_finished(upload)}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delays = DEFAULT_POLL.delays()
+    while remaining:
+        delay = next(delays)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise IngestionError(f"{len(remaining)} uploads still importing after {timeout} seconds", uploads, [])
+        await asyncio.sleep(delay)
+        async for upload in client.integrations.iter_user_costs_uploads(integration_token, validate="raw"):
+            if upload["token"] in remaining and import_finished(upload):
+                by_token[upload["token"]] = upload
+                remaining.discard(upload["token"])
+    return [by_token[upload["token"]] for upload in uploads]
+
+
+async def ingest_costs_async(
+    client: AsyncClient,
+    integration_token: str,
+    source: Any,
+    *,
+    fieldnames: Optional[Sequence[str]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    concurrency: int = 4,
+    wait: bool = True,
+    timeout: Optional[float] = 3600.0,
+    rollback: bool = True,
+    validate: Optional[ValidateMode] = None,
+) -> IngestResult:
+    """
+    Async version of ``ingest_costs``.
+
+    If the call is cancelled, the chunk uploads in flight are cancelled too
+    and, with ``rollback``, the uploads already created are deleted before
+    the cancellation propagates.
+    """
+    import asyncio
+
+    from ._types import UserCostsUpload
+
+    _check_options(chunk_rows, concurrency)
+    cleanup: List[Callable[[], Any]] = []
+    uploaded: Dict[int, Dict[str, Any]] = {}
+    errors: List[BaseException] = []
+    cancelled: Optional[BaseException] = None
+    pending: Dict[asyncio.Future[Any], int] = {}
+    rows = 0
+
+    def collect(done: Iterable[asyncio.Future[Any]], pending: Dict[asyncio.Future[Any], int]) -> None:
+        for future in done:
+            index = pending.pop(future)
+            if future.cancelled():
+                continue
+            try:
+                uploaded[index] = future.result()
+            except Exception as e:
+                errors.append(e)
+
+    try:
+        header, data = read_rows(source, fieldnames, cleanup)
+        stem = chunk_stem(source)
+
+        async def upload(index: int, chunk: List[Sequence[Any]]) -> Dict[str, Any]:
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    return await client.integrations.create_user_costs_upload_via_csv(
+                        integration_token,
+                        CSVRows(chunk, header, filename=f"{stem}-{index + 1:04d}.csv"),
+                        validate="raw",
+                    )
+                except Exception as e:
+                    delay = chunk_retry_delay(e, attempt, time.monotonic() - started)
+                    if delay is None:
+                        raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        for index, chunk in enumerate(read_guarded(iter_chunks(data, chunk_rows), errors)):
+            pending[asyncio.ensure_future(upload(index, chunk))] = index
+            rows += len(chunk)
+            if len(pending) >= concurrency:
+                collect((await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED))[0], pending)
+            if errors:
+                break
+        if pending:
+            collect((await asyncio.wait(pending))[0], pending)
+    except asyncio.CancelledError as e:
+        cancelled = e
+    finally:
+        if pending:
+            # Left early: stop the uploads still running rather than leave them behind.
+            for task in pending:
+                task.cancel()
+            collect((await asyncio.wait(pending))[0], pending)
+        for release in cleanup:
+            release()
+
+    uploads = [uploaded[index] for index in sorted(uploaded)]
+    if not errors and cancelled is None and wait:
+        try:
+            uploads = await _wait_for_imports_async(client, integration_token, uploads, timeout)
+        except asyncio.CancelledError as e:
+            cancelled = e
+        except Exception as e:
+            errors.append(e)
+        else:
+            if any(import_failed(upload) for upload in uploads):
+                errors.append(IngestionError("an upload failed to import", uploads, []))
+    if errors or cancelled is not None:
+        kept, deleted = await _rollback_async(client, integration_token, uploads) if rollback else (uploads, [])
+        if cancelled is not None:
+            raise cancelled
+        raise IngestionError(f"ingesting costs failed: {errors[0]}", kept, deleted) from errors[0]
+    return IngestResult([client._parse(UserCostsUpload, upload, validate) for upload in uploads], rows)
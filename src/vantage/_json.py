@@ -0,0 +1,93 @@
+"""Pluggable JSON encoding and decoding shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """
+    A pair of functions that encode request bodies and decode response bodies.
+
+    ``dumps`` turns a JSON-compatible value into UTF-8 bytes and ``loads``
+    parses bytes (or text) back. Responses validated in ``"full"`` mode skip
+    the codec and are parsed by Pydantic straight from the raw bytes.
+
+    Args:
+        name: A label for the codec, e.g. ``"orjson"``.
+        dumps: Encoder returning UTF-8 JSON bytes.
+        loads: Decoder accepting bytes or text.
+
+    Example:
+        client = Client("your-token", json_codec="msgspec")
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    # Same compact output as httpx's own ``json=`` encoding.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+STDLIB_CODEC = JSONCodec("json", _stdlib_dumps, json.loads)
+
+
+def orjson_codec() -> JSONCodec:
+    """Build a codec backed by ``orjson``. Raises ImportError if it is not installed."""
+    import orjson
+
+    return JSONCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def msgspec_codec() -> JSONCodec:
+    """Build a codec backed by ``msgspec``. Raises ImportError if it is not installed."""
+    import msgspec
+
+    return JSONCodec("msgspec", msgspec.json.encode, msgspec.json.decode)
+
+
+_FACTORIES = {
+    "orjson": orjson_codec,
+    "msgspec": msgspec_codec,
+    "json": lambda: STDLIB_CODEC,
+}
+
+_default: Optional[JSONCodec] = None
+
+
+def default_codec() -> JSONCodec:
+    """Return the fastest installed codec: orjson, then msgspec, then the stdlib."""
+    global _default
+    if _default is None:
+        for factory in (orjson_codec, msgspec_codec):
+            try:
+                _default = factory()
+                break
+            except ImportError:
+                continue
+        else:
+            _default = STDLIB_CODEC
+    return _default
+
+
+def get_json_codec(codec: Union[str, JSONCodec, None]) -> JSONCodec:
+    """
+    Resolve the ``json_codec`` client option.
+
+    Accepts None (pick automatically), ``"orjson"``, ``"msgspec"``, ``"json"``
+    or a ``JSONCodec`` instance.
+    """
+    if codec is None:
+        return default_codec()
+    if isinstance(codec, JSONCodec):
+        return codec
+    factory = _FACTORIES.get(codec)
+    if factory is None:
+        raise ValueError(f"json_codec must be one of {', '.join(map(repr, _FACTORIES))} or a JSONCodec, got {codec!r}")
+    return factory()
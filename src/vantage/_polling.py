@@ -0,0 +1,492 @@
+"""Waiting on many operations that finish in the background from one timer."""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+# asyncio and concurrent.futures are imported where they are used.
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+class WaitTimeoutError(TimeoutError):
+    """An operation did not finish within the time allowed for it."""
+
+
+@dataclass(frozen=True)
+class PollPolicy:
+    """
+    How often to check on an operation that is still running.
+
+    The first check happens right away. After that the wait starts at
+    ``initial`` seconds and grows by ``factor`` after every check, up to
+    ``max_interval``, so short operations are noticed quickly while long ones
+    cost few requests.
+
+    Args:
+        initial: Wait before the second check, in seconds.
+        factor: Growth of the wait after each check.
+        max_interval: Upper bound for a single wait, in seconds.
+        jitter: Spread each wait by up to this fraction, so operations started
+            together do not poll in lockstep.
+    """
+
+    initial: float = 1.0
+    factor: float = 1.5
+    max_interval: float = 30.0
+    jitter: float = 0.1
+
+    def delays(self) -> Iterator[float]:
+        """Yield the waits between checks."""
+        delay = self.initial
+        while True:
+            yield delay * (1 + random.uniform(-self.jitter, self.jitter)) if self.jitter else delay
+            delay = min(self.max_interval, delay * self.factor)
+
+
+DEFAULT_POLL = PollPolicy()
+
+
+class TimerWheel(Generic[T]):
+    """
+    A hashed timing wheel: timers in ``slots`` buckets of ``resolution`` seconds.
+
+    Scheduling and expiring a timer are O(1), however many are pending, at the
+    cost of firing up to one ``resolution`` late. Timers are not cancelled
+    here; the owner skips items that are no longer wanted when they fire.
+    """
+
+    def __init__(self, resolution: float, slots: int = 512) -> None:
+        self._resolution = resolution
+        self._slots: List[List[Tuple[int, T]]] = [[] for _ in range(slots)]
+        self._tick: Optional[int] = None  # last tick whose bucket has been expired
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def schedule(self, item: T, delay: float, now: float) -> None:
+        """Fire ``item`` ``delay`` seconds after ``now``, rounded up to the next tick."""
+        if self._tick is None:
+            self._tick = int(now / self._resolution)
+        target = max(self._tick + 1, math.ceil((now + delay) / self._resolution))
+        self._slots[target % len(self._slots)].append((target, item))
+        self._size += 1
+
+    def advance(self, now: float) -> List[T]:
+        """Expire every tick up to ``now`` and return the items that fired, earliest first."""
+        if self._tick is None:
+            return []
+        current = int(now / self._resolution)
+        if current - self._tick >= len(self._slots):
+            # Asleep for a whole revolution: every bucket may hold due timers.
+            ticks = range(current - len(self._slots) + 1, current + 1)
+        else:
+            ticks = range(self._tick + 1, current + 1)
+        due: List[Tuple[int, T]] = []
+        for tick in ticks:
+            bucket = self._slots[tick % len(self._slots)]
+            if bucket:
+                fired = [timer for timer in bucket if timer[0] <= current]
+                if fired:
+                    due.extend(fired)
+                    bucket[:] = [timer for timer in bucket if timer[0] > current]
+        self._tick = max(self._tick, current)
+        self._size -= len(due)
+        due.sort(key=lambda timer: timer[0])
+        return [item for _, item in due]
+
+
+class _Subscriber:
+    """One caller waiting on an operation, with its own deadline and result mapping."""
+
+    def __init__(self, future: Any, deadline: Optional[float], transform: Optional[Callable[[Any], Any]]) -> None:
+        self.future = future
+        self.deadline = deadline
+        self.transform = transform
+
+    def resolve(self, value: Any = None, error: Optional[BaseException] = None) -> None:
+        """Settle the future unless it was cancelled in the meantime."""
+        if self.future.done():
+            return
+        if error is None and self.transform is not None:
+            try:
+                value = self.transform(value)
+            except Exception as e:
+                error = e
+        if error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(value)
+
+
+class _Operation:
+    """One polled operation and everyone waiting on it."""
+
+    def __init__(self, key: Hashable, check: Callable[[], Any], is_done: Callable[[Any], bool], policy: PollPolicy) -> None:
+        self.key = key
+        self.check = check
+        self.is_done = is_done
+        self.delays = policy.delays()
+        self.subscribers: List[_Subscriber] = []
+        self.finished = False
+
+    def live(self) -> bool:
+        return any(not sub.future.done() for sub in self.subscribers)
+
+    def expire(self, now: float) -> None:
+        for sub in self.subscribers:
+            if sub.deadline is not None and now >= sub.deadline:
+                sub.resolve(error=WaitTimeoutError(f"operation {self.key!r} did not finish in time"))
+
+    def next_delay(self, now: float) -> float:
+        """The wait before the next check, cut short by the nearest deadline."""
+        delay = next(self.delays)
+        deadlines = [sub.deadline for sub in self.subscribers if sub.deadline is not None and not sub.future.done()]
+        return min([delay] + [deadline - now for deadline in deadlines])
+
+    def finish(self, value: Any = None, error: Optional[BaseException] = None) -> None:
+        for sub in self.subscribers:
+            sub.resolve(value, error)
+
+
+class Waiter:
+    """
+    Wait for many long-running operations from one timer thread.
+
+    ``submit`` returns a ``concurrent.futures.Future`` for an operation. All
+    pending operations share one ``TimerWheel`` driven by a single background
+    thread, which hands due checks to a pool of ``max_workers`` threads, so
+    waiting on hundreds of exports costs one thread and a bounded number of
+    requests in flight. Submitting a ``key`` that is already pending joins the
+    existing operation, so several callers waiting on the same export share
+    one status check. Cancelling a future stops polling once nobody else is
+    waiting on the operation.
+    """
+
+    def __init__(self, max_workers: int = 8, resolution: float = 0.1) -> None:
+        self._max_workers = max_workers
+        self._resolution = resolution
+        self._cond = threading.Condition()
+        self._wheel: TimerWheel[_Operation] = TimerWheel(resolution)
+        self._operations: Dict[Hashable, _Operation] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Any = None
+        self._closed = False
+
+    def submit(
+        self,
+        check: Callable[[], T],
+        *,
+        key: Optional[Hashable] = None,
+        is_done: Callable[[T], bool] = bool,
+        timeout: Optional[float] = None,
+        policy: Optional[PollPolicy] = None,
+        transform: Optional[Callable[[T], Any]] = None,
+    ) -> Any:
+        """
+        Call ``check`` until ``is_done`` accepts its result, and resolve the future with it.
+
+        ``transform``, if given, maps that result before the future receives it.
+        If ``check`` or ``is_done`` raises, the future fails with the error;
+        after ``timeout`` seconds it fails with ``WaitTimeoutError``.
+        """
+        from concurrent.futures import Future
+
+        future: Future[Any] = Future()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("the waiter has been closed")
+            operation = self._operations.get(key) if key is not None else None
+            start = operation is None
+            if operation is None:
+                operation = _Operation(key if key is not None else object(), check, is_done, policy or DEFAULT_POLL)
+                self._operations[operation.key] = operation
+            operation.subscribers.append(_Subscriber(future, deadline, transform))
+            if start:
+                self._start()
+        if start:
+            self._pool.submit(self._check, operation)
+        return future
+
+    def wait_all(
+        self,
+        make_check: Callable[[Any], Callable[[], T]],
+        inputs: Iterable[Any],
+        *,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        is_done: Callable[[T], bool] = bool,
+        timeout: Optional[float] = None,
+        policy: Optional[PollPolicy] = None,
+        transform: Optional[Callable[[T], Any]] = None,
+    ) -> Any:
+        """
+        Wait for one operation per input and return a ``BatchResult`` in input order.
+
+        An operation that fails or times out records its exception on its item.
+        If the wait is interrupted, the remaining operations are cancelled.
+        """
+        from concurrent.futures import wait
+
+        inputs = list(inputs)
+        futures = [
+            self.submit(
+                make_check(value),
+                key=key(value) if key is not None else None,
+                is_done=is_done,
+                timeout=timeout,
+                policy=policy,
+                transform=transform,
+            )
+            for value in inputs
+        ]
+        try:
+            wait(futures)
+        finally:
+            for future in futures:
+                future.cancel()
+        return _batch_of(inputs, futures)
+
+    def close(self) -> None:
+        """Stop polling and cancel every operation still pending."""
+        with self._cond:
+            self._closed = True
+            operations = list(self._operations.values())
+            self._operations.clear()
+            self._cond.notify_all()
+        for operation in operations:
+            for sub in operation.subscribers:
+                sub.future.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+    def _start(self) -> None:
+        if self._thread is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="vantage-waiter")
+            self._thread = threading.Thread(target=self._run, name="vantage-waiter-timer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and not len(self._wheel):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                due = self._wheel.advance(time.monotonic())
+                if not due:
+                    self._cond.wait(self._resolution)
+                    continue
+            for operation in due:
+                self._pool.submit(self._check, operation)
+
+    def _forget(self, operation: _Operation) -> bool:
+        """Drop an operation nobody waits on anymore. Returns whether it was dropped."""
+        with self._cond:
+            if operation.live():
+                return False
+            operation.finished = True
+            self._operations.pop(operation.key, None)
+            return True
+
+    def _settle(self, operation: _Operation, value: Any = None, error: Optional[BaseException] = None) -> None:
+        with self._cond:
+            operation.finished = True
+            self._operations.pop(operation.key, None)
+        operation.finish(value, error)
+
+    def _check(self, operation: _Operation) -> None:
+        if self._forget(operation):
+            return
+        try:
+            value = operation.check()
+            done = operation.is_done(value)
+        except Exception as e:
+            self._settle(operation, error=e)
+            return
+        if done:
+            self._settle(operation, value)
+            return
+        now = time.monotonic()
+        operation.expire(now)
+        with self._cond:
+            if self._closed or not operation.live():
+                operation.finished = True
+                self._operations.pop(operation.key, None)
+                return
+            self._wheel.schedule(operation, operation.next_delay(now), now)
+            self._cond.notify()
+
+
+class AsyncWaiter:
+    """
+    Async version of ``Waiter``, driven by one asyncio task.
+
+    ``submit`` returns an ``asyncio.Future``. Cancelling it, or the task
+    awaiting it, stops polling once nobody else waits on the operation. At
+    most ``max_concurrency`` checks run at once.
+    """
+
+    def __init__(self, max_concurrency: int = 8, resolution: float = 0.1) -> None:
+        self._max_concurrency = max_concurrency
+        self._resolution = resolution
+        self._wheel: TimerWheel[_Operation] = TimerWheel(resolution)
+        self._operations: Dict[Hashable, _Operation] = {}
+        self._driver: Optional[asyncio.Task[None]] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._checks: Set[asyncio.Task[None]] = set()
+
+    def submit(
+        self,
+        check: Callable[[], Awaitable[T]],
+        *,
+        key: Optional[Hashable] = None,
+        is_done: Callable[[T], bool] = bool,
+        timeout: Optional[float] = None,
+        policy: Optional[PollPolicy] = None,
+        transform: Optional[Callable[[T], Any]] = None,
+    ) -> asyncio.Future[Any]:
+        """Async version of ``Waiter.submit``: ``check`` is a coroutine function."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        deadline = None if timeout is None else loop.time() + timeout
+        operation = self._operations.get(key) if key is not None else None
+        if operation is None:
+            operation = _Operation(key if key is not None else object(), check, is_done, policy or DEFAULT_POLL)
+            self._operations[operation.key] = operation
+            operation.subscribers.append(_Subscriber(future, deadline, transform))
+            self._spawn(operation)
+        else:
+            operation.subscribers.append(_Subscriber(future, deadline, transform))
+        return future
+
+    async def wait_all(
+        self,
+        make_check: Callable[[Any], Callable[[], Awaitable[T]]],
+        inputs: Iterable[Any],
+        *,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        is_done: Callable[[T], bool] = bool,
+        timeout: Optional[float] = None,
+        policy: Optional[PollPolicy] = None,
+        transform: Optional[Callable[[T], Any]] = None,
+    ) -> Any:
+        """Async version of ``Waiter.wait_all``."""
+        import asyncio
+
+        inputs = list(inputs)
+        futures = [
+            self.submit(
+                make_check(value),
+                key=key(value) if key is not None else None,
+                is_done=is_done,
+                timeout=timeout,
+                policy=policy,
+                transform=transform,
+            )
+            for value in inputs
+        ]
+        try:
+            if futures:
+                await asyncio.wait(futures)
+        finally:
+            for future in futures:
+                future.cancel()
+        return _batch_of(inputs, futures)
+
+    def close(self) -> None:
+        """Stop polling and cancel every operation still pending."""
+        for operation in self._operations.values():
+            for sub in operation.subscribers:
+                sub.future.cancel()
+        self._operations.clear()
+        for task in list(self._checks):
+            task.cancel()
+        if self._driver is not None:
+            self._driver.cancel()
+            self._driver = None
+
+    def _spawn(self, operation: _Operation) -> None:
+        import asyncio
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_concurrency)
+        task = asyncio.ensure_future(self._check(operation))
+        self._checks.add(task)
+        task.add_done_callback(self._checks.discard)
+
+    def _drop(self, operation: _Operation) -> None:
+        operation.finished = True
+        if self._operations.get(operation.key) is operation:
+            del self._operations[operation.key]
+
+    async def _run(self) -> None:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        try:
+            while len(self._wheel):
+                await asyncio.sleep(self._resolution)
+                for operation in self._wheel.advance(loop.time()):
+                    self._spawn(operation)
+        finally:
+            if self._driver is asyncio.current_task():
+                self._driver = None
+
+    async def _check(self, operation: _Operation) -> None:
+        import asyncio
+
+        assert self._slots is not None
+        if not operation.live():
+            self._drop(operation)
+            return
+        try:
+            async with self._slots:
+                value = await operation.check()
+            done = operation.is_done(value)
+        except asyncio.CancelledError:
+            self._drop(operation)
+            raise
+        except Exception as e:
+            self._drop(operation)
+            operation.finish(error=e)
+            return
+        if done:
+            self._drop(operation)
+            operation.finish(value)
+            return
+        now = asyncio.get_running_loop().time()
+        operation.expire(now)
+        if not operation.live():
+            self._drop(operation)
+            return
+        self._wheel.schedule(operation, operation.next_delay(now), now)
+        if self._driver is None:
+            self._driver = asyncio.ensure_future(self._run())
+
+
+def virtual_tag_processed(status: Dict[str, Any]) -> bool:
+    """Whether a decoded ``VirtualTagConfigStatus`` says every provider has finished processing."""
+    return not status.get("processing")
+
+
+def _batch_of(inputs: List[Any], futures: List[Any]) -> Any:
+    from ._batch import BatchItem, BatchResult
+
+    items = []
+    for value, future in zip(inputs, futures):
+        error = future.exception()
+        items.append(BatchItem(value, error=error) if error is not None else BatchItem(value, future.result()))
+    return BatchResult(items)
@@ -0,0 +1,205 @@
+"""Per-call timing breakdowns kept in a ring buffer and aggregated per endpoint."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Union
+
+from ._hooks import Hooks, RequestEvent
+
+
+@dataclass(frozen=True)
+class CallProfile:
+    """
+    Where the time of one API call went, in seconds.
+
+    The parts add up to ``total``. ``wait`` is everything before the response
+    body started arriving: rate-limit pacing, retries, connecting and the
+    API's own processing time. ``transfer`` is only measured on transports
+    that support httpx's ``trace`` extension and is 0 elsewhere, in which case
+    the download counts as ``wait``. The ``total`` of a streamed page includes
+    the time the caller spent between its items.
+
+    Attributes:
+        endpoint: The method and templated route, e.g. ``GET /v2/costs``.
+        status: HTTP status of the response, None after a transport error.
+        wait: Time until the response body started arriving.
+        transfer: Time receiving the response body.
+        decode: Time decoding the JSON body.
+        validate: Time building models from it.
+        total: Time for the whole call.
+        response_bytes: Size of the response body as received.
+        items: Number of items in the page, for paginated endpoints.
+        failed: Whether the call raised.
+    """
+
+    endpoint: str
+    status: Optional[int]
+    wait: float
+    transfer: float
+    decode: float
+    validate: float
+    total: float
+    response_bytes: Optional[int] = None
+    items: Optional[int] = None
+    failed: bool = False
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """
+    Aggregated profiles of the calls to one endpoint still in the buffer.
+
+    Times are means in seconds, except ``total_time`` (their sum) and the
+    ``p50``/``p95`` percentiles of ``total``. ``items`` is the mean number of
+    items per call and ``items_total`` their sum, over the calls of a
+    paginated endpoint that reported a page.
+    """
+
+    endpoint: str
+    calls: int
+    failed: int
+    total_time: float
+    wait: float
+    transfer: float
+    decode: float
+    validate: float
+    total: float
+    p50: float
+    p95: float
+    response_bytes: Optional[float] = None
+    items: Optional[float] = None
+    items_total: Optional[int] = None
+
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Profiler:
+    """
+    Records a ``CallProfile`` for each API call a client makes.
+
+    The last ``size`` calls are kept, so a long-running process holds a
+    bounded, recent sample. Calls answered from the response caches make no
+    request and are not recorded. A profiler may be shared by several clients.
+
+    Example:
+        client = Client("your-api-token", profile=True)
+        client.costs.list(cost_report_token="rprt_abc123")
+        print(client.profiler.report())
+    """
+
+    def __init__(self, size: int = 1000) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._calls: Deque[CallProfile] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def attach(self, hooks: Optional[Hooks]) -> Hooks:
+        """Return ``hooks`` plus this profiler's, leaving ``hooks`` itself unchanged."""
+        hooks = hooks if hooks is not None else Hooks()
+        return Hooks(
+            before_request=hooks.before_request,
+            after_response=[*hooks.after_response, self.record],
+            on_error=[*hooks.on_error, self.record],
+            on_retry=hooks.on_retry,
+        )
+
+    def record(self, event: RequestEvent) -> None:
+        """Add the profile of a finished request."""
+        transfer = event.transfer or 0.0
+        decode = event.decode or 0.0
+        validate = event.validate or 0.0
+        total = event.total or 0.0
+        profile = CallProfile(
+            endpoint=f"{event.method} {event.route}",
+            status=event.status,
+            wait=max(total - transfer - decode - validate, 0.0),
+            transfer=transfer,
+            decode=decode,
+            validate=validate,
+            total=total,
+            response_bytes=event.response_bytes,
+            items=event.items,
+            failed=event.error is not None,
+        )
+        with self._lock:
+            self._calls.append(profile)
+
+    @property
+    def calls(self) -> List[CallProfile]:
+        """The recorded calls, oldest first."""
+        with self._lock:
+            return list(self._calls)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calls.clear()
+
+    def stats(self) -> Dict[str, EndpointStats]:
+        """Aggregate the recorded calls per endpoint, slowest overall first."""
+        grouped: Dict[str, List[CallProfile]] = {}
+        for call in self.calls:
+            grouped.setdefault(call.endpoint, []).append(call)
+
+        result = []
+        for endpoint, calls in grouped.items():
+            totals = sorted(call.total for call in calls)
+            sizes = [call.response_bytes for call in calls if call.response_bytes is not None]
+            items = [call.items for call in calls if call.items is not None]
+            result.append(
+                EndpointStats(
+                    endpoint=endpoint,
+                    calls=len(calls),
+                    failed=sum(call.failed for call in calls),
+                    total_time=sum(totals),
+                    wait=_mean([call.wait for call in calls]),
+                    transfer=_mean([call.transfer for call in calls]),
+                    decode=_mean([call.decode for call in calls]),
+                    validate=_mean([call.validate for call in calls]),
+                    total=_mean(totals),
+                    p50=_percentile(totals, 0.5),
+                    p95=_percentile(totals, 0.95),
+                    response_bytes=_mean(sizes) if sizes else None,
+                    items=_mean(items) if items else None,
+                    items_total=sum(items) if items else None,
+                )
+            )
+        result.sort(key=lambda stats: stats.total_time, reverse=True)
+        return {stats.endpoint: stats for stats in result}
+
+    def report(self) -> str:
+        """
+        Format ``stats()`` as a table, with times as means in milliseconds.
+
+        ``items`` is the number of items all calls returned and ``per call``
+        their mean, or ``-`` for endpoints that are not paginated.
+        """
+        header = (
+            f"{'endpoint':<48} {'calls':>6} {'failed':>6} {'wait':>9} {'transfer':>9} "
+            f"{'decode':>9} {'validate':>9} {'total':>9} {'p95':>9} {'items':>9} {'per call':>9}"
+        )
+        lines = [header]
+        for stats in self.stats().values():
+            items = f"{stats.items_total}" if stats.items_total is not None else "-"
+            per_call = f"{stats.items:.1f}" if stats.items is not None else "-"
+            lines.append(
+                f"{stats.endpoint:<48} {stats.calls:>6} {stats.failed:>6} {stats.wait * 1000:>9.1f} "
+                f"{stats.transfer * 1000:>9.1f} {stats.decode * 1000:>9.1f} {stats.validate * 1000:>9.1f} "
+                f"{stats.total * 1000:>9.1f} {stats.p95 * 1000:>9.1f} {items:>9} {per_call:>9}"
+            )
+        return "\n".join(lines)
+
+
+def get_profiler(profile: Union[bool, Profiler]) -> Optional[Profiler]:
+    """Resolve a client's ``profile`` option: ``True`` makes a new Profiler, ``False`` none."""
+    if profile is True:
+        return Profiler()
+    return profile or None
@@ -0,0 +1,136 @@
+"""Client-side token bucket rate limiting shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from ._retry import RATE_LIMIT_RESET_HEADERS, parse_reset
+
+RATE_LIMIT_REMAINING_HEADERS = ("x-ratelimit-remaining", "x-rate-limit-remaining", "ratelimit-remaining")
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that hands out reservations.
+
+    ``reserve()`` takes a token immediately (letting the balance go negative)
+    and returns how long the caller must wait before using it. The lock is
+    only held for the bookkeeping, so the same bucket can pace threads (which
+    ``time.sleep``) and coroutines (which ``asyncio.sleep``) at once.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def observe(self, remaining: Optional[float], reset: Optional[float]) -> None:
+        """
+        Align the bucket with the server's view of the rate limit window.
+
+        The local balance never exceeds ``remaining``, and once the server
+        reports nothing remaining, new reservations wait until ``reset`` seconds
+        from now.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and reset is not None:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+
+
+class RateLimiter:
+    """
+    Opt-in client-side rate limiter that paces requests before they are sent.
+
+    Share one instance between every client that uses the same API token,
+    including sync and async clients in different threads. Requests whose path
+    starts with one of ``families`` are drawn from that family's own bucket;
+    everything else shares the default bucket.
+
+    Args:
+        rate: Requests per second for the default bucket.
+        burst: Bucket capacity; defaults to ``max(1, rate)``.
+        families: Per-path-prefix ``(rate, burst)`` overrides, e.g.
+            ``{"/v2/costs": (1.0, 2)}``.
+        adaptive: Follow ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset``
+            response headers, pausing the bucket when the server reports that
+            the window is exhausted.
+
+    Example:
+        limiter = RateLimiter(5.0, families={"/v2/costs": (1.0, 2)})
+        client = Client("your-token", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        families: Optional[Mapping[str, Tuple[float, Optional[float]]]] = None,
+        adaptive: bool = True,
+    ) -> None:
+        self.adaptive = adaptive
+        self._default = TokenBucket(rate, burst)
+        # Longest prefix first so that "/v2/costs/data_exports" can override "/v2/costs".
+        self._families: Dict[str, TokenBucket] = {
+            prefix: TokenBucket(family_rate, family_burst)
+            for prefix, (family_rate, family_burst) in sorted(
+                (families or {}).items(), key=lambda item: len(item[0]), reverse=True
+            )
+        }
+
+    def bucket_for(self, path: str) -> TokenBucket:
+        """Return the bucket that paces requests to ``path``."""
+        for prefix, bucket in self._families.items():
+            if path.startswith(prefix):
+                return bucket
+        return self._default
+
+    def reserve(self, path: str) -> float:
+        """Reserve a request slot for ``path`` and return the seconds to wait first."""
+        return self.bucket_for(path).reserve()
+
+    def observe(self, path: str, headers: Mapping[str, str]) -> None:
+        """Adapt the bucket for ``path`` to rate-limit headers on a response."""
+        if not self.adaptive:
+            return
+        remaining = _first_header(headers, RATE_LIMIT_REMAINING_HEADERS)
+        if remaining is None:
+            return
+        try:
+            remaining_value: Optional[float] = float(remaining)
+        except ValueError:
+            remaining_value = None
+        reset = _first_header(headers, RATE_LIMIT_RESET_HEADERS)
+        self.bucket_for(path).observe(remaining_value, parse_reset(reset) if reset else None)
+
+
+def _first_header(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value:
+            return value
+    return None
@@ -0,0 +1,117 @@
+"""Retry policy shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, Mapping, Optional
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# Headers that tell us when the rate limit window resets, either as seconds to
+# wait or as a Unix timestamp.
+RATE_LIMIT_RESET_HEADERS = ("x-ratelimit-reset", "x-rate-limit-reset", "ratelimit-reset")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Only ``methods`` are retried, which by default are the idempotent ones.
+    Waits use exponential backoff with full jitter, unless the response has a
+    ``Retry-After`` or rate-limit reset header. In that case the wait the
+    server asked for is used. Retrying stops after ``max_retries`` attempts or
+    when the next wait would go past ``budget`` seconds since the first attempt.
+
+    Args:
+        max_retries: Maximum number of retries after the first attempt.
+        backoff_factor: Base delay in seconds; attempt ``n`` waits up to
+            ``backoff_factor * 2 ** n``.
+        max_backoff: Upper bound for a single wait, in seconds.
+        budget: Upper bound for the total time spent on a request including
+            retries, in seconds. ``None`` disables the cap.
+        statuses: HTTP status codes that are retried.
+        methods: HTTP methods that are retried.
+        jitter: Randomize backoff delays to avoid synchronized retries.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    budget: Optional[float] = 60.0
+    statuses: FrozenSet[int] = RETRY_STATUSES
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    jitter: bool = True
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        status: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """
+        Return how long to sleep before retrying, or None to give up.
+
+        ``attempt`` counts retries already made. ``status`` is None when the
+        request failed with a transport error instead of a response.
+        """
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return None
+        if status is not None and status not in self.statuses:
+            return None
+
+        delay = self._server_delay(headers) if headers is not None else None
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+
+        if self.budget is not None and elapsed + delay > self.budget:
+            return None
+        return delay
+
+    def _server_delay(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Read the wait requested by ``Retry-After`` or a rate-limit reset header."""
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            return parse_retry_after(retry_after)
+        for name in RATE_LIMIT_RESET_HEADERS:
+            value = headers.get(name)
+            if value:
+                return parse_reset(value)
+        return None
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parse a ``Retry-After`` value given as seconds or an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_reset(value: str) -> Optional[float]:
+    """Parse a rate-limit reset value given as seconds to wait or a Unix timestamp."""
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Anything that looks like an epoch timestamp is converted to a delta.
+    if reset > 1_000_000_000:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+DEFAULT_RETRY = RetryPolicy()
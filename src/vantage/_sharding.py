@@ -0,0 +1,93 @@
+"""Splitting cost queries into date shards and merging the results."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# How many periods of each ``date_bin`` one shard covers by default.
+DEFAULT_SHARD_BINS: Dict[str, int] = {
+    "day": 7,
+    "week": 4,
+    "month": 1,
+    "quarter": 1,
+}
+
+
+def _bin_start(day: date, date_bin: str) -> date:
+    if date_bin == "day":
+        return day
+    if date_bin == "week":
+        return day - timedelta(days=day.weekday())
+    if date_bin == "month":
+        return day.replace(day=1)
+    return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+
+
+def _advance(start: date, date_bin: str, bins: int) -> date:
+    if date_bin == "day":
+        return start + timedelta(days=bins)
+    if date_bin == "week":
+        return start + timedelta(weeks=bins)
+    months = start.month - 1 + bins * (3 if date_bin == "quarter" else 1)
+    return start.replace(year=start.year + months // 12, month=months % 12 + 1)
+
+
+def shard_date_range(
+    start_date: str,
+    end_date: str,
+    date_bin: str,
+    bins_per_shard: Optional[int] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Split the inclusive range ``start_date``..``end_date`` into shards.
+
+    Shard boundaries fall on ``date_bin`` boundaries (weeks start on Monday),
+    so no period is split between two shards. Each shard covers
+    ``bins_per_shard`` periods, except possibly the first and last.
+    """
+    if date_bin not in DEFAULT_SHARD_BINS:
+        raise ValueError(f"date_bin must be one of {', '.join(map(repr, DEFAULT_SHARD_BINS))} to shard, got {date_bin!r}")
+    bins = DEFAULT_SHARD_BINS[date_bin] if bins_per_shard is None else bins_per_shard
+    if bins < 1:
+        raise ValueError("bins_per_shard must be at least 1")
+    start = date.fromisoformat(start_date[:10])
+    end = date.fromisoformat(end_date[:10])
+    if end < start:
+        raise ValueError("end_date must not be before start_date")
+
+    shards = []
+    while start <= end:
+        following = _advance(_bin_start(start, date_bin), date_bin, bins)
+        shards.append((start.isoformat(), min(following - timedelta(days=1), end).isoformat()))
+        start = following
+    return shards
+
+
+def merge_shards(pages: Sequence[Dict[str, Any]], field: str, *, descending: bool = False) -> Dict[str, Any]:
+    """
+    Merge the bodies of per-shard cost queries into one.
+
+    Items are ordered by ``accrued_at``, keeping the API's order within a date.
+    ``total_cost`` and ``total_usage`` are summed across shards; links are
+    dropped because the merged body is not a page.
+    """
+    items: List[Any] = []
+    for page in pages:
+        items.extend(page.get(field) or ())
+    items.sort(key=lambda item: item.get("accrued_at") or "", reverse=descending)
+    merged: Dict[str, Any] = {"links": None, field: items}
+
+    totals = [page["total_cost"] for page in pages if page.get("total_cost")]
+    if totals:
+        amount = sum((Decimal(total["amount"]) for total in totals), Decimal(0))
+        merged["total_cost"] = {"amount": format(amount, "f"), "currency": totals[0]["currency"]}
+
+    usage: Dict[str, Decimal] = {}
+    for page in pages:
+        for entry in page.get("total_usage") or ():
+            usage[entry["unit"]] = usage.get(entry["unit"], Decimal(0)) + Decimal(entry["amount"])
+    if usage:
+        merged["total_usage"] = [{"amount": format(amount, "f"), "unit": unit} for unit, amount in usage.items()]
+    return merged
@@ -0,0 +1,144 @@
+"""Incremental extraction of array items from a streamed JSON object."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+_START, _KEY, _COLON, _VALUE, _AFTER_VALUE, _ITEMS, _END = range(7)
+
+
+class _Incomplete(Exception):
+    """The value at ``pos`` continues in a chunk that has not arrived yet."""
+
+    def __init__(self, pos: int) -> None:
+        super().__init__(pos)
+        self.pos = pos
+
+
+class JSONArrayStream:
+    """
+    Decode the elements of one top-level array of a JSON object as bytes arrive.
+
+    Feed the response body chunk by chunk. Each call returns every array
+    element completed so far, already decoded. Values are parsed with the
+    C-accelerated ``json`` scanner. Only the partial element at the end of the
+    buffer is kept, so memory is bounded by the largest item rather than the
+    whole document. Values of the other top-level keys named in ``capture``
+    (such as ``links``) are kept in ``captured``, and the number of elements
+    decoded so far in ``count``.
+
+    Example:
+        stream = JSONArrayStream("costs", capture={"links"})
+        for chunk in response.iter_bytes():
+            for item in stream.feed(chunk):
+                yield Cost.model_validate(item)
+        stream.close()
+    """
+
+    def __init__(self, key: str, capture: Iterable[str] = ()) -> None:
+        self.key = key
+        self.capture: FrozenSet[str] = frozenset(capture)
+        self.captured: Dict[str, Any] = {}
+        self.count = 0
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._state = _START
+        self._current_key = ""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume a chunk of the body and return the elements completed by it."""
+        return self._parse(self._text.decode(chunk), final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body, returning any last elements.
+
+        Raises:
+            ValueError: If the body ended before the JSON object was complete.
+        """
+        items = self._parse(self._text.decode(b"", final=True), final=True)
+        if self._state != _END:
+            raise ValueError("Truncated JSON response body")
+        return items
+
+    def _decode_value(self, buf: str, pos: int, final: bool) -> Tuple[Any, int]:
+        """Decode the value at ``pos``, raising _Incomplete if it may be cut off."""
+        try:
+            value, end = _DECODER.raw_decode(buf, pos)
+        except ValueError:
+            if final:
+                raise
+            raise _Incomplete(pos) from None
+        # A value that ends exactly at the buffer boundary may be a truncated
+        # number or literal, so wait for the next chunk to confirm it.
+        if end >= len(buf) and not final:
+            raise _Incomplete(pos)
+        return value, end
+
+    def _parse(self, text: str, final: bool) -> List[Any]:
+        buf = self._buf + text if self._buf else text
+        pos = 0
+        items: List[Any] = []
+        state = self._state
+
+        try:
+            while True:
+                pos = _WHITESPACE.match(buf, pos).end()
+                if pos >= len(buf) or state == _END:
+                    break
+                char = buf[pos]
+                if state == _START:
+                    if char != "{":
+                        raise ValueError(f"Expected a JSON object, got {char!r}")
+                    pos += 1
+                    state = _KEY
+                elif state == _KEY:
+                    if char == "}":
+                        pos += 1
+                        state = _END
+                        continue
+                    self._current_key, pos = self._decode_value(buf, pos, final)
+                    state = _COLON
+                elif state == _COLON:
+                    if char != ":":
+                        raise ValueError(f"Expected ':' after key, got {char!r}")
+                    pos += 1
+                    state = _VALUE
+                elif state == _VALUE:
+                    if char == "[" and self._current_key == self.key:
+                        pos += 1
+                        state = _ITEMS
+                        continue
+                    value, pos = self._decode_value(buf, pos, final)
+                    if self._current_key in self.capture:
+                        self.captured[self._current_key] = value
+                    state = _AFTER_VALUE
+                elif state == _AFTER_VALUE:
+                    pos += 1
+                    if char == ",":
+                        state = _KEY
+                    elif char == "}":
+                        state = _END
+                    else:
+                        raise ValueError(f"Expected ',' or '}}', got {char!r}")
+                elif state == _ITEMS:
+                    if char == "]":
+                        pos += 1
+                        state = _AFTER_VALUE
+                    elif char == ",":
+                        pos += 1
+                    else:
+                        item, pos = self._decode_value(buf, pos, final)
+                        items.append(item)
+        except _Incomplete as incomplete:
+            pos = incomplete.pos
+
+        self._buf = buf[pos:]
+        self._state = state
+        self.count += len(items)
+        return items
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Dict, List
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 from urllib.parse import quote
 
 import httpx
@@ -10,9 +15,34 @@ import httpx
 from .._base import (
     VantageAPIError,
     DEFAULT_BASE_URL,
+    DEFAULT_TIMEOUT,
+    Route,
+    ValidateMode,
     build_query_string,
+    check_validate_mode,
+    decode_json,
     is_multipart_route,
+    next_page_path,
+    parse_model,
+    parse_response,
 )
+from .._batch import BatchResult, run_batch, update_pairs
+from .._cache import ResponseCache, cache_scope
+from .._columnar import ColumnarResult
+from .._disk_cache import DiskCache
+from .._export import ExportDownload, download_export, export_finished
+from .._hooks import Hooks, RequestEvent, decode_timed
+from .._ingest import DEFAULT_CHUNK_ROWS, IngestResult, ingest_costs
+from .._json import JSONCodec, get_json_codec
+from .._polling import PollPolicy, Waiter, virtual_tag_processed
+from .._profile import Profiler, get_profiler
+from .._ratelimit import RateLimiter
+from .._retry import DEFAULT_RETRY, RetryPolicy
+from .._sharding import merge_shards, shard_date_range
+from .._singleflight import SingleFlight
+from .._stream import JSONArrayStream
+from .._tracing import get_tracing
+from .._upload import MultipartBody, UploadBody
 from .._types import *  # noqa: F401, F403
 
 
@@ -24,62 +54,231 @@ class SyncClient:
         bearer_token: str,
         *,
         base_url: str = DEFAULT_BASE_URL,
+        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        retry: Optional[RetryPolicy] = DEFAULT_RETRY,
+        rate_limiter: Optional[RateLimiter] = None,
+        validate: ValidateMode = "full",
+        json_codec: Union[str, JSONCodec, None] = None,
+        cache: Optional[ResponseCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        coalesce: bool = False,
+        hooks: Optional[Hooks] = None,
+        tracing: Any = None,
+        profile: Union[bool, Profiler] = False,
     ) -> None:
         self._bearer_token = bearer_token
         self._base_url = base_url.rstrip('/')
+        self._retry = retry
+        self._rate_limiter = rate_limiter
+        self._validate = check_validate_mode(validate)
+        self._json = get_json_codec(json_codec)
+        self._cache = cache
+        self._disk_cache = disk_cache
+        self._cache_scope = cache_scope(bearer_token)
+        self._single_flight = SingleFlight() if coalesce else None
+        self._tracing = get_tracing(tracing)
+        self.profiler = get_profiler(profile)
+        if self.profiler is not None:
+            hooks = self.profiler.attach(hooks)
+        # Traced calls are measured through a RequestEvent, which the hooks fill in.
+        self._hooks = Hooks() if hooks is None and self._tracing is not None else hooks
+        # An injected transport may be shared with other clients, so it is left open on close().
+        self._owns_transport = transport is None
         self._http = httpx.Client(
             headers={"Authorization": f"Bearer {bearer_token}"},
-            timeout=30.0,
+            timeout=timeout,
+            limits=limits if limits is not None else httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=http2,
+            transport=transport,
         )
 
-        # Initialize resource APIs
-        self.access_grants = AccessGrantsApi(self)
-        self.anomaly_alerts = AnomalyAlertsApi(self)
-        self.anomaly_notifications = AnomalyNotificationsApi(self)
-        self.audit_logs = AuditLogsApi(self)
-        self.billing_profiles = BillingProfilesApi(self)
-        self.billing_rules = BillingRulesApi(self)
-        self.budget_alerts = BudgetAlertsApi(self)
-        self.budgets = BudgetsApi(self)
-        self.business_metrics = BusinessMetricsApi(self)
-        self.cost_alerts = CostAlertsApi(self)
-        self.cost_provider_accounts = CostProviderAccountsApi(self)
-        self.cost_providers = CostProvidersApi(self)
-        self.cost_reports = CostReportsApi(self)
-        self.cost_services = CostServicesApi(self)
-        self.costs = CostsApi(self)
-        self.dashboards = DashboardsApi(self)
-        self.data_exports = DataExportsApi(self)
-        self.exchange_rates = ExchangeRatesApi(self)
-        self.financial_commitment_reports = FinancialCommitmentReportsApi(self)
-        self.financial_commitments = FinancialCommitmentsApi(self)
-        self.folders = FoldersApi(self)
-        self.integrations = IntegrationsApi(self)
-        self.invoices = InvoicesApi(self)
-        self.kubernetes_efficiency_reports = KubernetesEfficiencyReportsApi(self)
-        self.managed_accounts = ManagedAccountsApi(self)
-        self.me = MeApi(self)
-        self.network_flow_reports = NetworkFlowReportsApi(self)
-        self.ping = PingApi(self)
-        self.products = ProductsApi(self)
-        self.recommendation_views = RecommendationViewsApi(self)
-        self.recommendations = RecommendationsApi(self)
-        self.report_notifications = ReportNotificationsApi(self)
-        self.resource_reports = ResourceReportsApi(self)
-        self.resources = ResourcesApi(self)
-        self.saved_filters = SavedFiltersApi(self)
-        self.segments = SegmentsApi(self)
-        self.tags = TagsApi(self)
-        self.teams = TeamsApi(self)
-        self.unit_costs = UnitCostsApi(self)
-        self.user_feedback = UserFeedbackApi(self)
-        self.users = UsersApi(self)
-        self.virtual_tag_configs = VirtualTagConfigsApi(self)
-        self.workspaces = WorkspacesApi(self)
+    # Resource APIs are created on first access, keeping client construction cheap.
+    @cached_property
+    def access_grants(self) -> AccessGrantsApi:
+        return AccessGrantsApi(self)
+
+    @cached_property
+    def anomaly_alerts(self) -> AnomalyAlertsApi:
+        return AnomalyAlertsApi(self)
+
+    @cached_property
+    def anomaly_notifications(self) -> AnomalyNotificationsApi:
+        return AnomalyNotificationsApi(self)
+
+    @cached_property
+    def audit_logs(self) -> AuditLogsApi:
+        return AuditLogsApi(self)
+
+    @cached_property
+    def billing_profiles(self) -> BillingProfilesApi:
+        return BillingProfilesApi(self)
+
+    @cached_property
+    def billing_rules(self) -> BillingRulesApi:
+        return BillingRulesApi(self)
+
+    @cached_property
+    def budget_alerts(self) -> BudgetAlertsApi:
+        return BudgetAlertsApi(self)
+
+    @cached_property
+    def budgets(self) -> BudgetsApi:
+        return BudgetsApi(self)
+
+    @cached_property
+    def business_metrics(self) -> BusinessMetricsApi:
+        return BusinessMetricsApi(self)
+
+    @cached_property
+    def cost_alerts(self) -> CostAlertsApi:
+        return CostAlertsApi(self)
+
+    @cached_property
+    def cost_provider_accounts(self) -> CostProviderAccountsApi:
+        return CostProviderAccountsApi(self)
+
+    @cached_property
+    def cost_providers(self) -> CostProvidersApi:
+        return CostProvidersApi(self)
+
+    @cached_property
+    def cost_reports(self) -> CostReportsApi:
+        return CostReportsApi(self)
+
+    @cached_property
+    def cost_services(self) -> CostServicesApi:
+        return CostServicesApi(self)
+
+    @cached_property
+    def costs(self) -> CostsApi:
+        return CostsApi(self)
+
+    @cached_property
+    def dashboards(self) -> DashboardsApi:
+        return DashboardsApi(self)
+
+    @cached_property
+    def data_exports(self) -> DataExportsApi:
+        return DataExportsApi(self)
+
+    @cached_property
+    def exchange_rates(self) -> ExchangeRatesApi:
+        return ExchangeRatesApi(self)
+
+    @cached_property
+    def financial_commitment_reports(self) -> FinancialCommitmentReportsApi:
+        return FinancialCommitmentReportsApi(self)
+
+    @cached_property
+    def financial_commitments(self) -> FinancialCommitmentsApi:
+        return FinancialCommitmentsApi(self)
+
+    @cached_property
+    def folders(self) -> FoldersApi:
+        return FoldersApi(self)
+
+    @cached_property
+    def integrations(self) -> IntegrationsApi:
+        return IntegrationsApi(self)
+
+    @cached_property
+    def invoices(self) -> InvoicesApi:
+        return InvoicesApi(self)
+
+    @cached_property
+    def kubernetes_efficiency_reports(self) -> KubernetesEfficiencyReportsApi:
+        return KubernetesEfficiencyReportsApi(self)
+
+    @cached_property
+    def managed_accounts(self) -> ManagedAccountsApi:
+        return ManagedAccountsApi(self)
+
+    @cached_property
+    def me(self) -> MeApi:
+        return MeApi(self)
+
+    @cached_property
+    def network_flow_reports(self) -> NetworkFlowReportsApi:
+        return NetworkFlowReportsApi(self)
+
+    @cached_property
+    def ping(self) -> PingApi:
+        return PingApi(self)
+
+    @cached_property
+    def products(self) -> ProductsApi:
+        return ProductsApi(self)
+
+    @cached_property
+    def recommendation_views(self) -> RecommendationViewsApi:
+        return RecommendationViewsApi(self)
+
+    @cached_property
+    def recommendations(self) -> RecommendationsApi:
+        return RecommendationsApi(self)
+
+    @cached_property
+    def report_notifications(self) -> ReportNotificationsApi:
+        return ReportNotificationsApi(self)
+
+    @cached_property
+    def resource_reports(self) -> ResourceReportsApi:
+        return ResourceReportsApi(self)
+
+    @cached_property
+    def resources(self) -> ResourcesApi:
+        return ResourcesApi(self)
+
+    @cached_property
+    def saved_filters(self) -> SavedFiltersApi:
+        return SavedFiltersApi(self)
+
+    @cached_property
+    def segments(self) -> SegmentsApi:
+        return SegmentsApi(self)
+
+    @cached_property
+    def tags(self) -> TagsApi:
+        return TagsApi(self)
+
+    @cached_property
+    def teams(self) -> TeamsApi:
+        return TeamsApi(self)
+
+    @cached_property
+    def unit_costs(self) -> UnitCostsApi:
+        return UnitCostsApi(self)
+
+    @cached_property
+    def user_feedback(self) -> UserFeedbackApi:
+        return UserFeedbackApi(self)
+
+    @cached_property
+    def users(self) -> UsersApi:
+        return UsersApi(self)
+
+    @cached_property
+    def virtual_tag_configs(self) -> VirtualTagConfigsApi:
+        return VirtualTagConfigsApi(self)
+
+    @cached_property
+    def workspaces(self) -> WorkspacesApi:
+        return WorkspacesApi(self)
+
+    @cached_property
+    def _waiter(self) -> Waiter:
+        """Polls every long-running operation this client waits on."""
+        return Waiter()
 
     def close(self) -> None:
         """Close the HTTP client."""
-        self._http.close()
+        if "_waiter" in self.__dict__:
+            self._waiter.close()
+        if self._owns_transport:
+            self._http.close()
 
     def __enter__(self) -> SyncClient:
         return self
@@ -94,56 +293,297 @@ class SyncClient:
         *,
         params: Optional[Dict[str, Any]] = None,
         body: Optional[Dict[str, Any]] = None,
+        model: Any = None,
+        validate: Optional[ValidateMode] = None,
+        route: Optional[Route] = None,
     ) -> Any:
-        """Make a raw API request."""
+        """
+        Make a raw API request.
+
+        The JSON response is decoded with the client's codec, or parsed into
+        `model` according to `validate` when a model is given. Generated methods
+        pass their precompiled `route`; without one it is looked up from the path.
+        """
+        if route is None:
+            route = self._resolve_route(method, path)
         url = self._base_url + path
 
         if method.upper() == 'GET' and params:
             url += build_query_string(params)
             params = None
 
-        if is_multipart_route(path, method):
-            response = self._http.request(
-                method,
-                url,
-                data=body,
+        if self._tracing is None:
+            return self._request(method, path, url, params, body, model, validate, route)
+        event = RequestEvent(method.upper(), route.path, url)
+        with self._tracing.span(route, url, event):
+            return self._request(method, path, url, params, body, model, validate, route, event)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[Dict[str, Any]],
+        model: Any,
+        validate: Optional[ValidateMode],
+        route: Route,
+        event: Optional[RequestEvent] = None,
+    ) -> Any:
+        """Serve a `request()` from the caches or the API, reporting it to the hooks through `event`."""
+        cached = None
+        if method.upper() == 'GET' and not (route.handler or route.boolean_status):
+            if self._disk_cache is not None:
+                stored = self._disk_cache.get(self._cache_scope, path, url)
+                if stored is not None:
+                    return self._decode(stored, model, validate)
+            if self._cache is not None:
+                cached = self._cache.get(self._cache_scope, path, url)
+                if cached is not None and cached.fresh:
+                    return self._decode(cached.content, model, validate)
+
+        headers = {"Content-Type": "application/json"} if body is not None else None
+        if cached is not None:
+            # Expired but revalidatable: ask the API whether it changed.
+            headers = cached.revalidation_headers()
+
+        if event is None and self._hooks is not None:
+            event = RequestEvent(method.upper(), route.path, url)
+
+        if route.multipart:
+            # Files are streamed from disk or encoded as they are sent.
+            multipart = MultipartBody(body)
+            try:
+                response = self._send(
+                    method,
+                    path,
+                    url,
+                    data=multipart.data,
+                    files=multipart.files or None,
+                    retry=multipart.replayable,
+                    event=event,
+                )
+            finally:
+                multipart.close()
+        elif self._single_flight is not None and method.upper() == 'GET' and body is None:
+            # Identical GETs already in flight share one HTTP call and its response.
+            response = self._single_flight.do(
+                (url, tuple(sorted(headers.items())) if headers else None),
+                lambda: self._send(method, path, url, headers=headers, event=event),
             )
+            if event is not None and event.status is None:
+                # Another caller's request was shared; that caller reports it.
+                event = None
         else:
-            response = self._http.request(
+            response = self._send(
                 method,
+                path,
                 url,
                 params=params,
-                json=body,
+                content=self._json.dumps(body) if body is not None else None,
+                headers=headers,
+                event=event,
             )
 
-        if method.upper() == "GET" and path.startswith("/v2/virtual_tag_configs/async/"):
-            if response.status_code == 404:
-                return False
-            elif response.is_success:
-                return True
-            else:
-                raise VantageAPIError(
-                    status=response.status_code,
-                    status_text=response.reason_phrase,
-                    body=response.text,
-                )
+        if self._cache is not None:
+            if cached is not None and response.status_code == 304:
+                self._cache.refresh(cached, response.headers)
+                return self._decode(cached.content, model, validate, event, route.items)
+            if method.upper() != 'GET':
+                # A create, update or delete makes cached reads of the resource stale.
+                self._cache.invalidate(path)
+
+        if route.boolean_status:
+            # 404 -> False, 2xx -> True
+            if response.status_code != 404 and not response.is_success:
+                raise self._api_error(response, event)
+            if event is not None:
+                self._hooks.completed(event)
+            return response.is_success
 
         if not response.is_success:
-            raise VantageAPIError(
-                status=response.status_code,
-                status_text=response.reason_phrase,
-                body=response.text,
-            )
+            raise self._api_error(response, event)
+
+        if route.handler is not None:
+            if event is not None:
+                self._hooks.completed(event)
+            return getattr(self, route.handler)(response)
+
+        if method.upper() == 'GET':
+            if self._cache is not None:
+                self._cache.put(self._cache_scope, path, url, response.content, response.headers)
+            if self._disk_cache is not None:
+                self._disk_cache.put(self._cache_scope, path, url, response.content)
+        return self._decode(response.content, model, validate, event, route.items)
 
+    def _decode(
+        self,
+        content: bytes,
+        model: Any,
+        validate: Optional[ValidateMode],
+        event: Optional[RequestEvent] = None,
+        items: Optional[str] = None,
+    ) -> Any:
+        """
+        Decode a response body, parsing it into `model` when one is given.
+
+        With an `event`, the decode is timed, the `items` of a page are counted
+        and the event is completed.
+        """
+        mode = self._validate if validate is None else validate
+        if event is not None:
+            result = decode_timed(content, model, mode, self._json.loads, event, items)
+            self._hooks.completed(event)
+            return result
+        if model is not None:
+            return parse_response(model, content, mode, self._json.loads)
+        return decode_json(content, self._json.loads)
+
+    def _api_error(self, response: httpx.Response, event: Optional[RequestEvent]) -> VantageAPIError:
+        """Build the error for an unsuccessful response, reporting it to the `on_error` hooks."""
+        error = VantageAPIError(
+            status=response.status_code,
+            status_text=response.reason_phrase,
+            body=response.text,
+        )
+        if event is not None:
+            self._hooks.failed(event, error)
+        return error
+
+    def _resolve_route(self, method: str, path: str) -> Route:
+        """Look up the routing of a request made without a precompiled Route."""
+        method = method.upper()
+        handler = None
         if (method, path) in {("POST", "/v2/costs/data_exports"), ("POST", "/v2/kubernetes_efficiency_reports/data_exports"), ("POST", "/v2/unit_costs/data_exports")}:
-            return self._request_for_location(response)
+            handler = "_request_for_location"
+        boolean_status = (method == "GET" and path.startswith("/v2/virtual_tag_configs/async/"))
+        return Route(method, path, multipart=is_multipart_route(path, method), handler=handler, boolean_status=boolean_status)
 
-        try:
-            data = response.json()
-        except Exception:
-            data = None
+    def _parse(self, model: Any, data: Any, validate: Optional[ValidateMode] = None) -> Any:
+        """Turn a decoded payload into `model` using the per-call or client-level validate mode."""
+        return parse_model(model, data, self._validate if validate is None else validate)
 
-        return data
+    def _send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        *,
+        stream: bool = False,
+        retry: bool = True,
+        event: Optional[RequestEvent] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request, pacing it with the rate limiter and retrying transient failures.
+
+        Pass `retry=False` when the body cannot be sent twice, such as a stream.
+        Each attempt, retry and transport error is reported to the hooks through `event`.
+        """
+        attempt = 0
+        started = time.monotonic()
+        while True:
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve(path)
+                if wait > 0:
+                    time.sleep(wait)
+            try:
+                request = self._http.build_request(method, url, **kwargs)
+                if event is not None:
+                    self._hooks.start_attempt(event, request, attempt, asynchronous=False)
+                    if event.span is not None:
+                        self._tracing.inject(event.span, request.headers)
+                response = self._http.send(request, stream=stream)
+            except httpx.TransportError as e:
+                delay = None
+                if self._retry is not None and retry:
+                    delay = self._retry.next_delay(method, attempt, time.monotonic() - started)
+                if delay is None:
+                    if event is not None:
+                        self._hooks.failed(event, e)
+                    raise
+                if event is not None:
+                    self._hooks.retrying(event, delay, e)
+            else:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.observe(path, response.headers)
+                if event is not None:
+                    self._hooks.record_response(event, response)
+                if self._retry is None or not retry:
+                    return response
+                delay = self._retry.next_delay(
+                    method, attempt, time.monotonic() - started, response.status_code, response.headers
+                )
+                if delay is None:
+                    return response
+                if event is not None:
+                    self._hooks.retrying(event, delay)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _stream_items(
+        self, path: str, params: Optional[Dict[str, Any]], field: str, route: Route
+    ) -> Iterator[Any]:
+        """Yield the decoded items of a paginated GET one at a time, following `links.next`."""
+        next_path: Optional[str] = path + build_query_string(params or {})
+        while next_path is not None:
+            url = self._base_url + next_path
+            event = None
+            if self._hooks is not None:
+                event = RequestEvent("GET", route.path, url)
+            # A page's span stays open while its items are yielded, so it is not made current.
+            with self._tracing.span(route, url, event, current=False) if self._tracing is not None else nullcontext():
+                response = self._send("GET", next_path, url, stream=True, event=event)
+                try:
+                    if not response.is_success:
+                        response.read()
+                        raise self._api_error(response, event)
+                    stream = JSONArrayStream(field, capture={"links"})
+                    for chunk in response.iter_bytes():
+                        yield from stream.feed(chunk)
+                    yield from stream.close()
+                finally:
+                    response.close()
+                if event is not None:
+                    # Items are decoded as the body arrives, so the page reports no separate decode time.
+                    event.items = stream.count
+                    self._hooks.record_response(event, response)
+                    self._hooks.completed(event)
+            next_path = next_page_path(stream.captured.get("links"))
+
+    def _collect_pages(
+        self, path: str, params: Optional[Dict[str, Any]], field: str, route: Optional[Route] = None
+    ) -> Dict[str, Any]:
+        """Fetch every page of a paginated GET into one decoded body, following `links.next`."""
+        data = self.request("GET", path, params=params, route=route)
+        items = list(data.get(field) or ())
+        next_path = next_page_path(data.get("links"))
+        while next_path is not None:
+            page = self.request("GET", next_path, route=route)
+            items.extend(page.get(field) or ())
+            next_path = next_page_path(page.get("links"))
+        data[field] = items
+        return data
+
+    def _collect_shards(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        field: str,
+        shards: List[Tuple[str, str]],
+        concurrency: int,
+        route: Optional[Route] = None,
+    ) -> List[Dict[str, Any]]:
+        """Collect every page of each (start_date, end_date) shard, `concurrency` shards at a time, in shard order."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        def collect(shard: Tuple[str, str]) -> Dict[str, Any]:
+            return self._collect_pages(path, {**params, "start_date": shard[0], "end_date": shard[1]}, field, route)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(collect, shards))
 
     def _request_for_location(self, response: Any) -> str:
         """Extract the Location header from a response."""
@@ -153,10 +593,17 @@ class SyncClient:
 class AccessGrantsApi:
     """API methods for access_grants resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/access_grants", name="access_grants.list", items="access_grants")
+    _create_route = Route("POST", "/v2/access_grants", name="access_grants.create")
+    _get_route = Route("GET", "/v2/access_grants/{access_grant_token}", name="access_grants.get")
+    _update_route = Route("PUT", "/v2/access_grants/{access_grant_token}", name="access_grants.update")
+    _delete_route = Route("DELETE", "/v2/access_grants/{access_grant_token}", name="access_grants.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> AccessGrants:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> AccessGrants:
         """
         Get all access grants
         
@@ -168,12 +615,21 @@ class AccessGrantsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AccessGrants.model_validate(data)
-        return data
-
-    def create(self, body: CreateAccessGrant) -> AccessGrant:
+        return self._client.request("GET", path, params=params, body=body_data, model=AccessGrants, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[AccessGrant]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("access_grants") or ():
+                yield self._client._parse(AccessGrant, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateAccessGrant, *, validate: Optional[ValidateMode] = None) -> AccessGrant:
         """
         Create access grant
         
@@ -182,12 +638,9 @@ class AccessGrantsApi:
         path = "/v2/access_grants"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AccessGrant.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=AccessGrant, validate=validate, route=self._create_route)
 
-    def get(self, access_grant_token: str) -> AccessGrant:
+    def get(self, access_grant_token: str, *, validate: Optional[ValidateMode] = None) -> AccessGrant:
         """
         Get access grant by token
         
@@ -196,12 +649,9 @@ class AccessGrantsApi:
         path = f"/v2/access_grants/{quote(str(access_grant_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AccessGrant.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=AccessGrant, validate=validate, route=self._get_route)
 
-    def update(self, access_grant_token: str, body: UpdateAccessGrant) -> AccessGrant:
+    def update(self, access_grant_token: str, body: UpdateAccessGrant, *, validate: Optional[ValidateMode] = None) -> AccessGrant:
         """
         Update access grant
         
@@ -210,10 +660,7 @@ class AccessGrantsApi:
         path = f"/v2/access_grants/{quote(str(access_grant_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AccessGrant.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=AccessGrant, validate=validate, route=self._update_route)
 
     def delete(self, access_grant_token: str) -> None:
         """
@@ -224,16 +671,60 @@ class AccessGrantsApi:
         path = f"/v2/access_grants/{quote(str(access_grant_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AccessGrant]:
+        """
+        Fetch many access grants by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateAccessGrant], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AccessGrant]:
+        """
+        Create many access grants, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateAccessGrant], Iterable[Tuple[str, UpdateAccessGrant]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AccessGrant]:
+        """
+        Update many access grants, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many access grants by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class AnomalyAlertsApi:
     """API methods for anomaly_alerts resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/anomaly_alerts", name="anomaly_alerts.list", items="anomaly_alerts")
+    _get_route = Route("GET", "/v2/anomaly_alerts/{anomaly_alert_token}", name="anomaly_alerts.get")
+    _update_route = Route("PUT", "/v2/anomaly_alerts/{anomaly_alert_token}", name="anomaly_alerts.update")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, provider: Optional[str] = None, service: Optional[str] = None, cost_category: Optional[str] = None, cost_report_token: Optional[str] = None) -> AnomalyAlerts:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, provider: Optional[str] = None, service: Optional[str] = None, cost_category: Optional[str] = None, cost_report_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> AnomalyAlerts:
         """
         Get all anomaly alerts
         
@@ -251,12 +742,21 @@ class AnomalyAlertsApi:
             "cost_report_token": cost_report_token,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AnomalyAlerts.model_validate(data)
-        return data
-
-    def get(self, anomaly_alert_token: str) -> AnomalyAlert:
+        return self._client.request("GET", path, params=params, body=body_data, model=AnomalyAlerts, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, provider: Optional[str] = None, service: Optional[str] = None, cost_category: Optional[str] = None, cost_report_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[AnomalyAlert]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, start_date=start_date, end_date=end_date, provider=provider, service=service, cost_category=cost_category, cost_report_token=cost_report_token, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("anomaly_alerts") or ():
+                yield self._client._parse(AnomalyAlert, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def get(self, anomaly_alert_token: str, *, validate: Optional[ValidateMode] = None) -> AnomalyAlert:
         """
         Get anomaly alert by token
         
@@ -265,12 +765,9 @@ class AnomalyAlertsApi:
         path = f"/v2/anomaly_alerts/{quote(str(anomaly_alert_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AnomalyAlert.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=AnomalyAlert, validate=validate, route=self._get_route)
 
-    def update(self, anomaly_alert_token: str, body: UpdateAnomalyAlert) -> AnomalyAlert:
+    def update(self, anomaly_alert_token: str, body: UpdateAnomalyAlert, *, validate: Optional[ValidateMode] = None) -> AnomalyAlert:
         """
         Update anomaly alert
         
@@ -279,19 +776,44 @@ class AnomalyAlertsApi:
         path = f"/v2/anomaly_alerts/{quote(str(anomaly_alert_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AnomalyAlert.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=AnomalyAlert, validate=validate, route=self._update_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AnomalyAlert]:
+        """
+        Fetch many anomaly alerts by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateAnomalyAlert], Iterable[Tuple[str, UpdateAnomalyAlert]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AnomalyAlert]:
+        """
+        Update many anomaly alerts, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
 
 
 class AnomalyNotificationsApi:
     """API methods for anomaly_notifications resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/anomaly_notifications", name="anomaly_notifications.list", items="anomaly_notifications")
+    _create_route = Route("POST", "/v2/anomaly_notifications", name="anomaly_notifications.create")
+    _get_route = Route("GET", "/v2/anomaly_notifications/{anomaly_notification_token}", name="anomaly_notifications.get")
+    _update_route = Route("PUT", "/v2/anomaly_notifications/{anomaly_notification_token}", name="anomaly_notifications.update")
+    _delete_route = Route("DELETE", "/v2/anomaly_notifications/{anomaly_notification_token}", name="anomaly_notifications.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> AnomalyNotifications:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> AnomalyNotifications:
         """
         Get all anomaly notifications
         
@@ -303,12 +825,21 @@ class AnomalyNotificationsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AnomalyNotifications.model_validate(data)
-        return data
-
-    def create(self, body: CreateAnomalyNotification) -> AnomalyNotification:
+        return self._client.request("GET", path, params=params, body=body_data, model=AnomalyNotifications, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[AnomalyNotification]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("anomaly_notifications") or ():
+                yield self._client._parse(AnomalyNotification, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateAnomalyNotification, *, validate: Optional[ValidateMode] = None) -> AnomalyNotification:
         """
         Create anomaly notification
         
@@ -317,12 +848,9 @@ class AnomalyNotificationsApi:
         path = "/v2/anomaly_notifications"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AnomalyNotification.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=AnomalyNotification, validate=validate, route=self._create_route)
 
-    def get(self, anomaly_notification_token: str) -> AnomalyNotification:
+    def get(self, anomaly_notification_token: str, *, validate: Optional[ValidateMode] = None) -> AnomalyNotification:
         """
         Get anomaly notification by token
         
@@ -331,12 +859,9 @@ class AnomalyNotificationsApi:
         path = f"/v2/anomaly_notifications/{quote(str(anomaly_notification_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AnomalyNotification.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=AnomalyNotification, validate=validate, route=self._get_route)
 
-    def update(self, anomaly_notification_token: str, body: UpdateAnomalyNotification) -> AnomalyNotification:
+    def update(self, anomaly_notification_token: str, body: UpdateAnomalyNotification, *, validate: Optional[ValidateMode] = None) -> AnomalyNotification:
         """
         Update anomaly notification
         
@@ -345,10 +870,7 @@ class AnomalyNotificationsApi:
         path = f"/v2/anomaly_notifications/{quote(str(anomaly_notification_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AnomalyNotification.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=AnomalyNotification, validate=validate, route=self._update_route)
 
     def delete(self, anomaly_notification_token: str) -> None:
         """
@@ -359,16 +881,59 @@ class AnomalyNotificationsApi:
         path = f"/v2/anomaly_notifications/{quote(str(anomaly_notification_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AnomalyNotification]:
+        """
+        Fetch many anomaly notifications by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateAnomalyNotification], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AnomalyNotification]:
+        """
+        Create many anomaly notifications, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateAnomalyNotification], Iterable[Tuple[str, UpdateAnomalyNotification]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AnomalyNotification]:
+        """
+        Update many anomaly notifications, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many anomaly notifications by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class AuditLogsApi:
     """API methods for audit_logs resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/audit_logs", name="audit_logs.list", items="audit_logs")
+    _get_route = Route("GET", "/v2/audit_logs/{audit_log_token}", name="audit_logs.get")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, user: Optional[int] = None, workspace_token: Optional[str] = None, action: Optional[str] = None, object_name: Optional[str] = None, source: Optional[str] = None, object_type: Optional[str] = None, token: Optional[str] = None, object_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None) -> AuditLogs:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, user: Optional[int] = None, workspace_token: Optional[str] = None, action: Optional[str] = None, object_name: Optional[str] = None, source: Optional[str] = None, object_type: Optional[str] = None, token: Optional[str] = None, object_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, validate: Optional[ValidateMode] = None) -> AuditLogs:
         """
         Get all audit logs
         
@@ -390,12 +955,21 @@ class AuditLogsApi:
             "end_date": end_date,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AuditLogs.model_validate(data)
-        return data
-
-    def get(self, audit_log_token: str) -> AuditLog:
+        return self._client.request("GET", path, params=params, body=body_data, model=AuditLogs, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, user: Optional[int] = None, workspace_token: Optional[str] = None, action: Optional[str] = None, object_name: Optional[str] = None, source: Optional[str] = None, object_type: Optional[str] = None, token: Optional[str] = None, object_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[AuditLog]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, user=user, workspace_token=workspace_token, action=action, object_name=object_name, source=source, object_type=object_type, token=token, object_token=object_token, start_date=start_date, end_date=end_date, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("audit_logs") or ():
+                yield self._client._parse(AuditLog, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def get(self, audit_log_token: str, *, validate: Optional[ValidateMode] = None) -> AuditLog:
         """
         Get audit log by token
         
@@ -404,19 +978,32 @@ class AuditLogsApi:
         path = f"/v2/audit_logs/{quote(str(audit_log_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AuditLog.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=AuditLog, validate=validate, route=self._get_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[AuditLog]:
+        """
+        Fetch many audit logs by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
 
 
 class BillingProfilesApi:
     """API methods for billing_profiles resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/billing_profiles", name="billing_profiles.list", items="billing_profiles")
+    _create_route = Route("POST", "/v2/billing_profiles", name="billing_profiles.create")
+    _get_route = Route("GET", "/v2/billing_profiles/{billing_profile_token}", name="billing_profiles.get")
+    _update_route = Route("PUT", "/v2/billing_profiles/{billing_profile_token}", name="billing_profiles.update")
+    _delete_route = Route("DELETE", "/v2/billing_profiles/{billing_profile_token}", name="billing_profiles.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> BillingProfiles:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> BillingProfiles:
         """
         Get all billing profiles
         
@@ -428,12 +1015,21 @@ class BillingProfilesApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingProfiles.model_validate(data)
-        return data
-
-    def create(self, body: CreateBillingProfile) -> BillingProfile:
+        return self._client.request("GET", path, params=params, body=body_data, model=BillingProfiles, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[BillingProfile]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("billing_profiles") or ():
+                yield self._client._parse(BillingProfile, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateBillingProfile, *, validate: Optional[ValidateMode] = None) -> BillingProfile:
         """
         Create billing profile
         
@@ -442,12 +1038,9 @@ class BillingProfilesApi:
         path = "/v2/billing_profiles"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingProfile.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=BillingProfile, validate=validate, route=self._create_route)
 
-    def get(self, billing_profile_token: str) -> BillingProfile:
+    def get(self, billing_profile_token: str, *, validate: Optional[ValidateMode] = None) -> BillingProfile:
         """
         Get billing profile by token
         
@@ -456,12 +1049,9 @@ class BillingProfilesApi:
         path = f"/v2/billing_profiles/{quote(str(billing_profile_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingProfile.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=BillingProfile, validate=validate, route=self._get_route)
 
-    def update(self, billing_profile_token: str, body: UpdateBillingProfile) -> BillingProfile:
+    def update(self, billing_profile_token: str, body: UpdateBillingProfile, *, validate: Optional[ValidateMode] = None) -> BillingProfile:
         """
         Update billing profile
         
@@ -470,10 +1060,7 @@ class BillingProfilesApi:
         path = f"/v2/billing_profiles/{quote(str(billing_profile_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingProfile.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=BillingProfile, validate=validate, route=self._update_route)
 
     def delete(self, billing_profile_token: str) -> None:
         """
@@ -484,16 +1071,62 @@ class BillingProfilesApi:
         path = f"/v2/billing_profiles/{quote(str(billing_profile_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BillingProfile]:
+        """
+        Fetch many billing profiles by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateBillingProfile], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BillingProfile]:
+        """
+        Create many billing profiles, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateBillingProfile], Iterable[Tuple[str, UpdateBillingProfile]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BillingProfile]:
+        """
+        Update many billing profiles, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many billing profiles by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class BillingRulesApi:
     """API methods for billing_rules resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/billing_rules", name="billing_rules.list", items="billing_rules")
+    _create_route = Route("POST", "/v2/billing_rules", name="billing_rules.create")
+    _get_route = Route("GET", "/v2/billing_rules/{billing_rule_token}", name="billing_rules.get")
+    _update_route = Route("PUT", "/v2/billing_rules/{billing_rule_token}", name="billing_rules.update")
+    _delete_route = Route("DELETE", "/v2/billing_rules/{billing_rule_token}", name="billing_rules.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> BillingRules:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> BillingRules:
         """
         Get all billing rules
         
@@ -505,12 +1138,21 @@ class BillingRulesApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingRules.model_validate(data)
-        return data
-
-    def create(self, body: CreateBillingRule) -> BillingRule:
+        return self._client.request("GET", path, params=params, body=body_data, model=BillingRules, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[BillingRule]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("billing_rules") or ():
+                yield self._client._parse(BillingRule, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateBillingRule, *, validate: Optional[ValidateMode] = None) -> BillingRule:
         """
         Create billing rule
         
@@ -519,12 +1161,9 @@ class BillingRulesApi:
         path = "/v2/billing_rules"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingRule.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=BillingRule, validate=validate, route=self._create_route)
 
-    def get(self, billing_rule_token: str) -> BillingRule:
+    def get(self, billing_rule_token: str, *, validate: Optional[ValidateMode] = None) -> BillingRule:
         """
         Get billing rule by token
         
@@ -533,12 +1172,9 @@ class BillingRulesApi:
         path = f"/v2/billing_rules/{quote(str(billing_rule_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingRule.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=BillingRule, validate=validate, route=self._get_route)
 
-    def update(self, billing_rule_token: str, body: UpdateBillingRule) -> BillingRule:
+    def update(self, billing_rule_token: str, body: UpdateBillingRule, *, validate: Optional[ValidateMode] = None) -> BillingRule:
         """
         Update billing rule
         
@@ -547,10 +1183,7 @@ class BillingRulesApi:
         path = f"/v2/billing_rules/{quote(str(billing_rule_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BillingRule.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=BillingRule, validate=validate, route=self._update_route)
 
     def delete(self, billing_rule_token: str) -> None:
         """
@@ -561,16 +1194,62 @@ class BillingRulesApi:
         path = f"/v2/billing_rules/{quote(str(billing_rule_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BillingRule]:
+        """
+        Fetch many billing rules by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateBillingRule], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BillingRule]:
+        """
+        Create many billing rules, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateBillingRule], Iterable[Tuple[str, UpdateBillingRule]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BillingRule]:
+        """
+        Update many billing rules, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many billing rules by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class BudgetAlertsApi:
     """API methods for budget_alerts resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/budget_alerts", name="budget_alerts.list", items="budget_alerts")
+    _create_route = Route("POST", "/v2/budget_alerts", name="budget_alerts.create")
+    _get_route = Route("GET", "/v2/budget_alerts/{budget_alert_token}", name="budget_alerts.get")
+    _update_route = Route("PUT", "/v2/budget_alerts/{budget_alert_token}", name="budget_alerts.update")
+    _delete_route = Route("DELETE", "/v2/budget_alerts/{budget_alert_token}", name="budget_alerts.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> BudgetAlerts:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> BudgetAlerts:
         """
         Get all budget alerts
         
@@ -582,12 +1261,21 @@ class BudgetAlertsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BudgetAlerts.model_validate(data)
-        return data
-
-    def create(self, body: CreateBudgetAlert) -> BudgetAlert:
+        return self._client.request("GET", path, params=params, body=body_data, model=BudgetAlerts, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[BudgetAlert]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("budget_alerts") or ():
+                yield self._client._parse(BudgetAlert, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateBudgetAlert, *, validate: Optional[ValidateMode] = None) -> BudgetAlert:
         """
         Create budget alert
         
@@ -596,12 +1284,9 @@ class BudgetAlertsApi:
         path = "/v2/budget_alerts"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BudgetAlert.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=BudgetAlert, validate=validate, route=self._create_route)
 
-    def get(self, budget_alert_token: str) -> BudgetAlert:
+    def get(self, budget_alert_token: str, *, validate: Optional[ValidateMode] = None) -> BudgetAlert:
         """
         Get budget alert by token
         
@@ -610,12 +1295,9 @@ class BudgetAlertsApi:
         path = f"/v2/budget_alerts/{quote(str(budget_alert_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BudgetAlert.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=BudgetAlert, validate=validate, route=self._get_route)
 
-    def update(self, budget_alert_token: str, body: UpdateBudgetAlert) -> BudgetAlert:
+    def update(self, budget_alert_token: str, body: UpdateBudgetAlert, *, validate: Optional[ValidateMode] = None) -> BudgetAlert:
         """
         Update budget alert
         
@@ -624,10 +1306,7 @@ class BudgetAlertsApi:
         path = f"/v2/budget_alerts/{quote(str(budget_alert_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BudgetAlert.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=BudgetAlert, validate=validate, route=self._update_route)
 
     def delete(self, budget_alert_token: str) -> None:
         """
@@ -638,16 +1317,62 @@ class BudgetAlertsApi:
         path = f"/v2/budget_alerts/{quote(str(budget_alert_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BudgetAlert]:
+        """
+        Fetch many budget alerts by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateBudgetAlert], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BudgetAlert]:
+        """
+        Create many budget alerts, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateBudgetAlert], Iterable[Tuple[str, UpdateBudgetAlert]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BudgetAlert]:
+        """
+        Update many budget alerts, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many budget alerts by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class BudgetsApi:
     """API methods for budgets resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/budgets", name="budgets.list", items="budgets")
+    _create_route = Route("POST", "/v2/budgets", name="budgets.create")
+    _get_route = Route("GET", "/v2/budgets/{budget_token}", name="budgets.get")
+    _update_route = Route("PUT", "/v2/budgets/{budget_token}", name="budgets.update")
+    _delete_route = Route("DELETE", "/v2/budgets/{budget_token}", name="budgets.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> Budgets:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Budgets:
         """
         Get all budgets
         
@@ -659,12 +1384,21 @@ class BudgetsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Budgets.model_validate(data)
-        return data
-
-    def create(self, body: CreateBudget) -> Budget:
+        return self._client.request("GET", path, params=params, body=body_data, model=Budgets, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Budget]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("budgets") or ():
+                yield self._client._parse(Budget, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateBudget, *, validate: Optional[ValidateMode] = None) -> Budget:
         """
         Create budget
         
@@ -673,12 +1407,9 @@ class BudgetsApi:
         path = "/v2/budgets"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Budget.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Budget, validate=validate, route=self._create_route)
 
-    def get(self, budget_token: str, *, include_performance: Optional[bool] = None) -> Budget:
+    def get(self, budget_token: str, *, include_performance: Optional[bool] = None, validate: Optional[ValidateMode] = None) -> Budget:
         """
         Get budget by token
         
@@ -689,12 +1420,9 @@ class BudgetsApi:
             "include_performance": include_performance,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Budget.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Budget, validate=validate, route=self._get_route)
 
-    def update(self, budget_token: str, body: UpdateBudget) -> Budget:
+    def update(self, budget_token: str, body: UpdateBudget, *, validate: Optional[ValidateMode] = None) -> Budget:
         """
         Update budget
         
@@ -703,10 +1431,7 @@ class BudgetsApi:
         path = f"/v2/budgets/{quote(str(budget_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Budget.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Budget, validate=validate, route=self._update_route)
 
     def delete(self, budget_token: str) -> None:
         """
@@ -717,16 +1442,65 @@ class BudgetsApi:
         path = f"/v2/budgets/{quote(str(budget_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, include_performance: Optional[bool] = None, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Budget]:
+        """
+        Fetch many budgets by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, include_performance=include_performance, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateBudget], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Budget]:
+        """
+        Create many budgets, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateBudget], Iterable[Tuple[str, UpdateBudget]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Budget]:
+        """
+        Update many budgets, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many budgets by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class BusinessMetricsApi:
     """API methods for business_metrics resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/business_metrics", name="business_metrics.list")
+    _create_route = Route("POST", "/v2/business_metrics", name="business_metrics.create")
+    _get_route = Route("GET", "/v2/business_metrics/{business_metric_token}", name="business_metrics.get")
+    _update_route = Route("PUT", "/v2/business_metrics/{business_metric_token}", name="business_metrics.update")
+    _delete_route = Route("DELETE", "/v2/business_metrics/{business_metric_token}", name="business_metrics.delete")
+    _get_values_route = Route("GET", "/v2/business_metrics/{business_metric_token}/values", name="business_metrics.get_values")
+    _get_forecasted_values_route = Route("GET", "/v2/business_metrics/{business_metric_token}/forecasted_values", name="business_metrics.get_forecasted_values")
+    _update_values_csv_route = Route("PUT", "/v2/business_metrics/{business_metric_token}/values.csv", multipart=True, name="business_metrics.update_values_csv")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> BusinessMetrics:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> BusinessMetrics:
         """
         Get all business metrics
         
@@ -738,12 +1512,9 @@ class BusinessMetricsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BusinessMetrics.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=BusinessMetrics, validate=validate, route=self._list_route)
 
-    def create(self, body: CreateBusinessMetric) -> BusinessMetric:
+    def create(self, body: CreateBusinessMetric, *, validate: Optional[ValidateMode] = None) -> BusinessMetric:
         """
         Create business metric
         
@@ -752,12 +1523,9 @@ class BusinessMetricsApi:
         path = "/v2/business_metrics"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BusinessMetric.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=BusinessMetric, validate=validate, route=self._create_route)
 
-    def get(self, business_metric_token: str) -> BusinessMetric:
+    def get(self, business_metric_token: str, *, validate: Optional[ValidateMode] = None) -> BusinessMetric:
         """
         Get business metric by token
         
@@ -766,12 +1534,9 @@ class BusinessMetricsApi:
         path = f"/v2/business_metrics/{quote(str(business_metric_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BusinessMetric.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=BusinessMetric, validate=validate, route=self._get_route)
 
-    def update(self, business_metric_token: str, body: UpdateBusinessMetric) -> BusinessMetric:
+    def update(self, business_metric_token: str, body: UpdateBusinessMetric, *, validate: Optional[ValidateMode] = None) -> BusinessMetric:
         """
         Update business metric
         
@@ -780,10 +1545,7 @@ class BusinessMetricsApi:
         path = f"/v2/business_metrics/{quote(str(business_metric_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BusinessMetric.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=BusinessMetric, validate=validate, route=self._update_route)
 
     def delete(self, business_metric_token: str) -> None:
         """
@@ -794,9 +1556,9 @@ class BusinessMetricsApi:
         path = f"/v2/business_metrics/{quote(str(business_metric_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
 
-    def get_values(self, business_metric_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, start_date: Optional[str] = None) -> BusinessMetricValues:
+    def get_values(self, business_metric_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, start_date: Optional[str] = None, validate: Optional[ValidateMode] = None) -> BusinessMetricValues:
         """
         Get business metric values
         
@@ -809,12 +1571,9 @@ class BusinessMetricsApi:
             "start_date": start_date,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BusinessMetricValues.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=BusinessMetricValues, validate=validate, route=self._get_values_route)
 
-    def get_forecasted_values(self, business_metric_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, start_date: Optional[str] = None) -> BusinessMetricValues:
+    def get_forecasted_values(self, business_metric_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, start_date: Optional[str] = None, validate: Optional[ValidateMode] = None) -> BusinessMetricValues:
         """
         Get business metric forecasted values
         
@@ -827,12 +1586,9 @@ class BusinessMetricsApi:
             "start_date": start_date,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BusinessMetricValues.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=BusinessMetricValues, validate=validate, route=self._get_forecasted_values_route)
 
-    def update_values_csv(self, business_metric_token: str, body: dict[str, Any]) -> BusinessMetric:
+    def update_values_csv(self, business_metric_token: str, body: UploadBody, *, validate: Optional[ValidateMode] = None) -> BusinessMetric:
         """
         Update business metric values from CSV
         
@@ -841,19 +1597,64 @@ class BusinessMetricsApi:
         path = f"/v2/business_metrics/{quote(str(business_metric_token), safe='')}/values.csv"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return BusinessMetric.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=BusinessMetric, validate=validate, route=self._update_values_csv_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BusinessMetric]:
+        """
+        Fetch many business metrics by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateBusinessMetric], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BusinessMetric]:
+        """
+        Create many business metrics, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateBusinessMetric], Iterable[Tuple[str, UpdateBusinessMetric]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[BusinessMetric]:
+        """
+        Update many business metrics, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many business metrics by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class CostAlertsApi:
     """API methods for cost_alerts resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _get_events_route = Route("GET", "/v2/cost_alerts/{cost_alert_token}/events", name="cost_alerts.get_events", items="cost_alert_events")
+    _get_event_route = Route("GET", "/v2/cost_alerts/{cost_alert_token}/events/{event_token}", name="cost_alerts.get_event")
+    _list_route = Route("GET", "/v2/cost_alerts", name="cost_alerts.list", items="cost_alerts")
+    _create_route = Route("POST", "/v2/cost_alerts", name="cost_alerts.create")
+    _get_route = Route("GET", "/v2/cost_alerts/{cost_alert_token}", name="cost_alerts.get")
+    _update_route = Route("PUT", "/v2/cost_alerts/{cost_alert_token}", name="cost_alerts.update")
+    _delete_route = Route("DELETE", "/v2/cost_alerts/{cost_alert_token}", name="cost_alerts.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def get_events(self, cost_alert_token: str, *, report_token: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None) -> CostAlertEvents:
+    def get_events(self, cost_alert_token: str, *, report_token: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> CostAlertEvents:
         """
         Get all cost alert events
         
@@ -866,12 +1667,21 @@ class CostAlertsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostAlertEvents.model_validate(data)
-        return data
-
-    def get_event(self, cost_alert_token: str, event_token: str) -> CostAlertEvent:
+        return self._client.request("GET", path, params=params, body=body_data, model=CostAlertEvents, validate=validate, route=self._get_events_route)
+
+    def iter_events(self, cost_alert_token: str, *, report_token: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[CostAlertEvent]:
+        """Iterate over every item of `get_events`, following `links.next` one page at a time."""
+        data = self.get_events(cost_alert_token, report_token=report_token, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("cost_alert_events") or ():
+                yield self._client._parse(CostAlertEvent, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_events_route)
+
+    def get_event(self, cost_alert_token: str, event_token: str, *, validate: Optional[ValidateMode] = None) -> CostAlertEvent:
         """
         Get cost alert event by token
         
@@ -880,12 +1690,9 @@ class CostAlertsApi:
         path = f"/v2/cost_alerts/{quote(str(cost_alert_token), safe='')}/events/{quote(str(event_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostAlertEvent.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=CostAlertEvent, validate=validate, route=self._get_event_route)
 
-    def list(self) -> CostAlerts:
+    def list(self, *, validate: Optional[ValidateMode] = None) -> CostAlerts:
         """
         Get all cost alerts
         
@@ -894,12 +1701,21 @@ class CostAlertsApi:
         path = "/v2/cost_alerts"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostAlerts.model_validate(data)
-        return data
-
-    def create(self, body: CreateCostAlert) -> CostAlert:
+        return self._client.request("GET", path, params=params, body=body_data, model=CostAlerts, validate=validate, route=self._list_route)
+
+    def list_all(self, *, validate: Optional[ValidateMode] = None) -> Iterator[CostAlert]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("cost_alerts") or ():
+                yield self._client._parse(CostAlert, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateCostAlert, *, validate: Optional[ValidateMode] = None) -> CostAlert:
         """
         Create cost alert
         
@@ -908,12 +1724,9 @@ class CostAlertsApi:
         path = "/v2/cost_alerts"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostAlert.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=CostAlert, validate=validate, route=self._create_route)
 
-    def get(self, cost_alert_token: str) -> CostAlert:
+    def get(self, cost_alert_token: str, *, validate: Optional[ValidateMode] = None) -> CostAlert:
         """
         Get cost alert by token
         
@@ -922,12 +1735,9 @@ class CostAlertsApi:
         path = f"/v2/cost_alerts/{quote(str(cost_alert_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostAlert.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=CostAlert, validate=validate, route=self._get_route)
 
-    def update(self, cost_alert_token: str, body: UpdateCostAlert) -> CostAlert:
+    def update(self, cost_alert_token: str, body: UpdateCostAlert, *, validate: Optional[ValidateMode] = None) -> CostAlert:
         """
         Update cost alert
         
@@ -936,10 +1746,7 @@ class CostAlertsApi:
         path = f"/v2/cost_alerts/{quote(str(cost_alert_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostAlert.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=CostAlert, validate=validate, route=self._update_route)
 
     def delete(self, cost_alert_token: str) -> None:
         """
@@ -950,16 +1757,58 @@ class CostAlertsApi:
         path = f"/v2/cost_alerts/{quote(str(cost_alert_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[CostAlert]:
+        """
+        Fetch many cost alerts by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateCostAlert], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[CostAlert]:
+        """
+        Create many cost alerts, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateCostAlert], Iterable[Tuple[str, UpdateCostAlert]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[CostAlert]:
+        """
+        Update many cost alerts, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many cost alerts by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class CostProviderAccountsApi:
     """API methods for cost_provider_accounts resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/cost_provider_accounts", name="cost_provider_accounts.list", items="cost_provider_accounts")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, workspace_token: Optional[str] = None, provider: Optional[str] = None, account_id: Optional[str] = None, account_name: Optional[str] = None) -> CostProviderAccounts:
+    def list(self, *, workspace_token: Optional[str] = None, provider: Optional[str] = None, account_id: Optional[str] = None, account_name: Optional[str] = None, validate: Optional[ValidateMode] = None) -> CostProviderAccounts:
         """
         Get all cost provider accounts
         
@@ -973,19 +1822,31 @@ class CostProviderAccountsApi:
             "account_name": account_name,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostProviderAccounts.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=CostProviderAccounts, validate=validate, route=self._list_route)
+
+    def list_all(self, *, workspace_token: Optional[str] = None, provider: Optional[str] = None, account_id: Optional[str] = None, account_name: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[CostProviderAccount]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(workspace_token=workspace_token, provider=provider, account_id=account_id, account_name=account_name, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("cost_provider_accounts") or ():
+                yield self._client._parse(CostProviderAccount, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
 
 
 class CostProvidersApi:
     """API methods for cost_providers resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/cost_providers", name="cost_providers.list", items="cost_providers")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, workspace_token: Optional[str] = None) -> CostProviders:
+    def list(self, *, workspace_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> CostProviders:
         """
         Get cost providers
         
@@ -996,19 +1857,36 @@ class CostProvidersApi:
             "workspace_token": workspace_token,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostProviders.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=CostProviders, validate=validate, route=self._list_route)
+
+    def list_all(self, *, workspace_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[CostProvider]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(workspace_token=workspace_token, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("cost_providers") or ():
+                yield self._client._parse(CostProvider, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
 
 
 class CostReportsApi:
     """API methods for cost_reports resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/cost_reports", name="cost_reports.list", items="cost_reports")
+    _create_route = Route("POST", "/v2/cost_reports", name="cost_reports.create")
+    _get_route = Route("GET", "/v2/cost_reports/{cost_report_token}", name="cost_reports.get")
+    _update_route = Route("PUT", "/v2/cost_reports/{cost_report_token}", name="cost_reports.update")
+    _delete_route = Route("DELETE", "/v2/cost_reports/{cost_report_token}", name="cost_reports.delete")
+    _get_forecasted_costs_route = Route("GET", "/v2/cost_reports/{cost_report_token}/forecasted_costs", name="cost_reports.get_forecasted_costs", items="forecasted_costs")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, folder_token: Optional[str] = None) -> CostReports:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, folder_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> CostReports:
         """
         Get all cost reports
         
@@ -1021,12 +1899,21 @@ class CostReportsApi:
             "folder_token": folder_token,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostReports.model_validate(data)
-        return data
-
-    def create(self, body: CreateCostReport) -> CostReport:
+        return self._client.request("GET", path, params=params, body=body_data, model=CostReports, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, folder_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[CostReport]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, folder_token=folder_token, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("cost_reports") or ():
+                yield self._client._parse(CostReport, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateCostReport, *, validate: Optional[ValidateMode] = None) -> CostReport:
         """
         Create cost report
         
@@ -1035,12 +1922,9 @@ class CostReportsApi:
         path = "/v2/cost_reports"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostReport.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=CostReport, validate=validate, route=self._create_route)
 
-    def get(self, cost_report_token: str) -> CostReport:
+    def get(self, cost_report_token: str, *, validate: Optional[ValidateMode] = None) -> CostReport:
         """
         Get cost report by token
         
@@ -1049,12 +1933,9 @@ class CostReportsApi:
         path = f"/v2/cost_reports/{quote(str(cost_report_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostReport.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=CostReport, validate=validate, route=self._get_route)
 
-    def update(self, cost_report_token: str, body: UpdateCostReport) -> CostReport:
+    def update(self, cost_report_token: str, body: UpdateCostReport, *, validate: Optional[ValidateMode] = None) -> CostReport:
         """
         Update cost report
         
@@ -1063,10 +1944,7 @@ class CostReportsApi:
         path = f"/v2/cost_reports/{quote(str(cost_report_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostReport.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=CostReport, validate=validate, route=self._update_route)
 
     def delete(self, cost_report_token: str) -> None:
         """
@@ -1077,9 +1955,9 @@ class CostReportsApi:
         path = f"/v2/cost_reports/{quote(str(cost_report_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
 
-    def get_forecasted_costs(self, cost_report_token: str, *, start_date: Optional[str] = None, end_date: Optional[str] = None, provider: Optional[str] = None, service: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None) -> ForecastedCosts:
+    def get_forecasted_costs(self, cost_report_token: str, *, start_date: Optional[str] = None, end_date: Optional[str] = None, provider: Optional[str] = None, service: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> ForecastedCosts:
         """
         Get forecasted costs for a cost report
         
@@ -1095,19 +1973,92 @@ class CostReportsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ForecastedCosts.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=ForecastedCosts, validate=validate, route=self._get_forecasted_costs_route)
+
+    def iter_forecasted_costs(self, cost_report_token: str, *, start_date: Optional[str] = None, end_date: Optional[str] = None, provider: Optional[str] = None, service: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[ForecastedCost]:
+        """Iterate over every item of `get_forecasted_costs`, following `links.next` one page at a time."""
+        data = self.get_forecasted_costs(cost_report_token, start_date=start_date, end_date=end_date, provider=provider, service=service, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("forecasted_costs") or ():
+                yield self._client._parse(ForecastedCost, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_forecasted_costs_route)
+
+    def get_forecasted_costs_columnar(self, cost_report_token: str, *, start_date: Optional[str] = None, end_date: Optional[str] = None, provider: Optional[str] = None, service: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None) -> ColumnarResult:
+        """
+        Fetch every page of `get_forecasted_costs` into column arrays instead of `ForecastedCost` models.
+
+        Rows are decoded straight into a ColumnarResult, following `links.next`.
+        Stored as float64: amount.
+        Dictionary-encoded: provider, service.
+        """
+        path = f"/v2/cost_reports/{quote(str(cost_report_token), safe='')}/forecasted_costs"
+        params = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "provider": provider,
+            "service": service,
+            "page": page,
+            "limit": limit,
+        }
+        result = ColumnarResult(numeric=('amount',), categorical=('provider', 'service'))
+        for row in self._client._stream_items(path, params, "forecasted_costs", self._get_forecasted_costs_route):
+            result.append(row)
+        return result
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[CostReport]:
+        """
+        Fetch many cost reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateCostReport], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[CostReport]:
+        """
+        Create many cost reports, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateCostReport], Iterable[Tuple[str, UpdateCostReport]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[CostReport]:
+        """
+        Update many cost reports, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many cost reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class CostServicesApi:
     """API methods for cost_services resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/cost_services", name="cost_services.list", items="cost_services")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, workspace_token: Optional[str] = None) -> CostServices:
+    def list(self, *, workspace_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> CostServices:
         """
         Get cost services
         
@@ -1118,15 +2069,28 @@ class CostServicesApi:
             "workspace_token": workspace_token,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostServices.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=CostServices, validate=validate, route=self._list_route)
+
+    def list_all(self, *, workspace_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[CostService]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(workspace_token=workspace_token, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("cost_services") or ():
+                yield self._client._parse(CostService, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
 
 
 class CostsApi:
     """API methods for costs resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _create_export_route = Route("POST", "/v2/costs/data_exports", handler="_request_for_location", name="costs.create_export")
+    _list_route = Route("GET", "/v2/costs", name="costs.list", items="costs")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
@@ -1141,9 +2105,24 @@ class CostsApi:
             "groupings": groupings,
         }
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        return self._client.request("POST", path, params=params, body=body_data)
+        return self._client.request("POST", path, params=params, body=body_data, route=self._create_export_route)
+
+    def export_and_download(self, body: CreateCostExport, dest: Union[str, Path], *, groupings: Optional[List[str]] = None, concurrency: int = 4, timeout: Optional[float] = 3600.0, resume: bool = True, validate: Optional[ValidateMode] = None) -> ExportDownload:
+        """
+        Generate a data export with `create_export`, wait for it and download its files into `dest`.
+
+        The export is polled with a growing interval (up to 30s) until it completes,
+        failing after `timeout` seconds. Its files are streamed to disk `concurrency`
+        at a time and checked against their size and checksum. With `resume`, files
+        already downloaded are kept and partial ones are continued. Use
+        `ExportDownload.rows()` to iterate the CSV rows of all files.
+        """
+        location = self.create_export(body, groupings=groupings)
+        return download_export(
+            self._client, location, dest, concurrency=concurrency, timeout=timeout, resume=resume, validate=validate
+        )
 
-    def list(self, *, cost_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, groupings: Optional[List[str]] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None, date_bin: Optional[str] = None, settings_include_credits: Optional[bool] = None, settings_include_refunds: Optional[bool] = None, settings_include_discounts: Optional[bool] = None, settings_include_tax: Optional[bool] = None, settings_amortize: Optional[bool] = None, settings_unallocated: Optional[bool] = None, settings_aggregate_by: Optional[str] = None, settings_show_previous_period: Optional[bool] = None) -> Costs:
+    def list(self, *, cost_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, groupings: Optional[List[str]] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None, date_bin: Optional[str] = None, settings_include_credits: Optional[bool] = None, settings_include_refunds: Optional[bool] = None, settings_include_discounts: Optional[bool] = None, settings_include_tax: Optional[bool] = None, settings_amortize: Optional[bool] = None, settings_unallocated: Optional[bool] = None, settings_aggregate_by: Optional[str] = None, settings_show_previous_period: Optional[bool] = None, validate: Optional[ValidateMode] = None) -> Costs:
         """
         Get costs for cost report or VQL filter
         
@@ -1159,7 +2138,117 @@ class CostsApi:
             "groupings": groupings,
             "order": order,
             "limit": limit,
-            "page": page,
+            "page": page,
+            "date_bin": date_bin,
+            "settings[include_credits]": settings_include_credits,
+            "settings[include_refunds]": settings_include_refunds,
+            "settings[include_discounts]": settings_include_discounts,
+            "settings[include_tax]": settings_include_tax,
+            "settings[amortize]": settings_amortize,
+            "settings[unallocated]": settings_unallocated,
+            "settings[aggregate_by]": settings_aggregate_by,
+            "settings[show_previous_period]": settings_show_previous_period,
+        }
+        body_data = None
+        return self._client.request("GET", path, params=params, body=body_data, model=Costs, validate=validate, route=self._list_route)
+
+    def list_all(self, *, cost_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, groupings: Optional[List[str]] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None, date_bin: Optional[str] = None, settings_include_credits: Optional[bool] = None, settings_include_refunds: Optional[bool] = None, settings_include_discounts: Optional[bool] = None, settings_include_tax: Optional[bool] = None, settings_amortize: Optional[bool] = None, settings_unallocated: Optional[bool] = None, settings_aggregate_by: Optional[str] = None, settings_show_previous_period: Optional[bool] = None, validate: Optional[ValidateMode] = None) -> Iterator[Cost]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(cost_report_token=cost_report_token, filter=filter, workspace_token=workspace_token, start_date=start_date, end_date=end_date, groupings=groupings, order=order, limit=limit, page=page, date_bin=date_bin, settings_include_credits=settings_include_credits, settings_include_refunds=settings_include_refunds, settings_include_discounts=settings_include_discounts, settings_include_tax=settings_include_tax, settings_amortize=settings_amortize, settings_unallocated=settings_unallocated, settings_aggregate_by=settings_aggregate_by, settings_show_previous_period=settings_show_previous_period, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("costs") or ():
+                yield self._client._parse(Cost, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def stream(self, *, cost_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, groupings: Optional[List[str]] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None, date_bin: Optional[str] = None, settings_include_credits: Optional[bool] = None, settings_include_refunds: Optional[bool] = None, settings_include_discounts: Optional[bool] = None, settings_include_tax: Optional[bool] = None, settings_amortize: Optional[bool] = None, settings_unallocated: Optional[bool] = None, settings_aggregate_by: Optional[str] = None, settings_show_previous_period: Optional[bool] = None, validate: Optional[ValidateMode] = None) -> Iterator[Cost]:
+        """
+        Stream every item of `list`, decoding each one as it arrives.
+
+        Pages are followed through `links.next`, and each response body is parsed
+        incrementally, so memory is bounded by one item rather than one page.
+        """
+        path = "/v2/costs"
+        params = {
+            "cost_report_token": cost_report_token,
+            "filter": filter,
+            "workspace_token": workspace_token,
+            "start_date": start_date,
+            "end_date": end_date,
+            "groupings": groupings,
+            "order": order,
+            "limit": limit,
+            "page": page,
+            "date_bin": date_bin,
+            "settings[include_credits]": settings_include_credits,
+            "settings[include_refunds]": settings_include_refunds,
+            "settings[include_discounts]": settings_include_discounts,
+            "settings[include_tax]": settings_include_tax,
+            "settings[amortize]": settings_amortize,
+            "settings[unallocated]": settings_unallocated,
+            "settings[aggregate_by]": settings_aggregate_by,
+            "settings[show_previous_period]": settings_show_previous_period,
+        }
+        for item in self._client._stream_items(path, params, "costs", self._list_route):
+            yield self._client._parse(Cost, item, validate)
+
+    def list_columnar(self, *, cost_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, groupings: Optional[List[str]] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None, date_bin: Optional[str] = None, settings_include_credits: Optional[bool] = None, settings_include_refunds: Optional[bool] = None, settings_include_discounts: Optional[bool] = None, settings_include_tax: Optional[bool] = None, settings_amortize: Optional[bool] = None, settings_unallocated: Optional[bool] = None, settings_aggregate_by: Optional[str] = None, settings_show_previous_period: Optional[bool] = None) -> ColumnarResult:
+        """
+        Fetch every page of `list` into column arrays instead of `Cost` models.
+
+        Rows are decoded straight into a ColumnarResult, following `links.next`.
+        Stored as float64: amount.
+        Dictionary-encoded: currency, provider, service, region, account_id, billing_account_id, cost_category, cost_subcategory.
+        """
+        path = "/v2/costs"
+        params = {
+            "cost_report_token": cost_report_token,
+            "filter": filter,
+            "workspace_token": workspace_token,
+            "start_date": start_date,
+            "end_date": end_date,
+            "groupings": groupings,
+            "order": order,
+            "limit": limit,
+            "page": page,
+            "date_bin": date_bin,
+            "settings[include_credits]": settings_include_credits,
+            "settings[include_refunds]": settings_include_refunds,
+            "settings[include_discounts]": settings_include_discounts,
+            "settings[include_tax]": settings_include_tax,
+            "settings[amortize]": settings_amortize,
+            "settings[unallocated]": settings_unallocated,
+            "settings[aggregate_by]": settings_aggregate_by,
+            "settings[show_previous_period]": settings_show_previous_period,
+        }
+        result = ColumnarResult(numeric=('amount',), categorical=('currency', 'provider', 'service', 'region', 'account_id', 'billing_account_id', 'cost_category', 'cost_subcategory'))
+        for row in self._client._stream_items(path, params, "costs", self._list_route):
+            result.append(row)
+        return result
+
+    def list_sharded(self, *, cost_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, start_date: str, end_date: str, groupings: Optional[List[str]] = None, order: Optional[str] = None, limit: Optional[int] = None, date_bin: str, settings_include_credits: Optional[bool] = None, settings_include_refunds: Optional[bool] = None, settings_include_discounts: Optional[bool] = None, settings_include_tax: Optional[bool] = None, settings_amortize: Optional[bool] = None, settings_unallocated: Optional[bool] = None, settings_aggregate_by: Optional[str] = None, settings_show_previous_period: Optional[bool] = None, shard_bins: Optional[int] = None, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> Costs:
+        """
+        Fetch `list` for a long date range as several smaller queries.
+
+        `start_date`..`end_date` is split on `date_bin` boundaries into shards of
+        `shard_bins` periods (by default 7 days, 4 weeks, 1 month or 1 quarter).
+        Every page of each shard is fetched, up to `concurrency` shards at a time.
+        Items are merged in `accrued_at` order and `total_cost`/`total_usage` are
+        summed across shards.
+        """
+        path = "/v2/costs"
+        params = {
+            "cost_report_token": cost_report_token,
+            "filter": filter,
+            "workspace_token": workspace_token,
+            "start_date": start_date,
+            "end_date": end_date,
+            "groupings": groupings,
+            "order": order,
+            "limit": limit,
             "date_bin": date_bin,
             "settings[include_credits]": settings_include_credits,
             "settings[include_refunds]": settings_include_refunds,
@@ -1170,20 +2259,27 @@ class CostsApi:
             "settings[aggregate_by]": settings_aggregate_by,
             "settings[show_previous_period]": settings_show_previous_period,
         }
-        body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Costs.model_validate(data)
-        return data
+        shards = shard_date_range(start_date, end_date, date_bin, shard_bins)
+        pages = self._client._collect_shards(
+            path, params, "costs", shards, concurrency, self._list_route
+        )
+        return self._client._parse(Costs, merge_shards(pages, "costs", descending=order == "desc"), validate)
 
 
 class DashboardsApi:
     """API methods for dashboards resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/dashboards", name="dashboards.list", items="dashboards")
+    _create_route = Route("POST", "/v2/dashboards", name="dashboards.create")
+    _get_route = Route("GET", "/v2/dashboards/{dashboard_token}", name="dashboards.get")
+    _update_route = Route("PUT", "/v2/dashboards/{dashboard_token}", name="dashboards.update")
+    _delete_route = Route("DELETE", "/v2/dashboards/{dashboard_token}", name="dashboards.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> Dashboards:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Dashboards:
         """
         Get all dashboards
         
@@ -1195,12 +2291,21 @@ class DashboardsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Dashboards.model_validate(data)
-        return data
-
-    def create(self, body: CreateDashboard) -> Dashboard:
+        return self._client.request("GET", path, params=params, body=body_data, model=Dashboards, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Dashboard]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("dashboards") or ():
+                yield self._client._parse(Dashboard, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateDashboard, *, validate: Optional[ValidateMode] = None) -> Dashboard:
         """
         Create dashboard
         
@@ -1209,12 +2314,9 @@ class DashboardsApi:
         path = "/v2/dashboards"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Dashboard.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Dashboard, validate=validate, route=self._create_route)
 
-    def get(self, dashboard_token: str) -> Dashboard:
+    def get(self, dashboard_token: str, *, validate: Optional[ValidateMode] = None) -> Dashboard:
         """
         Get dashboard by token
         
@@ -1223,12 +2325,9 @@ class DashboardsApi:
         path = f"/v2/dashboards/{quote(str(dashboard_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Dashboard.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Dashboard, validate=validate, route=self._get_route)
 
-    def update(self, dashboard_token: str, body: UpdateDashboard) -> Dashboard:
+    def update(self, dashboard_token: str, body: UpdateDashboard, *, validate: Optional[ValidateMode] = None) -> Dashboard:
         """
         Update dashboard
         
@@ -1237,10 +2336,7 @@ class DashboardsApi:
         path = f"/v2/dashboards/{quote(str(dashboard_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Dashboard.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Dashboard, validate=validate, route=self._update_route)
 
     def delete(self, dashboard_token: str) -> None:
         """
@@ -1251,16 +2347,58 @@ class DashboardsApi:
         path = f"/v2/dashboards/{quote(str(dashboard_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Dashboard]:
+        """
+        Fetch many dashboards by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateDashboard], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Dashboard]:
+        """
+        Create many dashboards, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateDashboard], Iterable[Tuple[str, UpdateDashboard]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Dashboard]:
+        """
+        Update many dashboards, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many dashboards by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class DataExportsApi:
     """API methods for data_exports resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _get_route = Route("GET", "/v2/data_exports/{data_export_token}", name="data_exports.get")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def get(self, data_export_token: str) -> DataExport:
+    def get(self, data_export_token: str, *, validate: Optional[ValidateMode] = None) -> DataExport:
         """
         Get status of data export
         
@@ -1269,19 +2407,49 @@ class DataExportsApi:
         path = f"/v2/data_exports/{quote(str(data_export_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return DataExport.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=DataExport, validate=validate, route=self._get_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[DataExport]:
+        """
+        Fetch many data exports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def wait(self, data_export_token: str, *, timeout: Optional[float] = 3600.0, poll: Optional[PollPolicy] = None, validate: Optional[ValidateMode] = None) -> Future[DataExport]:
+        """
+        Return a future that resolves to the DataExport once it has finished.
+
+        `get` is polled in the background by the client's Waiter, right away
+        and then with a growing interval (see PollPolicy). Waits on the same
+        resource share one status check. The future fails with WaitTimeoutError
+        after `timeout` seconds; cancelling it stops the polling once nothing
+        else waits on it. To block until done, call `.result()` on it.
+        """
+        path = f"/v2/data_exports/{quote(str(data_export_token), safe='')}"
+        return self._client._waiter.submit(
+            lambda: self._client.request("GET", path, route=self._get_route),
+            key=path,
+            is_done=export_finished,
+            timeout=timeout,
+            policy=poll,
+            transform=lambda data: self._client._parse(DataExport, data, validate),
+        )
 
 
 class ExchangeRatesApi:
     """API methods for exchange_rates resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/exchange_rates", name="exchange_rates.list", items="exchange_rates")
+    _create_via_csv_route = Route("POST", "/v2/exchange_rates/csv", multipart=True, name="exchange_rates.create_via_csv")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> ExchangeRates:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> ExchangeRates:
         """
         Get all exchange rates
         
@@ -1293,12 +2461,21 @@ class ExchangeRatesApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ExchangeRates.model_validate(data)
-        return data
-
-    def create_via_csv(self, body: dict[str, Any]) -> None:
+        return self._client.request("GET", path, params=params, body=body_data, model=ExchangeRates, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[ExchangeRate]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("exchange_rates") or ():
+                yield self._client._parse(ExchangeRate, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create_via_csv(self, body: UploadBody) -> None:
         """
         Upload exchange rates via CSV
         
@@ -1307,16 +2484,23 @@ class ExchangeRatesApi:
         path = "/v2/exchange_rates/csv"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        self._client.request("POST", path, params=params, body=body_data)
+        self._client.request("POST", path, params=params, body=body_data, route=self._create_via_csv_route)
 
 
 class FinancialCommitmentReportsApi:
     """API methods for financial_commitment_reports resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/financial_commitment_reports", name="financial_commitment_reports.list", items="financial_commitment_reports")
+    _create_route = Route("POST", "/v2/financial_commitment_reports", name="financial_commitment_reports.create")
+    _get_route = Route("GET", "/v2/financial_commitment_reports/{financial_commitment_report_token}", name="financial_commitment_reports.get")
+    _update_route = Route("PUT", "/v2/financial_commitment_reports/{financial_commitment_report_token}", name="financial_commitment_reports.update")
+    _delete_route = Route("DELETE", "/v2/financial_commitment_reports/{financial_commitment_report_token}", name="financial_commitment_reports.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> FinancialCommitmentReports:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> FinancialCommitmentReports:
         """
         Get all financial commitment reports
         
@@ -1328,12 +2512,21 @@ class FinancialCommitmentReportsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return FinancialCommitmentReports.model_validate(data)
-        return data
-
-    def create(self, body: CreateFinancialCommitmentReport) -> FinancialCommitmentReport:
+        return self._client.request("GET", path, params=params, body=body_data, model=FinancialCommitmentReports, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[FinancialCommitmentReport]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("financial_commitment_reports") or ():
+                yield self._client._parse(FinancialCommitmentReport, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateFinancialCommitmentReport, *, validate: Optional[ValidateMode] = None) -> FinancialCommitmentReport:
         """
         Create financial commitment report
         
@@ -1342,12 +2535,9 @@ class FinancialCommitmentReportsApi:
         path = "/v2/financial_commitment_reports"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return FinancialCommitmentReport.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=FinancialCommitmentReport, validate=validate, route=self._create_route)
 
-    def get(self, financial_commitment_report_token: str) -> FinancialCommitmentReport:
+    def get(self, financial_commitment_report_token: str, *, validate: Optional[ValidateMode] = None) -> FinancialCommitmentReport:
         """
         Get financial commitment report by token
         
@@ -1356,12 +2546,9 @@ class FinancialCommitmentReportsApi:
         path = f"/v2/financial_commitment_reports/{quote(str(financial_commitment_report_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return FinancialCommitmentReport.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=FinancialCommitmentReport, validate=validate, route=self._get_route)
 
-    def update(self, financial_commitment_report_token: str, body: UpdateFinancialCommitmentReport) -> FinancialCommitmentReport:
+    def update(self, financial_commitment_report_token: str, body: UpdateFinancialCommitmentReport, *, validate: Optional[ValidateMode] = None) -> FinancialCommitmentReport:
         """
         Update financial commitment report
         
@@ -1370,10 +2557,7 @@ class FinancialCommitmentReportsApi:
         path = f"/v2/financial_commitment_reports/{quote(str(financial_commitment_report_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return FinancialCommitmentReport.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=FinancialCommitmentReport, validate=validate, route=self._update_route)
 
     def delete(self, financial_commitment_report_token: str) -> None:
         """
@@ -1384,16 +2568,58 @@ class FinancialCommitmentReportsApi:
         path = f"/v2/financial_commitment_reports/{quote(str(financial_commitment_report_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[FinancialCommitmentReport]:
+        """
+        Fetch many financial commitment reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateFinancialCommitmentReport], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[FinancialCommitmentReport]:
+        """
+        Create many financial commitment reports, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateFinancialCommitmentReport], Iterable[Tuple[str, UpdateFinancialCommitmentReport]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[FinancialCommitmentReport]:
+        """
+        Update many financial commitment reports, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many financial commitment reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class FinancialCommitmentsApi:
     """API methods for financial_commitments resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/financial_commitments", name="financial_commitments.list", items="financial_commitments")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> FinancialCommitments:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> FinancialCommitments:
         """
         Get all financial commitments
         
@@ -1405,19 +2631,35 @@ class FinancialCommitmentsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return FinancialCommitments.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=FinancialCommitments, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[FinancialCommitment]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("financial_commitments") or ():
+                yield self._client._parse(FinancialCommitment, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
 
 
 class FoldersApi:
     """API methods for folders resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/folders", name="folders.list", items="folders")
+    _create_route = Route("POST", "/v2/folders", name="folders.create")
+    _get_route = Route("GET", "/v2/folders/{folder_token}", name="folders.get")
+    _update_route = Route("PUT", "/v2/folders/{folder_token}", name="folders.update")
+    _delete_route = Route("DELETE", "/v2/folders/{folder_token}", name="folders.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> Folders:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Folders:
         """
         Get all folders
         
@@ -1429,12 +2671,21 @@ class FoldersApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Folders.model_validate(data)
-        return data
-
-    def create(self, body: CreateFolder) -> Folder:
+        return self._client.request("GET", path, params=params, body=body_data, model=Folders, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Folder]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("folders") or ():
+                yield self._client._parse(Folder, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateFolder, *, validate: Optional[ValidateMode] = None) -> Folder:
         """
         Create folder
         
@@ -1443,12 +2694,9 @@ class FoldersApi:
         path = "/v2/folders"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Folder.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Folder, validate=validate, route=self._create_route)
 
-    def get(self, folder_token: str) -> Folder:
+    def get(self, folder_token: str, *, validate: Optional[ValidateMode] = None) -> Folder:
         """
         Get folder by token
         
@@ -1457,12 +2705,9 @@ class FoldersApi:
         path = f"/v2/folders/{quote(str(folder_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Folder.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Folder, validate=validate, route=self._get_route)
 
-    def update(self, folder_token: str, body: UpdateFolder) -> Folder:
+    def update(self, folder_token: str, body: UpdateFolder, *, validate: Optional[ValidateMode] = None) -> Folder:
         """
         Update folder
         
@@ -1471,10 +2716,7 @@ class FoldersApi:
         path = f"/v2/folders/{quote(str(folder_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Folder.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Folder, validate=validate, route=self._update_route)
 
     def delete(self, folder_token: str) -> None:
         """
@@ -1485,16 +2727,67 @@ class FoldersApi:
         path = f"/v2/folders/{quote(str(folder_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Folder]:
+        """
+        Fetch many folders by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateFolder], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Folder]:
+        """
+        Create many folders, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateFolder], Iterable[Tuple[str, UpdateFolder]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Folder]:
+        """
+        Update many folders, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many folders by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class IntegrationsApi:
     """API methods for integrations resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/integrations", name="integrations.list", items="integrations")
+    _get_route = Route("GET", "/v2/integrations/{integration_token}", name="integrations.get")
+    _update_route = Route("PUT", "/v2/integrations/{integration_token}", name="integrations.update")
+    _delete_route = Route("DELETE", "/v2/integrations/{integration_token}", name="integrations.delete")
+    _create_custom_provider_route = Route("POST", "/v2/integrations/custom_provider", name="integrations.create_custom_provider")
+    _create_user_costs_upload_via_csv_route = Route("POST", "/v2/integrations/{integration_token}/costs.csv", multipart=True, name="integrations.create_user_costs_upload_via_csv")
+    _delete_user_costs_upload_route = Route("DELETE", "/v2/integrations/{integration_token}/costs/{user_costs_upload_token}", name="integrations.delete_user_costs_upload")
+    _get_user_costs_uploads_route = Route("GET", "/v2/integrations/{integration_token}/costs", name="integrations.get_user_costs_uploads", items="user_costs_uploads")
+    _create_gcp_route = Route("POST", "/v2/integrations/gcp", name="integrations.create_gcp")
+    _create_azure_route = Route("POST", "/v2/integrations/azure", name="integrations.create_azure")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, provider: Optional[str] = None, account_identifier: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None) -> Integrations:
+    def list(self, *, provider: Optional[str] = None, account_identifier: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Integrations:
         """
         Get all integrations
         
@@ -1508,12 +2801,21 @@ class IntegrationsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Integrations.model_validate(data)
-        return data
-
-    def get(self, integration_token: str) -> Integration:
+        return self._client.request("GET", path, params=params, body=body_data, model=Integrations, validate=validate, route=self._list_route)
+
+    def list_all(self, *, provider: Optional[str] = None, account_identifier: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Integration]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(provider=provider, account_identifier=account_identifier, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("integrations") or ():
+                yield self._client._parse(Integration, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def get(self, integration_token: str, *, validate: Optional[ValidateMode] = None) -> Integration:
         """
         Get integration by token
         
@@ -1522,12 +2824,9 @@ class IntegrationsApi:
         path = f"/v2/integrations/{quote(str(integration_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Integration.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Integration, validate=validate, route=self._get_route)
 
-    def update(self, integration_token: str, body: UpdateIntegration) -> Integration:
+    def update(self, integration_token: str, body: UpdateIntegration, *, validate: Optional[ValidateMode] = None) -> Integration:
         """
         Update integration
         
@@ -1536,10 +2835,7 @@ class IntegrationsApi:
         path = f"/v2/integrations/{quote(str(integration_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Integration.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Integration, validate=validate, route=self._update_route)
 
     def delete(self, integration_token: str) -> None:
         """
@@ -1550,9 +2846,9 @@ class IntegrationsApi:
         path = f"/v2/integrations/{quote(str(integration_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
 
-    def create_custom_provider(self, body: CreateCustomProviderIntegration) -> Integration:
+    def create_custom_provider(self, body: CreateCustomProviderIntegration, *, validate: Optional[ValidateMode] = None) -> Integration:
         """
         Create custom provider integration
         
@@ -1561,12 +2857,9 @@ class IntegrationsApi:
         path = "/v2/integrations/custom_provider"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Integration.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Integration, validate=validate, route=self._create_custom_provider_route)
 
-    def create_user_costs_upload_via_csv(self, integration_token: str, body: dict[str, Any]) -> UserCostsUpload:
+    def create_user_costs_upload_via_csv(self, integration_token: str, body: UploadBody, *, validate: Optional[ValidateMode] = None) -> UserCostsUpload:
         """
         Upload custom provider costs
         
@@ -1575,10 +2868,24 @@ class IntegrationsApi:
         path = f"/v2/integrations/{quote(str(integration_token), safe='')}/costs.csv"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return UserCostsUpload.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=UserCostsUpload, validate=validate, route=self._create_user_costs_upload_via_csv_route)
+
+    def ingest_costs(self, integration_token: str, source: UploadBody, *, fieldnames: Optional[List[str]] = None, chunk_rows: int = DEFAULT_CHUNK_ROWS, concurrency: int = 4, wait: bool = True, timeout: Optional[float] = 3600.0, rollback: bool = True, validate: Optional[ValidateMode] = None) -> IngestResult:
+        """
+        Upload a large cost file through `create_user_costs_upload_via_csv` in concurrent chunks.
+
+        `source` (a path, file or iterable of rows) is read as CSV and split into
+        files of at most `chunk_rows` rows, each with the header; up to `concurrency`
+        are uploaded at once. With `wait`, the uploads are tracked through
+        `get_user_costs_uploads` until they have imported. If any chunk fails, the
+        uploads already made are deleted again (unless `rollback` is False) and
+        IngestionError is raised.
+        """
+        return ingest_costs(
+            self._client, integration_token, source,
+            fieldnames=fieldnames, chunk_rows=chunk_rows, concurrency=concurrency,
+            wait=wait, timeout=timeout, rollback=rollback, validate=validate,
+        )
 
     def delete_user_costs_upload(self, integration_token: str, user_costs_upload_token: int) -> None:
         """
@@ -1589,9 +2896,9 @@ class IntegrationsApi:
         path = f"/v2/integrations/{quote(str(integration_token), safe='')}/costs/{quote(str(user_costs_upload_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_user_costs_upload_route)
 
-    def get_user_costs_uploads(self, integration_token: str) -> UserCostsUploads:
+    def get_user_costs_uploads(self, integration_token: str, *, validate: Optional[ValidateMode] = None) -> UserCostsUploads:
         """
         Get all user costs uploads
         
@@ -1600,12 +2907,21 @@ class IntegrationsApi:
         path = f"/v2/integrations/{quote(str(integration_token), safe='')}/costs"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return UserCostsUploads.model_validate(data)
-        return data
-
-    def create_gcp(self, body: CreateGcpIntegration) -> Integration:
+        return self._client.request("GET", path, params=params, body=body_data, model=UserCostsUploads, validate=validate, route=self._get_user_costs_uploads_route)
+
+    def iter_user_costs_uploads(self, integration_token: str, *, validate: Optional[ValidateMode] = None) -> Iterator[UserCostsUpload]:
+        """Iterate over every item of `get_user_costs_uploads`, following `links.next` one page at a time."""
+        data = self.get_user_costs_uploads(integration_token, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("user_costs_uploads") or ():
+                yield self._client._parse(UserCostsUpload, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_user_costs_uploads_route)
+
+    def create_gcp(self, body: CreateGcpIntegration, *, validate: Optional[ValidateMode] = None) -> Integration:
         """
         Create GCP integration
         
@@ -1614,12 +2930,9 @@ class IntegrationsApi:
         path = "/v2/integrations/gcp"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Integration.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Integration, validate=validate, route=self._create_gcp_route)
 
-    def create_azure(self, body: CreateAzureIntegration) -> Integration:
+    def create_azure(self, body: CreateAzureIntegration, *, validate: Optional[ValidateMode] = None) -> Integration:
         """
         Create Azure integration
         
@@ -1628,19 +2941,56 @@ class IntegrationsApi:
         path = "/v2/integrations/azure"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Integration.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Integration, validate=validate, route=self._create_azure_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Integration]:
+        """
+        Fetch many integrations by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateIntegration], Iterable[Tuple[str, UpdateIntegration]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Integration]:
+        """
+        Update many integrations, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many integrations by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class InvoicesApi:
     """API methods for invoices resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/invoices", name="invoices.list", items="invoices")
+    _create_route = Route("POST", "/v2/invoices", name="invoices.create")
+    _get_route = Route("GET", "/v2/invoices/{invoice_token}", name="invoices.get")
+    _download_route = Route("POST", "/v2/invoices/{invoice_token}/download", name="invoices.download")
+    _send_route = Route("POST", "/v2/invoices/{invoice_token}/send", name="invoices.send")
+    _send_and_approve_route = Route("POST", "/v2/invoices/{invoice_token}/send_and_approve", name="invoices.send_and_approve")
+    _get_cost_report_route = Route("GET", "/v2/invoices/{invoice_token}/cost_report", name="invoices.get_cost_report")
+    _regenerate_route = Route("POST", "/v2/invoices/{invoice_token}/regenerate", name="invoices.regenerate")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, managed_account_token: Optional[str] = None) -> Invoices:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, managed_account_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Invoices:
         """
         Get all invoices
         
@@ -1653,12 +3003,21 @@ class InvoicesApi:
             "managed_account_token": managed_account_token,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Invoices.model_validate(data)
-        return data
-
-    def create(self, body: CreateInvoice) -> Invoice:
+        return self._client.request("GET", path, params=params, body=body_data, model=Invoices, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, managed_account_token: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[Invoice]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, managed_account_token=managed_account_token, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("invoices") or ():
+                yield self._client._parse(Invoice, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateInvoice, *, validate: Optional[ValidateMode] = None) -> Invoice:
         """
         Create invoice
         
@@ -1667,12 +3026,9 @@ class InvoicesApi:
         path = "/v2/invoices"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Invoice.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Invoice, validate=validate, route=self._create_route)
 
-    def get(self, invoice_token: str) -> Invoice:
+    def get(self, invoice_token: str, *, validate: Optional[ValidateMode] = None) -> Invoice:
         """
         Get invoice by token
         
@@ -1681,12 +3037,9 @@ class InvoicesApi:
         path = f"/v2/invoices/{quote(str(invoice_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Invoice.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Invoice, validate=validate, route=self._get_route)
 
-    def download(self, invoice_token: str, body: DownloadInvoiceRequest) -> DownloadInvoice:
+    def download(self, invoice_token: str, body: DownloadInvoiceRequest, *, validate: Optional[ValidateMode] = None) -> DownloadInvoice:
         """
         Get invoice file
         
@@ -1695,12 +3048,9 @@ class InvoicesApi:
         path = f"/v2/invoices/{quote(str(invoice_token), safe='')}/download"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return DownloadInvoice.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=DownloadInvoice, validate=validate, route=self._download_route)
 
-    def send(self, invoice_token: str) -> SendInvoice:
+    def send(self, invoice_token: str, *, validate: Optional[ValidateMode] = None) -> SendInvoice:
         """
         Send invoice
         
@@ -1709,12 +3059,9 @@ class InvoicesApi:
         path = f"/v2/invoices/{quote(str(invoice_token), safe='')}/send"
         params = None
         body_data = None
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return SendInvoice.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=SendInvoice, validate=validate, route=self._send_route)
 
-    def send_and_approve(self, invoice_token: str) -> SendInvoice:
+    def send_and_approve(self, invoice_token: str, *, validate: Optional[ValidateMode] = None) -> SendInvoice:
         """
         Send and approve invoice
         
@@ -1723,12 +3070,9 @@ class InvoicesApi:
         path = f"/v2/invoices/{quote(str(invoice_token), safe='')}/send_and_approve"
         params = None
         body_data = None
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return SendInvoice.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=SendInvoice, validate=validate, route=self._send_and_approve_route)
 
-    def get_cost_report(self, invoice_token: str) -> CostReportUrl:
+    def get_cost_report(self, invoice_token: str, *, validate: Optional[ValidateMode] = None) -> CostReportUrl:
         """
         Get cost report URL
         
@@ -1737,12 +3081,9 @@ class InvoicesApi:
         path = f"/v2/invoices/{quote(str(invoice_token), safe='')}/cost_report"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return CostReportUrl.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=CostReportUrl, validate=validate, route=self._get_cost_report_route)
 
-    def regenerate(self, invoice_token: str) -> Invoice:
+    def regenerate(self, invoice_token: str, *, validate: Optional[ValidateMode] = None) -> Invoice:
         """
         Regenerate invoice
         
@@ -1751,19 +3092,42 @@ class InvoicesApi:
         path = f"/v2/invoices/{quote(str(invoice_token), safe='')}/regenerate"
         params = None
         body_data = None
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Invoice.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Invoice, validate=validate, route=self._regenerate_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Invoice]:
+        """
+        Fetch many invoices by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateInvoice], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Invoice]:
+        """
+        Create many invoices, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
 
 
 class KubernetesEfficiencyReportsApi:
     """API methods for kubernetes_efficiency_reports resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/kubernetes_efficiency_reports", name="kubernetes_efficiency_reports.list", items="kubernetes_efficiency_reports")
+    _create_route = Route("POST", "/v2/kubernetes_efficiency_reports", name="kubernetes_efficiency_reports.create")
+    _create_export_route = Route("POST", "/v2/kubernetes_efficiency_reports/data_exports", handler="_request_for_location", name="kubernetes_efficiency_reports.create_export")
+    _get_route = Route("GET", "/v2/kubernetes_efficiency_reports/{kubernetes_efficiency_report_token}", name="kubernetes_efficiency_reports.get")
+    _update_route = Route("PUT", "/v2/kubernetes_efficiency_reports/{kubernetes_efficiency_report_token}", name="kubernetes_efficiency_reports.update")
+    _delete_route = Route("DELETE", "/v2/kubernetes_efficiency_reports/{kubernetes_efficiency_report_token}", name="kubernetes_efficiency_reports.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> KubernetesEfficiencyReports:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> KubernetesEfficiencyReports:
         """
         Get all Kubernetes efficiency reports
         
@@ -1775,12 +3139,21 @@ class KubernetesEfficiencyReportsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return KubernetesEfficiencyReports.model_validate(data)
-        return data
-
-    def create(self, body: CreateKubernetesEfficiencyReport) -> KubernetesEfficiencyReport:
+        return self._client.request("GET", path, params=params, body=body_data, model=KubernetesEfficiencyReports, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[KubernetesEfficiencyReport]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("kubernetes_efficiency_reports") or ():
+                yield self._client._parse(KubernetesEfficiencyReport, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateKubernetesEfficiencyReport, *, validate: Optional[ValidateMode] = None) -> KubernetesEfficiencyReport:
         """
         Create Kubernetes efficiency report
         
@@ -1789,10 +3162,7 @@ class KubernetesEfficiencyReportsApi:
         path = "/v2/kubernetes_efficiency_reports"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return KubernetesEfficiencyReport.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=KubernetesEfficiencyReport, validate=validate, route=self._create_route)
 
     def create_export(self, body: CreateKubernetesEfficiencyReportExport, *, groupings: Optional[List[str]] = None) -> str:
         """
@@ -1805,9 +3175,24 @@ class KubernetesEfficiencyReportsApi:
             "groupings": groupings,
         }
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        return self._client.request("POST", path, params=params, body=body_data)
+        return self._client.request("POST", path, params=params, body=body_data, route=self._create_export_route)
+
+    def export_and_download(self, body: CreateKubernetesEfficiencyReportExport, dest: Union[str, Path], *, groupings: Optional[List[str]] = None, concurrency: int = 4, timeout: Optional[float] = 3600.0, resume: bool = True, validate: Optional[ValidateMode] = None) -> ExportDownload:
+        """
+        Generate a data export with `create_export`, wait for it and download its files into `dest`.
+
+        The export is polled with a growing interval (up to 30s) until it completes,
+        failing after `timeout` seconds. Its files are streamed to disk `concurrency`
+        at a time and checked against their size and checksum. With `resume`, files
+        already downloaded are kept and partial ones are continued. Use
+        `ExportDownload.rows()` to iterate the CSV rows of all files.
+        """
+        location = self.create_export(body, groupings=groupings)
+        return download_export(
+            self._client, location, dest, concurrency=concurrency, timeout=timeout, resume=resume, validate=validate
+        )
 
-    def get(self, kubernetes_efficiency_report_token: str) -> KubernetesEfficiencyReport:
+    def get(self, kubernetes_efficiency_report_token: str, *, validate: Optional[ValidateMode] = None) -> KubernetesEfficiencyReport:
         """
         Get Kubernetes efficiency report by token
         
@@ -1816,12 +3201,9 @@ class KubernetesEfficiencyReportsApi:
         path = f"/v2/kubernetes_efficiency_reports/{quote(str(kubernetes_efficiency_report_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return KubernetesEfficiencyReport.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=KubernetesEfficiencyReport, validate=validate, route=self._get_route)
 
-    def update(self, kubernetes_efficiency_report_token: str, body: UpdateKubernetesEfficiencyReport) -> KubernetesEfficiencyReport:
+    def update(self, kubernetes_efficiency_report_token: str, body: UpdateKubernetesEfficiencyReport, *, validate: Optional[ValidateMode] = None) -> KubernetesEfficiencyReport:
         """
         Update Kubernetes efficiency report
         
@@ -1830,10 +3212,7 @@ class KubernetesEfficiencyReportsApi:
         path = f"/v2/kubernetes_efficiency_reports/{quote(str(kubernetes_efficiency_report_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return KubernetesEfficiencyReport.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=KubernetesEfficiencyReport, validate=validate, route=self._update_route)
 
     def delete(self, kubernetes_efficiency_report_token: str) -> None:
         """
@@ -1844,16 +3223,65 @@ class KubernetesEfficiencyReportsApi:
         path = f"/v2/kubernetes_efficiency_reports/{quote(str(kubernetes_efficiency_report_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[KubernetesEfficiencyReport]:
+        """
+        Fetch many kubernetes efficiency reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateKubernetesEfficiencyReport], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[KubernetesEfficiencyReport]:
+        """
+        Create many kubernetes efficiency reports, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateKubernetesEfficiencyReport], Iterable[Tuple[str, UpdateKubernetesEfficiencyReport]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[KubernetesEfficiencyReport]:
+        """
+        Update many kubernetes efficiency reports, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many kubernetes efficiency reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class ManagedAccountsApi:
     """API methods for managed_accounts resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/managed_accounts", name="managed_accounts.list", items="managed_accounts")
+    _create_route = Route("POST", "/v2/managed_accounts", name="managed_accounts.create")
+    _get_route = Route("GET", "/v2/managed_accounts/{managed_account_token}", name="managed_accounts.get")
+    _update_route = Route("PUT", "/v2/managed_accounts/{managed_account_token}", name="managed_accounts.update")
+    _delete_route = Route("DELETE", "/v2/managed_accounts/{managed_account_token}", name="managed_accounts.delete")
+    _update_sso_connection_for_route = Route("PUT", "/v2/managed_accounts/{managed_account_token}/sso_connection", name="managed_accounts.update_sso_connection_for")
+    _create_sso_connection_for_route = Route("POST", "/v2/managed_accounts/{managed_account_token}/sso_connection", name="managed_accounts.create_sso_connection_for")
+    _delete_sso_connection_for_route = Route("DELETE", "/v2/managed_accounts/{managed_account_token}/sso_connection", name="managed_accounts.delete_sso_connection_for")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> ManagedAccounts:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> ManagedAccounts:
         """
         Get all managed accounts
         
@@ -1865,12 +3293,21 @@ class ManagedAccountsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ManagedAccounts.model_validate(data)
-        return data
-
-    def create(self, body: CreateManagedAccount) -> ManagedAccount:
+        return self._client.request("GET", path, params=params, body=body_data, model=ManagedAccounts, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[ManagedAccount]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("managed_accounts") or ():
+                yield self._client._parse(ManagedAccount, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateManagedAccount, *, validate: Optional[ValidateMode] = None) -> ManagedAccount:
         """
         Create managed account
         
@@ -1879,12 +3316,9 @@ class ManagedAccountsApi:
         path = "/v2/managed_accounts"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ManagedAccount.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=ManagedAccount, validate=validate, route=self._create_route)
 
-    def get(self, managed_account_token: str) -> ManagedAccount:
+    def get(self, managed_account_token: str, *, validate: Optional[ValidateMode] = None) -> ManagedAccount:
         """
         Get managed account by token
         
@@ -1893,12 +3327,9 @@ class ManagedAccountsApi:
         path = f"/v2/managed_accounts/{quote(str(managed_account_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ManagedAccount.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=ManagedAccount, validate=validate, route=self._get_route)
 
-    def update(self, managed_account_token: str, body: UpdateManagedAccount) -> ManagedAccount:
+    def update(self, managed_account_token: str, body: UpdateManagedAccount, *, validate: Optional[ValidateMode] = None) -> ManagedAccount:
         """
         Update managed account
         
@@ -1907,10 +3338,7 @@ class ManagedAccountsApi:
         path = f"/v2/managed_accounts/{quote(str(managed_account_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ManagedAccount.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=ManagedAccount, validate=validate, route=self._update_route)
 
     def delete(self, managed_account_token: str) -> None:
         """
@@ -1921,9 +3349,9 @@ class ManagedAccountsApi:
         path = f"/v2/managed_accounts/{quote(str(managed_account_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
 
-    def update_sso_connection_for(self, managed_account_token: str, body: UpdateSsoConnectionForManagedAccount) -> ManagedAccount:
+    def update_sso_connection_for(self, managed_account_token: str, body: UpdateSsoConnectionForManagedAccount, *, validate: Optional[ValidateMode] = None) -> ManagedAccount:
         """
         Update SSO configuration for managed account
         
@@ -1932,12 +3360,9 @@ class ManagedAccountsApi:
         path = f"/v2/managed_accounts/{quote(str(managed_account_token), safe='')}/sso_connection"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ManagedAccount.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=ManagedAccount, validate=validate, route=self._update_sso_connection_for_route)
 
-    def create_sso_connection_for(self, managed_account_token: str, body: CreateSsoConnectionForManagedAccount) -> ManagedAccount:
+    def create_sso_connection_for(self, managed_account_token: str, body: CreateSsoConnectionForManagedAccount, *, validate: Optional[ValidateMode] = None) -> ManagedAccount:
         """
         Configure SSO for managed account
         
@@ -1946,10 +3371,7 @@ class ManagedAccountsApi:
         path = f"/v2/managed_accounts/{quote(str(managed_account_token), safe='')}/sso_connection"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ManagedAccount.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=ManagedAccount, validate=validate, route=self._create_sso_connection_for_route)
 
     def delete_sso_connection_for(self, managed_account_token: str) -> None:
         """
@@ -1960,16 +3382,59 @@ class ManagedAccountsApi:
         path = f"/v2/managed_accounts/{quote(str(managed_account_token), safe='')}/sso_connection"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_sso_connection_for_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ManagedAccount]:
+        """
+        Fetch many managed accounts by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateManagedAccount], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ManagedAccount]:
+        """
+        Create many managed accounts, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateManagedAccount], Iterable[Tuple[str, UpdateManagedAccount]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ManagedAccount]:
+        """
+        Update many managed accounts, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many managed accounts by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class MeApi:
     """API methods for me resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _get_route = Route("GET", "/v2/me", name="me.get")
+    _update_route = Route("PUT", "/v2/me", name="me.update")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def get(self) -> Me:
+    def get(self, *, validate: Optional[ValidateMode] = None) -> Me:
         """
         Get authenticated user info
         
@@ -1978,12 +3443,9 @@ class MeApi:
         path = "/v2/me"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Me.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Me, validate=validate, route=self._get_route)
 
-    def update(self, body: UpdateMe) -> Me:
+    def update(self, body: UpdateMe, *, validate: Optional[ValidateMode] = None) -> Me:
         """
         Update authenticated user
         
@@ -1992,19 +3454,23 @@ class MeApi:
         path = "/v2/me"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Me.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Me, validate=validate, route=self._update_route)
 
 
 class NetworkFlowReportsApi:
     """API methods for network_flow_reports resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/network_flow_reports", name="network_flow_reports.list", items="network_flow_reports")
+    _create_route = Route("POST", "/v2/network_flow_reports", name="network_flow_reports.create")
+    _get_route = Route("GET", "/v2/network_flow_reports/{network_flow_report_token}", name="network_flow_reports.get")
+    _update_route = Route("PUT", "/v2/network_flow_reports/{network_flow_report_token}", name="network_flow_reports.update")
+    _delete_route = Route("DELETE", "/v2/network_flow_reports/{network_flow_report_token}", name="network_flow_reports.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> NetworkFlowReports:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> NetworkFlowReports:
         """
         Get all network flow reports
         
@@ -2016,12 +3482,21 @@ class NetworkFlowReportsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return NetworkFlowReports.model_validate(data)
-        return data
-
-    def create(self, body: CreateNetworkFlowReport) -> NetworkFlowReport:
+        return self._client.request("GET", path, params=params, body=body_data, model=NetworkFlowReports, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[NetworkFlowReport]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("network_flow_reports") or ():
+                yield self._client._parse(NetworkFlowReport, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateNetworkFlowReport, *, validate: Optional[ValidateMode] = None) -> NetworkFlowReport:
         """
         Create network flow report
         
@@ -2030,12 +3505,9 @@ class NetworkFlowReportsApi:
         path = "/v2/network_flow_reports"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return NetworkFlowReport.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=NetworkFlowReport, validate=validate, route=self._create_route)
 
-    def get(self, network_flow_report_token: str) -> NetworkFlowReport:
+    def get(self, network_flow_report_token: str, *, validate: Optional[ValidateMode] = None) -> NetworkFlowReport:
         """
         Get network flow report by token
         
@@ -2044,12 +3516,9 @@ class NetworkFlowReportsApi:
         path = f"/v2/network_flow_reports/{quote(str(network_flow_report_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return NetworkFlowReport.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=NetworkFlowReport, validate=validate, route=self._get_route)
 
-    def update(self, network_flow_report_token: str, body: UpdateNetworkFlowReport) -> NetworkFlowReport:
+    def update(self, network_flow_report_token: str, body: UpdateNetworkFlowReport, *, validate: Optional[ValidateMode] = None) -> NetworkFlowReport:
         """
         Update network flow report
         
@@ -2058,10 +3527,7 @@ class NetworkFlowReportsApi:
         path = f"/v2/network_flow_reports/{quote(str(network_flow_report_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return NetworkFlowReport.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=NetworkFlowReport, validate=validate, route=self._update_route)
 
     def delete(self, network_flow_report_token: str) -> None:
         """
@@ -2072,12 +3538,54 @@ class NetworkFlowReportsApi:
         path = f"/v2/network_flow_reports/{quote(str(network_flow_report_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[NetworkFlowReport]:
+        """
+        Fetch many network flow reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateNetworkFlowReport], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[NetworkFlowReport]:
+        """
+        Create many network flow reports, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateNetworkFlowReport], Iterable[Tuple[str, UpdateNetworkFlowReport]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[NetworkFlowReport]:
+        """
+        Update many network flow reports, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many network flow reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class PingApi:
     """API methods for ping resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _ping_route = Route("GET", "/v2/ping", name="ping.ping")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
@@ -2086,16 +3594,22 @@ class PingApi:
         path = "/v2/ping"
         params = None
         body_data = None
-        self._client.request("GET", path, params=params, body=body_data)
+        self._client.request("GET", path, params=params, body=body_data, route=self._ping_route)
 
 
 class ProductsApi:
     """API methods for products resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _get_prices_route = Route("GET", "/v2/products/{product_id}/prices", name="products.get_prices", items="prices")
+    _get_price_route = Route("GET", "/v2/products/{product_id}/prices/{id}", name="products.get_price")
+    _list_route = Route("GET", "/v2/products", name="products.list", items="products")
+    _get_route = Route("GET", "/v2/products/{id}", name="products.get")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def get_prices(self, product_id: str, *, page: Optional[int] = None, limit: Optional[int] = None) -> Prices:
+    def get_prices(self, product_id: str, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Prices:
         """
         Get prices for a product
         
@@ -2107,12 +3621,21 @@ class ProductsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Prices.model_validate(data)
-        return data
-
-    def get_price(self, product_id: str, id: str) -> Price:
+        return self._client.request("GET", path, params=params, body=body_data, model=Prices, validate=validate, route=self._get_prices_route)
+
+    def iter_prices(self, product_id: str, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Price]:
+        """Iterate over every item of `get_prices`, following `links.next` one page at a time."""
+        data = self.get_prices(product_id, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("prices") or ():
+                yield self._client._parse(Price, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_prices_route)
+
+    def get_price(self, product_id: str, id: str, *, validate: Optional[ValidateMode] = None) -> Price:
         """
         Get price by ID
         
@@ -2121,12 +3644,9 @@ class ProductsApi:
         path = f"/v2/products/{quote(str(product_id), safe='')}/prices/{quote(str(id), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Price.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Price, validate=validate, route=self._get_price_route)
 
-    def list(self, *, provider_id: Optional[str] = None, service_id: Optional[str] = None, name: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None) -> Products:
+    def list(self, *, provider_id: Optional[str] = None, service_id: Optional[str] = None, name: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Products:
         """
         Get all products
         
@@ -2141,12 +3661,21 @@ class ProductsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Products.model_validate(data)
-        return data
-
-    def get(self, id: str) -> Product:
+        return self._client.request("GET", path, params=params, body=body_data, model=Products, validate=validate, route=self._list_route)
+
+    def list_all(self, *, provider_id: Optional[str] = None, service_id: Optional[str] = None, name: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Product]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(provider_id=provider_id, service_id=service_id, name=name, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("products") or ():
+                yield self._client._parse(Product, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def get(self, id: str, *, validate: Optional[ValidateMode] = None) -> Product:
         """
         Get product by ID
         
@@ -2155,19 +3684,32 @@ class ProductsApi:
         path = f"/v2/products/{quote(str(id), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Product.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Product, validate=validate, route=self._get_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Product]:
+        """
+        Fetch many products by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
 
 
 class RecommendationViewsApi:
     """API methods for recommendation_views resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/recommendation_views", name="recommendation_views.list", items="recommendation_views")
+    _create_route = Route("POST", "/v2/recommendation_views", name="recommendation_views.create")
+    _get_route = Route("GET", "/v2/recommendation_views/{recommendation_view_token}", name="recommendation_views.get")
+    _update_route = Route("PUT", "/v2/recommendation_views/{recommendation_view_token}", name="recommendation_views.update")
+    _delete_route = Route("DELETE", "/v2/recommendation_views/{recommendation_view_token}", name="recommendation_views.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> RecommendationViews:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> RecommendationViews:
         """
         Get all recommendation views
         
@@ -2179,12 +3721,21 @@ class RecommendationViewsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return RecommendationViews.model_validate(data)
-        return data
-
-    def create(self, body: CreateRecommendationView) -> RecommendationView:
+        return self._client.request("GET", path, params=params, body=body_data, model=RecommendationViews, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[RecommendationView]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("recommendation_views") or ():
+                yield self._client._parse(RecommendationView, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateRecommendationView, *, validate: Optional[ValidateMode] = None) -> RecommendationView:
         """
         Create recommendation view
         
@@ -2193,12 +3744,9 @@ class RecommendationViewsApi:
         path = "/v2/recommendation_views"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return RecommendationView.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=RecommendationView, validate=validate, route=self._create_route)
 
-    def get(self, recommendation_view_token: str) -> RecommendationView:
+    def get(self, recommendation_view_token: str, *, validate: Optional[ValidateMode] = None) -> RecommendationView:
         """
         Get recommendation view by token
         
@@ -2207,12 +3755,9 @@ class RecommendationViewsApi:
         path = f"/v2/recommendation_views/{quote(str(recommendation_view_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return RecommendationView.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=RecommendationView, validate=validate, route=self._get_route)
 
-    def update(self, recommendation_view_token: str, body: UpdateRecommendationView) -> RecommendationView:
+    def update(self, recommendation_view_token: str, body: UpdateRecommendationView, *, validate: Optional[ValidateMode] = None) -> RecommendationView:
         """
         Update recommendation view
         
@@ -2221,10 +3766,7 @@ class RecommendationViewsApi:
         path = f"/v2/recommendation_views/{quote(str(recommendation_view_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return RecommendationView.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=RecommendationView, validate=validate, route=self._update_route)
 
     def delete(self, recommendation_view_token: str) -> None:
         """
@@ -2235,16 +3777,62 @@ class RecommendationViewsApi:
         path = f"/v2/recommendation_views/{quote(str(recommendation_view_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[RecommendationView]:
+        """
+        Fetch many recommendation views by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateRecommendationView], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[RecommendationView]:
+        """
+        Create many recommendation views, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateRecommendationView], Iterable[Tuple[str, UpdateRecommendationView]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[RecommendationView]:
+        """
+        Update many recommendation views, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many recommendation views by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class RecommendationsApi:
     """API methods for recommendations resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/recommendations", name="recommendations.list", items="recommendations")
+    _get_route = Route("GET", "/v2/recommendations/{recommendation_token}", name="recommendations.get")
+    _get_resources_route = Route("GET", "/v2/recommendations/{recommendation_token}/resources", name="recommendations.get_resources", items="resources")
+    _get_resource_route = Route("GET", "/v2/recommendations/{recommendation_token}/resources/{resource_token}", name="recommendations.get_resource")
+    _get_type_resources_route = Route("GET", "/v2/recommendations/by_type/{type}/resources", name="recommendations.get_type_resources", items="resources")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, provider_ids: Optional[List[str]] = None, billing_account_ids: Optional[List[str]] = None, account_ids: Optional[List[str]] = None, regions: Optional[List[str]] = None, tag_key: Optional[str] = None, tag_value: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, status: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, workspace_token: Optional[str] = None, provider_account_id: Optional[str] = None, category: Optional[str] = None, type: Optional[str] = None, provider: Optional[str] = None) -> Recommendations:
+    def list(self, *, provider_ids: Optional[List[str]] = None, billing_account_ids: Optional[List[str]] = None, account_ids: Optional[List[str]] = None, regions: Optional[List[str]] = None, tag_key: Optional[str] = None, tag_value: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, status: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, workspace_token: Optional[str] = None, provider_account_id: Optional[str] = None, category: Optional[str] = None, type: Optional[str] = None, provider: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Recommendations:
         """
         Get all recommendations
         
@@ -2270,12 +3858,21 @@ class RecommendationsApi:
             "provider": provider,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Recommendations.model_validate(data)
-        return data
-
-    def get(self, recommendation_token: str) -> Recommendation:
+        return self._client.request("GET", path, params=params, body=body_data, model=Recommendations, validate=validate, route=self._list_route)
+
+    def list_all(self, *, provider_ids: Optional[List[str]] = None, billing_account_ids: Optional[List[str]] = None, account_ids: Optional[List[str]] = None, regions: Optional[List[str]] = None, tag_key: Optional[str] = None, tag_value: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, status: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, workspace_token: Optional[str] = None, provider_account_id: Optional[str] = None, category: Optional[str] = None, type: Optional[str] = None, provider: Optional[str] = None, validate: Optional[ValidateMode] = None) -> Iterator[Recommendation]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(provider_ids=provider_ids, billing_account_ids=billing_account_ids, account_ids=account_ids, regions=regions, tag_key=tag_key, tag_value=tag_value, start_date=start_date, end_date=end_date, status=status, page=page, limit=limit, workspace_token=workspace_token, provider_account_id=provider_account_id, category=category, type=type, provider=provider, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("recommendations") or ():
+                yield self._client._parse(Recommendation, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def get(self, recommendation_token: str, *, validate: Optional[ValidateMode] = None) -> Recommendation:
         """
         Get recommendation by token
         
@@ -2284,12 +3881,9 @@ class RecommendationsApi:
         path = f"/v2/recommendations/{quote(str(recommendation_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Recommendation.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Recommendation, validate=validate, route=self._get_route)
 
-    def get_resources(self, recommendation_token: str, *, page: Optional[int] = None, limit: Optional[int] = None) -> RecommendationProviderResources:
+    def get_resources(self, recommendation_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> RecommendationProviderResources:
         """
         Get all resources for a recommendation
         
@@ -2301,12 +3895,21 @@ class RecommendationsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return RecommendationProviderResources.model_validate(data)
-        return data
-
-    def get_resource(self, recommendation_token: str, resource_token: str) -> ProviderResource:
+        return self._client.request("GET", path, params=params, body=body_data, model=RecommendationProviderResources, validate=validate, route=self._get_resources_route)
+
+    def iter_resources(self, recommendation_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[ProviderResource]:
+        """Iterate over every item of `get_resources`, following `links.next` one page at a time."""
+        data = self.get_resources(recommendation_token, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("resources") or ():
+                yield self._client._parse(ProviderResource, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_resources_route)
+
+    def get_resource(self, recommendation_token: str, resource_token: str, *, validate: Optional[ValidateMode] = None) -> ProviderResource:
         """
         Get specific resource for a recommendation
         
@@ -2315,12 +3918,9 @@ class RecommendationsApi:
         path = f"/v2/recommendations/{quote(str(recommendation_token), safe='')}/resources/{quote(str(resource_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ProviderResource.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=ProviderResource, validate=validate, route=self._get_resource_route)
 
-    def get_type_resources(self, type: str, *, provider_ids: Optional[List[str]] = None, billing_account_ids: Optional[List[str]] = None, account_ids: Optional[List[str]] = None, regions: Optional[List[str]] = None, tag_key: Optional[str] = None, tag_value: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, status: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, workspace_token: str) -> RecommendationProviderResources:
+    def get_type_resources(self, type: str, *, provider_ids: Optional[List[str]] = None, billing_account_ids: Optional[List[str]] = None, account_ids: Optional[List[str]] = None, regions: Optional[List[str]] = None, tag_key: Optional[str] = None, tag_value: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, status: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, workspace_token: str, validate: Optional[ValidateMode] = None) -> RecommendationProviderResources:
         """
         Get all resources for a recommendation type
         
@@ -2342,19 +3942,44 @@ class RecommendationsApi:
             "workspace_token": workspace_token,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return RecommendationProviderResources.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=RecommendationProviderResources, validate=validate, route=self._get_type_resources_route)
+
+    def iter_type_resources(self, type: str, *, provider_ids: Optional[List[str]] = None, billing_account_ids: Optional[List[str]] = None, account_ids: Optional[List[str]] = None, regions: Optional[List[str]] = None, tag_key: Optional[str] = None, tag_value: Optional[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None, status: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, workspace_token: str, validate: Optional[ValidateMode] = None) -> Iterator[ProviderResource]:
+        """Iterate over every item of `get_type_resources`, following `links.next` one page at a time."""
+        data = self.get_type_resources(type, provider_ids=provider_ids, billing_account_ids=billing_account_ids, account_ids=account_ids, regions=regions, tag_key=tag_key, tag_value=tag_value, start_date=start_date, end_date=end_date, status=status, page=page, limit=limit, workspace_token=workspace_token, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("resources") or ():
+                yield self._client._parse(ProviderResource, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_type_resources_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Recommendation]:
+        """
+        Fetch many recommendations by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
 
 
 class ReportNotificationsApi:
     """API methods for report_notifications resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/report_notifications", name="report_notifications.list", items="report_notifications")
+    _create_route = Route("POST", "/v2/report_notifications", name="report_notifications.create")
+    _get_route = Route("GET", "/v2/report_notifications/{report_notification_token}", name="report_notifications.get")
+    _update_route = Route("PUT", "/v2/report_notifications/{report_notification_token}", name="report_notifications.update")
+    _delete_route = Route("DELETE", "/v2/report_notifications/{report_notification_token}", name="report_notifications.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> ReportNotifications:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> ReportNotifications:
         """
         Get all report notifications
         
@@ -2366,12 +3991,21 @@ class ReportNotificationsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ReportNotifications.model_validate(data)
-        return data
-
-    def create(self, body: CreateReportNotification) -> ReportNotification:
+        return self._client.request("GET", path, params=params, body=body_data, model=ReportNotifications, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[ReportNotification]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("report_notifications") or ():
+                yield self._client._parse(ReportNotification, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateReportNotification, *, validate: Optional[ValidateMode] = None) -> ReportNotification:
         """
         Create report notification
         
@@ -2380,12 +4014,9 @@ class ReportNotificationsApi:
         path = "/v2/report_notifications"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ReportNotification.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=ReportNotification, validate=validate, route=self._create_route)
 
-    def get(self, report_notification_token: str) -> ReportNotification:
+    def get(self, report_notification_token: str, *, validate: Optional[ValidateMode] = None) -> ReportNotification:
         """
         Get report notification by token
         
@@ -2394,12 +4025,9 @@ class ReportNotificationsApi:
         path = f"/v2/report_notifications/{quote(str(report_notification_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ReportNotification.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=ReportNotification, validate=validate, route=self._get_route)
 
-    def update(self, report_notification_token: str, body: UpdateReportNotification) -> ReportNotification:
+    def update(self, report_notification_token: str, body: UpdateReportNotification, *, validate: Optional[ValidateMode] = None) -> ReportNotification:
         """
         Update report notification
         
@@ -2408,10 +4036,7 @@ class ReportNotificationsApi:
         path = f"/v2/report_notifications/{quote(str(report_notification_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ReportNotification.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=ReportNotification, validate=validate, route=self._update_route)
 
     def delete(self, report_notification_token: str) -> None:
         """
@@ -2422,16 +4047,63 @@ class ReportNotificationsApi:
         path = f"/v2/report_notifications/{quote(str(report_notification_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ReportNotification]:
+        """
+        Fetch many report notifications by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateReportNotification], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ReportNotification]:
+        """
+        Create many report notifications, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateReportNotification], Iterable[Tuple[str, UpdateReportNotification]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ReportNotification]:
+        """
+        Update many report notifications, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many report notifications by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class ResourceReportsApi:
     """API methods for resource_reports resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _get_columns_route = Route("GET", "/v2/resource_reports/columns", name="resource_reports.get_columns")
+    _list_route = Route("GET", "/v2/resource_reports", name="resource_reports.list", items="resource_reports")
+    _create_route = Route("POST", "/v2/resource_reports", name="resource_reports.create")
+    _get_route = Route("GET", "/v2/resource_reports/{resource_report_token}", name="resource_reports.get")
+    _update_route = Route("PUT", "/v2/resource_reports/{resource_report_token}", name="resource_reports.update")
+    _delete_route = Route("DELETE", "/v2/resource_reports/{resource_report_token}", name="resource_reports.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def get_columns(self, *, resource_type: str) -> ResourceReportColumns:
+    def get_columns(self, *, resource_type: str, validate: Optional[ValidateMode] = None) -> ResourceReportColumns:
         """
         Get resource report columns
         
@@ -2442,12 +4114,9 @@ class ResourceReportsApi:
             "resource_type": resource_type,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ResourceReportColumns.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=ResourceReportColumns, validate=validate, route=self._get_columns_route)
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> ResourceReports:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> ResourceReports:
         """
         Get all resource reports
         
@@ -2459,12 +4128,21 @@ class ResourceReportsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ResourceReports.model_validate(data)
-        return data
-
-    def create(self, body: CreateResourceReport) -> ResourceReport:
+        return self._client.request("GET", path, params=params, body=body_data, model=ResourceReports, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[ResourceReport]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("resource_reports") or ():
+                yield self._client._parse(ResourceReport, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateResourceReport, *, validate: Optional[ValidateMode] = None) -> ResourceReport:
         """
         Create resource report
         
@@ -2473,12 +4151,9 @@ class ResourceReportsApi:
         path = "/v2/resource_reports"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ResourceReport.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=ResourceReport, validate=validate, route=self._create_route)
 
-    def get(self, resource_report_token: str) -> ResourceReport:
+    def get(self, resource_report_token: str, *, validate: Optional[ValidateMode] = None) -> ResourceReport:
         """
         Get resource report by token
         
@@ -2487,12 +4162,9 @@ class ResourceReportsApi:
         path = f"/v2/resource_reports/{quote(str(resource_report_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ResourceReport.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=ResourceReport, validate=validate, route=self._get_route)
 
-    def update(self, resource_report_token: str, body: UpdateResourceReport) -> ResourceReport:
+    def update(self, resource_report_token: str, body: UpdateResourceReport, *, validate: Optional[ValidateMode] = None) -> ResourceReport:
         """
         Update resource report
         
@@ -2501,10 +4173,7 @@ class ResourceReportsApi:
         path = f"/v2/resource_reports/{quote(str(resource_report_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return ResourceReport.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=ResourceReport, validate=validate, route=self._update_route)
 
     def delete(self, resource_report_token: str) -> None:
         """
@@ -2515,16 +4184,59 @@ class ResourceReportsApi:
         path = f"/v2/resource_reports/{quote(str(resource_report_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ResourceReport]:
+        """
+        Fetch many resource reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateResourceReport], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ResourceReport]:
+        """
+        Create many resource reports, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateResourceReport], Iterable[Tuple[str, UpdateResourceReport]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[ResourceReport]:
+        """
+        Update many resource reports, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many resource reports by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class ResourcesApi:
     """API methods for resources resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _get_report_route = Route("GET", "/v2/resources", name="resources.get_report", items="resources")
+    _get_route = Route("GET", "/v2/resources/{resource_token}", name="resources.get")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def get_report(self, *, resource_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, include_cost: Optional[bool] = None, page: Optional[int] = None, limit: Optional[int] = None) -> Resources:
+    def get_report(self, *, resource_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, include_cost: Optional[bool] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Resources:
         """
         Get resources
         
@@ -2540,12 +4252,40 @@ class ResourcesApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Resources.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Resources, validate=validate, route=self._get_report_route)
+
+    def iter_report(self, *, resource_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, include_cost: Optional[bool] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Resource]:
+        """Iterate over every item of `get_report`, following `links.next` one page at a time."""
+        data = self.get_report(resource_report_token=resource_report_token, filter=filter, workspace_token=workspace_token, include_cost=include_cost, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("resources") or ():
+                yield self._client._parse(Resource, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_report_route)
+
+    def stream_report(self, *, resource_report_token: Optional[str] = None, filter: Optional[str] = None, workspace_token: Optional[str] = None, include_cost: Optional[bool] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Resource]:
+        """
+        Stream every item of `get_report`, decoding each one as it arrives.
+
+        Pages are followed through `links.next`, and each response body is parsed
+        incrementally, so memory is bounded by one item rather than one page.
+        """
+        path = "/v2/resources"
+        params = {
+            "resource_report_token": resource_report_token,
+            "filter": filter,
+            "workspace_token": workspace_token,
+            "include_cost": include_cost,
+            "page": page,
+            "limit": limit,
+        }
+        for item in self._client._stream_items(path, params, "resources", self._get_report_route):
+            yield self._client._parse(Resource, item, validate)
 
-    def get(self, resource_token: str, *, include_cost: Optional[bool] = None) -> Resource:
+    def get(self, resource_token: str, *, include_cost: Optional[bool] = None, validate: Optional[ValidateMode] = None) -> Resource:
         """
         Get resource by token
         
@@ -2556,19 +4296,32 @@ class ResourcesApi:
             "include_cost": include_cost,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Resource.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Resource, validate=validate, route=self._get_route)
+
+    def get_many(self, tokens: Iterable[str], *, include_cost: Optional[bool] = None, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Resource]:
+        """
+        Fetch many resources by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, include_cost=include_cost, validate=validate), tokens, concurrency)
 
 
 class SavedFiltersApi:
     """API methods for saved_filters resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/saved_filters", name="saved_filters.list", items="saved_filters")
+    _create_route = Route("POST", "/v2/saved_filters", name="saved_filters.create")
+    _get_route = Route("GET", "/v2/saved_filters/{saved_filter_token}", name="saved_filters.get")
+    _update_route = Route("PUT", "/v2/saved_filters/{saved_filter_token}", name="saved_filters.update")
+    _delete_route = Route("DELETE", "/v2/saved_filters/{saved_filter_token}", name="saved_filters.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> SavedFilters:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> SavedFilters:
         """
         Get all saved filters
         
@@ -2580,12 +4333,21 @@ class SavedFiltersApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return SavedFilters.model_validate(data)
-        return data
-
-    def create(self, body: CreateSavedFilter) -> SavedFilter:
+        return self._client.request("GET", path, params=params, body=body_data, model=SavedFilters, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[SavedFilter]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("saved_filters") or ():
+                yield self._client._parse(SavedFilter, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateSavedFilter, *, validate: Optional[ValidateMode] = None) -> SavedFilter:
         """
         Create saved filter
         
@@ -2594,12 +4356,9 @@ class SavedFiltersApi:
         path = "/v2/saved_filters"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return SavedFilter.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=SavedFilter, validate=validate, route=self._create_route)
 
-    def get(self, saved_filter_token: str) -> SavedFilter:
+    def get(self, saved_filter_token: str, *, validate: Optional[ValidateMode] = None) -> SavedFilter:
         """
         Get saved filter by token
         
@@ -2608,12 +4367,9 @@ class SavedFiltersApi:
         path = f"/v2/saved_filters/{quote(str(saved_filter_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return SavedFilter.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=SavedFilter, validate=validate, route=self._get_route)
 
-    def update(self, saved_filter_token: str, body: UpdateSavedFilter) -> SavedFilter:
+    def update(self, saved_filter_token: str, body: UpdateSavedFilter, *, validate: Optional[ValidateMode] = None) -> SavedFilter:
         """
         Update saved filter
         
@@ -2622,10 +4378,7 @@ class SavedFiltersApi:
         path = f"/v2/saved_filters/{quote(str(saved_filter_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return SavedFilter.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=SavedFilter, validate=validate, route=self._update_route)
 
     def delete(self, saved_filter_token: str) -> None:
         """
@@ -2636,16 +4389,62 @@ class SavedFiltersApi:
         path = f"/v2/saved_filters/{quote(str(saved_filter_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[SavedFilter]:
+        """
+        Fetch many saved filters by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateSavedFilter], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[SavedFilter]:
+        """
+        Create many saved filters, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateSavedFilter], Iterable[Tuple[str, UpdateSavedFilter]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[SavedFilter]:
+        """
+        Update many saved filters, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many saved filters by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class SegmentsApi:
     """API methods for segments resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/segments", name="segments.list", items="segments")
+    _create_route = Route("POST", "/v2/segments", name="segments.create")
+    _get_route = Route("GET", "/v2/segments/{segment_token}", name="segments.get")
+    _update_route = Route("PUT", "/v2/segments/{segment_token}", name="segments.update")
+    _delete_route = Route("DELETE", "/v2/segments/{segment_token}", name="segments.delete")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> Segments:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Segments:
         """
         Get all segments
         
@@ -2657,12 +4456,21 @@ class SegmentsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Segments.model_validate(data)
-        return data
-
-    def create(self, body: CreateSegment) -> Segment:
+        return self._client.request("GET", path, params=params, body=body_data, model=Segments, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Segment]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("segments") or ():
+                yield self._client._parse(Segment, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateSegment, *, validate: Optional[ValidateMode] = None) -> Segment:
         """
         Create segment
         
@@ -2671,12 +4479,9 @@ class SegmentsApi:
         path = "/v2/segments"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Segment.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Segment, validate=validate, route=self._create_route)
 
-    def get(self, segment_token: str) -> Segment:
+    def get(self, segment_token: str, *, validate: Optional[ValidateMode] = None) -> Segment:
         """
         Get segment by token
         
@@ -2685,12 +4490,9 @@ class SegmentsApi:
         path = f"/v2/segments/{quote(str(segment_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Segment.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Segment, validate=validate, route=self._get_route)
 
-    def update(self, segment_token: str, body: UpdateSegment) -> Segment:
+    def update(self, segment_token: str, body: UpdateSegment, *, validate: Optional[ValidateMode] = None) -> Segment:
         """
         Update segment
         
@@ -2699,10 +4501,7 @@ class SegmentsApi:
         path = f"/v2/segments/{quote(str(segment_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Segment.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Segment, validate=validate, route=self._update_route)
 
     def delete(self, segment_token: str) -> None:
         """
@@ -2713,16 +4512,60 @@ class SegmentsApi:
         path = f"/v2/segments/{quote(str(segment_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Segment]:
+        """
+        Fetch many segments by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateSegment], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Segment]:
+        """
+        Create many segments, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateSegment], Iterable[Tuple[str, UpdateSegment]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Segment]:
+        """
+        Update many segments, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many segments by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class TagsApi:
     """API methods for tags resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/tags", name="tags.list", items="tags")
+    _update_route = Route("PUT", "/v2/tags", name="tags.update")
+    _get_values_route = Route("GET", "/v2/tags/{key}/values", name="tags.get_values", items="tag_values")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, providers: Optional[List[str]] = None, search_query: Optional[str] = None, sort_direction: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None) -> Tags:
+    def list(self, *, providers: Optional[List[str]] = None, search_query: Optional[str] = None, sort_direction: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Tags:
         """
         Get all tags
         
@@ -2737,12 +4580,21 @@ class TagsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Tags.model_validate(data)
-        return data
-
-    def update(self, body: UpdateTag) -> Tags:
+        return self._client.request("GET", path, params=params, body=body_data, model=Tags, validate=validate, route=self._list_route)
+
+    def list_all(self, *, providers: Optional[List[str]] = None, search_query: Optional[str] = None, sort_direction: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Tag]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(providers=providers, search_query=search_query, sort_direction=sort_direction, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("tags") or ():
+                yield self._client._parse(Tag, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def update(self, body: UpdateTag, *, validate: Optional[ValidateMode] = None) -> Tags:
         """
         Update tag
         
@@ -2751,12 +4603,9 @@ class TagsApi:
         path = "/v2/tags"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Tags.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Tags, validate=validate, route=self._update_route)
 
-    def get_values(self, key: str, *, providers: Optional[List[str]] = None, sort_direction: Optional[str] = None, search_query: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None) -> TagValues:
+    def get_values(self, key: str, *, providers: Optional[List[str]] = None, sort_direction: Optional[str] = None, search_query: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> TagValues:
         """
         Get tag values
         
@@ -2771,19 +4620,38 @@ class TagsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return TagValues.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=TagValues, validate=validate, route=self._get_values_route)
+
+    def iter_values(self, key: str, *, providers: Optional[List[str]] = None, sort_direction: Optional[str] = None, search_query: Optional[str] = None, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[TagValue]:
+        """Iterate over every item of `get_values`, following `links.next` one page at a time."""
+        data = self.get_values(key, providers=providers, sort_direction=sort_direction, search_query=search_query, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("tag_values") or ():
+                yield self._client._parse(TagValue, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_values_route)
 
 
 class TeamsApi:
     """API methods for teams resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/teams", name="teams.list", items="teams")
+    _create_route = Route("POST", "/v2/teams", name="teams.create")
+    _get_route = Route("GET", "/v2/teams/{team_token}", name="teams.get")
+    _update_route = Route("PUT", "/v2/teams/{team_token}", name="teams.update")
+    _delete_route = Route("DELETE", "/v2/teams/{team_token}", name="teams.delete")
+    _get_members_route = Route("GET", "/v2/teams/{team_token}/members", name="teams.get_members", items="members")
+    _add_member_route = Route("POST", "/v2/teams/{team_token}/members", name="teams.add_member")
+    _remove_member_route = Route("DELETE", "/v2/teams/{team_token}/members/{user_token}", name="teams.remove_member")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> Teams:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Teams:
         """
         Get all teams
         
@@ -2795,12 +4663,21 @@ class TeamsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Teams.model_validate(data)
-        return data
-
-    def create(self, body: CreateTeam) -> Team:
+        return self._client.request("GET", path, params=params, body=body_data, model=Teams, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Team]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("teams") or ():
+                yield self._client._parse(Team, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateTeam, *, validate: Optional[ValidateMode] = None) -> Team:
         """
         Create team
         
@@ -2809,12 +4686,9 @@ class TeamsApi:
         path = "/v2/teams"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Team.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Team, validate=validate, route=self._create_route)
 
-    def get(self, team_token: str) -> Team:
+    def get(self, team_token: str, *, validate: Optional[ValidateMode] = None) -> Team:
         """
         Get team by token
         
@@ -2823,12 +4697,9 @@ class TeamsApi:
         path = f"/v2/teams/{quote(str(team_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Team.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Team, validate=validate, route=self._get_route)
 
-    def update(self, team_token: str, body: UpdateTeam) -> Team:
+    def update(self, team_token: str, body: UpdateTeam, *, validate: Optional[ValidateMode] = None) -> Team:
         """
         Update team
         
@@ -2837,10 +4708,7 @@ class TeamsApi:
         path = f"/v2/teams/{quote(str(team_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Team.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Team, validate=validate, route=self._update_route)
 
     def delete(self, team_token: str) -> None:
         """
@@ -2851,9 +4719,9 @@ class TeamsApi:
         path = f"/v2/teams/{quote(str(team_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
 
-    def get_members(self, team_token: str, *, page: Optional[int] = None, limit: Optional[int] = None) -> TeamMembers:
+    def get_members(self, team_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> TeamMembers:
         """
         Get team members
         
@@ -2865,12 +4733,21 @@ class TeamsApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return TeamMembers.model_validate(data)
-        return data
-
-    def add_member(self, team_token: str, body: AddTeamMember) -> TeamMember:
+        return self._client.request("GET", path, params=params, body=body_data, model=TeamMembers, validate=validate, route=self._get_members_route)
+
+    def iter_members(self, team_token: str, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[TeamMember]:
+        """Iterate over every item of `get_members`, following `links.next` one page at a time."""
+        data = self.get_members(team_token, page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("members") or ():
+                yield self._client._parse(TeamMember, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._get_members_route)
+
+    def add_member(self, team_token: str, body: AddTeamMember, *, validate: Optional[ValidateMode] = None) -> TeamMember:
         """
         Add team member
         
@@ -2879,10 +4756,7 @@ class TeamsApi:
         path = f"/v2/teams/{quote(str(team_token), safe='')}/members"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return TeamMember.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=TeamMember, validate=validate, route=self._add_member_route)
 
     def remove_member(self, team_token: str, user_token: str) -> None:
         """
@@ -2893,12 +4767,55 @@ class TeamsApi:
         path = f"/v2/teams/{quote(str(team_token), safe='')}/members/{quote(str(user_token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._remove_member_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Team]:
+        """
+        Fetch many teams by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateTeam], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Team]:
+        """
+        Create many teams, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateTeam], Iterable[Tuple[str, UpdateTeam]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Team]:
+        """
+        Update many teams, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many teams by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
 
 
 class UnitCostsApi:
     """API methods for unit_costs resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _create_export_route = Route("POST", "/v2/unit_costs/data_exports", handler="_request_for_location", name="unit_costs.create_export")
+    _list_route = Route("GET", "/v2/unit_costs", name="unit_costs.list", items="unit_costs")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
@@ -2911,9 +4828,24 @@ class UnitCostsApi:
         path = "/v2/unit_costs/data_exports"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        return self._client.request("POST", path, params=params, body=body_data)
+        return self._client.request("POST", path, params=params, body=body_data, route=self._create_export_route)
+
+    def export_and_download(self, body: CreateUnitCostsExport, dest: Union[str, Path], *, concurrency: int = 4, timeout: Optional[float] = 3600.0, resume: bool = True, validate: Optional[ValidateMode] = None) -> ExportDownload:
+        """
+        Generate a data export with `create_export`, wait for it and download its files into `dest`.
+
+        The export is polled with a growing interval (up to 30s) until it completes,
+        failing after `timeout` seconds. Its files are streamed to disk `concurrency`
+        at a time and checked against their size and checksum. With `resume`, files
+        already downloaded are kept and partial ones are continued. Use
+        `ExportDownload.rows()` to iterate the CSV rows of all files.
+        """
+        location = self.create_export(body)
+        return download_export(
+            self._client, location, dest, concurrency=concurrency, timeout=timeout, resume=resume, validate=validate
+        )
 
-    def list(self, *, cost_report_token: str, start_date: Optional[str] = None, end_date: Optional[str] = None, date_bin: Optional[str] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None) -> UnitCosts:
+    def list(self, *, cost_report_token: str, start_date: Optional[str] = None, end_date: Optional[str] = None, date_bin: Optional[str] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None, validate: Optional[ValidateMode] = None) -> UnitCosts:
         """
         Get all unit costs for a cost report
         
@@ -2930,19 +4862,54 @@ class UnitCostsApi:
             "page": page,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return UnitCosts.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=UnitCosts, validate=validate, route=self._list_route)
+
+    def list_all(self, *, cost_report_token: str, start_date: Optional[str] = None, end_date: Optional[str] = None, date_bin: Optional[str] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[UnitCost]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(cost_report_token=cost_report_token, start_date=start_date, end_date=end_date, date_bin=date_bin, order=order, limit=limit, page=page, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("unit_costs") or ():
+                yield self._client._parse(UnitCost, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def list_columnar(self, *, cost_report_token: str, start_date: Optional[str] = None, end_date: Optional[str] = None, date_bin: Optional[str] = None, order: Optional[str] = None, limit: Optional[int] = None, page: Optional[int] = None) -> ColumnarResult:
+        """
+        Fetch every page of `list` into column arrays instead of `UnitCost` models.
+
+        Rows are decoded straight into a ColumnarResult, following `links.next`.
+        Stored as float64: unit_cost_amount, business_metric_amount, scale.
+        Dictionary-encoded: business_metric_token, business_metric_title.
+        """
+        path = "/v2/unit_costs"
+        params = {
+            "cost_report_token": cost_report_token,
+            "start_date": start_date,
+            "end_date": end_date,
+            "date_bin": date_bin,
+            "order": order,
+            "limit": limit,
+            "page": page,
+        }
+        result = ColumnarResult(numeric=('unit_cost_amount', 'business_metric_amount', 'scale'), categorical=('business_metric_token', 'business_metric_title'))
+        for row in self._client._stream_items(path, params, "unit_costs", self._list_route):
+            result.append(row)
+        return result
 
 
 class UserFeedbackApi:
     """API methods for user_feedback resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _create_route = Route("POST", "/v2/user_feedback", name="user_feedback.create")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def create(self, body: CreateUserFeedback) -> UserFeedback:
+    def create(self, body: CreateUserFeedback, *, validate: Optional[ValidateMode] = None) -> UserFeedback:
         """
         Submit user feedback
         
@@ -2951,19 +4918,30 @@ class UserFeedbackApi:
         path = "/v2/user_feedback"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return UserFeedback.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=UserFeedback, validate=validate, route=self._create_route)
+
+    def create_many(self, bodies: Iterable[CreateUserFeedback], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[UserFeedback]:
+        """
+        Create many user feedback, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
 
 
 class UsersApi:
     """API methods for users resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/users", name="users.list", items="users")
+    _get_route = Route("GET", "/v2/users/{user_token}", name="users.get")
+    _update_route = Route("PUT", "/v2/users/{user_token}", name="users.update")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> Users:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Users:
         """
         Get all users
         
@@ -2975,12 +4953,21 @@ class UsersApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Users.model_validate(data)
-        return data
-
-    def get(self, user_token: str) -> User:
+        return self._client.request("GET", path, params=params, body=body_data, model=Users, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[User]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("users") or ():
+                yield self._client._parse(User, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def get(self, user_token: str, *, validate: Optional[ValidateMode] = None) -> User:
         """
         Get user by token
         
@@ -2989,12 +4976,9 @@ class UsersApi:
         path = f"/v2/users/{quote(str(user_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return User.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=User, validate=validate, route=self._get_route)
 
-    def update(self, user_token: str, body: UpdateUser) -> User:
+    def update(self, user_token: str, body: UpdateUser, *, validate: Optional[ValidateMode] = None) -> User:
         """
         Update a user
         
@@ -3003,19 +4987,47 @@ class UsersApi:
         path = f"/v2/users/{quote(str(user_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return User.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=User, validate=validate, route=self._update_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[User]:
+        """
+        Fetch many users by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateUser], Iterable[Tuple[str, UpdateUser]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[User]:
+        """
+        Update many users, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
 
 
 class VirtualTagConfigsApi:
     """API methods for virtual_tag_configs resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/virtual_tag_configs", name="virtual_tag_configs.list")
+    _create_route = Route("POST", "/v2/virtual_tag_configs", name="virtual_tag_configs.create")
+    _get_route = Route("GET", "/v2/virtual_tag_configs/{token}", name="virtual_tag_configs.get")
+    _update_route = Route("PUT", "/v2/virtual_tag_configs/{token}", name="virtual_tag_configs.update")
+    _delete_route = Route("DELETE", "/v2/virtual_tag_configs/{token}", name="virtual_tag_configs.delete")
+    _get_status_route = Route("GET", "/v2/virtual_tag_configs/{token}/status", name="virtual_tag_configs.get_status")
+    _update_async_route = Route("PUT", "/v2/virtual_tag_configs/{token}/async", name="virtual_tag_configs.update_async")
+    _get_async_virtual_tag_config_status_route = Route("GET", "/v2/virtual_tag_configs/async/{request_id}", boolean_status=True, name="virtual_tag_configs.get_async_virtual_tag_config_status")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self) -> VirtualTagConfigs:
+    def list(self, *, validate: Optional[ValidateMode] = None) -> VirtualTagConfigs:
         """
         Get all virtual tag configs
         
@@ -3024,12 +5036,9 @@ class VirtualTagConfigsApi:
         path = "/v2/virtual_tag_configs"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return VirtualTagConfigs.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=VirtualTagConfigs, validate=validate, route=self._list_route)
 
-    def create(self, body: CreateVirtualTagConfig) -> VirtualTagConfig:
+    def create(self, body: CreateVirtualTagConfig, *, validate: Optional[ValidateMode] = None) -> VirtualTagConfig:
         """
         Create virtual tag config
         
@@ -3038,12 +5047,9 @@ class VirtualTagConfigsApi:
         path = "/v2/virtual_tag_configs"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return VirtualTagConfig.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=VirtualTagConfig, validate=validate, route=self._create_route)
 
-    def get(self, token: str) -> VirtualTagConfig:
+    def get(self, token: str, *, validate: Optional[ValidateMode] = None) -> VirtualTagConfig:
         """
         Get virtual tag config by token
         
@@ -3052,12 +5058,9 @@ class VirtualTagConfigsApi:
         path = f"/v2/virtual_tag_configs/{quote(str(token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return VirtualTagConfig.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=VirtualTagConfig, validate=validate, route=self._get_route)
 
-    def update(self, token: str, body: UpdateVirtualTagConfig) -> VirtualTagConfig:
+    def update(self, token: str, body: UpdateVirtualTagConfig, *, validate: Optional[ValidateMode] = None) -> VirtualTagConfig:
         """
         Update virtual tag config
         
@@ -3066,10 +5069,7 @@ class VirtualTagConfigsApi:
         path = f"/v2/virtual_tag_configs/{quote(str(token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return VirtualTagConfig.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=VirtualTagConfig, validate=validate, route=self._update_route)
 
     def delete(self, token: str) -> None:
         """
@@ -3080,9 +5080,9 @@ class VirtualTagConfigsApi:
         path = f"/v2/virtual_tag_configs/{quote(str(token), safe='')}"
         params = None
         body_data = None
-        self._client.request("DELETE", path, params=params, body=body_data)
+        self._client.request("DELETE", path, params=params, body=body_data, route=self._delete_route)
 
-    def get_status(self, token: str) -> VirtualTagConfigStatus:
+    def get_status(self, token: str, *, validate: Optional[ValidateMode] = None) -> VirtualTagConfigStatus:
         """
         Get virtual tag config processing status
         
@@ -3091,12 +5091,9 @@ class VirtualTagConfigsApi:
         path = f"/v2/virtual_tag_configs/{quote(str(token), safe='')}/status"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return VirtualTagConfigStatus.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=VirtualTagConfigStatus, validate=validate, route=self._get_status_route)
 
-    def update_async(self, token: str, body: UpdateAsyncVirtualTagConfig) -> AsyncVirtualTagConfigUpdate:
+    def update_async(self, token: str, body: UpdateAsyncVirtualTagConfig, *, validate: Optional[ValidateMode] = None) -> AsyncVirtualTagConfigUpdate:
         """
         Update virtual tag config asynchronously
         
@@ -3105,10 +5102,7 @@ class VirtualTagConfigsApi:
         path = f"/v2/virtual_tag_configs/{quote(str(token), safe='')}/async"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return AsyncVirtualTagConfigUpdate.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=AsyncVirtualTagConfigUpdate, validate=validate, route=self._update_async_route)
 
     def get_async_virtual_tag_config_status(self, request_id: str) -> bool:
         """
@@ -3119,16 +5113,110 @@ class VirtualTagConfigsApi:
         path = f"/v2/virtual_tag_configs/async/{quote(str(request_id), safe='')}"
         params = None
         body_data = None
-        return self._client.request("GET", path, params=params, body=body_data)
+        return self._client.request("GET", path, params=params, body=body_data, route=self._get_async_virtual_tag_config_status_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[VirtualTagConfig]:
+        """
+        Fetch many virtual tag configs by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateVirtualTagConfig], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[VirtualTagConfig]:
+        """
+        Create many virtual tag configs, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateVirtualTagConfig], Iterable[Tuple[str, UpdateVirtualTagConfig]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[VirtualTagConfig]:
+        """
+        Update many virtual tag configs, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
+
+    def delete_many(self, tokens: Iterable[str], *, concurrency: int = 4) -> BatchResult[None]:
+        """
+        Delete many virtual tag configs by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.delete(item), tokens, concurrency)
+
+    def update_async_and_wait(self, token: str, body: UpdateAsyncVirtualTagConfig, *, timeout: Optional[float] = 600.0, poll: Optional[PollPolicy] = None, validate: Optional[ValidateMode] = None) -> VirtualTagConfig:
+        """
+        Start `update_async` and wait until `get_async_virtual_tag_config_status` reports it done.
+
+        The status is checked right away and then with a growing interval (see
+        PollPolicy), by the client's Waiter. Returns the updated resource. Raises
+        WaitTimeoutError if the update has not finished within `timeout` seconds.
+        """
+        update = self.update_async(token, body, validate="raw")
+        self.wait_async_updates([update["request_id"]], timeout=timeout, poll=poll).raise_for_errors()
+        return self.get(token, validate=validate)
+
+    def wait_async_updates(self, request_ids: Iterable[str], *, timeout: Optional[float] = 600.0, poll: Optional[PollPolicy] = None) -> BatchResult[bool]:
+        """
+        Wait until `get_async_virtual_tag_config_status` reports every request done.
+
+        All requests are polled by the client's Waiter, with a growing interval
+        each; waits on the same request share its checks. Returns one BatchItem
+        per request ID, in input order; one that has not finished within `timeout`
+        seconds records a WaitTimeoutError.
+        """
+        return self._client._waiter.wait_all(
+            lambda request_id: lambda: self.get_async_virtual_tag_config_status(request_id),
+            request_ids,
+            key=lambda request_id: f"/v2/virtual_tag_configs/async/{quote(str(request_id), safe='')}",
+            timeout=timeout,
+            policy=poll,
+        )
+
+    def wait_until_processed(self, token: str, *, timeout: Optional[float] = 3600.0, poll: Optional[PollPolicy] = None, validate: Optional[ValidateMode] = None) -> Future[VirtualTagConfigStatus]:
+        """
+        Return a future that resolves to the VirtualTagConfigStatus once it has finished.
+
+        `get_status` is polled in the background by the client's Waiter, right away
+        and then with a growing interval (see PollPolicy). Waits on the same
+        resource share one status check. The future fails with WaitTimeoutError
+        after `timeout` seconds; cancelling it stops the polling once nothing
+        else waits on it. To block until done, call `.result()` on it.
+        """
+        path = f"/v2/virtual_tag_configs/{quote(str(token), safe='')}/status"
+        return self._client._waiter.submit(
+            lambda: self._client.request("GET", path, route=self._get_status_route),
+            key=path,
+            is_done=virtual_tag_processed,
+            timeout=timeout,
+            policy=poll,
+            transform=lambda data: self._client._parse(VirtualTagConfigStatus, data, validate),
+        )
 
 
 class WorkspacesApi:
     """API methods for workspaces resource."""
 
+    # Routing of each method, resolved once when the class is defined.
+    _list_route = Route("GET", "/v2/workspaces", name="workspaces.list", items="workspaces")
+    _create_route = Route("POST", "/v2/workspaces", name="workspaces.create")
+    _get_route = Route("GET", "/v2/workspaces/{workspace_token}", name="workspaces.get")
+    _update_route = Route("PUT", "/v2/workspaces/{workspace_token}", name="workspaces.update")
+
     def __init__(self, client: SyncClient) -> None:
         self._client = client
 
-    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None) -> Workspaces:
+    def list(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Workspaces:
         """
         Get all workspaces
         
@@ -3140,12 +5228,21 @@ class WorkspacesApi:
             "limit": limit,
         }
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Workspaces.model_validate(data)
-        return data
-
-    def create(self, body: CreateWorkspace) -> Workspace:
+        return self._client.request("GET", path, params=params, body=body_data, model=Workspaces, validate=validate, route=self._list_route)
+
+    def list_all(self, *, page: Optional[int] = None, limit: Optional[int] = None, validate: Optional[ValidateMode] = None) -> Iterator[Workspace]:
+        """Iterate over every item of `list`, following `links.next` one page at a time."""
+        data = self.list(page=page, limit=limit, validate="raw")
+        while True:
+            next_path = next_page_path(data.get("links"))
+            for item in data.get("workspaces") or ():
+                yield self._client._parse(Workspace, item, validate)
+            if next_path is None:
+                return
+            del data
+            data = self._client.request("GET", next_path, route=self._list_route)
+
+    def create(self, body: CreateWorkspace, *, validate: Optional[ValidateMode] = None) -> Workspace:
         """
         Create workspace
         
@@ -3154,12 +5251,9 @@ class WorkspacesApi:
         path = "/v2/workspaces"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("POST", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Workspace.model_validate(data)
-        return data
+        return self._client.request("POST", path, params=params, body=body_data, model=Workspace, validate=validate, route=self._create_route)
 
-    def get(self, workspace_token: str) -> Workspace:
+    def get(self, workspace_token: str, *, validate: Optional[ValidateMode] = None) -> Workspace:
         """
         Get workspace by token
         
@@ -3168,12 +5262,9 @@ class WorkspacesApi:
         path = f"/v2/workspaces/{quote(str(workspace_token), safe='')}"
         params = None
         body_data = None
-        data = self._client.request("GET", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Workspace.model_validate(data)
-        return data
+        return self._client.request("GET", path, params=params, body=body_data, model=Workspace, validate=validate, route=self._get_route)
 
-    def update(self, workspace_token: str, body: UpdateWorkspace) -> Workspace:
+    def update(self, workspace_token: str, body: UpdateWorkspace, *, validate: Optional[ValidateMode] = None) -> Workspace:
         """
         Update workspace
         
@@ -3182,8 +5273,35 @@ class WorkspacesApi:
         path = f"/v2/workspaces/{quote(str(workspace_token), safe='')}"
         params = None
         body_data = body.model_dump(by_alias=True, exclude_none=True) if hasattr(body, 'model_dump') else body
-        data = self._client.request("PUT", path, params=params, body=body_data)
-        if isinstance(data, dict):
-            return Workspace.model_validate(data)
-        return data
+        return self._client.request("PUT", path, params=params, body=body_data, model=Workspace, validate=validate, route=self._update_route)
+
+    def get_many(self, tokens: Iterable[str], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Workspace]:
+        """
+        Fetch many workspaces by token, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.get(item, validate=validate), tokens, concurrency)
+
+    def create_many(self, bodies: Iterable[CreateWorkspace], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Workspace]:
+        """
+        Create many workspaces, `concurrency` at a time.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.create(item, validate=validate), bodies, concurrency)
+
+    def update_many(self, updates: Union[Mapping[str, UpdateWorkspace], Iterable[Tuple[str, UpdateWorkspace]]], *, concurrency: int = 4, validate: Optional[ValidateMode] = None) -> BatchResult[Workspace]:
+        """
+        Update many workspaces, `concurrency` at a time.
+
+        `updates` maps tokens to update bodies, as a dict or as (token, body) pairs;
+        each BatchItem's input is the (token, body) pair.
+
+        Returns one BatchItem per input, in input order. An item that fails records
+        its exception (e.g. VantageAPIError) instead of aborting the batch.
+        """
+        return run_batch(lambda item: self.update(item[0], item[1], validate=validate), update_pairs(updates), concurrency)
 
@@ -0,0 +1,111 @@
+"""Optional OpenTelemetry spans for the API calls a client makes."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from ._base import Route
+from ._hooks import RequestEvent
+
+
+def get_tracing(tracing: Any) -> Optional[Tracing]:
+    """
+    Resolve a client's ``tracing`` option.
+
+    Tracing is opt-in: ``None`` and ``False`` leave it off, so having
+    ``opentelemetry-api`` installed costs nothing unless asked for. ``True``
+    traces with the global ``TracerProvider`` and any other value is used as
+    the ``TracerProvider``. Both require ``opentelemetry-api``.
+    """
+    if tracing is None or tracing is False:
+        return None
+    try:
+        return Tracing(None if tracing is True else tracing)
+    except ImportError as e:
+        raise ImportError("tracing requires opentelemetry-api: pip install vantage-python[otel]") from e
+
+
+class Tracing:
+    """
+    Opens one span per API call, named after the client method, e.g. ``cost_reports.get``.
+
+    Spans are CLIENT spans carrying the templated route, the requested page and
+    limit, the response status and sizes, the number of items in a page and the
+    decode and validate times. The trace context of the span is sent with the
+    request in the headers of the globally configured propagator.
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        from opentelemetry import context, propagate, trace
+
+        self._context = context
+        self._trace = trace
+        self._inject = propagate.inject
+        self._tracer = trace.get_tracer("vantage", tracer_provider=tracer_provider)
+        self._error = trace.Status(trace.StatusCode.ERROR)
+
+    @contextmanager
+    def span(self, route: Route, url: str, event: RequestEvent, current: bool = True) -> Iterator[Any]:
+        """
+        Trace one call, ending the span with the outcome recorded on ``event``.
+
+        Pass ``current=False`` for a span that stays open while items are
+        yielded to the caller, which must not run inside it.
+        """
+        span = self._tracer.start_span(
+            route.name or f"{route.method} {route.path}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=_attributes(route, url),
+        )
+        event.span = span
+        token = self._context.attach(self._trace.set_span_in_context(span)) if current else None
+        try:
+            yield span
+        except GeneratorExit:
+            # The caller stopped iterating; that is not a failed call.
+            raise
+        except BaseException as e:
+            span.record_exception(e)
+            span.set_status(self._error)
+            raise
+        finally:
+            _record(span, event)
+            if token is not None:
+                self._context.detach(token)
+            span.end()
+
+    def inject(self, span: Any, headers: Any) -> None:
+        """Add the trace context of ``span`` to the headers of an outgoing request."""
+        self._inject(headers, context=self._trace.set_span_in_context(span))
+
+
+def _attributes(route: Route, url: str) -> Dict[str, Any]:
+    parts = urlsplit(url)
+    attributes: Dict[str, Any] = {
+        "http.request.method": route.method,
+        "url.template": route.path,
+        "server.address": parts.hostname or "",
+    }
+    for key, value in parse_qsl(parts.query):
+        if key in ("page", "limit") and value.isdigit():
+            attributes[f"vantage.{key}"] = int(value)
+    return attributes
+
+
+def _record(span: Any, event: RequestEvent) -> None:
+    if event.status is not None:
+        span.set_attribute("http.response.status_code", event.status)
+    if event.attempt:
+        span.set_attribute("http.request.resend_count", event.attempt)
+    if event.request_bytes:
+        span.set_attribute("http.request.body.size", event.request_bytes)
+    if event.response_bytes is not None:
+        span.set_attribute("http.response.body.size", event.response_bytes)
+    if event.items is not None:
+        span.set_attribute("vantage.items", event.items)
+    if event.decode is not None:
+        span.set_attribute("vantage.decode_duration", event.decode)
+    if event.validate is not None:
+        span.set_attribute("vantage.validate_duration", event.validate)
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from typing import Any, Optional, List, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel as _PydanticBaseModel, ConfigDict, Field
+
+
+class BaseModel(_PydanticBaseModel):
+    """Base for the generated models. Validators are built on first use, not at import."""
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class AccessGrants(BaseModel):
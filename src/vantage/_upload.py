@@ -0,0 +1,167 @@
+"""Streaming CSV file parts for the multipart upload endpoints."""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+# Form field the CSV upload endpoints read the file from.
+CSV_FIELD = "csv"
+
+# What the multipart endpoints accept as ``body``: form fields, or a CSV source.
+UploadBody = Union[Dict[str, Any], str, "os.PathLike[str]", IO[Any], Iterable[Any]]
+
+_END = object()
+
+
+class CSVRows(io.RawIOBase):
+    """
+    A read-only binary stream that encodes rows to CSV as it is read.
+
+    Only the rows needed to fill each read are pulled from ``rows``, so a
+    generator of any length is uploaded in bounded memory. Rows may be
+    sequences or mappings; for mappings the header comes from ``fieldnames``
+    or, if omitted, from the keys of the first row.
+
+    Args:
+        rows: The rows to encode.
+        fieldnames: Column names written as the header row. Required to write
+            a header for sequence rows.
+        filename: File name sent with the part.
+
+    Example:
+        client.integrations.create_user_costs_upload_via_csv(
+            "accss_crdntl_abc",
+            CSVRows(read_billing_rows(), fieldnames=["date", "cost", "service"]),
+        )
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Union[Sequence[Any], Mapping[str, Any]]],
+        fieldnames: Optional[Sequence[str]] = None,
+        *,
+        filename: str = "upload.csv",
+    ) -> None:
+        super().__init__()
+        self.name = filename
+        self._rows = iter(rows)
+        self._fieldnames = list(fieldnames) if fieldnames is not None else None
+        self._text = io.StringIO()
+        self._writer: Any = None
+        self._pending = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def _encode(self, row: Any) -> None:
+        if self._writer is None:
+            if isinstance(row, Mapping):
+                self._writer = csv.DictWriter(self._text, self._fieldnames or list(row))
+                self._writer.writeheader()
+            else:
+                self._writer = csv.writer(self._text)
+                if self._fieldnames is not None:
+                    self._writer.writerow(self._fieldnames)
+        self._writer.writerow(row)
+        self._pending += self._text.getvalue().encode("utf-8")
+        self._text.seek(0)
+        self._text.truncate()
+
+    def readinto(self, buffer: Any) -> int:
+        while len(self._pending) < len(buffer):
+            row = next(self._rows, _END)
+            if row is _END:
+                break
+            self._encode(row)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        del self._pending[:size]
+        return size
+
+
+class _EncodedText(io.RawIOBase):
+    """Read a text-mode file as UTF-8 bytes, a chunk at a time."""
+
+    def __init__(self, text: IO[str]) -> None:
+        super().__init__()
+        self.name = getattr(text, "name", "upload.csv")
+        self._text = text
+        self._pending = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while len(self._pending) < len(buffer):
+            chunk = self._text.read(len(buffer))
+            if not chunk:
+                break
+            self._pending += chunk.encode("utf-8")
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        del self._pending[:size]
+        return size
+
+
+def _is_file(value: Any) -> bool:
+    # A str in a dict body is form data, not a path; see MultipartBody.
+    return isinstance(value, os.PathLike) or hasattr(value, "read")
+
+
+class MultipartBody:
+    """
+    Split a multipart request body into form fields and streamed file parts.
+
+    ``body`` is either a dict of form fields or a CSV source sent as the
+    ``csv`` field. A source is a path (``str`` or ``os.PathLike``), a file
+    object, a ``CSVRows`` or any other iterable of rows. In a dict,
+    ``os.PathLike``, file object and ``CSVRows`` values become file parts and
+    everything else stays a form field. That includes ``str`` values, so
+    ``{"csv": text}`` still sends the CSV text as a plain form field; pass
+    ``{"csv": Path("costs.csv")}`` to upload a file. Files opened here are
+    closed by ``close()``.
+    """
+
+    def __init__(self, body: Any) -> None:
+        self.data: Dict[str, Any] = {}
+        self.files: Dict[str, Tuple[str, IO[bytes], str]] = {}
+        self._opened: List[IO[bytes]] = []
+        #: Whether the parts can be read again, which a retry requires.
+        self.replayable = True
+
+        if body is None:
+            return
+        if isinstance(body, Mapping):
+            for name, value in body.items():
+                if _is_file(value):
+                    self._add_file(name, value)
+                else:
+                    self.data[name] = value
+        elif isinstance(body, (str, os.PathLike)) or hasattr(body, "read"):
+            self._add_file(CSV_FIELD, body)
+        else:
+            self._add_file(CSV_FIELD, body if isinstance(body, CSVRows) else CSVRows(body))
+
+    def _add_file(self, name: str, value: Any) -> None:
+        if isinstance(value, (str, os.PathLike)):
+            handle: Any = open(value, "rb")
+            self._opened.append(handle)
+        elif isinstance(value, io.TextIOBase):
+            handle = _EncodedText(value)
+            self.replayable = False
+        else:
+            handle = value
+            if isinstance(value, CSVRows) or not (hasattr(value, "seekable") and value.seekable()):
+                self.replayable = False
+        filename = Path(str(getattr(handle, "name", "upload.csv"))).name
+        self.files[name] = (filename, handle, "text/csv")
+
+    def close(self) -> None:
+        for handle in self._opened:
+            handle.close()
+        self._opened.clear()
+
@@ -0,0 +1,176 @@
+"""Tests for the ``*_many`` batch helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, List
+
+import httpx
+import pytest
+
+from vantage import AsyncClient, BatchResult, Client, VantageAPIError
+from vantage._batch import run_batch, run_batch_async
+from vantage._types import UpdateFolder
+
+
+class Peak:
+    """Counts how many calls run at once."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def __exit__(self, *exc: Any) -> None:
+        with self.lock:
+            self.running -= 1
+
+
+def folder(request: httpx.Request) -> httpx.Response:
+    """Serve folders whose token ends in a digit; others are missing."""
+    token = request.url.path.rsplit("/", 1)[1]
+    if not token[-1].isdigit():
+        return httpx.Response(404, json={"errors": ["not found"]})
+    if request.method == "DELETE":
+        return httpx.Response(204)
+    return httpx.Response(200, json={"token": token, "title": token})
+
+
+class TestRunBatch:
+    """run_batch with threads."""
+
+    def test_results_in_input_order(self) -> None:
+        def call(value: int) -> int:
+            time.sleep(0.001 * (5 - value))
+            return value * 10
+
+        result = run_batch(call, range(5), concurrency=5)
+        assert [item.input for item in result] == [0, 1, 2, 3, 4]
+        assert result.results == [0, 10, 20, 30, 40]
+
+    def test_errors_are_captured_per_item(self) -> None:
+        def call(value: int) -> int:
+            if value % 2:
+                raise ValueError(f"odd {value}")
+            return value
+
+        result = run_batch(call, range(5), concurrency=2)
+        assert [item.ok for item in result] == [True, False, True, False, True]
+        assert result.results == [0, None, 2, None, 4]
+        assert [str(item.error) for item in result.failed] == ["odd 1", "odd 3"]
+        assert [item.input for item in result.succeeded] == [0, 2, 4]
+        with pytest.raises(ValueError, match="odd 1"):
+            result.raise_for_errors()
+
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_runs_exactly_concurrency_at_a_time(self, concurrency: int) -> None:
+        peak = Peak()
+        # Every call waits for ``concurrency`` calls to be running together.
+        barrier = threading.Barrier(concurrency, timeout=5)
+
+        def call(value: int) -> int:
+            with peak:
+                barrier.wait()
+                time.sleep(0.01)
+            return value
+
+        assert run_batch(call, range(6), concurrency).results == list(range(6))
+        assert peak.peak == concurrency
+
+    def test_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            run_batch(lambda value: value, [1], concurrency=0)
+
+    def test_empty(self) -> None:
+        result = run_batch(lambda value: value, [], concurrency=2)
+        assert len(result) == 0
+        result.raise_for_errors()
+
+
+class TestRunBatchAsync:
+    """run_batch_async with tasks."""
+
+    async def test_results_in_input_order(self) -> None:
+        async def call(value: int) -> int:
+            await asyncio.sleep(0.001 * (5 - value))
+            return value * 10
+
+        result = await run_batch_async(call, range(5), concurrency=5)
+        assert result.results == [0, 10, 20, 30, 40]
+
+    async def test_errors_are_captured_per_item(self) -> None:
+        async def call(value: int) -> int:
+            if value == 1:
+                raise ValueError("one")
+            return value
+
+        result = await run_batch_async(call, range(3), concurrency=3)
+        assert result.results == [0, None, 2]
+        assert isinstance(result[1].error, ValueError)
+
+    @pytest.mark.parametrize("concurrency", [1, 2, 4])
+    async def test_bounds_concurrency(self, concurrency: int) -> None:
+        peak = Peak()
+
+        async def call(value: int) -> int:
+            with peak:
+                await asyncio.sleep(0.002)
+            return value
+
+        assert (await run_batch_async(call, range(8), concurrency)).results == list(range(8))
+        assert peak.peak == concurrency
+
+    async def test_invalid_concurrency(self) -> None:
+        async def call(value: int) -> int:
+            return value
+
+        with pytest.raises(ValueError):
+            await run_batch_async(call, [1], concurrency=0)
+
+
+class TestManyMethods:
+    """The generated ``*_many`` methods against a mock API."""
+
+    def test_get_many(self) -> None:
+        client = Client("token", transport=httpx.MockTransport(folder), retry=None, validate="raw")
+        result = client.folders.get_many(["fldr_1", "fldr_x", "fldr_3"], concurrency=2)
+        assert isinstance(result, BatchResult)
+        assert [item.input for item in result] == ["fldr_1", "fldr_x", "fldr_3"]
+        assert [item.result["token"] if item.ok else None for item in result] == ["fldr_1", None, "fldr_3"]
+        assert isinstance(result[1].error, VantageAPIError) and result[1].error.status == 404
+
+    def test_update_many_takes_a_mapping_or_pairs(self) -> None:
+        sent: List[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.content)
+            return httpx.Response(200, json={"token": request.url.path.rsplit("/", 1)[1], "title": "renamed"})
+
+        client = Client("token", transport=httpx.MockTransport(handler), retry=None, validate="raw")
+        updates = {"fldr_1": UpdateFolder(title="renamed"), "fldr_2": UpdateFolder(title="renamed")}
+        by_mapping = client.folders.update_many(updates)
+        by_pairs = client.folders.update_many(list(updates.items()))
+        assert [item.input for item in by_mapping] == [item.input for item in by_pairs] == list(updates.items())
+        assert [item.result["token"] for item in by_mapping] == ["fldr_1", "fldr_2"]
+        assert len(sent) == 4
+
+    def test_delete_many(self) -> None:
+        client = Client("token", transport=httpx.MockTransport(folder), retry=None)
+        result = client.folders.delete_many(["fldr_1", "fldr_x"])
+        assert [item.ok for item in result] == [True, False]
+        assert result.results == [None, None]
+
+    async def test_async_get_many(self) -> None:
+        async with AsyncClient("token", transport=httpx.MockTransport(folder), retry=None, validate="raw") as client:
+            result = await client.folders.get_many([f"fldr_{i}" for i in range(10)] + ["fldr_x"], concurrency=3)
+        assert [item.result["token"] for item in result.succeeded] == [f"fldr_{i}" for i in range(10)]
+        assert [item.input for item in result.failed] == ["fldr_x"]
+        with pytest.raises(VantageAPIError):
+            result.raise_for_errors()
@@ -0,0 +1,156 @@
+"""Tests for the in-memory response cache.
+
+Runs offline against httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import List, Optional
+
+import httpx
+import pytest
+
+import vantage._cache
+from vantage import Client, ResponseCache
+
+SCOPE = "scope"
+URL = "https://api.vantage.sh/v2/workspaces?page=1&limit=5"
+
+
+class Clock:
+    """A stand-in for ``time.monotonic`` that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(vantage._cache, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+class TestResponseCache:
+    """ResponseCache on its own."""
+
+    def test_fresh_until_ttl(self, clock: Clock) -> None:
+        cache = ResponseCache({"/v2/workspaces": 60})
+        cache.put(SCOPE, "/v2/workspaces", URL, b"{}", {})
+        entry = cache.get(SCOPE, "/v2/workspaces", URL)
+        assert entry is not None and entry.fresh
+        clock.now += 59.9
+        assert cache.get(SCOPE, "/v2/workspaces", URL) is entry and entry.fresh
+        clock.now += 0.1
+        assert not entry.fresh
+
+    def test_expired_without_validators_is_dropped(self, clock: Clock) -> None:
+        cache = ResponseCache({"/v2/workspaces": 60})
+        cache.put(SCOPE, "/v2/workspaces", URL, b"{}", {})
+        clock.now += 61
+        assert cache.get(SCOPE, "/v2/workspaces", URL) is None
+        assert len(cache) == 0
+
+    def test_expired_with_validators_is_kept_for_revalidation(self, clock: Clock) -> None:
+        cache = ResponseCache({"/v2/workspaces": 60})
+        cache.put(SCOPE, "/v2/workspaces", URL, b"{}", {"etag": '"v1"'})
+        clock.now += 61
+        entry = cache.get(SCOPE, "/v2/workspaces", URL)
+        assert entry is not None and not entry.fresh
+        assert entry.revalidation_headers() == {"If-None-Match": '"v1"'}
+        cache.refresh(entry, {"etag": '"v2"'})
+        assert entry.fresh and entry.etag == '"v2"'
+
+    def test_longest_prefix_wins(self) -> None:
+        cache = ResponseCache({"/v2/resource_reports": 10, "/v2/resource_reports/columns": 600})
+        assert cache.ttl_for("/v2/resource_reports/columns") == 600
+        assert cache.ttl_for("/v2/resource_reports/rprt_1") == 10
+        assert cache.ttl_for("/v2/resource_reportsx") is None
+
+    def test_query_order_and_scope(self) -> None:
+        cache = ResponseCache({"/v2/workspaces": 60})
+        cache.put(SCOPE, "/v2/workspaces", URL, b"{}", {})
+        assert cache.get(SCOPE, "/v2/workspaces", "https://api.vantage.sh/v2/workspaces?limit=5&page=1") is not None
+        assert cache.get("other", "/v2/workspaces", URL) is None
+
+    def test_no_store_and_uncached_paths(self) -> None:
+        cache = ResponseCache({"/v2/workspaces": 60})
+        cache.put(SCOPE, "/v2/workspaces", URL, b"{}", {"cache-control": "private, no-store"})
+        cache.put(SCOPE, "/v2/folders", "https://api.vantage.sh/v2/folders", b"{}", {})
+        assert len(cache) == 0
+
+    def test_invalidate_drops_the_resource(self) -> None:
+        cache = ResponseCache({"/v2/workspaces": 60, "/v2/me": 60})
+        cache.put(SCOPE, "/v2/workspaces", URL, b"{}", {})
+        cache.put(SCOPE, "/v2/workspaces/wrkspc_1", "https://api.vantage.sh/v2/workspaces/wrkspc_1", b"{}", {})
+        cache.put(SCOPE, "/v2/me", "https://api.vantage.sh/v2/me", b"{}", {})
+        cache.invalidate("/v2/workspaces/wrkspc_1")
+        assert len(cache) == 1
+        assert cache.get(SCOPE, "/v2/me", "https://api.vantage.sh/v2/me") is not None
+
+    def test_lru_eviction(self) -> None:
+        cache = ResponseCache({"/v2/workspaces": 60}, max_entries=2)
+        urls = [f"https://api.vantage.sh/v2/workspaces?page={page}" for page in range(3)]
+        cache.put(SCOPE, "/v2/workspaces", urls[0], b"0", {})
+        cache.put(SCOPE, "/v2/workspaces", urls[1], b"1", {})
+        cache.get(SCOPE, "/v2/workspaces", urls[0])
+        cache.put(SCOPE, "/v2/workspaces", urls[2], b"2", {})
+        assert cache.get(SCOPE, "/v2/workspaces", urls[1]) is None
+        assert cache.get(SCOPE, "/v2/workspaces", urls[0]) is not None
+
+
+class Workspaces:
+    """Serves /v2/workspaces with an ETag and honours If-None-Match."""
+
+    def __init__(self) -> None:
+        self.version = 1
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"v{self.version}"'
+        if request.method != "GET":
+            self.version += 1
+            return httpx.Response(200, json={"token": "wrkspc_1", "name": "renamed"})
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        body = {"workspaces": [{"token": "wrkspc_1", "version": self.version}], "links": {}}
+        return httpx.Response(200, json=body, headers={"etag": etag})
+
+    def last_condition(self) -> Optional[str]:
+        return self.requests[-1].headers.get("if-none-match")
+
+
+class TestClientCache:
+    """Caching through the client."""
+
+    def test_fresh_entry_makes_no_request(self) -> None:
+        server = Workspaces()
+        client = Client("token", transport=httpx.MockTransport(server), cache=ResponseCache(), validate="raw")
+        first = client.workspaces.list()
+        assert client.workspaces.list() == first
+        assert len(server.requests) == 1
+
+    def test_expired_entry_is_revalidated_with_304(self) -> None:
+        server = Workspaces()
+        cache = ResponseCache({"/v2/workspaces": 0})
+        client = Client("token", transport=httpx.MockTransport(server), cache=cache, validate="raw")
+        first = client.workspaces.list()
+        assert server.last_condition() is None
+        second = client.workspaces.list()
+        assert server.last_condition() == '"v1"'
+        assert second == first
+        assert len(server.requests) == 2
+
+    def test_write_invalidates(self) -> None:
+        server = Workspaces()
+        client = Client("token", transport=httpx.MockTransport(server), cache=ResponseCache(), validate="raw")
+        assert client.workspaces.list()["workspaces"][0]["version"] == 1
+        client.workspaces.update("wrkspc_1", {"name": "renamed"})
+        assert client.workspaces.list()["workspaces"][0]["version"] == 2
+        assert [request.method for request in server.requests] == ["GET", "PUT", "GET"]
+        assert server.last_condition() is None
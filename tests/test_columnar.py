@@ -0,0 +1,122 @@
+"""Tests for decoding cost rows into column arrays."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from vantage import AsyncClient, Client, ColumnarResult
+
+ROWS: List[Dict[str, Any]] = [
+    {"accrued_at": "2024-01-01", "amount": "1.50", "provider": "aws", "service": "EC2", "links": {"self": "x"}},
+    {"accrued_at": "2024-01-01", "amount": "2", "provider": "gcp"},
+    {"accrued_at": "2024-01-02", "amount": None, "provider": "aws", "service": None, "tags": [{"key": "env"}]},
+    {"accrued_at": "2024-01-02", "provider": None, "service": "S3", "metadata": {"region": "eu-west-1"}},
+]
+
+
+def decode(rows: List[Dict[str, Any]]) -> ColumnarResult:
+    result = ColumnarResult(numeric=("amount",), categorical=("provider", "service"))
+    for row in rows:
+        result.append(row)
+    return result
+
+
+class TestColumnarResult:
+    """Appending rows and reading columns back."""
+
+    def test_columns_in_first_seen_order(self) -> None:
+        result = decode(ROWS)
+        assert len(result) == 4
+        assert result.column_names == ["accrued_at", "amount", "provider", "service", "tags", "metadata"]
+
+    def test_missing_keys_are_back_filled(self) -> None:
+        result = decode(ROWS)
+        assert result["amount"] == [1.5, 2.0, None, None]
+        assert result["service"] == ["EC2", None, None, "S3"]
+        assert result["tags"] == [None, None, [{"key": "env"}], None]
+        assert result["metadata"] == [None, None, None, {"region": "eu-west-1"}]
+
+    def test_categorical_columns_are_dictionary_encoded(self) -> None:
+        result = decode(ROWS)
+        assert result.categories("provider") == ["aws", "gcp"]
+        assert list(result.codes("provider")) == [0, 1, 0, -1]
+        assert result["provider"] == ["aws", "gcp", "aws", None]
+        assert list(result.codes("service")) == [0, -1, -1, 1]
+
+    def test_every_column_has_one_value_per_row(self) -> None:
+        result = decode(ROWS)
+        for name in result.column_names:
+            assert len(result[name]) == len(result)
+
+    def test_empty(self) -> None:
+        result = decode([])
+        assert len(result) == 0
+        assert result.column_names == []
+        assert result.to_numpy() == {}
+
+
+class TestConversions:
+    """Handing columns to NumPy, Arrow and pandas."""
+
+    def test_to_numpy(self) -> None:
+        np = pytest.importorskip("numpy")
+        arrays = decode(ROWS).to_numpy()
+        assert arrays["amount"].dtype == np.float64
+        assert arrays["amount"][:2].tolist() == [1.5, 2.0] and np.isnan(arrays["amount"][2:]).all()
+        assert arrays["provider"].tolist() == ["aws", "gcp", "aws", None]
+        # Nested values stay whole objects rather than becoming extra dimensions.
+        assert arrays["tags"].shape == (4,)
+        assert arrays["tags"][2] == [{"key": "env"}]
+
+    def test_to_pandas_categorical(self) -> None:
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        frame = decode(ROWS).to_pandas()
+        assert list(frame.columns) == ["accrued_at", "amount", "provider", "service", "tags", "metadata"]
+        assert isinstance(frame["provider"].dtype, pd.CategoricalDtype)
+        assert list(frame["provider"].cat.categories) == ["aws", "gcp"]
+        assert frame["provider"].tolist()[:3] == ["aws", "gcp", "aws"] and pd.isna(frame["provider"][3])
+        assert frame["service"].cat.codes.tolist() == [0, -1, -1, 1]
+        assert frame["amount"].dtype == "float64"
+        assert frame["amount"][:2].tolist() == [1.5, 2.0] and frame["amount"][2:].isna().all()
+        assert frame["metadata"][3] == {"region": "eu-west-1"}
+
+    def test_to_pandas_empty(self) -> None:
+        pytest.importorskip("pandas")
+        pytest.importorskip("pyarrow")
+        frame = decode([]).to_pandas()
+        assert frame.empty and list(frame.columns) == []
+
+    def test_to_arrow_all_missing_category(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        table = decode([{"provider": None}, {"provider": None}]).to_arrow()
+        assert pa.types.is_dictionary(table.schema.field("provider").type)
+        assert table.column("provider").null_count == 2
+
+
+def cost_pages(request: httpx.Request) -> httpx.Response:
+    """Three pages of costs, the middle one empty."""
+    page = int(request.url.params.get("page", "1"))
+    costs = {1: ROWS[:2], 2: [], 3: ROWS[2:]}[page]
+    links = {"next": f"https://api.vantage.sh/v2/costs?page={page + 1}"} if page < 3 else {}
+    return httpx.Response(200, json={"costs": costs, "links": links})
+
+
+class TestListColumnar:
+    """costs.list_columnar across pages."""
+
+    def test_sync(self) -> None:
+        client = Client("token", transport=httpx.MockTransport(cost_pages), retry=None)
+        result = client.costs.list_columnar(cost_report_token="rprt_1")
+        assert len(result) == 4
+        assert result["provider"] == ["aws", "gcp", "aws", None]
+        assert result.column_names == decode(ROWS).column_names
+
+    async def test_async(self) -> None:
+        async with AsyncClient("token", transport=httpx.MockTransport(cost_pages), retry=None) as client:
+            result = await client.costs.list_columnar(cost_report_token="rprt_1")
+        assert len(result) == 4
+        assert result["amount"] == [1.5, 2.0, None, None]
@@ -0,0 +1,120 @@
+"""Tests for building models without validation in ``validate="construct"`` mode.
+
+``construct_model`` is checked against Pydantic's own ``model_construct`` for
+the fields it sets, and against ``model_validate`` for the values it builds,
+since it also turns nested objects into models.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from vantage._base import construct_model
+from vantage._types import CreateCostExport, Folder, Workspaces
+
+
+class Tag(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    key: str
+    values: List[str] = Field(default_factory=list)
+
+
+class Resource(BaseModel):
+    model_config = ConfigDict(defer_build=True, populate_by_name=True)
+
+    token: str
+    type_: str = Field(alias="type")
+    region: Optional[str] = Field(default="us-east-1")
+    labels: Dict[str, str] = {}
+    tags: List[Tag] = Field(default_factory=list)
+    parent: Optional[Resource] = None
+
+
+WORKSPACE = {
+    "token": "wrkspc_1",
+    "name": "Main",
+    "created_at": "2024-01-01T00:00:00Z",
+    "enable_currency_conversion": False,
+    "currency": "USD",
+    "exchange_rate_date": "daily_rate",
+}
+
+CASES = [
+    pytest.param(Resource, {"token": "r1", "type": "vm"}, id="defaults"),
+    pytest.param(Resource, {"token": "r1", "type": "vm", "region": None, "labels": {"a": "b"}}, id="overrides"),
+    pytest.param(Resource, {"token": "r1", "type": "vm", "colour": "blue"}, id="extra-keys"),
+    pytest.param(Resource, {"token": "r1", "type_": "vm"}, id="field-name"),
+    pytest.param(
+        Resource, {"token": "r1", "type": "vm", "tags": [{"key": "env"}, {"key": "team", "values": ["x"]}]}, id="list"
+    ),
+    pytest.param(Resource, {"token": "r1", "type": "vm", "parent": {"token": "r0", "type": "vpc"}}, id="nested"),
+    pytest.param(CreateCostExport, {"cost_report_token": "rprt_1", "schema": "focus"}, id="generated-alias"),
+    pytest.param(CreateCostExport, {"cost_report_token": "rprt_1"}, id="generated-default"),
+    pytest.param(
+        Folder,
+        {
+            "token": "fldr_1",
+            "title": "Team",
+            "parent_folder_token": None,
+            "saved_filter_tokens": [],
+            "cost_report_tokens": ["rprt_1"],
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "workspace_token": "wrkspc_1",
+        },
+        id="generated-flat",
+    ),
+    pytest.param(
+        Workspaces,
+        {"links": {"next": None}, "workspaces": [WORKSPACE]},
+        id="generated-nested",
+    ),
+]
+
+
+class TestConstructModel:
+    """construct_model compared with Pydantic."""
+
+    @pytest.mark.parametrize("model, data", CASES)
+    def test_matches_validation(self, model: Any, data: Dict[str, Any]) -> None:
+        assert construct_model(model, data) == model.model_validate(data)
+
+    @pytest.mark.parametrize("model, data", CASES)
+    def test_matches_model_construct(self, model: Any, data: Dict[str, Any]) -> None:
+        built = construct_model(model, data)
+        expected = model.model_construct(**data)
+        assert built.model_fields_set == expected.model_fields_set
+        assert built.__pydantic_extra__ == expected.__pydantic_extra__
+        assert set(vars(built)) == set(vars(expected))
+        for name, value in vars(expected).items():
+            # model_construct leaves nested objects as dicts, which test_matches_validation covers.
+            if not isinstance(getattr(built, name), (BaseModel, list)) or not getattr(built, name):
+                assert getattr(built, name) == value
+
+    def test_nested_models_are_instances(self) -> None:
+        built = construct_model(
+            Resource, {"token": "r1", "type": "vm", "tags": [{"key": "env"}], "parent": {"token": "r0", "type": "vpc"}}
+        )
+        assert isinstance(built.tags[0], Tag) and built.tags[0].values == []
+        assert isinstance(built.parent, Resource) and built.parent.type_ == "vpc"
+        assert built.parent.model_fields_set == {"token", "type_"}
+
+    def test_alias_wins_over_field_name(self) -> None:
+        built = construct_model(Resource, {"token": "r1", "type_": "name", "type": "alias"})
+        assert built.type_ == Resource.model_construct(token="r1", type_="name", type="alias").type_ == "alias"
+
+    def test_mutable_defaults_are_not_shared(self) -> None:
+        first = construct_model(Resource, {"token": "r1", "type": "vm"})
+        second = construct_model(Resource, {"token": "r2", "type": "vm"})
+        assert first.tags is not second.tags
+        assert first.labels is not second.labels
+        first.tags.append(Tag(key="env"))
+        assert second.tags == []
+
+    def test_non_dicts_pass_through(self) -> None:
+        assert construct_model(Resource, None) is None
+        assert construct_model(Resource, [1]) == [1]
@@ -7,11 +7,12 @@ Tests the full CRUD lifecycle on folders using both sync and async clients.
 from __future__ import annotations
 
 import os
+from itertools import islice
 
 import pytest
 
 from vantage import Client, AsyncClient, VantageAPIError
-from vantage._types import CreateFolder, UpdateFolder
+from vantage._types import CreateFolder, Folder, UpdateFolder
 
 API_TOKEN = os.environ.get("VANTAGE_API_TOKEN", "")
 WORKSPACE_TOKEN = os.environ.get("VANTAGE_WORKSPACE_TOKEN", "")
@@ -63,6 +64,15 @@ class TestSyncErrors:
         assert exc_info.value.status == 401
 
 
+class TestSyncPagination:
+    """Auto-pagination with the synchronous client."""
+
+    def test_list_all_follows_links(self) -> None:
+        client = Client(API_TOKEN)
+        folders = list(islice(client.folders.list_all(limit=1), 3))
+        assert all(isinstance(folder, Folder) for folder in folders)
+
+
 # ── Async client ─────────────────────────────────────────────────────────────
 
 
@@ -101,3 +111,16 @@ class TestAsyncErrors:
             with pytest.raises(VantageAPIError) as exc_info:
                 await client.folders.list()
             assert exc_info.value.status == 401
+
+
+class TestAsyncPagination:
+    """Auto-pagination with the asynchronous client."""
+
+    async def test_list_all_follows_links(self) -> None:
+        async with AsyncClient(API_TOKEN) as client:
+            folders = []
+            async for folder in client.folders.list_all(limit=1):
+                folders.append(folder)
+                if len(folders) == 3:
+                    break
+            assert all(isinstance(folder, Folder) for folder in folders)
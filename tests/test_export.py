@@ -0,0 +1,182 @@
+"""Tests for downloading data export files.
+
+Runs offline against a completed export and an object store served through
+httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+import vantage._export
+from vantage import AsyncClient, Client, DataExportError, PollPolicy, RetryPolicy
+from vantage._types import CreateCostExport
+
+DATA = b"accrued_at,amount\n" + b"".join(b"2024-01-%02d,%d.5\n" % (day, day) for day in range(1, 29))
+FILE_URL = "https://storage.example/bucket/costs.csv?signature=abc"
+
+
+@pytest.fixture(autouse=True)
+def fast(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(vantage._export, "EXPORT_POLL", PollPolicy(initial=0.001, factor=1.0, jitter=0))
+    monkeypatch.setattr(vantage._export, "DOWNLOAD_RETRY", RetryPolicy(max_retries=3, backoff_factor=0.001, budget=None))
+
+
+class Storage:
+    """
+    Serves a completed export whose manifest holds one file.
+
+    ``honour_range=False`` answers ranged requests with the whole object,
+    and ``size`` / ``md5`` override the length and checksum the store reports.
+    """
+
+    def __init__(
+        self,
+        data: bytes = DATA,
+        honour_range: bool = True,
+        size: Optional[int] = None,
+        md5: Optional[str] = None,
+    ) -> None:
+        self.data = data
+        self.honour_range = honour_range
+        self.size = size
+        self.md5 = md5
+        self.ranges: List[Optional[str]] = []
+        self.authorization: List[Optional[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v2/costs/data_exports":
+            return httpx.Response(202, headers={"Location": "https://api.vantage.sh/v2/data_exports/dta_1"})
+        if request.url.path == "/v2/data_exports/dta_1":
+            return httpx.Response(200, json=self.export())
+        self.ranges.append(request.headers.get("range"))
+        self.authorization.append(request.headers.get("authorization"))
+        data = self.data
+        md5 = base64.b64encode(bytes.fromhex(self.md5 or hashlib.md5(data).hexdigest())).decode()
+        size = len(data) if self.size is None else self.size
+        start = int(self.ranges[-1][6:-1]) if self.ranges[-1] and self.honour_range else 0
+        if start >= len(data):
+            return httpx.Response(416, headers={"content-range": f"bytes */{len(data)}"})
+        if start:
+            headers = {"content-range": f"bytes {start}-{len(data) - 1}/{size}", "x-goog-hash": f"md5={md5}"}
+            return httpx.Response(206, stream=httpx.ByteStream(data[start:]), headers=headers)
+        headers = {"content-length": str(size), "content-md5": md5}
+        return httpx.Response(200, stream=httpx.ByteStream(data), headers=headers)
+
+    def export(self) -> Dict[str, Any]:
+        return {
+            "token": "dta_1",
+            "status": "completed",
+            "export_type": "cost",
+            "attributes": {},
+            "created_at": "2024-01-01T00:00:00Z",
+            "manifest": {"files": [FILE_URL], "completed_at": "2024-01-01T00:01:00Z", "valid_until": None},
+        }
+
+
+def download(storage: Storage, dest: Path, **kwargs: Any) -> Any:
+    client = Client("token", transport=httpx.MockTransport(storage), retry=None, validate="raw")
+    return client.costs.export_and_download(CreateCostExport(cost_report_token="rprt_1"), dest, **kwargs)
+
+
+class TestDownloadExport:
+    """export_and_download with the sync client."""
+
+    def test_downloads_without_the_api_token(self, tmp_path: Path) -> None:
+        storage = Storage()
+        result = download(storage, tmp_path)
+        assert result.paths == [tmp_path / "costs.csv"]
+        assert result.paths[0].read_bytes() == DATA
+        assert storage.ranges == [None]
+        assert storage.authorization == [None]
+        assert len(list(result.rows())) == 28
+
+    def test_resumes_a_partial_file(self, tmp_path: Path) -> None:
+        storage = Storage()
+        (tmp_path / "costs.csv.part").write_bytes(DATA[:100])
+        result = download(storage, tmp_path)
+        assert storage.ranges == ["bytes=100-"]
+        assert result.paths[0].read_bytes() == DATA
+        assert not (tmp_path / "costs.csv.part").exists()
+
+    def test_ignored_range_starts_over(self, tmp_path: Path) -> None:
+        storage = Storage(honour_range=False)
+        (tmp_path / "costs.csv.part").write_bytes(DATA[:100])
+        result = download(storage, tmp_path)
+        assert storage.ranges == ["bytes=100-"]
+        # A 200 carries the whole object, so it replaces the partial file instead of extending it.
+        assert result.paths[0].read_bytes() == DATA
+
+    def test_unsatisfiable_range_restarts(self, tmp_path: Path) -> None:
+        storage = Storage()
+        (tmp_path / "costs.csv.part").write_bytes(b"x" * (len(DATA) + 10))
+        result = download(storage, tmp_path)
+        assert storage.ranges == [f"bytes={len(DATA) + 10}-", None]
+        assert result.paths[0].read_bytes() == DATA
+
+    def test_without_resume_ignores_partial_files(self, tmp_path: Path) -> None:
+        storage = Storage()
+        (tmp_path / "costs.csv.part").write_bytes(b"stale")
+        download(storage, tmp_path, resume=False)
+        assert storage.ranges == [None]
+        assert (tmp_path / "costs.csv").read_bytes() == DATA
+
+    def test_keeps_finished_files(self, tmp_path: Path) -> None:
+        storage = Storage()
+        (tmp_path / "costs.csv").write_bytes(b"done")
+        download(storage, tmp_path)
+        assert storage.ranges == []
+
+    def test_size_mismatch_deletes_the_partial_file(self, tmp_path: Path) -> None:
+        with pytest.raises(DataExportError, match="expected"):
+            download(Storage(size=len(DATA) + 1), tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_md5_mismatch_deletes_the_partial_file(self, tmp_path: Path) -> None:
+        with pytest.raises(DataExportError, match="MD5"):
+            download(Storage(md5="0" * 32), tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_resumed_md5_covers_the_whole_file(self, tmp_path: Path) -> None:
+        (tmp_path / "costs.csv.part").write_bytes(b"y" * 100)
+        with pytest.raises(DataExportError, match="MD5"):
+            download(Storage(), tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDownloadExportAsync:
+    """export_and_download with the async client."""
+
+    async def download(self, storage: Storage, dest: Path) -> Any:
+        async with AsyncClient("token", transport=httpx.MockTransport(storage), retry=None, validate="raw") as client:
+            return await client.costs.export_and_download(CreateCostExport(cost_report_token="rprt_1"), dest)
+
+    async def test_resumes_a_partial_file(self, tmp_path: Path) -> None:
+        storage = Storage()
+        (tmp_path / "costs.csv.part").write_bytes(DATA[:100])
+        result = await self.download(storage, tmp_path)
+        assert storage.ranges == ["bytes=100-"]
+        assert result.paths[0].read_bytes() == DATA
+
+    async def test_ignored_range_starts_over(self, tmp_path: Path) -> None:
+        (tmp_path / "costs.csv.part").write_bytes(DATA[:100])
+        result = await self.download(Storage(honour_range=False), tmp_path)
+        assert result.paths[0].read_bytes() == DATA
+
+    async def test_unsatisfiable_range_restarts(self, tmp_path: Path) -> None:
+        storage = Storage()
+        (tmp_path / "costs.csv.part").write_bytes(b"x" * (len(DATA) + 10))
+        result = await self.download(storage, tmp_path)
+        assert storage.ranges == [f"bytes={len(DATA) + 10}-", None]
+        assert result.paths[0].read_bytes() == DATA
+
+    async def test_mismatch_deletes_the_partial_file(self, tmp_path: Path) -> None:
+        with pytest.raises(DataExportError, match="MD5"):
+            await self.download(Storage(md5="0" * 32), tmp_path)
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,200 @@
+"""Tests for the request instrumentation hooks.
+
+Runs offline against httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from vantage import AsyncClient, Client, Hooks, RequestEvent, RetryPolicy, VantageAPIError
+from vantage._types import CreateFolder
+
+FOLDER = {
+    "token": "fldr_1",
+    "title": "Team",
+    "parent_folder_token": None,
+    "saved_filter_tokens": [],
+    "cost_report_tokens": [],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "workspace_token": "wrkspc_1",
+}
+RETRY = RetryPolicy(backoff_factor=0.001, jitter=False)
+FIELDS = (
+    "method", "route", "url", "attempt", "status", "request_bytes", "response_bytes", "items", "error", "retry_delay"
+)
+
+
+class Recorder:
+    """Hooks that snapshot the event each time they run."""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+        self.events: List[RequestEvent] = []
+
+    def hook(self, name: str) -> Any:
+        def record(event: RequestEvent) -> None:
+            self.calls.append({"hook": name, **{field: getattr(event, field) for field in FIELDS}})
+            self.events.append(event)
+
+        return record
+
+    def hooks(self) -> Hooks:
+        return Hooks(
+            before_request=self.hook("before_request"),
+            after_response=self.hook("after_response"),
+            on_error=self.hook("on_error"),
+            on_retry=self.hook("on_retry"),
+        )
+
+    @property
+    def sequence(self) -> List[str]:
+        return [call["hook"] for call in self.calls]
+
+
+def replies(*responses: Any) -> Any:
+    """A handler answering with ``responses`` in turn, raising those that are exceptions."""
+    queue = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = queue.pop(0) if queue else httpx.Response(200, json=FOLDER)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return handler
+
+
+def client_for(handler: Any, hooks: Hooks, **kwargs: Any) -> Client:
+    kwargs.setdefault("retry", RETRY)
+    return Client("token", transport=httpx.MockTransport(handler), hooks=hooks, **kwargs)
+
+
+class TestHooks:
+    """The events the sync client reports."""
+
+    def test_success(self) -> None:
+        recorder = Recorder()
+        client_for(replies(), recorder.hooks()).folders.get("fldr_1")
+        assert recorder.sequence == ["before_request", "after_response"]
+        before, after = recorder.calls
+        assert before["method"] == "GET" and before["route"] == "/v2/folders/{folder_token}"
+        assert before["url"] == "https://api.vantage.sh/v2/folders/fldr_1"
+        assert before["attempt"] == 0 and before["status"] is None
+        assert after["status"] == 200
+        assert after["response_bytes"] == len(httpx.Response(200, json=FOLDER).content)
+        assert after["error"] is None
+        event = recorder.events[-1]
+        assert event.total is not None and event.total >= 0
+        assert event.validate is not None
+
+    def test_request_body_size_and_page_items(self) -> None:
+        recorder = Recorder()
+        pages = replies(httpx.Response(201, json=FOLDER), httpx.Response(200, json={"folders": [FOLDER] * 3}))
+        client = client_for(pages, recorder.hooks(), validate="raw")
+        client.folders.create(CreateFolder(title="Team"))
+        client.folders.list()
+        assert recorder.calls[0]["request_bytes"] == len(b'{"title":"Team"}')
+        assert recorder.calls[-1]["items"] == 3
+        assert recorder.events[-1].validate is None
+
+    def test_http_error(self) -> None:
+        recorder = Recorder()
+        client = client_for(replies(httpx.Response(404, json={"errors": ["missing"]})), recorder.hooks())
+        with pytest.raises(VantageAPIError) as raised:
+            client.folders.get("fldr_1")
+        assert recorder.sequence == ["before_request", "on_error"]
+        assert recorder.calls[-1]["status"] == 404
+        assert recorder.calls[-1]["error"] is raised.value
+
+    def test_retry_on_status(self) -> None:
+        recorder = Recorder()
+        client = client_for(replies(httpx.Response(503)), recorder.hooks())
+        client.folders.get("fldr_1")
+        assert recorder.sequence == ["before_request", "on_retry", "before_request", "after_response"]
+        retry = recorder.calls[1]
+        assert retry["status"] == 503 and retry["attempt"] == 0
+        assert retry["retry_delay"] == pytest.approx(0.001) and retry["error"] is None
+        assert [call["attempt"] for call in recorder.calls[2:]] == [1, 1]
+        assert recorder.calls[-1]["status"] == 200 and recorder.calls[-1]["retry_delay"] is None
+
+    def test_retry_on_transport_error(self) -> None:
+        recorder = Recorder()
+        client = client_for(replies(httpx.ConnectError("refused")), recorder.hooks())
+        client.folders.get("fldr_1")
+        assert recorder.sequence == ["before_request", "on_retry", "before_request", "after_response"]
+        assert isinstance(recorder.calls[1]["error"], httpx.ConnectError)
+        assert recorder.calls[-1]["error"] is None
+
+    def test_transport_error(self) -> None:
+        recorder = Recorder()
+        client = client_for(replies(httpx.ConnectError("refused")), recorder.hooks(), retry=None)
+        with pytest.raises(httpx.ConnectError):
+            client.folders.get("fldr_1")
+        assert recorder.sequence == ["before_request", "on_error"]
+        assert isinstance(recorder.calls[-1]["error"], httpx.ConnectError)
+
+    def test_one_event_per_call(self) -> None:
+        recorder = Recorder()
+        client_for(replies(httpx.Response(503)), recorder.hooks()).folders.get("fldr_1")
+        assert all(event is recorder.events[0] for event in recorder.events)
+
+
+class TestFailingHooks:
+    """A hook that raises."""
+
+    @staticmethod
+    def broken(event: RequestEvent) -> None:
+        raise RuntimeError("metrics backend down")
+
+    @pytest.mark.parametrize("stage", ["before_request", "after_response", "on_retry"])
+    def test_does_not_break_the_request(self, stage: str, caplog: pytest.LogCaptureFixture) -> None:
+        recorder = Recorder()
+        hooks = recorder.hooks()
+        getattr(hooks, stage).insert(0, self.broken)
+        with caplog.at_level(logging.ERROR, logger="vantage"):
+            folder = client_for(replies(httpx.Response(503)), hooks).folders.get("fldr_1", validate="raw")
+        assert folder == FOLDER
+        # The other hooks of the same stage still ran.
+        assert recorder.sequence == ["before_request", "on_retry", "before_request", "after_response"]
+        assert "metrics backend down" in caplog.text
+
+    def test_does_not_replace_the_api_error(self) -> None:
+        hooks = Hooks(on_error=self.broken)
+        client = client_for(replies(httpx.Response(404, json={"errors": ["missing"]})), hooks)
+        with pytest.raises(VantageAPIError):
+            client.folders.get("fldr_1")
+
+
+class TestAsyncHooks:
+    """The events the async client reports."""
+
+    async def test_retry_then_success(self) -> None:
+        recorder = Recorder()
+        transport = httpx.MockTransport(replies(httpx.Response(503)))
+        async with AsyncClient("token", transport=transport, retry=RETRY, hooks=recorder.hooks()) as client:
+            await client.folders.get("fldr_1")
+        assert recorder.sequence == ["before_request", "on_retry", "before_request", "after_response"]
+        assert recorder.calls[-1]["route"] == "/v2/folders/{folder_token}"
+        assert recorder.calls[-1]["status"] == 200
+
+    async def test_http_error(self) -> None:
+        recorder = Recorder()
+        transport = httpx.MockTransport(replies(httpx.Response(404, json={"errors": ["missing"]})))
+        async with AsyncClient("token", transport=transport, retry=RETRY, hooks=recorder.hooks()) as client:
+            with pytest.raises(VantageAPIError):
+                await client.folders.get("fldr_1")
+        assert recorder.sequence == ["before_request", "on_error"]
+
+    async def test_failing_hook(self) -> None:
+        def broken(event: RequestEvent) -> None:
+            raise RuntimeError("boom")
+
+        transport = httpx.MockTransport(replies())
+        async with AsyncClient("token", transport=transport, hooks=Hooks(after_response=broken)) as client:
+            assert (await client.folders.get("fldr_1", validate="raw")) == FOLDER
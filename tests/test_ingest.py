@@ -0,0 +1,197 @@
+"""Tests for chunked custom cost ingestion.
+
+Runs offline against an in-memory integration served through httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import httpx
+import pytest
+
+import vantage._ingest
+from vantage import AsyncClient, Client, IngestionError, PollPolicy, RetryPolicy
+
+
+@pytest.fixture(autouse=True)
+def fast(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(vantage._ingest, "DEFAULT_POLL", PollPolicy(initial=0.001, factor=1.0, jitter=0))
+    monkeypatch.setattr(
+        vantage._ingest, "CHUNK_RETRY", RetryPolicy(backoff_factor=0.001, jitter=False, methods=frozenset({"POST"}))
+    )
+
+
+class Integration:
+    """
+    Serves the user costs uploads of one integration.
+
+    Chunks whose file name contains a key of ``failures`` answer with that
+    many errors, 503 unless ``status`` says otherwise, before succeeding.
+    """
+
+    def __init__(
+        self,
+        failures: Optional[Dict[str, int]] = None,
+        status: Optional[int] = None,
+        final: str = "complete",
+    ) -> None:
+        self.failures = dict(failures or {})
+        self.status = status
+        self.final = final
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.attempts: Dict[str, int] = {}
+        self.deleted: List[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            body = request.read()
+            filename = body.split(b'filename="')[1].split(b'"')[0].decode()
+            with self.lock:
+                self.attempts[filename] = self.attempts.get(filename, 0) + 1
+                for key, count in self.failures.items():
+                    if key in filename and self.attempts[filename] <= count:
+                        return httpx.Response(self.status or 503, json={"errors": ["unavailable"]})
+                token = f"up_{filename}"
+                self.uploads[token] = {
+                    "token": token,
+                    "filename": filename,
+                    "import_status": "processing",
+                    "created_at": "2024-01-01T00:00:00Z",
+                }
+            return httpx.Response(201, json=self.uploads[token])
+        if request.method == "DELETE":
+            self.deleted.append(request.url.path.rsplit("/", 1)[1])
+            return httpx.Response(204)
+        for upload in self.uploads.values():
+            upload["import_status"] = self.final
+        return httpx.Response(200, json={"user_costs_uploads": list(self.uploads.values()), "links": {}})
+
+
+def rows(count: int) -> List[List[str]]:
+    return [["date", "cost"]] + [["2024-01-01", str(i)] for i in range(count)]
+
+
+def broken_rows(good: int) -> Iterator[Sequence[str]]:
+    yield ["date", "cost"]
+    for i in range(good):
+        yield ["2024-01-01", str(i)]
+    raise ValueError("malformed row")
+
+
+def client_for(server: Integration) -> Client:
+    return Client("token", transport=httpx.MockTransport(server), retry=None, validate="raw")
+
+
+class TestIngestCosts:
+    """ingest_costs with the sync client."""
+
+    def test_uploads_every_chunk_in_order(self) -> None:
+        server = Integration()
+        result = client_for(server).integrations.ingest_costs("accss_1", rows(5), chunk_rows=2, concurrency=2)
+        assert result.rows == 5
+        assert [upload["filename"] for upload in result.uploads] == ["costs-0001.csv", "costs-0002.csv", "costs-0003.csv"]
+        assert all(upload["import_status"] == "complete" for upload in result.uploads)
+
+    def test_retries_a_chunk_on_5xx(self) -> None:
+        server = Integration(failures={"0002": 2})
+        result = client_for(server).integrations.ingest_costs("accss_1", rows(3), chunk_rows=1)
+        assert len(result.uploads) == 3
+        assert server.attempts["costs-0002.csv"] == 3
+        assert server.deleted == []
+
+    def test_failed_chunk_rolls_back_earlier_uploads(self) -> None:
+        server = Integration(failures={"0003": 10**6}, status=422)
+        with pytest.raises(IngestionError) as raised:
+            client_for(server).integrations.ingest_costs("accss_1", rows(6), chunk_rows=1, concurrency=1)
+        assert server.attempts["costs-0003.csv"] == 1
+        assert raised.value.rolled_back == ["up_costs-0001.csv", "up_costs-0002.csv"]
+        assert sorted(server.deleted) == ["up_costs-0001.csv", "up_costs-0002.csv"]
+        assert "costs-0004.csv" not in server.attempts
+
+    def test_exhausted_retries_roll_back(self) -> None:
+        server = Integration(failures={"0002": 10**6})
+        with pytest.raises(IngestionError):
+            client_for(server).integrations.ingest_costs("accss_1", rows(2), chunk_rows=1, concurrency=1)
+        assert server.attempts["costs-0002.csv"] == 4
+        assert server.deleted == ["up_costs-0001.csv"]
+
+    def test_import_failure_rolls_back(self) -> None:
+        server = Integration(final="failed")
+        with pytest.raises(IngestionError) as raised:
+            client_for(server).integrations.ingest_costs("accss_1", rows(2), chunk_rows=1)
+        assert sorted(raised.value.rolled_back) == sorted(server.uploads)
+
+    def test_wait_timeout_rolls_back(self) -> None:
+        server = Integration(final="processing")
+        with pytest.raises(IngestionError, match="still importing") as raised:
+            client_for(server).integrations.ingest_costs("accss_1", rows(2), chunk_rows=1, timeout=0.02)
+        assert sorted(raised.value.rolled_back) == sorted(server.uploads)
+        assert raised.value.uploads == []
+
+    def test_reader_error_rolls_back(self) -> None:
+        server = Integration()
+        with pytest.raises(IngestionError, match="malformed row") as raised:
+            client_for(server).integrations.ingest_costs("accss_1", broken_rows(5), chunk_rows=2)
+        assert isinstance(raised.value.__cause__, ValueError)
+        assert sorted(raised.value.rolled_back) == ["up_costs-0001.csv", "up_costs-0002.csv"]
+        assert sorted(server.deleted) == sorted(server.uploads)
+
+    def test_without_rollback_reports_uploads(self) -> None:
+        server = Integration()
+        with pytest.raises(IngestionError) as raised:
+            client_for(server).integrations.ingest_costs("accss_1", broken_rows(2), chunk_rows=1, rollback=False)
+        assert [upload["token"] for upload in raised.value.uploads] == ["up_costs-0001.csv", "up_costs-0002.csv"]
+        assert server.deleted == []
+
+
+class TestIngestCostsAsync:
+    """ingest_costs with the async client."""
+
+    async def test_retries_a_chunk_on_5xx(self) -> None:
+        server = Integration(failures={"0001": 1})
+        async with AsyncClient("token", transport=httpx.MockTransport(server), retry=None, validate="raw") as client:
+            result = await client.integrations.ingest_costs("accss_1", rows(2), chunk_rows=1)
+        assert len(result.uploads) == 2
+        assert server.attempts["costs-0001.csv"] == 2
+
+    async def test_reader_error_rolls_back(self) -> None:
+        server = Integration()
+        async with AsyncClient("token", transport=httpx.MockTransport(server), retry=None) as client:
+            with pytest.raises(IngestionError, match="malformed row"):
+                await client.integrations.ingest_costs("accss_1", broken_rows(3), chunk_rows=1, concurrency=2)
+        assert sorted(server.deleted) == sorted(server.uploads)
+        assert len(server.uploads) == 3
+
+    async def test_wait_timeout_rolls_back(self) -> None:
+        server = Integration(final="processing")
+        async with AsyncClient("token", transport=httpx.MockTransport(server), retry=None) as client:
+            with pytest.raises(IngestionError, match="still importing"):
+                await client.integrations.ingest_costs("accss_1", rows(2), chunk_rows=1, timeout=0.02)
+        assert sorted(server.deleted) == sorted(server.uploads)
+
+    async def test_cancellation_stops_uploads_and_rolls_back(self) -> None:
+        release = asyncio.Event()
+        server = Integration()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST" and b"costs-0002" in request.read():
+                await release.wait()
+            return server(request)
+
+        async with AsyncClient("token", transport=httpx.MockTransport(handler), retry=None) as client:
+            task = asyncio.ensure_future(
+                client.integrations.ingest_costs("accss_1", rows(3), chunk_rows=1, concurrency=3)
+            )
+            while "costs-0001.csv" not in server.attempts or "costs-0003.csv" not in server.attempts:
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            release.set()
+            await asyncio.sleep(0.01)
+        assert "up_costs-0002.csv" not in server.uploads
+        assert sorted(server.deleted) == ["up_costs-0001.csv", "up_costs-0003.csv"]
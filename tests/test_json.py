@@ -0,0 +1,153 @@
+"""Tests for the pluggable JSON codecs and response parsing."""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, List
+
+import httpx
+import pytest
+
+import vantage._json
+from vantage import Client, JSONCodec
+from vantage._base import parse_response
+from vantage._json import STDLIB_CODEC, default_codec, get_json_codec
+from vantage._types import CreateFolder, Folder, Folders
+
+CODECS = ["json", "orjson", "msgspec"]
+
+FOLDER = {
+    "token": "fldr_1",
+    "title": "Équipe ☁ \"ops\"",
+    "parent_folder_token": None,
+    "saved_filter_tokens": ["svd_fltr_1"],
+    "cost_report_tokens": [],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "workspace_token": "wrkspc_1",
+}
+BODY = json.dumps({"folders": [FOLDER, {**FOLDER, "token": "fldr_2"}], "links": {"next": None}}).encode()
+
+
+def codec(name: str) -> JSONCodec:
+    if name != "json":
+        pytest.importorskip(name)
+    return get_json_codec(name)
+
+
+@pytest.fixture
+def fresh_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(vantage._json, "_default", None)
+
+
+class TestCodecSelection:
+    """Which codec a client gets."""
+
+    def test_prefers_orjson(self, fresh_default: None) -> None:
+        pytest.importorskip("orjson")
+        assert default_codec().name == "orjson"
+
+    def test_falls_back_to_msgspec(self, fresh_default: None, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("msgspec")
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        assert default_codec().name == "msgspec"
+
+    def test_falls_back_to_the_stdlib(self, fresh_default: None, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        assert default_codec() is STDLIB_CODEC
+
+    def test_default_is_chosen_once(self, fresh_default: None, monkeypatch: pytest.MonkeyPatch) -> None:
+        first = default_codec()
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+        assert default_codec() is first
+
+    def test_named_codec_that_is_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        with pytest.raises(ImportError):
+            get_json_codec("orjson")
+
+    def test_unknown_name(self) -> None:
+        with pytest.raises(ValueError, match="json_codec"):
+            get_json_codec("simdjson")
+
+    def test_custom_codec(self) -> None:
+        custom = JSONCodec("custom", STDLIB_CODEC.dumps, json.loads)
+        assert get_json_codec(custom) is custom
+        assert Client("token", json_codec=custom)._json is custom
+
+
+class TestCodecsAgree:
+    """Every codec encodes and decodes the same way."""
+
+    @pytest.mark.parametrize("name", CODECS)
+    def test_loads(self, name: str) -> None:
+        assert codec(name).loads(BODY) == json.loads(BODY)
+
+    @pytest.mark.parametrize("name", CODECS)
+    def test_dumps(self, name: str) -> None:
+        value = {"title": "Équipe ☁", "tokens": ["a", "b"], "count": 3, "ratio": 0.5, "flag": True, "none": None}
+        assert codec(name).dumps(value) == STDLIB_CODEC.dumps(value)
+
+    @pytest.mark.parametrize("name", CODECS)
+    @pytest.mark.parametrize("content", [b"", b"not json", b"\xff", b'{"a":'])
+    def test_invalid_bodies_decode_to_none(self, name: str, content: bytes) -> None:
+        assert parse_response(Folder, content, "construct", codec(name).loads) is None
+
+    @pytest.mark.parametrize("name", CODECS)
+    @pytest.mark.parametrize("mode", ["full", "construct", "raw"])
+    def test_parse_response(self, name: str, mode: str) -> None:
+        assert parse_response(Folders, BODY, mode, codec(name).loads) == parse_response(
+            Folders, BODY, mode, STDLIB_CODEC.loads
+        )
+
+    @pytest.mark.parametrize("name", CODECS)
+    def test_request_bodies(self, name: str) -> None:
+        sent: List[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request.read())
+            return httpx.Response(201, content=json.dumps(FOLDER).encode())
+
+        client = Client("token", transport=httpx.MockTransport(handler), retry=None, json_codec=codec(name))
+        folder = client.folders.create(CreateFolder(title=FOLDER["title"]))
+        assert folder == Folder.model_validate(FOLDER)
+        assert json.loads(sent[0]) == {"title": FOLDER["title"]}
+
+
+class TestParseResponse:
+    """The ``model_validate_json`` fast path against the dict path."""
+
+    def test_full_mode_skips_the_codec(self) -> None:
+        calls: List[Any] = []
+
+        def loads(content: bytes) -> Any:
+            calls.append(content)
+            return json.loads(content)
+
+        assert parse_response(Folders, BODY, "full", loads) == Folders.model_validate(json.loads(BODY))
+        assert calls == []
+
+    def test_fast_path_matches_the_dict_path(self) -> None:
+        fast = parse_response(Folders, BODY, "full", json.loads)
+        slow = Folders.model_validate(json.loads(BODY))
+        assert fast == slow
+        assert fast.model_fields_set == slow.model_fields_set
+        assert fast.folders[0].model_fields_set == slow.folders[0].model_fields_set
+
+    @pytest.mark.parametrize("content, expected", [(b"[1, 2]", [1, 2]), (b'"done"', "done"), (b"not json", None)])
+    def test_non_objects_are_returned_decoded(self, content: bytes, expected: Any) -> None:
+        assert parse_response(Folder, content, "full", json.loads) == expected
+
+    def test_invalid_objects_still_raise(self) -> None:
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            parse_response(Folder, b'{"token": 1}', "full", json.loads)
+
+    def test_construct_and_raw(self) -> None:
+        built = parse_response(Folders, BODY, "construct", json.loads)
+        assert built == Folders.model_validate(json.loads(BODY))
+        assert parse_response(Folders, BODY, "raw", json.loads) == json.loads(BODY)
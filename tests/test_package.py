@@ -0,0 +1,40 @@
+"""Tests for the names the ``vantage`` package exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import vantage
+import vantage._types
+
+
+class TestPackage:
+    """The top-level package namespace."""
+
+    def test_import_is_lazy(self) -> None:
+        # Run in a fresh interpreter, since other tests have imported everything here.
+        code = (
+            "import sys, vantage\n"
+            "lazy = ['httpx', 'vantage._types', 'vantage._sync.client', 'vantage._async.client']\n"
+            "lazy += sorted({'vantage' + module for module in vantage._LAZY.values()})\n"
+            "print(' '.join(module for module in lazy if module in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
+
+    def test_all_is_public_api_only(self) -> None:
+        names = vantage.__all__
+        assert len(names) == len(set(names))
+        assert {"Client", "AsyncClient", "RetryPolicy", "CSVRows", "DiskCache", "Folder"} <= set(names)
+        assert not {"importlib", "TYPE_CHECKING", "Any", "Optional", "List", "Union", "Field", "ConfigDict"} & set(names)
+        assert all(not name.startswith("_") for name in names)
+        for name in names:
+            assert getattr(vantage, name) is not None
+
+    def test_star_import(self) -> None:
+        namespace: dict = {}
+        exec("from vantage import *", namespace)
+        assert namespace["Folder"] is vantage._types.Folder
+        assert namespace["IngestionError"] is vantage.IngestionError
+        assert "annotations" not in namespace
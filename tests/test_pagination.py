@@ -0,0 +1,202 @@
+"""Tests for following and prefetching paginated list responses.
+
+Runs offline against httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from vantage import AsyncClient, Client
+from vantage._base import fetch_pages_in_order, remaining_page_paths
+from vantage._types import Links
+
+API = "https://api.vantage.sh"
+
+
+class Folders:
+    """
+    Serves ``pages`` pages of folders, two per page.
+
+    ``last=False`` leaves ``links.last`` out, and ``delays`` holds a per-page
+    response delay for the async transport.
+    """
+
+    def __init__(self, pages: int, last: bool = True, delays: Optional[Dict[int, float]] = None) -> None:
+        self.pages = pages
+        self.last = last
+        self.delays = delays or {}
+        self.requested: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def page(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        self.requested.append(page)
+        query = "limit=2&workspace_token=wrkspc_1"
+        links: Dict[str, Any] = {"self": f"{API}/v2/folders?page={page}&{query}"}
+        if page < self.pages:
+            links["next"] = f"{API}/v2/folders?page={page + 1}&{query}"
+        if self.last:
+            links["last"] = f"{API}/v2/folders?page={self.pages}&{query}"
+        folders = [{"token": f"fldr_{page}_{i}"} for i in range(2)]
+        return httpx.Response(200, json={"folders": folders, "links": links})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self.page(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(int(request.url.params.get("page", "1")), 0.001))
+            return self.page(request)
+        finally:
+            self.in_flight -= 1
+
+
+def tokens(pages: int) -> List[str]:
+    return [f"fldr_{page}_{i}" for page in range(1, pages + 1) for i in range(2)]
+
+
+class TestRemainingPagePaths:
+    """Page paths derived from ``links``."""
+
+    def test_rewrites_only_the_page_parameter(self) -> None:
+        links = {"next": f"{API}/v2/costs?limit=5&page=2&filter=a%3Db", "last": f"{API}/v2/costs?page=4&limit=5"}
+        assert remaining_page_paths(links) == [
+            "/v2/costs?limit=5&page=2&filter=a%3Db",
+            "/v2/costs?limit=5&page=3&filter=a%3Db",
+            "/v2/costs?limit=5&page=4&filter=a%3Db",
+        ]
+
+    def test_reads_links_models(self) -> None:
+        links = Links(next=f"{API}/v2/folders?page=2", last=f"{API}/v2/folders?page=2")
+        assert remaining_page_paths(links) == ["/v2/folders?page=2"]
+
+    @pytest.mark.parametrize(
+        "links",
+        [
+            {"next": f"{API}/v2/folders?page=2"},
+            {"next": f"{API}/v2/folders?page=2", "last": None},
+            {"next": f"{API}/v2/folders?page=2", "last": f"{API}/v2/folders"},
+            {"next": f"{API}/v2/folders?page=2", "last": f"{API}/v2/folders?per_page=9"},
+            {"next": f"{API}/v2/folders?page=2", "last": "not a url"},
+            {"next": f"{API}/v2/folders?cursor=abc", "last": f"{API}/v2/folders?page=9"},
+            {"next": None, "last": f"{API}/v2/folders?page=9"},
+            None,
+        ],
+    )
+    def test_unknown_page_count(self, links: Any) -> None:
+        assert remaining_page_paths(links) is None
+
+    def test_last_before_next(self) -> None:
+        assert remaining_page_paths({"next": f"{API}/v2/folders?page=3", "last": f"{API}/v2/folders?page=2"}) == []
+
+
+class TestFetchPagesInOrder:
+    """Bounded, ordered prefetching."""
+
+    async def test_yields_in_order_when_pages_finish_out_of_order(self) -> None:
+        finished: List[int] = []
+
+        async def fetch(page: int) -> int:
+            await asyncio.sleep(0.001 * (10 - page))
+            finished.append(page)
+            return page
+
+        assert [page async for page in fetch_pages_in_order(fetch, list(range(10)), 10)] == list(range(10))
+        assert finished != sorted(finished)
+
+    @pytest.mark.parametrize("concurrency", [1, 3, 20])
+    async def test_bounds_requests_in_flight(self, concurrency: int) -> None:
+        in_flight = peak = 0
+
+        async def fetch(page: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return page
+
+        assert [page async for page in fetch_pages_in_order(fetch, list(range(8)), concurrency)] == list(range(8))
+        assert peak == min(concurrency, 8)
+
+    async def test_closing_early_cancels_pending_fetches(self) -> None:
+        started: List[int] = []
+        cancelled: List[int] = []
+
+        async def fetch(page: int) -> int:
+            started.append(page)
+            try:
+                await asyncio.sleep(0 if page == 0 else 1)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+            return page
+
+        pages = fetch_pages_in_order(fetch, list(range(10)), 3)
+        assert await pages.__anext__() == 0
+        await pages.aclose()
+        await asyncio.sleep(0)
+        # Page 3 was queued when page 0 was yielded and is cancelled before it starts.
+        assert started == [0, 1, 2]
+        assert cancelled == [1, 2]
+
+    async def test_error_propagates_in_order(self) -> None:
+        async def fetch(page: int) -> int:
+            if page == 2:
+                raise RuntimeError("page 2")
+            return page
+
+        seen = []
+        with pytest.raises(RuntimeError, match="page 2"):
+            async for page in fetch_pages_in_order(fetch, list(range(5)), 2):
+                seen.append(page)
+        assert seen == [0, 1]
+
+
+class TestListAll:
+    """list_all against a paginated API."""
+
+    def test_sync_follows_next(self) -> None:
+        server = Folders(pages=3)
+        client = Client("token", transport=httpx.MockTransport(server), retry=None, validate="raw")
+        assert [folder["token"] for folder in client.folders.list_all(limit=2)] == tokens(3)
+        assert server.requested == [1, 2, 3]
+
+    def test_sync_single_page(self) -> None:
+        server = Folders(pages=1)
+        client = Client("token", transport=httpx.MockTransport(server), retry=None)
+        assert [folder.token for folder in client.folders.list_all(limit=2, validate="construct")] == tokens(1)
+
+    async def test_async_follows_next(self) -> None:
+        server = Folders(pages=3)
+        transport = httpx.MockTransport(server.handle_async)
+        async with AsyncClient("token", transport=transport, retry=None, validate="raw") as client:
+            assert [folder["token"] async for folder in client.folders.list_all(limit=2)] == tokens(3)
+        assert server.max_in_flight == 1
+
+    async def test_async_prefetches_up_to_concurrency(self) -> None:
+        # Later pages answer first, so order has to be restored.
+        server = Folders(pages=6, delays={2: 0.03, 3: 0.02, 4: 0.01})
+        transport = httpx.MockTransport(server.handle_async)
+        async with AsyncClient("token", transport=transport, retry=None, validate="raw") as client:
+            folders = [folder["token"] async for folder in client.folders.list_all(limit=2, concurrency=3)]
+        assert folders == tokens(6)
+        assert sorted(server.requested) == [1, 2, 3, 4, 5, 6]
+        assert server.max_in_flight == 3
+
+    async def test_async_without_last_link_goes_one_page_at_a_time(self) -> None:
+        server = Folders(pages=4, last=False)
+        transport = httpx.MockTransport(server.handle_async)
+        async with AsyncClient("token", transport=transport, retry=None, validate="raw") as client:
+            folders = [folder["token"] async for folder in client.folders.list_all(limit=2, concurrency=4)]
+        assert folders == tokens(4)
+        assert server.requested == [1, 2, 3, 4]
+        assert server.max_in_flight == 1
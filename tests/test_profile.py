@@ -0,0 +1,180 @@
+"""Tests for per-call profiling and its per-endpoint report."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import httpx
+import pytest
+
+from vantage import AsyncClient, Client, Hooks, Profiler, RequestEvent, VantageAPIError
+from vantage._profile import get_profiler
+
+FOLDER = {
+    "token": "fldr_1",
+    "title": "Team",
+    "parent_folder_token": None,
+    "saved_filter_tokens": [],
+    "cost_report_tokens": [],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "workspace_token": "wrkspc_1",
+}
+PAGE_SIZES = {1: 3, 2: 3, 3: 1}
+
+
+def event(
+    route: str = "/v2/costs",
+    total: float = 0.1,
+    transfer: Optional[float] = None,
+    decode: Optional[float] = None,
+    validate: Optional[float] = None,
+    items: Optional[int] = None,
+    status: Optional[int] = 200,
+    error: Optional[BaseException] = None,
+) -> RequestEvent:
+    result = RequestEvent("GET", route, "https://api.vantage.sh" + route)
+    result.total, result.transfer, result.decode, result.validate = total, transfer, decode, validate
+    result.items, result.status, result.error = items, status, error
+    result.response_bytes = 1000
+    return result
+
+
+def folder_pages(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("page", "1"))
+    links = {"next": f"https://api.vantage.sh/v2/folders?page={page + 1}"} if page < 3 else {}
+    folders = [{**FOLDER, "token": f"fldr_{page}_{i}"} for i in range(PAGE_SIZES[page])]
+    return httpx.Response(200, json={"folders": folders, "links": links})
+
+
+class TestProfiler:
+    """Recording and aggregating call profiles."""
+
+    def test_phases_add_up_to_the_total(self) -> None:
+        profiler = Profiler()
+        profiler.record(event(total=0.5, transfer=0.1, decode=0.05, validate=0.15, items=10))
+        (call,) = profiler.calls
+        assert call.endpoint == "GET /v2/costs"
+        assert call.wait == pytest.approx(0.2)
+        assert call.wait + call.transfer + call.decode + call.validate == pytest.approx(call.total)
+        assert call.items == 10 and call.response_bytes == 1000 and not call.failed
+
+    def test_unmeasured_phases_count_as_wait(self) -> None:
+        profiler = Profiler()
+        profiler.record(event(total=0.3))
+        (call,) = profiler.calls
+        assert (call.wait, call.transfer, call.decode, call.validate) == (0.3, 0.0, 0.0, 0.0)
+
+    def test_failed_calls(self) -> None:
+        profiler = Profiler()
+        profiler.record(event(status=None, error=httpx.ConnectError("refused")))
+        assert profiler.calls[0].failed and profiler.calls[0].status is None
+        assert profiler.stats()["GET /v2/costs"].failed == 1
+
+    def test_stats_per_endpoint(self) -> None:
+        profiler = Profiler()
+        for total, items in [(0.1, 100), (0.2, 100), (0.3, 37)]:
+            profiler.record(event(total=total, decode=0.01, validate=0.02, items=items))
+        profiler.record(event(route="/v2/me", total=1.0))
+        me, costs = profiler.stats().values()
+        assert me.endpoint == "GET /v2/me"  # slowest overall first
+        assert costs.calls == 3
+        assert costs.total_time == pytest.approx(0.6)
+        assert costs.total == pytest.approx(0.2)
+        assert costs.wait == pytest.approx(0.17)
+        assert costs.decode == pytest.approx(0.01) and costs.validate == pytest.approx(0.02)
+        assert (costs.p50, costs.p95) == (0.2, 0.3)
+        assert costs.items_total == 237
+        assert costs.items == pytest.approx(79.0)
+        assert me.items is None and me.items_total is None
+
+    def test_keeps_the_last_calls(self) -> None:
+        profiler = Profiler(size=2)
+        for total in (0.1, 0.2, 0.3):
+            profiler.record(event(total=total))
+        assert [call.total for call in profiler.calls] == [0.2, 0.3]
+        profiler.clear()
+        assert profiler.calls == [] and profiler.stats() == {}
+
+    def test_invalid_size(self) -> None:
+        with pytest.raises(ValueError):
+            Profiler(size=0)
+
+    def test_report(self) -> None:
+        profiler = Profiler()
+        for total, items in [(0.1, 100), (0.2, 100), (0.3, 37)]:
+            profiler.record(event(total=total, transfer=0.01, items=items))
+        profiler.record(event(route="/v2/me", total=0.05))
+        header, costs, me = profiler.report().splitlines()
+        assert header.split() == [
+            "endpoint", "calls", "failed", "wait", "transfer", "decode", "validate", "total", "p95", "items", "per", "call"
+        ]
+        assert costs.split() == ["GET", "/v2/costs", "3", "0", "190.0", "10.0", "0.0", "0.0", "200.0", "300.0", "237", "79.0"]
+        assert me.split()[-2:] == ["-", "-"]
+
+    def test_report_is_empty_without_calls(self) -> None:
+        assert len(Profiler().report().splitlines()) == 1
+
+    def test_attach_keeps_the_client_hooks(self) -> None:
+        profiler = Profiler()
+        seen = []
+        hooks = Hooks(after_response=seen.append)
+        attached = profiler.attach(hooks)
+        assert attached.after_response == [seen.append, profiler.record]
+        assert attached.on_error == [profiler.record]
+        assert hooks.after_response == [seen.append]
+
+    def test_get_profiler(self) -> None:
+        profiler = Profiler()
+        assert get_profiler(profiler) is profiler
+        assert isinstance(get_profiler(True), Profiler)
+        assert get_profiler(False) is None
+
+
+class TestClientProfiling:
+    """Profiles recorded by the clients."""
+
+    def test_items_across_pages(self) -> None:
+        client = Client("token", transport=httpx.MockTransport(folder_pages), retry=None, profile=True)
+        assert len(list(client.folders.list_all(validate="raw"))) == 7
+        assert [call.items for call in client.profiler.calls] == [3, 3, 1]
+        stats = client.profiler.stats()["GET /v2/folders"]
+        assert stats.calls == 3
+        assert stats.items_total == 7
+        assert stats.items == pytest.approx(7 / 3)
+        assert client.profiler.report().splitlines()[1].split()[-2:] == ["7", "2.3"]
+
+    @pytest.mark.parametrize("mode", ["full", "construct", "raw"])
+    def test_phases_per_validate_mode(self, mode: str) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=FOLDER))
+        client = Client("token", transport=transport, retry=None, profile=True, validate=mode)  # type: ignore[arg-type]
+        client.folders.get("fldr_1")
+        (call,) = client.profiler.calls
+        assert call.endpoint == "GET /v2/folders/{folder_token}" and call.status == 200
+        # "full" parses and validates the bytes in one step; "raw" builds no models.
+        assert (call.decode > 0) == (mode != "full")
+        assert (call.validate > 0) == (mode != "raw")
+        assert call.total >= call.decode + call.validate
+        assert call.response_bytes == len(httpx.Response(200, json=FOLDER).content)
+
+    def test_errors_are_recorded(self) -> None:
+        transport = httpx.MockTransport(lambda request: httpx.Response(404, json={"errors": ["missing"]}))
+        client = Client("token", transport=transport, retry=None, profile=True)
+        with pytest.raises(VantageAPIError):
+            client.folders.get("fldr_1")
+        (call,) = client.profiler.calls
+        assert call.failed and call.status == 404
+
+    def test_shared_between_clients(self) -> None:
+        profiler = Profiler()
+        transport: Any = httpx.MockTransport(lambda request: httpx.Response(200, json=FOLDER))
+        for _ in range(2):
+            Client("token", transport=transport, retry=None, profile=profiler).folders.get("fldr_1")
+        assert profiler.stats()["GET /v2/folders/{folder_token}"].calls == 2
+
+    async def test_async_items_across_pages(self) -> None:
+        transport = httpx.MockTransport(folder_pages)
+        async with AsyncClient("token", transport=transport, retry=None, profile=True) as client:
+            assert len([folder async for folder in client.folders.list_all(validate="raw")]) == 7
+        stats = client.profiler.stats()["GET /v2/folders"]
+        assert (stats.calls, stats.items_total) == (3, 7)
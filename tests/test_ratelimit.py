@@ -0,0 +1,204 @@
+"""Tests for client-side rate limiting, driven by a fake clock."""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional
+
+import httpx
+import pytest
+
+import vantage._ratelimit
+import vantage._sync.client
+from vantage import Client, RateLimiter, RetryPolicy, VantageAPIError
+from vantage._ratelimit import TokenBucket
+
+
+class FakeClock:
+    """A monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(vantage._ratelimit, "time", clock)
+    monkeypatch.setattr(vantage._sync.client, "time", clock)
+    return clock
+
+
+class TestTokenBucket:
+    """Reservations from one bucket."""
+
+    def test_burst_then_steady_rate(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=2.0, burst=3)
+        assert [bucket.reserve() for _ in range(6)] == [0.0, 0.0, 0.0, 0.5, 1.0, 1.5]
+
+    def test_refills_with_time(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=2.0, burst=3)
+        for _ in range(3):
+            bucket.reserve()
+        clock.advance(1.0)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_refill_is_capped_at_burst(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=2.0, burst=3)
+        clock.advance(3600)
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+
+    def test_waiting_callers_queue_behind_each_other(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=4.0, burst=1)
+        assert bucket.reserve() == 0.0
+        waits = [bucket.reserve() for _ in range(3)]
+        assert waits == [0.25, 0.5, 0.75]
+        clock.advance(0.75)
+        assert bucket.reserve() == 0.25
+
+    def test_default_burst(self, clock: FakeClock) -> None:
+        assert TokenBucket(rate=0.5).burst == 1.0
+        assert TokenBucket(rate=8).burst == 8
+
+    def test_invalid_rate(self) -> None:
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_observed_remaining_caps_the_balance(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=1.0, burst=5)
+        bucket.observe(remaining=1, reset=None)
+        assert [bucket.reserve() for _ in range(2)] == [0.0, 1.0]
+
+    def test_observed_remaining_never_adds_tokens(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=1.0, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+        bucket.observe(remaining=100, reset=None)
+        assert bucket.reserve() == 1.0
+
+    def test_exhausted_window_blocks_until_reset(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=10.0, burst=10)
+        bucket.observe(remaining=0, reset=5.0)
+        assert bucket.reserve() == 5.0
+        clock.advance(5.0)
+        assert bucket.reserve() == 0.0
+
+
+class TestRateLimiter:
+    """Buckets per path family and header handling."""
+
+    def test_longest_family_prefix_wins(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(10.0, families={"/v2/costs": (1.0, 1), "/v2/costs/data_exports": (2.0, 2)})
+        assert limiter.bucket_for("/v2/costs/data_exports/dta_1").rate == 2.0
+        assert limiter.bucket_for("/v2/costs?page=2").rate == 1.0
+        assert limiter.bucket_for("/v2/folders").rate == 10.0
+
+    def test_families_do_not_share_tokens(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(1.0, families={"/v2/costs": (1.0, 1)})
+        assert limiter.reserve("/v2/costs") == 0.0
+        assert limiter.reserve("/v2/folders") == 0.0
+        assert limiter.reserve("/v2/costs") == 1.0
+
+    @pytest.mark.parametrize(
+        "headers, wait",
+        [
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "7"}, 7.0),
+            ({"RateLimit-Remaining": "0", "RateLimit-Reset": "3"}, 3.0),
+            ({"X-RateLimit-Remaining": "0"}, 0.1),
+            ({"X-RateLimit-Remaining": "many", "X-RateLimit-Reset": "7"}, 0.0),
+            ({"X-RateLimit-Reset": "7"}, 0.0),
+        ],
+    )
+    def test_observe_headers(self, clock: FakeClock, headers: Dict[str, str], wait: float) -> None:
+        limiter = RateLimiter(10.0)
+        limiter.observe("/v2/folders", httpx.Headers(headers))
+        assert limiter.reserve("/v2/folders") == pytest.approx(wait)
+
+    def test_reset_as_a_unix_timestamp(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(10.0)
+        reset = str(int(time.time()) + 30)
+        limiter.observe("/v2/folders", httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}))
+        assert 28 < limiter.reserve("/v2/folders") <= 30
+
+    def test_not_adaptive(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(10.0, adaptive=False)
+        limiter.observe("/v2/folders", httpx.Headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "7"}))
+        assert limiter.reserve("/v2/folders") == 0.0
+
+
+class Server:
+    """Answers with ``responses`` in turn, then 200, recording when each request arrived."""
+
+    def __init__(self, clock: FakeClock, *responses: httpx.Response) -> None:
+        self.clock = clock
+        self.responses = list(responses)
+        self.times: List[float] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.times.append(self.clock.now - 1000.0)
+        if self.responses:
+            return self.responses.pop(0)
+        return httpx.Response(200, json={"token": "wrkspc_1"})
+
+
+def client_for(server: Server, limiter: RateLimiter, retry: Optional[RetryPolicy] = None) -> Client:
+    return Client("token", transport=httpx.MockTransport(server), rate_limiter=limiter, retry=retry, validate="raw")
+
+
+class TestClientPacing:
+    """The rate limiter and retries inside the client."""
+
+    def test_requests_are_paced(self, clock: FakeClock) -> None:
+        server = Server(clock)
+        client = client_for(server, RateLimiter(2.0, burst=2))
+        for _ in range(5):
+            client.me.get()
+        assert server.times == [0.0, 0.0, 0.5, 1.0, 1.5]
+
+    def test_retry_after_on_429(self, clock: FakeClock) -> None:
+        throttled = httpx.Response(
+            429, headers={"Retry-After": "3", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}
+        )
+        server = Server(clock, throttled)
+        client = client_for(server, RateLimiter(10.0), RetryPolicy(jitter=False))
+        assert client.me.get() == {"token": "wrkspc_1"}
+        # The retry waits out Retry-After once; the limiter adds nothing on top.
+        assert clock.sleeps == [3.0]
+        assert server.times == [0.0, 3.0]
+
+    def test_limiter_holds_a_retry_until_the_window_resets(self, clock: FakeClock) -> None:
+        throttled = httpx.Response(
+            429, headers={"Retry-After": "1", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}
+        )
+        server = Server(clock, throttled)
+        client = client_for(server, RateLimiter(10.0), RetryPolicy(jitter=False))
+        client.me.get()
+        assert clock.sleeps == [1.0, 4.0]
+        assert server.times == [0.0, 5.0]
+
+    def test_exhausted_window_pauses_every_client_sharing_the_limiter(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(10.0)
+        exhausted = httpx.Response(200, json={}, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+        first = Server(clock, exhausted)
+        second = Server(clock)
+        client_for(first, limiter).me.get()
+        client_for(second, limiter).me.get()
+        assert second.times == [2.0]
+
+    def test_429_without_retry(self, clock: FakeClock) -> None:
+        server = Server(clock, httpx.Response(429, headers={"Retry-After": "3"}, json={"errors": ["slow down"]}))
+        client = client_for(server, RateLimiter(10.0))
+        with pytest.raises(VantageAPIError):
+            client.me.get()
+        assert clock.sleeps == []
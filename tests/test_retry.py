@@ -0,0 +1,119 @@
+"""Tests for the retry policy shared by the clients.
+
+Runs offline against httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+from typing import List
+
+import httpx
+import pytest
+
+from vantage import Client, RetryPolicy, VantageAPIError
+from vantage._retry import parse_reset, parse_retry_after
+
+POLICY = RetryPolicy(jitter=False)
+
+
+class TestNextDelay:
+    """RetryPolicy.next_delay without server hints."""
+
+    def test_exponential_backoff(self) -> None:
+        delays = [POLICY.next_delay("GET", attempt, 0.0, 503) for attempt in range(3)]
+        assert delays == [0.5, 1.0, 2.0]
+
+    def test_capped_by_max_backoff(self) -> None:
+        policy = RetryPolicy(max_retries=10, max_backoff=3.0, budget=None, jitter=False)
+        assert policy.next_delay("GET", 8, 0.0, 503) == 3.0
+
+    def test_jitter_stays_within_backoff(self) -> None:
+        policy = RetryPolicy()
+        for _ in range(100):
+            delay = policy.next_delay("GET", 2, 0.0, 503)
+            assert delay is not None and 0.0 <= delay <= 2.0
+
+    def test_gives_up_after_max_retries(self) -> None:
+        assert POLICY.next_delay("GET", 3, 0.0, 503) is None
+
+    def test_only_idempotent_methods(self) -> None:
+        assert POLICY.next_delay("POST", 0, 0.0, 503) is None
+        assert POLICY.next_delay("PATCH", 0, 0.0) is None
+        assert POLICY.next_delay("delete", 0, 0.0, 503) == 0.5
+
+    def test_only_retryable_statuses(self) -> None:
+        assert POLICY.next_delay("GET", 0, 0.0, 404) is None
+        assert POLICY.next_delay("GET", 0, 0.0, 429) == 0.5
+
+    def test_transport_errors_are_retried(self) -> None:
+        assert POLICY.next_delay("GET", 0, 0.0, None) == 0.5
+
+    def test_budget(self) -> None:
+        policy = RetryPolicy(budget=10.0, jitter=False)
+        assert policy.next_delay("GET", 2, 7.5, 503) == 2.0
+        assert policy.next_delay("GET", 2, 8.5, 503) is None
+
+
+class TestServerDelay:
+    """Retry-After and rate-limit reset headers."""
+
+    def test_retry_after_seconds(self) -> None:
+        assert POLICY.next_delay("GET", 0, 0.0, 429, {"retry-after": "7"}) == 7.0
+
+    def test_retry_after_http_date(self) -> None:
+        delay = POLICY.next_delay("GET", 0, 0.0, 503, {"retry-after": formatdate(time.time() + 20, usegmt=True)})
+        assert delay is not None and 18.0 <= delay <= 20.0
+
+    def test_rate_limit_reset(self) -> None:
+        assert POLICY.next_delay("GET", 0, 0.0, 429, {"x-ratelimit-reset": "4"}) == 4.0
+
+    def test_retry_after_wins_over_reset(self) -> None:
+        headers = {"retry-after": "2", "x-ratelimit-reset": "9"}
+        assert POLICY.next_delay("GET", 0, 0.0, 429, headers) == 2.0
+
+    def test_server_delay_counts_against_budget(self) -> None:
+        assert POLICY.next_delay("GET", 0, 0.0, 429, {"retry-after": "120"}) is None
+
+    def test_unparseable_header_falls_back_to_backoff(self) -> None:
+        assert POLICY.next_delay("GET", 1, 0.0, 429, {"retry-after": "soon"}) == 1.0
+
+    def test_parse_retry_after(self) -> None:
+        assert parse_retry_after("3.5") == 3.5
+        assert parse_retry_after("-1") == 0.0
+        assert parse_retry_after("nonsense") is None
+
+    def test_parse_reset_timestamp(self) -> None:
+        delay = parse_reset(str(int(time.time()) + 30))
+        assert delay is not None and 28.0 <= delay <= 30.0
+        assert parse_reset(str(int(time.time()) - 30)) == 0.0
+        assert parse_reset("x") is None
+
+
+class TestClientRetries:
+    """Retries made by the sync client."""
+
+    def test_retries_get_until_success(self) -> None:
+        statuses: List[int] = [503, 429]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if statuses:
+                return httpx.Response(statuses.pop(0), headers={"retry-after": "0"})
+            return httpx.Response(200, json={"folders": [], "links": {}})
+
+        client = Client("token", transport=httpx.MockTransport(handler), validate="raw")
+        assert client.folders.list()["folders"] == []
+        assert statuses == []
+
+    def test_does_not_retry_post(self) -> None:
+        calls: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            return httpx.Response(503, headers={"retry-after": "0"})
+
+        client = Client("token", transport=httpx.MockTransport(handler))
+        with pytest.raises(VantageAPIError):
+            client.folders.create({"title": "x"})
+        assert calls == ["POST"]
@@ -0,0 +1,103 @@
+"""Tests for splitting cost queries into date shards and merging the results."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from vantage._sharding import merge_shards, shard_date_range
+
+
+class TestShardDateRange:
+    """Shard boundaries for each date bin."""
+
+    def test_days(self) -> None:
+        assert shard_date_range("2024-01-01", "2024-01-20", "day") == [
+            ("2024-01-01", "2024-01-07"),
+            ("2024-01-08", "2024-01-14"),
+            ("2024-01-15", "2024-01-20"),
+        ]
+
+    def test_weeks_start_on_monday(self) -> None:
+        # 2024-01-03 is a Wednesday; the first shard ends on the Sunday four weeks on.
+        assert shard_date_range("2024-01-03", "2024-03-01", "week") == [
+            ("2024-01-03", "2024-01-28"),
+            ("2024-01-29", "2024-02-25"),
+            ("2024-02-26", "2024-03-01"),
+        ]
+
+    def test_months_across_a_leap_february_and_new_year(self) -> None:
+        assert shard_date_range("2023-12-15", "2024-03-10", "month") == [
+            ("2023-12-15", "2023-12-31"),
+            ("2024-01-01", "2024-01-31"),
+            ("2024-02-01", "2024-02-29"),
+            ("2024-03-01", "2024-03-10"),
+        ]
+
+    def test_quarters(self) -> None:
+        assert shard_date_range("2024-02-10", "2024-12-31", "quarter", bins_per_shard=2) == [
+            ("2024-02-10", "2024-06-30"),
+            ("2024-07-01", "2024-12-31"),
+        ]
+
+    def test_single_day(self) -> None:
+        assert shard_date_range("2024-05-05", "2024-05-05", "month") == [("2024-05-05", "2024-05-05")]
+
+    def test_accepts_datetimes(self) -> None:
+        assert shard_date_range("2024-01-31T00:00:00Z", "2024-02-01T23:59:59Z", "month") == [
+            ("2024-01-31", "2024-01-31"),
+            ("2024-02-01", "2024-02-01"),
+        ]
+
+    @pytest.mark.parametrize("date_bin", ["day", "week", "month", "quarter"])
+    def test_shards_tile_the_range(self, date_bin: str) -> None:
+        shards = shard_date_range("2023-11-17", "2025-02-03", date_bin, bins_per_shard=1)
+        assert shards[0][0] == "2023-11-17" and shards[-1][1] == "2025-02-03"
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            assert date.fromisoformat(end) + timedelta(days=1) == date.fromisoformat(start)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            shard_date_range("2024-01-01", "2024-02-01", "year")
+        with pytest.raises(ValueError):
+            shard_date_range("2024-01-01", "2024-02-01", "day", bins_per_shard=0)
+        with pytest.raises(ValueError):
+            shard_date_range("2024-02-01", "2024-01-01", "day")
+
+
+class TestMergeShards:
+    """Merging per-shard cost bodies."""
+
+    PAGES = [
+        {
+            "links": {"next": None},
+            "costs": [{"accrued_at": "2024-01-02", "amount": "1.10"}, {"accrued_at": "2024-01-01", "amount": "2.00"}],
+            "total_cost": {"amount": "3.10", "currency": "USD"},
+            "total_usage": [{"amount": "10", "unit": "GB"}, {"amount": "1.5", "unit": "Hrs"}],
+        },
+        {
+            "links": {"next": None},
+            "costs": [{"accrued_at": "2024-02-01", "amount": "0.20"}],
+            "total_cost": {"amount": "0.20", "currency": "USD"},
+            "total_usage": [{"amount": "5.25", "unit": "GB"}],
+        },
+    ]
+
+    def test_orders_items_by_date(self) -> None:
+        merged = merge_shards(self.PAGES, "costs")
+        assert [item["accrued_at"] for item in merged["costs"]] == ["2024-01-01", "2024-01-02", "2024-02-01"]
+        assert merged["links"] is None
+
+    def test_descending(self) -> None:
+        merged = merge_shards(self.PAGES, "costs", descending=True)
+        assert [item["accrued_at"] for item in merged["costs"]] == ["2024-02-01", "2024-01-02", "2024-01-01"]
+
+    def test_sums_totals_exactly(self) -> None:
+        merged = merge_shards(self.PAGES, "costs")
+        assert merged["total_cost"] == {"amount": "3.30", "currency": "USD"}
+        assert merged["total_usage"] == [{"amount": "15.25", "unit": "GB"}, {"amount": "1.5", "unit": "Hrs"}]
+
+    def test_without_totals(self) -> None:
+        merged = merge_shards([{"costs": [{"accrued_at": "2024-01-01"}]}, {"costs": None}], "costs")
+        assert merged == {"links": None, "costs": [{"accrued_at": "2024-01-01"}]}
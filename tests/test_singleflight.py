@@ -0,0 +1,149 @@
+"""Tests for coalescing identical in-flight calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from vantage._singleflight import AsyncSingleFlight, SingleFlight
+
+
+class Blocking:
+    """A call that blocks until released, counting how often it runs."""
+
+    def __init__(self, error: bool = False) -> None:
+        self.error = error
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self) -> Dict[str, Any]:
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error:
+            raise RuntimeError("boom")
+        return {"calls": self.calls}
+
+
+def run_together(flight: SingleFlight, key: str, fn: Blocking, followers: int) -> List[Any]:
+    """Start one leader, let ``followers`` join it while it runs, then release it."""
+
+    def call() -> Any:
+        try:
+            return flight.do(key, fn)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=followers + 1) as pool:
+        leader = pool.submit(call)
+        assert fn.started.wait(5)
+        others = [pool.submit(call) for _ in range(followers)]
+        time.sleep(0.05)
+        fn.release.set()
+        return [leader.result(5)] + [future.result(5) for future in others]
+
+
+class TestSingleFlight:
+    """Coalescing across threads."""
+
+    def test_concurrent_calls_share_one_result(self) -> None:
+        fn = Blocking()
+        results = run_together(SingleFlight(), "GET /v2/me", fn, followers=5)
+        assert fn.calls == 1
+        assert all(result is results[0] for result in results)
+
+    def test_concurrent_calls_share_one_error(self) -> None:
+        fn = Blocking(error=True)
+        results = run_together(SingleFlight(), "GET /v2/me", fn, followers=5)
+        assert fn.calls == 1
+        assert isinstance(results[0], RuntimeError)
+        assert all(result is results[0] for result in results)
+
+    def test_different_keys_run_separately(self) -> None:
+        flight = SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+
+    def test_key_is_released_after_the_call(self) -> None:
+        flight = SingleFlight()
+        calls = []
+        for _ in range(3):
+            flight.do("a", lambda: calls.append(1))
+        assert len(calls) == 3
+
+    def test_key_is_released_after_an_error(self) -> None:
+        flight = SingleFlight()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("a", fail)
+        assert flight.do("a", lambda: 1) == 1
+
+
+class TestAsyncSingleFlight:
+    """Coalescing across tasks."""
+
+    async def test_concurrent_calls_share_one_result(self) -> None:
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def fetch() -> Dict[str, int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"calls": calls}
+
+        results = await asyncio.gather(*(flight.do("GET /v2/me", fetch) for _ in range(5)))
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_concurrent_calls_share_one_error(self) -> None:
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def fetch() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(flight.do("GET /v2/me", fetch) for _ in range(5)), return_exceptions=True)
+        assert calls == 1
+        assert isinstance(results[0], RuntimeError)
+        assert all(result is results[0] for result in results)
+
+    async def test_cancelling_the_leader_does_not_cancel_the_call(self) -> None:
+        flight = AsyncSingleFlight()
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("a", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("a", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await follower == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    async def test_key_is_released_after_the_call(self) -> None:
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("a", fetch) == 1
+        assert await flight.do("a", fetch) == 2
@@ -0,0 +1,102 @@
+"""Tests for incremental decoding of streamed list responses."""
+
+from __future__ import annotations
+
+import json
+import random
+from typing import Any, Iterable, List, Tuple
+
+import pytest
+
+from vantage._stream import JSONArrayStream
+
+DOCUMENT = {
+    "links": {"self": "/v2/costs?page=1", "next": "/v2/costs?page=2"},
+    "costs": [
+        {"amount": "12.50", "service": "Amazon S3", "tags": ["a", "b"], "nested": {"x": [1, 2, {"y": None}]}},
+        {"amount": "-0.001e3", "service": "Zürich \"quoted\" \\ back", "ok": True},
+        {"amount": "7", "service": "東京 region 💸", "ok": False},
+        12345,
+        "plain string",
+        [],
+    ],
+    "total": 6,
+}
+BODY = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode()
+
+
+def decode(chunks: Iterable[bytes], capture: Iterable[str] = ("links",)) -> Tuple[List[Any], JSONArrayStream]:
+    """Feed every chunk to a new stream and return all the items it produced, and the stream."""
+    stream = JSONArrayStream("costs", capture=capture)
+    items: List[Any] = []
+    for chunk in chunks:
+        items.extend(stream.feed(chunk))
+    items.extend(stream.close())
+    return items, stream
+
+
+def split(body: bytes, cuts: Iterable[int]) -> List[bytes]:
+    bounds = [0, *sorted(cuts), len(body)]
+    return [body[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+class TestJSONArrayStream:
+    """Decoding the same document however its bytes are split."""
+
+    def test_whole_body(self) -> None:
+        items, stream = decode([BODY])
+        assert items == DOCUMENT["costs"]
+        assert stream.captured == {"links": DOCUMENT["links"]}
+        assert stream.count == 6
+
+    def test_byte_by_byte(self) -> None:
+        items, stream = decode(BODY[i : i + 1] for i in range(len(BODY)))
+        assert items == DOCUMENT["costs"]
+        assert stream.captured == {"links": DOCUMENT["links"]}
+
+    def test_every_single_split_point(self) -> None:
+        for cut in range(1, len(BODY)):
+            assert decode(split(BODY, [cut]))[0] == DOCUMENT["costs"]
+
+    def test_random_splits(self) -> None:
+        rng = random.Random(1234)
+        for _ in range(200):
+            cuts = rng.sample(range(1, len(BODY)), rng.randint(1, 40))
+            assert decode(split(BODY, cuts))[0] == DOCUMENT["costs"]
+
+    def test_split_inside_a_multibyte_character(self) -> None:
+        cut = BODY.index("💸".encode()) + 2
+        assert decode(split(BODY, [cut]))[0] == DOCUMENT["costs"]
+
+    def test_number_at_chunk_boundary_waits_for_more(self) -> None:
+        stream = JSONArrayStream("costs")
+        assert stream.feed(b'{"costs": [12') == []
+        assert stream.feed(b"34, 5]}") == [1234, 5]
+        assert stream.close() == []
+
+    def test_items_are_returned_as_they_complete(self) -> None:
+        stream = JSONArrayStream("costs")
+        assert stream.feed(b'{"costs": [{"a": 1}, {"a"') == [{"a": 1}]
+        assert stream.feed(b": 2}]}") == [{"a": 2}]
+
+    def test_array_after_other_keys(self) -> None:
+        body = b'{"links": {"next": null}, "meta": [1, [2]], "costs": [1, 2]}'
+        items, stream = decode([body], capture=("links", "meta"))
+        assert items == [1, 2]
+        assert stream.captured == {"links": {"next": None}, "meta": [1, [2]]}
+
+    def test_missing_key_yields_nothing(self) -> None:
+        assert decode([b'{"links": {}, "other": [1, 2]}'])[0] == []
+
+    def test_empty_array(self) -> None:
+        assert decode([b'{"costs": []}'])[0] == []
+
+    def test_truncated_body_raises(self) -> None:
+        stream = JSONArrayStream("costs")
+        stream.feed(BODY[: len(BODY) // 2])
+        with pytest.raises(ValueError):
+            stream.close()
+
+    def test_not_an_object_raises(self) -> None:
+        with pytest.raises(ValueError):
+            JSONArrayStream("costs").feed(b"[1, 2]")
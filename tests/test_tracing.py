@@ -0,0 +1,105 @@
+"""Tests for the OpenTelemetry spans of API calls.
+
+Runs offline against httpx.MockTransport, with spans collected by an
+in-memory exporter. Skipped when ``opentelemetry-sdk`` is not installed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+import httpx
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from vantage import AsyncClient, Client, VantageAPIError
+
+FOLDER = {
+    "token": "fldr_1",
+    "title": "Team",
+    "parent_folder_token": None,
+    "saved_filter_tokens": [],
+    "cost_report_tokens": [],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "workspace_token": "wrkspc_1",
+}
+
+
+@pytest.fixture
+def exporter() -> Tuple[TracerProvider, InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider, exporter
+
+
+def folders_pages(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("page", "1"))
+    folders = [{**FOLDER, "token": f"fldr_{page}_{i}"} for i in range(2)]
+    links = {"next": f"https://api.vantage.sh/v2/folders?page={page + 1}&limit=2"} if page < 2 else {}
+    return httpx.Response(200, json={"folders": folders, "links": links})
+
+
+class TestTracing:
+    """Spans made by the clients."""
+
+    def test_off_by_default(self) -> None:
+        client = Client("token", transport=httpx.MockTransport(lambda r: httpx.Response(200, json=FOLDER)))
+        assert client._tracing is None
+        assert client._hooks is None
+
+    def test_span_per_call(self, exporter: Tuple[TracerProvider, InMemorySpanExporter]) -> None:
+        provider, spans = exporter
+        headers: List[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            headers.append(request.headers.get("traceparent"))
+            return httpx.Response(200, json=FOLDER)
+
+        client = Client("token", transport=httpx.MockTransport(handler), tracing=provider)
+        client.folders.get("fldr_1")
+        (span,) = spans.get_finished_spans()
+        assert span.name == "folders.get"
+        assert span.kind == trace.SpanKind.CLIENT
+        assert span.attributes["url.template"] == "/v2/folders/{folder_token}"
+        assert span.attributes["http.request.method"] == "GET"
+        assert span.attributes["http.response.status_code"] == 200
+        assert span.attributes["vantage.validate_duration"] >= 0
+        assert f"{span.context.span_id:016x}" in headers[0]
+
+    def test_error_status(self, exporter: Tuple[TracerProvider, InMemorySpanExporter]) -> None:
+        provider, spans = exporter
+        transport = httpx.MockTransport(lambda r: httpx.Response(404, json={"errors": ["not found"]}))
+        client = Client("token", transport=transport, tracing=provider, retry=None)
+        with pytest.raises(VantageAPIError):
+            client.folders.get("fldr_1")
+        (span,) = spans.get_finished_spans()
+        assert span.status.status_code == trace.StatusCode.ERROR
+        assert span.attributes["http.response.status_code"] == 404
+
+    def test_list_all_pages(self, exporter: Tuple[TracerProvider, InMemorySpanExporter]) -> None:
+        provider, spans = exporter
+        client = Client("token", transport=httpx.MockTransport(folders_pages), tracing=provider)
+        assert len(list(client.folders.list_all(limit=2))) == 4
+        finished = spans.get_finished_spans()
+        assert [span.name for span in finished] == ["folders.list", "folders.list"]
+        assert [span.attributes["vantage.items"] for span in finished] == [2, 2]
+        assert finished[1].attributes["vantage.page"] == 2
+        # The pages are fetched raw and validated after their spans closed.
+        assert all("vantage.validate_duration" not in span.attributes for span in finished)
+
+    async def test_async_client(self, exporter: Tuple[TracerProvider, InMemorySpanExporter]) -> None:
+        provider, spans = exporter
+        transport = httpx.MockTransport(lambda r: httpx.Response(200, json=FOLDER))
+        async with AsyncClient("token", transport=transport, tracing=provider) as client:
+            await client.folders.get("fldr_1")
+        (span,) = spans.get_finished_spans()
+        assert span.name == "folders.get"
+        assert span.attributes["http.response.status_code"] == 200
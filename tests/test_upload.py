@@ -0,0 +1,185 @@
+"""Tests for streamed multipart CSV uploads.
+
+Runs offline against httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from vantage import AsyncClient, Client, CSVRows, RetryPolicy, VantageAPIError
+from vantage._upload import MultipartBody
+
+UPLOAD = {"token": "up_1", "filename": "costs.csv", "import_status": "processing", "created_at": "2024-01-01T00:00:00Z"}
+CSV = b"date,cost\r\n2024-01-01,1.50\r\n2024-01-02,2.25\r\n"
+RETRY = RetryPolicy(backoff_factor=0.001, jitter=False, methods=frozenset({"POST"}))
+
+
+class Recorder:
+    """Records every request body and answers with ``statuses`` in turn, then 201."""
+
+    def __init__(self, *statuses: int) -> None:
+        self.statuses = list(statuses)
+        self.requests: List[httpx.Request] = []
+        self.bodies: List[bytes] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.bodies.append(request.read())
+        status = self.statuses.pop(0) if self.statuses else 201
+        return httpx.Response(status, json=UPLOAD if status == 201 else {"errors": ["unavailable"]})
+
+
+def parts(request: httpx.Request, body: bytes) -> Dict[str, Any]:
+    """Split a multipart body on the boundary from its Content-Type into {name: (filename, content)}."""
+    content_type = request.headers["content-type"]
+    assert content_type.startswith("multipart/form-data; boundary=")
+    boundary = content_type.split("boundary=", 1)[1].encode()
+    chunks = body.split(b"--" + boundary)
+    assert chunks[0] == b"" and chunks[-1] == b"--\r\n"
+    result = {}
+    for chunk in chunks[1:-1]:
+        head, _, content = chunk[2:-2].partition(b"\r\n\r\n")
+        disposition = head.split(b"\r\n")[0].decode()
+        name = disposition.split('name="', 1)[1].split('"', 1)[0]
+        filename = disposition.split('filename="', 1)[1].split('"', 1)[0] if "filename=" in disposition else None
+        result[name] = (filename, content)
+    return result
+
+
+def rows() -> Iterator[List[str]]:
+    yield ["date", "cost"]
+    yield ["2024-01-01", "1.50"]
+    yield ["2024-01-02", "2.25"]
+
+
+def upload(server: Recorder, body: Any, retry: Any = None) -> Any:
+    client = Client("token", transport=httpx.MockTransport(server), retry=retry, validate="raw")
+    return client.integrations.create_user_costs_upload_via_csv("accss_1", body)
+
+
+class TestCSVRows:
+    """Encoding rows to CSV on read."""
+
+    def test_sequence_rows(self) -> None:
+        assert CSVRows(rows()).read() == CSV
+
+    def test_mapping_rows_take_the_header_from_the_first_row(self) -> None:
+        data = [{"date": "2024-01-01", "cost": "1.50"}, {"date": "2024-01-02", "cost": "2.25"}]
+        assert CSVRows(data).read() == CSV
+
+    def test_small_reads(self) -> None:
+        stream = CSVRows(rows(), filename="costs.csv")
+        chunks = iter(lambda: stream.read(5), b"")
+        assert b"".join(chunks) == CSV
+        assert stream.name == "costs.csv"
+
+
+class TestMultipart:
+    """The multipart body sent to the CSV endpoints."""
+
+    def test_path_is_streamed_with_content_length(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        server = Recorder()
+        upload(server, path)
+        request, body = server.requests[0], server.bodies[0]
+        assert int(request.headers["content-length"]) == len(body)
+        assert parts(request, body) == {"csv": ("costs.csv", CSV)}
+
+    def test_rows_are_sent_chunked(self) -> None:
+        server = Recorder()
+        upload(server, CSVRows(rows(), filename="rows.csv"))
+        request, body = server.requests[0], server.bodies[0]
+        assert "content-length" not in request.headers
+        assert parts(request, body) == {"csv": ("rows.csv", CSV)}
+
+    def test_str_values_in_a_dict_stay_form_fields(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        server = Recorder()
+        upload(server, {"csv": str(path), "note": "January"})
+        # Without file parts the fields are sent URL-encoded, as before streaming uploads.
+        assert server.requests[0].headers["content-type"] == "application/x-www-form-urlencoded"
+        assert parse_qs(server.bodies[0].decode()) == {"csv": [str(path)], "note": ["January"]}
+
+    def test_path_values_in_a_dict_are_files(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        server = Recorder()
+        upload(server, {"csv": path, "note": "January"})
+        assert parts(server.requests[0], server.bodies[0]) == {"csv": ("costs.csv", CSV), "note": (None, b"January")}
+
+    def test_text_files_are_encoded(self) -> None:
+        server = Recorder()
+        upload(server, io.StringIO("date,cost\r\n2024-01-01,€1\r\n"))
+        assert parts(server.requests[0], server.bodies[0])["csv"][1] == "date,cost\r\n2024-01-01,€1\r\n".encode()
+
+    def test_boundaries_differ_per_request(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        server = Recorder()
+        upload(server, path)
+        upload(server, path)
+        first, second = (request.headers["content-type"] for request in server.requests)
+        assert first != second
+
+    def test_opened_files_are_closed(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        body = MultipartBody(path)
+        handle = body.files["csv"][1]
+        body.close()
+        assert handle.closed
+
+
+class TestReplay:
+    """Sending a multipart body again on retry."""
+
+    def test_path_is_resent_whole(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        server = Recorder(503, 503)
+        assert upload(server, path, retry=RETRY) == UPLOAD
+        assert len(server.bodies) == 3
+        assert [parts(request, body)["csv"] for request, body in zip(server.requests, server.bodies)] == [
+            ("costs.csv", CSV)
+        ] * 3
+
+    def test_seekable_file_is_resent_whole(self) -> None:
+        server = Recorder(503)
+        handle = io.BytesIO(CSV)
+        handle.name = "costs.csv"
+        upload(server, handle, retry=RETRY)
+        assert [parts(request, body)["csv"][1] for request, body in zip(server.requests, server.bodies)] == [CSV] * 2
+
+    @pytest.mark.parametrize("body", [lambda: CSVRows(rows()), lambda: rows(), lambda: io.StringIO(CSV.decode())])
+    def test_streams_are_not_retried(self, body: Any) -> None:
+        server = Recorder(503)
+        with pytest.raises(VantageAPIError):
+            upload(server, body(), retry=RETRY)
+        assert len(server.bodies) == 1
+
+    def test_replayable(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        body = MultipartBody(path)
+        assert body.replayable
+        body.close()
+        assert MultipartBody({"csv": CSV.decode()}).replayable
+        assert not MultipartBody(CSVRows(rows())).replayable
+        assert not MultipartBody(rows()).replayable
+
+    async def test_async_path_is_resent_whole(self, tmp_path: Path) -> None:
+        path = tmp_path / "costs.csv"
+        path.write_bytes(CSV)
+        server = Recorder(503)
+        async with AsyncClient("token", transport=httpx.MockTransport(server), retry=RETRY, validate="raw") as client:
+            assert await client.integrations.create_user_costs_upload_via_csv("accss_1", path) == UPLOAD
+        assert [parts(request, body)["csv"][1] for request, body in zip(server.requests, server.bodies)] == [CSV] * 2
@@ -0,0 +1,268 @@
+"""Tests for the timing wheel and the Waiters that poll long-running operations.
+
+Runs offline: status checks are plain callables or go through httpx.MockTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict
+
+import httpx
+import pytest
+
+from vantage import AsyncClient, Client, PollPolicy, WaitTimeoutError
+from vantage._polling import AsyncWaiter, TimerWheel, Waiter, _batch_of
+
+FAST = PollPolicy(initial=0.01, factor=1.0, max_interval=0.01, jitter=0)
+
+
+class Counter:
+    """A status check that reports done on its ``done_after + 1``-th call."""
+
+    def __init__(self, done_after: int = 2) -> None:
+        self.done_after = done_after
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> Dict[str, object]:
+        with self.lock:
+            self.calls += 1
+            return {"done": self.calls > self.done_after, "calls": self.calls}
+
+    async def check(self) -> Dict[str, object]:
+        return self()
+
+
+def is_done(status: Dict[str, object]) -> bool:
+    return bool(status["done"])
+
+
+class TestTimerWheel:
+    """Scheduling and expiring timers."""
+
+    def test_fires_in_deadline_order(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(0.1, slots=8)
+        wheel.schedule("late", 0.25, 0.0)
+        wheel.schedule("early", 0.05, 0.0)
+        assert len(wheel) == 2
+        assert wheel.advance(0.05) == []
+        assert wheel.advance(0.1) == ["early"]
+        assert wheel.advance(0.31) == ["late"]
+        assert len(wheel) == 0
+
+    def test_timers_beyond_one_revolution(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(0.1, slots=8)
+        wheel.schedule("far", 2.0, 0.0)
+        # Slot 4 comes round at 0.4, 1.2 and 2.0; only the last fires it.
+        assert wheel.advance(0.4) == []
+        assert wheel.advance(1.9) == []
+        assert wheel.advance(2.0) == ["far"]
+
+    def test_long_sleep_expires_everything_due(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(0.1, slots=8)
+        wheel.schedule("a", 0.3, 0.0)
+        wheel.schedule("b", 0.1, 0.0)
+        assert wheel.advance(100.0) == ["b", "a"]
+
+    def test_never_fires_in_the_current_tick(self) -> None:
+        wheel: TimerWheel[str] = TimerWheel(0.1, slots=8)
+        wheel.schedule("now", 0.0, 0.05)
+        assert wheel.advance(0.05) == []
+        assert wheel.advance(0.1) == ["now"]
+
+
+class TestWaiter:
+    """Polling from the sync Waiter."""
+
+    def test_resolves_with_transformed_result(self) -> None:
+        waiter = Waiter(resolution=0.01)
+        check = Counter(done_after=2)
+        try:
+            future = waiter.submit(check, is_done=is_done, policy=FAST, transform=lambda s: s["calls"])
+            assert future.result(5) == 3
+            assert check.calls == 3
+        finally:
+            waiter.close()
+
+    def test_same_key_shares_one_check(self) -> None:
+        waiter = Waiter(resolution=0.01)
+        check = Counter(done_after=3)
+        try:
+            futures = [waiter.submit(check, key="op", is_done=is_done, policy=FAST) for _ in range(10)]
+            assert all(future.result(5)["calls"] == 4 for future in futures)
+            assert check.calls == 4
+        finally:
+            waiter.close()
+
+    def test_deadlines_are_per_waiter(self) -> None:
+        waiter = Waiter(resolution=0.01)
+        check = Counter(done_after=15)
+        try:
+            impatient = waiter.submit(check, key="op", is_done=is_done, policy=FAST, timeout=0.03)
+            patient = waiter.submit(check, key="op", is_done=is_done, policy=FAST)
+            with pytest.raises(WaitTimeoutError):
+                impatient.result(5)
+            assert patient.result(5)["calls"] == 16
+        finally:
+            waiter.close()
+
+    def test_timeout_raises(self) -> None:
+        waiter = Waiter(resolution=0.01)
+        try:
+            future = waiter.submit(Counter(done_after=10**6), is_done=is_done, policy=FAST, timeout=0.05)
+            with pytest.raises(WaitTimeoutError):
+                future.result(5)
+        finally:
+            waiter.close()
+
+    def test_cancel_stops_polling(self) -> None:
+        waiter = Waiter(resolution=0.01)
+        check = Counter(done_after=10**6)
+        try:
+            future = waiter.submit(check, is_done=is_done, policy=FAST)
+            time.sleep(0.05)
+            assert future.cancel()
+            time.sleep(0.05)
+            calls = check.calls
+            time.sleep(0.1)
+            assert check.calls == calls
+        finally:
+            waiter.close()
+
+    def test_check_error_fails_every_waiter(self) -> None:
+        def check() -> None:
+            raise ValueError("boom")
+
+        waiter = Waiter(resolution=0.01)
+        try:
+            futures = [waiter.submit(check, key="op", policy=FAST) for _ in range(2)]
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result(5)
+        finally:
+            waiter.close()
+
+    def test_wait_all_records_failures_per_item(self) -> None:
+        waiter = Waiter(resolution=0.01)
+        checks = {"ok": Counter(done_after=1), "slow": Counter(done_after=10**6)}
+        try:
+            result = waiter.wait_all(lambda name: checks[name], ["ok", "slow"], is_done=is_done, policy=FAST, timeout=0.1)
+            assert [item.ok for item in result] == [True, False]
+            assert isinstance(result[1].error, WaitTimeoutError)
+        finally:
+            waiter.close()
+
+    def test_close_cancels_pending(self) -> None:
+        waiter = Waiter(resolution=0.01)
+        future = waiter.submit(Counter(done_after=10**6), is_done=is_done, policy=FAST)
+        waiter.close()
+        assert future.cancelled()
+        with pytest.raises(RuntimeError):
+            waiter.submit(Counter(), is_done=is_done)
+
+
+class TestAsyncWaiter:
+    """Polling from the AsyncWaiter."""
+
+    async def test_same_key_shares_one_check(self) -> None:
+        waiter = AsyncWaiter(resolution=0.01)
+        check = Counter(done_after=3)
+        futures = [waiter.submit(check.check, key="op", is_done=is_done, policy=FAST) for _ in range(10)]
+        results = await asyncio.gather(*futures)
+        assert [status["calls"] for status in results] == [4] * 10
+        assert check.calls == 4
+
+    async def test_deadlines_are_per_waiter(self) -> None:
+        waiter = AsyncWaiter(resolution=0.01)
+        check = Counter(done_after=15)
+        impatient = waiter.submit(check.check, key="op", is_done=is_done, policy=FAST, timeout=0.03)
+        patient = waiter.submit(check.check, key="op", is_done=is_done, policy=FAST)
+        with pytest.raises(WaitTimeoutError):
+            await impatient
+        assert (await patient)["calls"] == 16
+
+    async def test_cancelling_the_awaiting_task_stops_polling(self) -> None:
+        waiter = AsyncWaiter(resolution=0.01)
+        check = Counter(done_after=10**6)
+        task = asyncio.ensure_future(waiter.wait_all(lambda _: check.check, ["op"], is_done=is_done, policy=FAST))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.03)
+        calls = check.calls
+        await asyncio.sleep(0.1)
+        assert check.calls == calls
+        waiter.close()
+
+    async def test_timeout_raises(self) -> None:
+        waiter = AsyncWaiter(resolution=0.01)
+        future = waiter.submit(Counter(done_after=10**6).check, is_done=is_done, policy=FAST, timeout=0.05)
+        with pytest.raises(WaitTimeoutError):
+            await future
+        waiter.close()
+
+
+class TestBatchOf:
+    """Collecting settled futures into a BatchResult."""
+
+    def test_keeps_input_order_and_errors(self) -> None:
+        ok: Future[int] = Future()
+        ok.set_result(1)
+        failed: Future[int] = Future()
+        failed.set_exception(WaitTimeoutError("late"))
+        result = _batch_of(["a", "b"], [ok, failed])
+        assert [item.input for item in result] == ["a", "b"]
+        assert result[0].ok and result[0].result == 1
+        assert not result[1].ok and isinstance(result[1].error, WaitTimeoutError)
+
+
+class Exports:
+    """Serves data export statuses that complete on the ``done_after + 1``-th request."""
+
+    def __init__(self, done_after: int = 2) -> None:
+        self.done_after = done_after
+        self.requests: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        token = request.url.path.rsplit("/", 1)[1]
+        with self.lock:
+            self.requests[token] = self.requests.get(token, 0) + 1
+            count = self.requests[token]
+        status = "completed" if count > self.done_after else "pending"
+        return httpx.Response(200, json={"token": token, "status": status, "manifest": {"files": []}})
+
+
+class TestClientWait:
+    """data_exports.wait through the client's Waiter."""
+
+    def test_concurrent_waits_share_requests(self) -> None:
+        exports = Exports(done_after=2)
+        client = Client("token", transport=httpx.MockTransport(exports), retry=None)
+        try:
+            futures = [client.data_exports.wait("dta_xprt_1", poll=FAST, validate="raw") for _ in range(5)]
+            assert all(future.result(5)["status"] == "completed" for future in futures)
+            assert exports.requests == {"dta_xprt_1": 3}
+        finally:
+            client.close()
+
+    def test_timeout_raises(self) -> None:
+        exports = Exports(done_after=10**6)
+        client = Client("token", transport=httpx.MockTransport(exports), retry=None)
+        try:
+            with pytest.raises(WaitTimeoutError):
+                client.data_exports.wait("dta_xprt_1", poll=FAST, timeout=0.05).result(5)
+        finally:
+            client.close()
+
+    async def test_async_wait(self) -> None:
+        exports = Exports(done_after=2)
+        async with AsyncClient("token", transport=httpx.MockTransport(exports), retry=None) as client:
+            status = await client.data_exports.wait("dta_xprt_1", poll=FAST, validate="raw")
+            assert status["status"] == "completed"
+            assert exports.requests == {"dta_xprt_1": 3}